@@ -11,19 +11,30 @@ from pathlib import Path
 import typer
 from hypercli.agents import (
     AGENT_FILE_MAX_BYTES,
+    DEFAULT_BULK_CONCURRENCY,
     DEFAULT_HERMES_AGENT_IMAGE,
     DEFAULT_OPENCLAW_IMAGE,
     DEFAULT_OPENCLAW_PRO_IMAGE,
     Agent,
+    BulkItem,
     Deployments,
     HermesAgent,
     OpenClawAgent,
+    agent_selector,
     build_openclaw_memory_index_env,
+    is_agent_runtime_inactive_state,
 )
+from hypercli.agent_index import AgentIndex
+from hypercli.agent_metrics import DEFAULT_METRICS_CONCURRENCY
+from hypercli.exec_batch import DEFAULT_EXEC_CONCURRENCY
+from hypercli.file_sync import DEFAULT_SYNC_CONCURRENCY, FileSyncPlan
 from hypercli.config import get_agent_api_key as get_config_agent_api_key
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
+from .output import exec_fan_out
+
 app = typer.Typer(help="Manage agent deployments")
 routes_app = typer.Typer(help="Manage declarative agent routes", no_args_is_help=True)
 app.add_typer(routes_app, name="routes")
@@ -221,7 +232,13 @@ def _get_deployments_client(agents_ws_url: str | None = None) -> Deployments:
     )
     resolved_agents_ws_url = agents_ws_url or _GLOBAL_AGENTS_WS_URL or os.environ.get("AGENTS_WS_URL")
     http = HTTPClient(api_base, api_key)
-    return Deployments(http, api_key=api_key, api_base=api_base, agents_ws_url=resolved_agents_ws_url)
+    return Deployments(
+        http,
+        api_key=api_key,
+        api_base=api_base,
+        agents_ws_url=resolved_agents_ws_url,
+        agent_index=AgentIndex.for_account(api_base, api_key),
+    )
 
 
 def _save_agent_state(agent: Agent):
@@ -721,10 +738,22 @@ def list_agents(
     name: str | None = typer.Option(None, "--name", "-n", help="Filter by exact agent name"),
     query: str | None = typer.Option(None, "--query", "-q", help="Search IDs, names, handles, and hostnames"),
     include_deleted: bool = typer.Option(False, "--include-deleted", help="Include deleted agents"),
+    watch: bool = typer.Option(False, "--watch", "-w", help="Keep the table live, updated from deployment events"),
 ):
     """List all agents."""
     agents = _get_deployments_client()
 
+    if watch:
+        if json_output:
+            console.print("[red]❌ --watch cannot be combined with --json[/red]")
+            raise typer.Exit(1)
+        _watch_agents(
+            agents,
+            _agent_list_predicate(state=state, handle=handle, name=name, query=query),
+            include_deleted=include_deleted,
+        )
+        return
+
     try:
         pods = agents.list(
             state=state,
@@ -754,7 +783,15 @@ def list_agents(
         console.print("Create one: [bold]hyper agents create[/bold]")
         return
 
-    table = Table(title="Agents")
+    for pod in pods:
+        _save_agent_state(pod)
+
+    console.print()
+    console.print(_agents_table(pods))
+
+
+def _agents_table(pods: list[Agent], title: str = "Agents") -> Table:
+    table = Table(title=title)
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Name", style="blue")
     table.add_column("Handle")
@@ -777,10 +814,57 @@ def list_agents(
         ]
         row.append(created)
         table.add_row(*row)
-        _save_agent_state(pod)
+    return table
 
-    console.print()
-    console.print(table)
+
+def _agent_list_predicate(
+    *,
+    state: str | None,
+    handle: str | None,
+    name: str | None,
+    query: str | None,
+):
+    """Client-side twin of the list filters, applied to a live fleet mirror."""
+    needle = query.lower() if query else None
+
+    def keep(agent: Agent) -> bool:
+        if state and str(agent.state or "").upper() != state.upper():
+            return False
+        if handle and agent.handle != handle:
+            return False
+        if name and agent.name != name:
+            return False
+        if needle:
+            fields = (agent.id, agent.name, agent.handle, agent.hostname)
+            return any(needle in str(value or "").lower() for value in fields)
+        return True
+
+    return keep
+
+
+def _watch_agents(agents: Deployments, keep, *, include_deleted: bool) -> None:
+    """Render the agent table live from a FleetMirror until interrupted."""
+    import asyncio
+    from rich.live import Live
+    from hypercli.fleet import FleetMirror
+
+    async def run() -> None:
+        changed = asyncio.Event()
+        async with FleetMirror(agents, include_deleted=include_deleted) as fleet:
+            fleet.add_listener(lambda _change: changed.set())
+            with Live(console=console, refresh_per_second=2) as live:
+                while True:
+                    live.update(_agents_table(fleet.filter(keep), title="Agents (live)"))
+                    await changed.wait()
+                    changed.clear()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        console.print(f"[red]❌ Failed to watch agents: {e}[/red]")
+        raise typer.Exit(1)
 
 
 def _print_relay_key(relay_key: dict | None) -> None:
@@ -966,9 +1050,244 @@ def metrics(
         _print_agent_metrics(data)
 
 
+def _format_cores(cores: float | None) -> str:
+    if cores is None:
+        return ""
+    return f"{cores * 1000:.0f}m" if cores < 1 else f"{cores:.2f}"
+
+
+def _format_bytes(value: float | None, *, rate: bool = False) -> str:
+    if value is None:
+        return ""
+    suffix = "/s" if rate else ""
+    size = abs(value)
+    for unit in ("B", "Ki", "Mi", "Gi"):
+        if size < 1024:
+            break
+        size /= 1024
+    else:
+        unit = "Ti"
+    sign = "-" if value < 0 else ("+" if rate and value > 0 else "")
+    return f"{sign}{size:.0f}{unit}{suffix}" if unit == "B" else f"{sign}{size:.1f}{unit}{suffix}"
+
+
+def _top_table(collector, rows, sort: str) -> Table:
+    table = Table(title=f"Agents by {sort} (round {collector.rounds}, every {collector.interval:g}s)")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Name", style="blue")
+    table.add_column("CPU", justify="right")
+    table.add_column("CPU p95", justify="right")
+    table.add_column("Memory", justify="right")
+    table.add_column("Mem p95", justify="right")
+    table.add_column("Mem rate", justify="right")
+    table.add_column("Errors", justify="right")
+    for row in rows:
+        errors = f"[red]{row.errors}[/red]" if row.errors else ""
+        agent = collector.agents.get(row.agent_id)
+        table.add_row(
+            row.agent_id[:12],
+            (agent.name if agent else None) or "",
+            _format_cores(row.cpu),
+            _format_cores(row.cpu_p95),
+            _format_bytes(row.memory),
+            _format_bytes(row.memory_p95),
+            _format_bytes(row.memory_rate, rate=True),
+            errors,
+        )
+    return table
+
+
+@app.command("top")
+def top(
+    selector: str | None = typer.Option(
+        None, "--selector", "-l", help="Only agents matching field=glob pairs, e.g. name=web-*"
+    ),
+    sort: str = typer.Option("cpu", "--sort", "-s", help="Sort by cpu or memory"),
+    interval: float = typer.Option(5.0, "--interval", "-i", min=0.5, help="Seconds between samples"),
+    limit: int = typer.Option(20, "--limit", "-n", min=1, help="Rows to show"),
+    window: int | None = typer.Option(
+        None, "--window", min=2, help="Samples used for p95 and memory rate (default: all kept)"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_METRICS_CONCURRENCY, "--concurrency", "-j", min=1, help="Agents sampled at once"
+    ),
+    rounds: int | None = typer.Option(None, "--rounds", min=1, help="Stop after this many samples"),
+    export: Path | None = typer.Option(
+        None, "--export", help="Write every sample to a .csv or .parquet file on exit"
+    ),
+):
+    """Live CPU and memory table for running agents, sampled on an interval."""
+    import asyncio
+    from rich.live import Live
+    from hypercli.agent_metrics import METRICS_SORT_KEYS, MetricsCollector
+
+    if sort not in METRICS_SORT_KEYS:
+        console.print(f"[red]❌ --sort must be one of: {', '.join(METRICS_SORT_KEYS)}[/red]")
+        raise typer.Exit(1)
+    if export is not None and export.suffix.lower() not in (".csv", ".parquet"):
+        console.print("[red]❌ --export must end in .csv or .parquet[/red]")
+        raise typer.Exit(1)
+
+    agents = _get_deployments_client()
+    try:
+        keep = agent_selector(selector) if selector else (lambda _agent: True)
+        pods = [pod for pod in agents.list(state="RUNNING") if keep(pod)]
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]❌ Failed to list agents: {e}[/red]")
+        raise typer.Exit(1)
+    if not pods:
+        console.print("[dim]No running agents.[/dim]")
+        return
+
+    collector = MetricsCollector(
+        agents,
+        # Without a selector the collector keeps rediscovering running agents.
+        pods if selector else None,
+        interval=interval,
+        concurrency=concurrency,
+    )
+
+    async def run() -> None:
+        with Live(console=console, refresh_per_second=2) as live:
+            async for _ in collector.run(rounds):
+                rows = collector.top(by=sort, limit=limit, window=window)
+                live.update(_top_table(collector, rows, sort))
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        console.print(f"[red]❌ Failed to sample agent metrics: {e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        if export is not None:
+            try:
+                if export.suffix.lower() == ".parquet":
+                    count = collector.to_parquet(export)
+                else:
+                    count = collector.to_csv(export)
+            except Exception as e:
+                console.print(f"[red]❌ Failed to export metrics: {e}[/red]")
+                raise typer.Exit(1)
+            console.print(f"[dim]Wrote {count} sample(s) to {export}[/dim]")
+
+
+# Which current states each bulk operation acts on; the rest are skipped.
+_BULK_ELIGIBLE_STATES = {
+    "start": lambda state: state in {"STOPPED", "ARCHIVED", "FAILED"},
+    "stop": lambda state: not is_agent_runtime_inactive_state(state),
+    "archive": lambda state: state == "STOPPED",
+    "delete": lambda state: True,
+}
+
+
+def _bulk_requested(agent_id: str | None, all_agents: bool, selector: str | None) -> bool:
+    """Whether a lifecycle command targets many agents; exits on a bad combination."""
+    if all_agents or selector:
+        if agent_id:
+            console.print("[red]❌ Pass an agent or --all/--selector, not both.[/red]")
+            raise typer.Exit(1)
+        return True
+    if not agent_id:
+        console.print("[red]❌ Expected an agent, or --all/--selector.[/red]")
+        raise typer.Exit(1)
+    return False
+
+
+def _bulk_start_launch_config(agent: Agent) -> dict:
+    """Saved local launch config when there is one, else the Backend's stored one."""
+    try:
+        return _load_complete_launch_config(agent.id)
+    except ValueError:
+        return agent.launch_config
+
+
+def _bulk_lifecycle(
+    operation: str,
+    selector: str | None,
+    *,
+    concurrency: int,
+    wait: bool,
+    timeout: float,
+    force: bool,
+) -> None:
+    """Run one lifecycle operation on every eligible agent and print a result table."""
+    agents = _get_deployments_client()
+    try:
+        keep = agent_selector(selector) if selector else (lambda _agent: True)
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise typer.Exit(1)
+    try:
+        eligible = _BULK_ELIGIBLE_STATES[operation]
+        pods = [pod for pod in agents.list() if keep(pod) and eligible(str(pod.state or "").upper())]
+    except Exception as e:
+        console.print(f"[red]❌ Failed to list agents: {e}[/red]")
+        raise typer.Exit(1)
+    if not pods:
+        console.print(f"[dim]No agents to {operation}.[/dim]")
+        return
+    if not force and not typer.confirm(f"{operation.capitalize()} {len(pods)} agent(s)?"):
+        raise typer.Exit(0)
+
+    console.print(f"[dim]Running {operation} on {len(pods)} agent(s), {concurrency} at a time...[/dim]")
+    try:
+        items = agents.bulk(
+            operation,
+            pods,
+            concurrency=concurrency,
+            wait=wait,
+            timeout=timeout,
+            launch_config=_bulk_start_launch_config if operation == "start" else None,
+        )
+    except Exception as e:
+        console.print(f"[red]❌ Bulk {operation} failed: {e}[/red]")
+        raise typer.Exit(1)
+
+    names = {pod.id: pod.name or pod.id[:12] for pod in pods}
+    console.print(_bulk_results_table(operation, items, names))
+    for item in items:
+        if not item.ok:
+            continue
+        if operation == "delete":
+            _remove_agent_state(item.agent_id)
+        elif item.agent is not None:
+            _save_agent_state(item.agent)
+    failed = sum(1 for item in items if not item.ok)
+    console.print(f"[bold]{len(items)} agent(s):[/bold] {len(items) - failed} ok, {failed} failed")
+    if failed:
+        raise typer.Exit(1)
+
+
+def _bulk_results_table(operation: str, items: list[BulkItem], names: dict[str, str]) -> Table:
+    table = Table(title=f"Bulk {operation}")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Name", style="blue")
+    table.add_column("State")
+    table.add_column("Result")
+    table.add_column("Time", justify="right")
+    for item in items:
+        style = _agent_state_style(item.state)
+        result = "[green]ok[/green]" if item.ok else f"[red]{escape(str(item.error))}[/red]"
+        table.add_row(
+            item.agent_id[:12],
+            names.get(item.agent_id, item.agent_id[:12]),
+            f"[{style}]{item.state}[/{style}]" if item.state else "",
+            result,
+            f"{item.elapsed:.1f}s",
+        )
+    return table
+
+
 @app.command("start")
 def start(
-    agent_id: str = typer.Argument(..., help="Agent ID, unique name, handle, hostname, or prefix"),
+    agent_id: str | None = typer.Argument(
+        None, help="Agent ID, unique name, handle, hostname, or prefix; omit with --all/--selector"
+    ),
     env: list[str] = typer.Option(None, "--env", "-e", help="Environment variable override (KEY=VALUE). Repeatable."),
     command: str = typer.Option(None, "--command", help="Container args as a shell-style string"),
     entrypoint: str = typer.Option(None, "--entrypoint", help="Container entrypoint as a shell-style string"),
@@ -998,8 +1317,40 @@ def start(
     gateway_token: str = typer.Option(None, "--gateway-token", help="OpenClaw gateway token override"),
     api_server_key: str = typer.Option(None, "--api-server-key", help="Hermes API Server bearer key override"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Validate launch configuration without starting the agent"),
+    all_agents: bool = typer.Option(False, "--all", help="Start every stopped, archived, or failed agent"),
+    selector: str | None = typer.Option(None, "--selector", "-l", help="Only agents matching field=glob terms, e.g. name=web-*"),
+    concurrency: int = typer.Option(DEFAULT_BULK_CONCURRENCY, "--concurrency", "-j", min=1, help="Starts in flight at once with --all/--selector"),
+    wait: bool = typer.Option(True, "--wait/--no-wait", help="With --all/--selector, wait for every agent to reach RUNNING"),
+    timeout: float = typer.Option(900.0, "--timeout", min=1.0, help="Wait timeout in seconds with --all/--selector"),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation with --all/--selector"),
 ):
-    """Start a previously stopped agent."""
+    """Start a previously stopped agent, or many with --all/--selector."""
+    if _bulk_requested(agent_id, all_agents, selector):
+        overrides = [
+            flag
+            for flag, value in {
+                "--env": env, "--command": command, "--entrypoint": entrypoint, "--image": image,
+                "--desktop": desktop, "--memory-search": memory_search,
+                "--index-on-session-start": index_on_session_start, "--index-on-search": index_on_search,
+                "--index-watch": index_watch, "--index-watch-debounce-ms": index_watch_debounce_ms,
+                "--index-interval-minutes": index_interval_minutes, "--registry-url": registry_url,
+                "--registry-username": registry_username, "--registry-password": registry_password,
+                "--sync-include": sync_include, "--sync-exclude": sync_exclude, "--sync-uid": sync_uid,
+                "--sync-gid": sync_gid, "--gateway-token": gateway_token,
+                "--api-server-key": api_server_key, "--dry-run": dry_run or None,
+            }.items()
+            if value is not None
+        ]
+        if overrides:
+            console.print(
+                "[red]❌ --all/--selector starts each agent with its saved launch "
+                f"configuration and does not accept overrides: {', '.join(overrides)}[/red]"
+            )
+            raise typer.Exit(1)
+        _bulk_lifecycle(
+            "start", selector, concurrency=concurrency, wait=wait, timeout=timeout, force=force
+        )
+        return
     _reject_self_target(agent_id, "start")
     agent_id = _resolve_agent(agent_id)
     requested_agent_id = "self" if agent_id.strip().lower() == "self" else agent_id
@@ -1193,12 +1544,22 @@ def start(
 
 @app.command("stop")
 def stop(
-    agent_id: str = typer.Argument(..., help="Agent ID, unique name, handle, hostname, or prefix"),
+    agent_id: str | None = typer.Argument(
+        None, help="Agent ID, unique name, handle, hostname, or prefix; omit with --all/--selector"
+    ),
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
     wait: bool = typer.Option(False, "--wait", help="Wait for cleanup to finish and state to become STOPPED"),
     timeout: float = typer.Option(900.0, "--timeout", min=1.0, help="Wait timeout in seconds"),
+    all_agents: bool = typer.Option(False, "--all", help="Stop every agent with a live runtime"),
+    selector: str | None = typer.Option(None, "--selector", "-l", help="Only agents matching field=glob terms, e.g. name=web-*"),
+    concurrency: int = typer.Option(DEFAULT_BULK_CONCURRENCY, "--concurrency", "-j", min=1, help="Stops in flight at once with --all/--selector"),
 ):
-    """Stop an agent (keeps DB record, destroys pod)."""
+    """Stop an agent (keeps DB record, destroys pod), or many with --all/--selector."""
+    if _bulk_requested(agent_id, all_agents, selector):
+        _bulk_lifecycle(
+            "stop", selector, concurrency=concurrency, wait=wait, timeout=timeout, force=force
+        )
+        return
     _reject_self_target(agent_id, "stop")
     agent_id = _resolve_agent(agent_id)
 
@@ -1246,9 +1607,22 @@ def restore(
 
 @app.command("archive")
 def archive(
-    agent_id: str = typer.Argument(..., help="Agent ID, unique name, handle, hostname, or prefix"),
+    agent_id: str | None = typer.Argument(
+        None, help="Agent ID, unique name, handle, hostname, or prefix; omit with --all/--selector"
+    ),
+    all_agents: bool = typer.Option(False, "--all", help="Archive every stopped agent"),
+    selector: str | None = typer.Option(None, "--selector", "-l", help="Only agents matching field=glob terms, e.g. name=web-*"),
+    concurrency: int = typer.Option(DEFAULT_BULK_CONCURRENCY, "--concurrency", "-j", min=1, help="Archives in flight at once with --all/--selector"),
+    wait: bool = typer.Option(False, "--wait", help="With --all/--selector, wait for every agent to reach ARCHIVED"),
+    timeout: float = typer.Option(900.0, "--timeout", min=1.0, help="Wait timeout in seconds with --wait"),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation with --all/--selector"),
 ):
     """Archive a stopped agent's durable workspace without launching it."""
+    if _bulk_requested(agent_id, all_agents, selector):
+        _bulk_lifecycle(
+            "archive", selector, concurrency=concurrency, wait=wait, timeout=timeout, force=force
+        )
+        return
     agent_id = _resolve_agent(agent_id)
     agents = _get_deployments_client()
 
@@ -1264,10 +1638,18 @@ def archive(
 
 @app.command("delete")
 def delete(
-    agent_id: str = typer.Argument(..., help="Agent ID, unique name, handle, hostname, or prefix"),
+    agent_id: str | None = typer.Argument(
+        None, help="Agent ID, unique name, handle, hostname, or prefix; omit with --all/--selector"
+    ),
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
+    all_agents: bool = typer.Option(False, "--all", help="Delete every agent"),
+    selector: str | None = typer.Option(None, "--selector", "-l", help="Only agents matching field=glob terms, e.g. name=web-*"),
+    concurrency: int = typer.Option(DEFAULT_BULK_CONCURRENCY, "--concurrency", "-j", min=1, help="Deletes in flight at once with --all/--selector"),
 ):
-    """Delete an agent entirely (pod + record)."""
+    """Delete an agent entirely (pod + record), or many with --all/--selector."""
+    if _bulk_requested(agent_id, all_agents, selector):
+        _bulk_lifecycle("delete", selector, concurrency=concurrency, wait=False, timeout=0, force=force)
+        return
     agent_id = _resolve_agent(agent_id)
     agents = _get_deployments_client()
     try:
@@ -1293,11 +1675,56 @@ def delete(
 
 @app.command("exec")
 def exec_cmd(
-    agent_id: str = typer.Argument(..., help="Agent ID, unique name, handle, hostname, or prefix"),
-    command: list[str] = typer.Argument(..., help="Executable followed by arguments"),
+    agent_id: str | None = typer.Argument(
+        None, help="Agent ID, unique name, handle, hostname, or prefix; omit with --all"
+    ),
+    command: list[str] | None = typer.Argument(None, help="Executable followed by arguments"),
     timeout: int = typer.Option(30, "--timeout", "-t", help="Command timeout (seconds)"),
+    all_agents: bool = typer.Option(False, "--all", help="Run on every agent matching --state"),
+    state: str = typer.Option("RUNNING", "--state", "-s", help="Lifecycle state to target with --all"),
+    concurrency: int = typer.Option(
+        DEFAULT_EXEC_CONCURRENCY, "--concurrency", "-j", min=1, help="Commands in flight at once with --all"
+    ),
+    target_timeout: float | None = typer.Option(
+        None, "--target-timeout", min=1, help="Per-agent wall-clock limit with --all (default: timeout + 15s)"
+    ),
 ):
-    """Execute a command through the Backend one-shot WebSocket."""
+    """Execute a command through the Backend one-shot WebSocket.
+
+    With --all, runs on every agent in --state concurrently, prints each
+    agent's output as it finishes, and exits non-zero unless all exited 0.
+    """
+    if all_agents:
+        argv = [agent_id, *(command or [])] if agent_id else list(command or [])
+        if not argv:
+            console.print("[red]❌ Missing command to run.[/red]")
+            raise typer.Exit(1)
+        agents = _get_deployments_client()
+        state = state.upper()
+        try:
+            pods = agents.list(state=state)
+        except Exception as e:
+            console.print(f"[red]❌ Failed to list agents: {e}[/red]")
+            raise typer.Exit(1)
+        if not pods:
+            console.print(f"[dim]No {state} agents found.[/dim]")
+            return
+        names = {pod.id: pod.name or pod.id[:12] for pod in pods}
+        console.print(f"[dim]Running on {len(pods)} agent(s), {concurrency} at a time...[/dim]")
+        try:
+            results = agents.exec_many(
+                pods, argv, timeout=timeout, concurrency=concurrency, target_timeout=target_timeout
+            )
+        except ValueError as e:
+            console.print(f"[red]❌ Exec failed: {e}[/red]")
+            raise typer.Exit(1)
+        if not exec_fan_out(results, label=lambda target: names.get(target, target[:12])):
+            raise typer.Exit(1)
+        return
+
+    if not agent_id or not command:
+        console.print("[red]❌ Expected an agent and a command, or --all.[/red]")
+        raise typer.Exit(1)
     agent_id = _resolve_agent(agent_id)
 
     try:
@@ -1342,12 +1769,84 @@ async def _read_agent_shell_output(ws) -> None:
         raise RuntimeError(f"Shell WebSocket closed with code {close_code}{suffix}")
 
 
+def _print_sync_plan(plan: FileSyncPlan, *, verbose: bool) -> None:
+    if verbose:
+        table = Table(title="Sync Plan" + (" (dry run)" if plan.dry_run else ""))
+        table.add_column("Path")
+        table.add_column("Action")
+        table.add_column("Reason")
+        table.add_column("Size", justify="right")
+        for action in plan.actions:
+            table.add_row(
+                action.path,
+                plan.direction if action.transfer else "skip",
+                action.reason,
+                "" if action.size is None else f"{action.size:,}",
+            )
+        console.print(table)
+    verb = "Would transfer" if plan.dry_run else "Transferred"
+    console.print(
+        f"[green]✓[/green] {verb} {len(plan.transfers)} file(s) "
+        f"({plan.bytes_to_transfer:,} bytes), {len(plan.skipped)} unchanged"
+    )
+
+
+def _run_sync(
+    source: str,
+    destination: str,
+    *,
+    force: bool,
+    checksum: bool,
+    dry_run: bool,
+    concurrency: int,
+) -> FileSyncPlan:
+    src_agent_id, src_path = _parse_cp_target(source)
+    dst_agent_id, dst_path = _parse_cp_target(destination)
+    if bool(src_agent_id) == bool(dst_agent_id):
+        raise typer.BadParameter("Exactly one side must be remote (AGENT_ID:PATH).")
+
+    agents = _get_deployments_client()
+    options = {
+        "force": force,
+        "checksum": checksum,
+        "dry_run": dry_run,
+        "concurrency": concurrency,
+    }
+    if dst_agent_id:
+        pod = _get_agent_with_token(dst_agent_id)
+        return agents.sync_to(pod, src_path, dst_path, **options)
+    pod = _get_agent_with_token(src_agent_id)
+    return agents.sync_from(pod, src_path, dst_path, **options)
+
+
 @app.command("cp")
 def cp(
     source: str = typer.Argument(..., help="Local path or AGENT_ID:remote_path"),
     destination: str = typer.Argument(..., help="Local path or AGENT_ID:remote_path"),
+    recursive: bool = typer.Option(False, "--recursive", "-r", help="Copy a directory tree"),
+    concurrency: int = typer.Option(
+        DEFAULT_SYNC_CONCURRENCY, "--concurrency", "-j", help="Parallel transfers with -r"
+    ),
 ):
     """Copy files to or from an agent."""
+    if recursive:
+        try:
+            plan = _run_sync(
+                source,
+                destination,
+                force=True,
+                checksum=False,
+                dry_run=False,
+                concurrency=concurrency,
+            )
+        except typer.BadParameter:
+            raise
+        except Exception as e:
+            console.print(f"[red]❌ Copy failed: {e}[/red]")
+            raise typer.Exit(1)
+        _print_sync_plan(plan, verbose=False)
+        return
+
     src_agent_id, src_path = _parse_cp_target(source)
     dst_agent_id, dst_path = _parse_cp_target(destination)
 
@@ -1370,12 +1869,42 @@ def cp(
             console.print(f"[green]✓[/green] Copied [bold]{src_agent_id[:12]}:{src_path}[/bold] to [bold]{local_path}[/bold]")
     except Exception as e:
         message = str(e)
-        if message.startswith("Path is a directory:"):
-            message = f"{message} Copy expects a file path, not a directory."
+        if message.startswith("Path is a directory:") or isinstance(e, IsADirectoryError):
+            message = f"{message} Copy expects a file path, not a directory. Use -r to copy a tree."
         console.print(f"[red]❌ Copy failed: {message}[/red]")
         raise typer.Exit(1)
 
 
+@app.command("sync")
+def sync(
+    source: str = typer.Argument(..., help="Local directory or AGENT_ID:remote_dir"),
+    destination: str = typer.Argument(..., help="Local directory or AGENT_ID:remote_dir"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show the plan without transferring"),
+    checksum: bool = typer.Option(
+        False, "--checksum", "-c", help="Skip only files whose sha256 matches"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_SYNC_CONCURRENCY, "--concurrency", "-j", help="Parallel transfers"
+    ),
+):
+    """Sync a directory tree to or from an agent, skipping unchanged files."""
+    try:
+        plan = _run_sync(
+            source,
+            destination,
+            force=False,
+            checksum=checksum,
+            dry_run=dry_run,
+            concurrency=concurrency,
+        )
+    except typer.BadParameter:
+        raise
+    except Exception as e:
+        console.print(f"[red]❌ Sync failed: {e}[/red]")
+        raise typer.Exit(1)
+    _print_sync_plan(plan, verbose=dry_run)
+
+
 @app.command("shell")
 def shell(
     agent_id: str = typer.Argument(..., help="Agent ID, unique name, handle, hostname, or prefix"),
@@ -1462,11 +1991,23 @@ def logs(
         "-f",
         help="Follow log output",
     ),
+    archive_dir: Path | None = typer.Option(
+        None, "--archive", help="Also write lines to rotating gzip files in DIR", metavar="DIR"
+    ),
 ):
     """Stream logs from an agent."""
     agent_id = _resolve_agent(agent_id)
     agents = _get_deployments_client()
     import asyncio
+    from hypercli import LogArchive
+
+    archive = None
+    if archive_dir is not None:
+        try:
+            archive = LogArchive(archive_dir, name="agents")
+        except OSError as e:
+            console.print(f"[red]❌ Cannot archive to {archive_dir}: {e}[/red]")
+            raise typer.Exit(1)
 
     async def _stream_ws():
         try:
@@ -1474,6 +2015,7 @@ def logs(
                 agent_id,
                 tail_lines=lines,
                 follow=follow,
+                archive=archive,
             ):
                 console.print(line, markup=False, highlight=False, soft_wrap=True)
         except KeyboardInterrupt:
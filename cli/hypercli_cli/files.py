@@ -2,8 +2,11 @@
 import os
 import typer
 from rich.console import Console
+from rich.progress import BarColumn, DownloadColumn, Progress, TransferSpeedColumn
 from rich.table import Table
 
+from hypercli.files import DEFAULT_UPLOAD_CONCURRENCY, MIN_UPLOAD_PART_SIZE, UPLOAD_PART_SIZE
+
 app = typer.Typer(help="Upload, inspect, and delete files on the platform")
 console = Console()
 
@@ -26,15 +29,43 @@ def _fmt_size(size: int) -> str:
 def upload_file(
     file_path: str = typer.Argument(..., help="Path to local file to upload"),
     wait: bool = typer.Option(True, "--wait/--no-wait", help="Wait for upload to complete"),
+    part_size: int = typer.Option(
+        UPLOAD_PART_SIZE // (1024 * 1024),
+        "--part-size",
+        min=MIN_UPLOAD_PART_SIZE // (1024 * 1024),
+        help="Part size in MiB; files at least this large upload in resumable parts",
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_UPLOAD_CONCURRENCY, "--concurrency", "-j", min=1, help="Parts uploaded in parallel"
+    ),
 ):
-    """Upload a file for use in flows and renders."""
+    """Upload a file for use in flows and renders.
+
+    Large files upload in parts; rerunning the same command after an
+    interruption resumes from the parts already uploaded.
+    """
     if not os.path.isfile(file_path):
         console.print(f"[red]File not found: {file_path}[/red]")
         raise typer.Exit(1)
 
     client = _get_client()
-    console.print(f"Uploading [cyan]{os.path.basename(file_path)}[/cyan] ({_fmt_size(os.path.getsize(file_path))})...")
-    f = client.files.upload(file_path)
+    size = os.path.getsize(file_path)
+    part_bytes = part_size * 1024 * 1024
+    console.print(f"Uploading [cyan]{os.path.basename(file_path)}[/cyan] ({_fmt_size(size)})...")
+    with Progress(
+        BarColumn(), DownloadColumn(), TransferSpeedColumn(), console=console, transient=True
+    ) as progress:
+        task = progress.add_task("upload", total=size)
+
+        def on_progress(sent: int, total: int) -> None:
+            progress.update(task, completed=sent, total=total)
+
+        if size >= part_bytes:
+            f = client.files.upload_resumable(
+                file_path, part_size=part_bytes, concurrency=concurrency, progress=on_progress
+            )
+        else:
+            f = client.files.upload(file_path, progress=on_progress)
     console.print(f"[green]Uploaded[/green]  ID: [bold]{f.id}[/bold]")
 
     if wait and f.state == "processing":
@@ -144,9 +144,14 @@ def print_render_result(render, fmt: str, x402_result=None):
         console.print(f"  Cancel URL: {x402_result.cancel_url}")
 
 
-def _watch_flow_status(client: HyperCLI, render_id: str, poll_interval: float = 2.0):
-    """Watch flow render status live."""
+def _watch_flow_status(client: HyperCLI, render_id: str, poll_interval: float | None = None):
+    """Watch flow render status live.
+
+    Polls on the SDK's adaptive schedule (fast first, backing off while nothing
+    changes) unless a fixed ``poll_interval`` is given.
+    """
     import time
+    from hypercli.renders import poll_intervals
     from rich.live import Live
     from rich.panel import Panel
     from rich.table import Table
@@ -166,6 +171,8 @@ def _watch_flow_status(client: HyperCLI, render_id: str, poll_interval: float =
         return Panel(table, title="[bold]Flow Status[/bold]")
 
     with Live(console=console, refresh_per_second=2) as live:
+        delays = poll_intervals(poll_interval)
+        last_seen = None
         while True:
             status = client.renders.status(render_id)
             render = None
@@ -174,7 +181,10 @@ def _watch_flow_status(client: HyperCLI, render_id: str, poll_interval: float =
                 live.update(render_status_panel(status, render))
                 break
             live.update(render_status_panel(status))
-            time.sleep(poll_interval)
+            if (status.state, status.progress) != last_seen:
+                last_seen = (status.state, status.progress)
+                delays = poll_intervals(poll_interval)
+            time.sleep(next(delays))
 
 
 def _download_flow_result(render, destination: Path) -> Path:
@@ -1,8 +1,14 @@
 """hyper jobs commands"""
+import ipaddress
+from pathlib import Path
+
 import typer
 from typing import Optional
 from hypercli import HyperCLI
-from .output import output, console, success, spinner
+from hypercli.exec_batch import DEFAULT_EXEC_CONCURRENCY
+from hypercli.job_index import JobIndex
+from hypercli.jobs import DEFAULT_CREATE_CONCURRENCY
+from .output import exec_fan_out, output, console, success, spinner
 
 app = typer.Typer(help="Manage running jobs")
 
@@ -22,16 +28,39 @@ def _parse_tags(tag_args: list[str]) -> list[str]:
     return tags
 
 
+def _is_ip_address(value: str) -> bool:
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
 def _resolve_job_id(client: HyperCLI, job_id: str) -> str:
-    """Resolve a partial job ID prefix to a full UUID."""
+    """Resolve a job ID prefix, hostname or IP address to a full UUID.
+
+    Lookups go through the local job index, refreshed incrementally first;
+    a miss walks the whole job list once before giving up.
+    """
     if len(job_id) == 36:
         return job_id
-    jobs = client.jobs.list()
-    matches = [j.job_id for j in jobs if j.job_id.startswith(job_id)]
+    index = JobIndex.for_jobs(client.jobs)
+
+    def match() -> list[str]:
+        found = index.match_id(job_id) or index.match_hostname(job_id)
+        if not found and _is_ip_address(job_id):
+            found = index.match_ip(job_id)
+        return found
+
+    index.refresh(client.jobs)
+    matches = match()
+    if not matches:
+        index.refresh(client.jobs, full=True)
+        matches = match()
     if len(matches) == 1:
         return matches[0]
     elif len(matches) == 0:
-        console.print(f"[red]Error:[/red] No job matching '{job_id}' in recent jobs. Try the full UUID.")
+        console.print(f"[red]Error:[/red] No job matching '{job_id}'. Try the full UUID.")
         raise typer.Exit(1)
     else:
         console.print(f"[red]Error:[/red] Ambiguous prefix '{job_id}' — {len(matches)} matches:")
@@ -81,6 +110,94 @@ def list_jobs(
         )
 
 
+@app.command("launch")
+def launch_many(
+    spec_file: Path = typer.Option(
+        ..., "--from", exists=True, dir_okay=False, help="JSON-lines file, one job spec per line"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_CREATE_CONCURRENCY, "--concurrency", "-j", min=1, help="Submissions in flight at once"
+    ),
+    rate: Optional[float] = typer.Option(None, "--rate", min=0.01, help="Max submissions per second"),
+    ledger: Optional[Path] = typer.Option(
+        None, "--ledger", help="Launch ledger for resuming (default: <file>.launched.jsonl)"
+    ),
+    fmt: str = typer.Option("table", "--output", "-o", help="Output format: table|json"),
+):
+    """Launch a sweep of jobs from a JSON-lines spec file.
+
+    Each line is a JSON object of job fields (image, command, gpu_type,
+    gpu_count, region, env, tags, ...), optionally with an idempotency_key.
+    Launched jobs are recorded in the ledger; rerunning the same file skips
+    them, so an interrupted sweep can simply be restarted.
+
+    Examples:
+        hyper jobs launch --from sweep.jsonl -j 16 --rate 5
+    """
+    import json
+
+    specs = []
+    for number, line in enumerate(spec_file.read_text().splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            spec = json.loads(line)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {spec_file}:{number}: invalid JSON ({e})")
+            raise typer.Exit(1)
+        if not isinstance(spec, dict):
+            console.print(f"[red]Error:[/red] {spec_file}:{number}: expected a JSON object")
+            raise typer.Exit(1)
+        specs.append(spec)
+    if not specs:
+        console.print(f"[yellow]No job specs in {spec_file}[/yellow]")
+        return
+
+    ledger_path = ledger or spec_file.with_name(f"{spec_file.name}.launched.jsonl")
+    client = get_client()
+
+    def report(item):
+        if fmt == "json":
+            return
+        if item.resumed:
+            console.print(f"[dim]= {item.job_id} (already launched)[/dim]")
+        elif item.ok:
+            console.print(f"[green]✓[/green] {item.job_id}")
+        else:
+            console.print(f"[red]✗ {item.key[:12]}: {item.error}[/red]")
+
+    try:
+        items = client.jobs.create_many(
+            specs, concurrency=concurrency, rate_limit=rate, ledger=ledger_path, on_result=report
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    failed = [item for item in items if not item.ok]
+    if fmt == "json":
+        output(
+            [
+                {
+                    "idempotency_key": item.key,
+                    "job_id": item.job_id,
+                    "resumed": item.resumed,
+                    "error": str(item.error) if item.error else None,
+                }
+                for item in items
+            ],
+            "json",
+        )
+    else:
+        resumed = sum(1 for item in items if item.resumed)
+        console.print(
+            f"[bold]{len(items)} spec(s):[/bold] {len(items) - len(failed) - resumed} launched, "
+            f"{resumed} already launched, {len(failed)} failed [dim](ledger: {ledger_path})[/dim]"
+        )
+    if failed:
+        raise typer.Exit(1)
+
+
 @app.command("get")
 def get_job(
     job_id: str = typer.Argument(..., help="Job ID"),
@@ -96,28 +213,95 @@ def get_job(
 
 @app.command("logs")
 def logs(
-    job_id: str = typer.Argument(..., help="Job ID"),
+    job_ids: Optional[list[str]] = typer.Argument(None, help="Job ID(s); several require --follow"),
     follow: bool = typer.Option(False, "--follow", "-f", help="Stream logs via WebSocket"),
     tail: int = typer.Option(None, "--tail", "-n", help="Show last N lines"),
+    tag: list[str] = typer.Option(
+        [], "--tag", help="With --follow: also follow active jobs tagged KEY=VALUE", metavar="KEY=VALUE"
+    ),
     tui: bool = typer.Option(False, "--tui", help="Interactive TUI with metrics"),
     cancel_on_exit: bool = typer.Option(False, "--cancel-on-exit", help="Cancel job when exiting with Ctrl+C (with --tui)"),
+    archive_dir: Optional[Path] = typer.Option(
+        None, "--archive", help="Also write lines to rotating gzip files in DIR", metavar="DIR"
+    ),
+    grep: Optional[str] = typer.Option(None, "--grep", "-g", help="Only show lines matching this regex"),
+    ignore_case: bool = typer.Option(False, "--ignore-case", "-i", help="Case-insensitive --grep"),
+    level: Optional[str] = typer.Option(
+        None, "--level", help="Only show lines at or above this level (debug, info, warning, error)"
+    ),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Only show lines stamped after a duration ago (10m, 2h) or time"
+    ),
 ):
-    """Get job logs"""
+    """Get job logs
+
+    Following several jobs (or every active job with a tag) merges their
+    output into one stream, each line prefixed with its job ID. --archive
+    keeps a timestamped, compressed copy of every line on disk. --grep,
+    --level and --since filter what is shown (the archive keeps everything).
+
+    Examples:
+        hyper jobs logs <job_id> --follow
+        hyper jobs logs --follow <job_a> <job_b> --tag team=ml
+        hyper jobs logs --follow --tag sweep=7 --archive ./sweep-logs
+        hyper jobs logs <job_id> --grep 'CUDA|NCCL' --since 10m
+    """
     client = get_client()
-    job_id = _resolve_job_id(client, job_id)
+    job_ids = list(job_ids or [])
+    line_filter = _build_log_filter(grep, ignore_case, level, since)
+    if tui and (archive_dir is not None or line_filter is not None):
+        console.print("[red]Error:[/red] --archive, --grep, --level and --since cannot be used with --tui.")
+        raise typer.Exit(1)
+    archive = _open_log_archive(archive_dir)
+
+    if tag or len(job_ids) > 1:
+        if not follow or tui:
+            console.print("[red]Error:[/red] Multiple jobs and --tag require --follow (without --tui).")
+            raise typer.Exit(1)
+        resolved = [_resolve_job_id(client, job_id) for job_id in job_ids]
+        if tag:
+            from hypercli.jobs import TERMINAL_JOB_STATES
+
+            with spinner("Finding jobs..."):
+                resolved.extend(
+                    job.job_id
+                    for job in client.jobs.iter_all(tags=_parse_tags(tag))
+                    if (job.state or "").lower() not in TERMINAL_JOB_STATES
+                )
+        resolved = list(dict.fromkeys(resolved))
+        if not resolved:
+            console.print("[yellow]No active jobs match.[/yellow]")
+            return
+        _stream_many_logs(resolved, tail=tail, archive=archive, line_filter=line_filter)
+        return
+
+    if not job_ids:
+        console.print("[red]Error:[/red] Missing job ID.")
+        raise typer.Exit(1)
+    job_id = _resolve_job_id(client, job_ids[0])
 
     if tui:
         _follow_job(job_id, cancel_on_exit=cancel_on_exit)
     elif follow:
-        _stream_logs(job_id)
+        _stream_logs(job_id, archive=archive, line_filter=line_filter)
     else:
-        logs_str = client.jobs.logs(job_id)
-        if not logs_str:
+        # With a filter, --tail counts matching lines, so fetch the whole log
+        fetch_tail = None if line_filter is not None else tail or None
+        lines = client.jobs.log_chunk(job_id, tail=fetch_tail).lines
+        if archive is not None:
+            with archive:
+                for line in lines:
+                    archive.write(line, source=job_id)
+        if not lines:
             print("(no logs)")
             return
-        lines = logs_str.rstrip("\n").split("\n")
-        if tail:
-            lines = lines[-tail:]
+        if line_filter is not None:
+            lines = line_filter.apply(lines, source=job_id)
+            if tail:
+                lines = lines[-tail:]
+            if not lines:
+                print("(no matching lines)")
+                return
         for line in lines:
             print(line)
 
@@ -234,7 +418,34 @@ def _make_bar(value: float, max_val: float, warn: float = None, crit: float = No
     return f"[{color}]{bar}[/{color}]"
 
 
-def _stream_logs(job_id: str):
+def _build_log_filter(
+    grep: Optional[str], ignore_case: bool, level: Optional[str], since: Optional[str]
+):
+    if grep is None and level is None and since is None:
+        return None
+    import re
+    from hypercli import LogFilter
+
+    try:
+        return LogFilter(grep, ignore_case=ignore_case, min_level=level, since=since)
+    except (ValueError, re.error) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _open_log_archive(directory: Optional[Path]):
+    if directory is None:
+        return None
+    from hypercli import LogArchive
+
+    try:
+        return LogArchive(directory, name="jobs")
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Cannot archive to {directory}: {e}")
+        raise typer.Exit(1)
+
+
+def _stream_logs(job_id: str, archive=None, line_filter=None):
     """Stream logs via WebSocket (like tail -f)"""
     import asyncio
     from hypercli import stream_logs
@@ -249,6 +460,8 @@ def _stream_logs(job_id: str):
                 on_line=lambda line: print(line),
                 fetch_initial=True,
                 fetch_final=True,
+                archive=archive,
+                line_filter=line_filter,
             )
         except KeyboardInterrupt:
             pass
@@ -259,6 +472,36 @@ def _stream_logs(job_id: str):
         pass
 
 
+def _stream_many_logs(
+    job_ids: list[str], tail: Optional[int] = None, archive=None, line_filter=None
+):
+    """Follow several jobs at once through one LogHub, prefixing each line."""
+    import asyncio
+    from hypercli import LogHub
+    from hypercli.logs import DEFAULT_MAX_INITIAL_LINES
+
+    client = get_client()
+    hub = LogHub(
+        client,
+        job_ids,
+        max_initial_lines=tail or DEFAULT_MAX_INITIAL_LINES,
+        archive=archive,
+        line_filter=line_filter,
+    )
+    console.print(f"[dim]Following {len(job_ids)} job(s)...[/dim]")
+
+    def on_event(event):
+        if event.line is not None:
+            print(f"[{event.job_id[:8]}] {event.line}", flush=True)
+        else:
+            console.print(f"[dim]\\[{event.job_id[:8]}] state: {event.state}[/dim]")
+
+    try:
+        asyncio.run(hub.run(on_event))
+    except KeyboardInterrupt:
+        pass
+
+
 def _follow_job(job_id: str, cancel_on_exit: bool = False):
     """Follow job with TUI"""
     from .tui.job_monitor import run_job_monitor
@@ -433,23 +676,64 @@ def _render_metrics(m):
 
 @app.command("exec")
 def exec_command(
-    job_id: str = typer.Argument(..., help="Job ID (full or prefix)"),
-    command: list[str] = typer.Argument(..., help="Executable followed by arguments"),
+    job_id: Optional[str] = typer.Argument(None, help="Job ID (full or prefix); omit with --all"),
+    command: Optional[list[str]] = typer.Argument(None, help="Executable followed by arguments"),
     timeout: int = typer.Option(
         30, "--timeout", "-t", min=1, max=300, help="Timeout in seconds"
     ),
+    all_jobs: bool = typer.Option(False, "--all", help="Run on every job matching --state/--tag"),
+    state: str = typer.Option("running", "--state", "-s", help="Job state to target with --all"),
+    tag: list[str] = typer.Option([], "--tag", help="With --all: filter by tag as KEY=VALUE", metavar="KEY=VALUE"),
+    concurrency: int = typer.Option(
+        DEFAULT_EXEC_CONCURRENCY, "--concurrency", "-j", min=1, help="Commands in flight at once with --all"
+    ),
+    target_timeout: Optional[float] = typer.Option(
+        None, "--target-timeout", min=1, help="Per-job wall-clock limit with --all (default: timeout + 15s)"
+    ),
 ):
     """Execute a command non-interactively on a running job container.
 
     Runs the command and returns stdout/stderr. For interactive shells, use 'hyper jobs shell'.
+    With --all, runs on every matching job concurrently, prints each job's
+    output as it finishes, and exits non-zero unless every job exited 0.
 
     Examples:
         hyper jobs exec <job_id> nvidia-smi
         hyper jobs exec <job_id> --timeout 10 ps aux
+        hyper jobs exec --all --tag team=ml -- nvidia-smi -L
     """
     import sys
 
     client = get_client()
+    if all_jobs:
+        argv = [job_id, *(command or [])] if job_id else list(command or [])
+        if not argv:
+            console.print("[red]Error:[/red] Missing command to run.")
+            raise typer.Exit(1)
+        tags = _parse_tags(tag) if tag else None
+        with spinner("Finding jobs..."):
+            job_ids = [job.job_id for job in client.jobs.iter_all(state=state, tags=tags)]
+        if not job_ids:
+            console.print(f"[yellow]No {state} jobs match.[/yellow]")
+            return
+        console.print(f"[dim]Running on {len(job_ids)} job(s), {concurrency} at a time...[/dim]")
+        try:
+            results = client.jobs.exec_many(
+                job_ids, argv, timeout=timeout, concurrency=concurrency, target_timeout=target_timeout
+            )
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+        if not exec_fan_out(results, label=lambda target: target[:8]):
+            raise typer.Exit(1)
+        return
+
+    if tag:
+        console.print("[red]Error:[/red] --tag requires --all.")
+        raise typer.Exit(1)
+    if not job_id or not command:
+        console.print("[red]Error:[/red] Expected a job ID and a command, or --all.")
+        raise typer.Exit(1)
     job_id = _resolve_job_id(client, job_id)
 
     with spinner("Executing command..."):
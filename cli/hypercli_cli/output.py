@@ -4,6 +4,7 @@ from datetime import date, datetime
 import json as json_lib
 from typing import Any
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 from rich import print_json
 
@@ -94,3 +95,37 @@ def success(msg: str):
 def spinner(msg: str = "Loading..."):
     """Context manager for showing a spinner during slow operations"""
     return console.status(f"[bold cyan]{msg}[/bold cyan]", spinner="dots")
+
+
+def exec_fan_out(items, label=lambda target: target) -> bool:
+    """Print ``exec_many`` results as they arrive, then an exit-code summary.
+
+    Remote output lines are prefixed with the target label. Returns True when
+    every target exited 0.
+    """
+    import sys
+    from hypercli import ExecSummary
+
+    seen = []
+    for item in items:
+        seen.append(item)
+        name = label(item.target)
+        if item.error is not None:
+            console.print(f"[red]✗ {escape(name)}: {escape(str(item.error))}[/red]")
+            continue
+        for stream, text in ((sys.stdout, item.result.stdout), (sys.stderr, item.result.stderr)):
+            for line in (text or "").splitlines():
+                stream.write(f"[{name}] {line}\n")
+            stream.flush()
+        mark = "[green]✓[/green]" if item.ok else "[red]✗[/red]"
+        console.print(f"{mark} {escape(name)}: exit {item.exit_code} ({item.elapsed:.1f}s)")
+
+    summary = ExecSummary.from_items(seen)
+    codes = ", ".join(
+        f"exit {code}: {count}" for code, count in summary.exit_codes.items() if code != 0
+    )
+    console.print(
+        f"[bold]{summary.total} target(s):[/bold] {summary.succeeded} ok, "
+        f"{summary.failed} failed{f' ({codes})' if codes else ''}, {summary.errors} error(s)"
+    )
+    return summary.ok
@@ -59,3 +59,42 @@ def test_agents_list_passes_all_server_filters(monkeypatch):
         "query": "agent-id-prefix",
         "include_deleted": True,
     }]
+
+
+def test_agents_ls_watch_filters_a_live_fleet_mirror(monkeypatch):
+    import hypercli.fleet as fleet_module
+    from hypercli.agents import Agent
+
+    shown = []
+    fleet = [
+        Agent(id="a-1", user_id="u", state="RUNNING", name="alpha"),
+        Agent(id="b-2", user_id="u", state="STOPPED", name="beta"),
+    ]
+
+    class FakeMirror:
+        def __init__(self, deployments, *, include_deleted=False):
+            assert include_deleted is False
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_exc_info):
+            return None
+
+        def add_listener(self, _listener):
+            return lambda: None
+
+        def filter(self, keep):
+            shown.append([agent.id for agent in fleet if keep(agent)])
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(agents_module, "_get_deployments_client", lambda: object())
+    monkeypatch.setattr(fleet_module, "FleetMirror", FakeMirror)
+
+    result = runner.invoke(app, ["agents", "ls", "--watch", "--state", "running"])
+
+    assert result.exit_code == 0
+    assert shown == [["a-1"]]
+
+    rejected = runner.invoke(app, ["agents", "ls", "--watch", "--json"])
+    assert rejected.exit_code == 1
@@ -83,3 +83,67 @@ def test_agents_metrics_reports_sdk_failure(monkeypatch):
     assert result.exit_code == 1
     assert "Failed to get agent metrics" in result.stdout
     assert "Agent is not running" in result.stdout
+
+
+def test_agents_top_samples_running_agents_and_exports_csv(monkeypatch, tmp_path):
+    from hypercli.agents import Agent
+
+    usage = {"a-1": ("25m", "128Mi"), "b-2": ("1500m", "64Mi"), "c-3": ("900m", "2Gi")}
+
+    class FakeDeployments:
+        def list(self, state=None):
+            assert state == "RUNNING"
+            return [
+                Agent(id=agent_id, user_id="u", name=f"web-{agent_id}", state="RUNNING")
+                for agent_id in ("a-1", "b-2")
+            ] + [Agent(id="c-3", user_id="u", name="db-c-3", state="RUNNING")]
+
+        def metrics(self, agent_id):
+            cpu, memory = usage[agent_id]
+            return {"event": "agent_metrics_result", "ok": True, "cpu": cpu, "memory": memory}
+
+    monkeypatch.setattr(agents_module, "_get_deployments_client", lambda: FakeDeployments())
+    export = tmp_path / "samples.csv"
+
+    result = runner.invoke(
+        app,
+        [
+            "agents", "top", "--selector", "name=web-*", "--sort", "cpu",
+            "--rounds", "2", "--interval", "0.5", "--export", str(export),
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.index("b-2") < result.stdout.index("a-1")
+    assert "1.50" in result.stdout and "128.0Mi" in result.stdout
+    assert "c-3" not in result.stdout
+    lines = export.read_text().splitlines()
+    assert lines[0] == "agent_id,timestamp,cpu_cores,memory_bytes"
+    assert len(lines) == 5
+
+
+def test_agents_top_rejects_unknown_sort_key(monkeypatch):
+    monkeypatch.setattr(agents_module, "_get_deployments_client", lambda: object())
+
+    result = runner.invoke(app, ["agents", "top", "--sort", "disk"])
+
+    assert result.exit_code == 1
+    assert "--sort must be one of: cpu, memory" in result.stdout
+
+
+def test_agents_top_names_agents_found_by_rediscovery(monkeypatch):
+    from hypercli.agents import Agent
+
+    class FakeDeployments:
+        def list(self, state=None):
+            return [Agent(id="n-9", user_id="u", name="fresh-agent", state="RUNNING")]
+
+        def metrics(self, agent_id):
+            return {"event": "agent_metrics_result", "ok": True, "cpu": "10m", "memory": "1Mi"}
+
+    monkeypatch.setattr(agents_module, "_get_deployments_client", lambda: FakeDeployments())
+
+    result = runner.invoke(app, ["agents", "top", "--rounds", "1"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "fresh-agent" in result.stdout
@@ -8,6 +8,7 @@ from hypercli.agents import (
     DEFAULT_HERMES_AGENT_IMAGE,
     DEFAULT_OPENCLAW_PRO_IMAGE,
 )
+from hypercli.file_sync import FileSyncAction, FileSyncPlan
 from typer.testing import CliRunner
 
 from hypercli_cli import agents as agents_module
@@ -246,7 +247,7 @@ def test_agents_logs_defaults_to_websocket_and_forwards_no_follow(monkeypatch):
     called = {}
 
     class FakeDeployments:
-        async def logs_stream_ws(self, agent_id, tail_lines=100, follow=True):
+        async def logs_stream_ws(self, agent_id, tail_lines=100, follow=True, archive=None):
             called.update(
                 agent_id=agent_id,
                 tail_lines=tail_lines,
@@ -932,6 +933,67 @@ def test_agents_cp_reports_directory_path_error(monkeypatch, tmp_path):
     assert "Copy expects a file path, not a directory." in result.stdout
 
 
+def test_agents_cp_recursive_forces_full_tree_copy(monkeypatch, tmp_path):
+    calls = []
+
+    class FakeDeployments:
+        def sync_to(self, pod, local_dir, remote_dir, **options):
+            calls.append((pod.id, local_dir, remote_dir, options))
+            return FileSyncPlan(
+                direction="upload",
+                actions=[FileSyncAction("a.txt", "a.txt", "proj/a.txt", 3, "forced")],
+            )
+
+    monkeypatch.setattr("hypercli_cli.agents._get_deployments_client", lambda: FakeDeployments())
+    monkeypatch.setattr("hypercli_cli.agents._get_agent_with_token", lambda agent_id: SimpleNamespace(id=agent_id))
+    monkeypatch.setattr("hypercli_cli.agents._resolve_agent", lambda agent_id: agent_id)
+
+    result = runner.invoke(
+        app, ["agents", "cp", "-r", "-j", "4", str(tmp_path), "agent-xyz:proj"]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert calls == [
+        (
+            "agent-xyz",
+            str(tmp_path),
+            "proj",
+            {"force": True, "checksum": False, "dry_run": False, "concurrency": 4},
+        )
+    ]
+    assert "Transferred 1 file(s)" in result.stdout
+
+
+def test_agents_sync_dry_run_prints_plan(monkeypatch, tmp_path):
+    calls = []
+
+    class FakeDeployments:
+        def sync_from(self, pod, remote_dir, local_dir, **options):
+            calls.append((pod.id, remote_dir, local_dir, options))
+            return FileSyncPlan(
+                direction="download",
+                actions=[
+                    FileSyncAction("new.txt", "proj/new.txt", "out/new.txt", 10, "missing"),
+                    FileSyncAction("same.txt", "proj/same.txt", "out/same.txt", 4, "unchanged"),
+                ],
+                dry_run=True,
+            )
+
+    monkeypatch.setattr("hypercli_cli.agents._get_deployments_client", lambda: FakeDeployments())
+    monkeypatch.setattr("hypercli_cli.agents._get_agent_with_token", lambda agent_id: SimpleNamespace(id=agent_id))
+    monkeypatch.setattr("hypercli_cli.agents._resolve_agent", lambda agent_id: agent_id)
+
+    result = runner.invoke(
+        app, ["agents", "sync", "agent-xyz:proj", str(tmp_path), "--dry-run", "--checksum"]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert calls[0][3] == {"force": False, "checksum": True, "dry_run": True, "concurrency": 8}
+    assert "new.txt" in result.stdout
+    assert "missing" in result.stdout
+    assert "Would transfer 1 file(s) (10 bytes), 1 unchanged" in result.stdout
+
+
 def test_agents_cp_rejects_oversized_local_file(monkeypatch, tmp_path):
     source = tmp_path / "big.bin"
     with source.open("wb") as f:
@@ -1004,6 +1066,112 @@ def test_agents_stop_waits_for_stopped(monkeypatch):
     assert "Agent stopped" in result.output
 
 
+def test_agents_stop_selector_runs_bulk_on_live_matching_agents(monkeypatch):
+    from hypercli.agents import Agent, BulkItem
+
+    calls = []
+    fleet = [
+        Agent(id="agent-web-1", user_id="u", state="RUNNING", name="web-1"),
+        Agent(id="agent-web-2", user_id="u", state="STOPPED", name="web-2"),
+        Agent(id="agent-web-3", user_id="u", state="STARTING", name="web-3"),
+        Agent(id="agent-db-1", user_id="u", state="RUNNING", name="db-1"),
+    ]
+
+    class FakeDeployments:
+        def list(self):
+            return fleet
+
+        def bulk(self, operation, pods, **kwargs):
+            calls.append((operation, [pod.id for pod in pods], kwargs))
+            return [
+                BulkItem("agent-web-1", operation, agent=Agent(id="agent-web-1", user_id="u", state="STOPPED")),
+                BulkItem("agent-web-3", operation, error=RuntimeError("Agent entered FAILED")),
+            ]
+
+    saved = []
+    monkeypatch.setattr(agents_module, "_get_deployments_client", lambda: FakeDeployments())
+    monkeypatch.setattr(agents_module, "_save_agent_state", lambda agent: saved.append(agent.id))
+
+    result = runner.invoke(
+        app,
+        ["agents", "stop", "--selector", "name=web-*", "--force", "--wait", "-j", "8"],
+    )
+
+    assert result.exit_code == 1
+    assert calls == [(
+        "stop",
+        ["agent-web-1", "agent-web-3"],
+        {"concurrency": 8, "wait": True, "timeout": 900.0, "launch_config": None},
+    )]
+    assert saved == ["agent-web-1"]
+    assert "Agent entered FAILED" in result.output
+    assert "1 ok, 1 failed" in result.output
+
+    both = runner.invoke(app, ["agents", "stop", "agent-web-1", "--all"])
+    assert both.exit_code == 1
+    assert "not both" in both.output
+
+
+def test_agents_start_all_confirms_and_uses_saved_launch_configs(monkeypatch):
+    from hypercli.agents import Agent, BulkItem
+
+    calls = []
+    fleet = [
+        Agent(id="agent-a", user_id="u", state="STOPPED", name="a", launch_config={"image": "stored"}),
+        Agent(id="agent-b", user_id="u", state="RUNNING", name="b"),
+        Agent(id="agent-c", user_id="u", state="ARCHIVED", name="c", launch_config={"image": "stored"}),
+    ]
+
+    class FakeDeployments:
+        def list(self):
+            return fleet
+
+        def bulk(self, operation, pods, **kwargs):
+            calls.append((operation, [pod.id for pod in pods], kwargs))
+            return [
+                BulkItem(pod.id, operation, agent=Agent(id=pod.id, user_id="u", state="RUNNING"))
+                for pod in pods
+            ]
+
+    def load_launch_config(agent_id):
+        if agent_id == "agent-a":
+            return {"image": "saved"}
+        raise ValueError("no saved launch config")
+
+    monkeypatch.setattr(agents_module, "_get_deployments_client", lambda: FakeDeployments())
+    monkeypatch.setattr(agents_module, "_save_agent_state", lambda agent: None)
+    monkeypatch.setattr(agents_module, "_load_complete_launch_config", load_launch_config)
+
+    declined = runner.invoke(app, ["agents", "start", "--all"], input="n\n")
+
+    assert declined.exit_code == 0
+    assert "Start 2 agent(s)?" in declined.output
+    assert calls == []
+
+    result = runner.invoke(app, ["agents", "start", "--all", "--no-wait"], input="y\n")
+
+    assert result.exit_code == 0, result.output
+    [(operation, targets, kwargs)] = calls
+    assert (operation, targets) == ("start", ["agent-a", "agent-c"])
+    assert (kwargs["wait"], kwargs["concurrency"]) == (False, 16)
+    assert [kwargs["launch_config"](pod) for pod in (fleet[0], fleet[2])] == [
+        {"image": "saved"},
+        {"image": "stored"},
+    ]
+    assert "2 ok, 0 failed" in result.output
+
+
+def test_agents_start_all_rejects_launch_overrides(monkeypatch):
+    monkeypatch.setattr(agents_module, "_get_deployments_client", lambda: pytest.fail("listed agents"))
+
+    result = runner.invoke(
+        app, ["agents", "start", "--all", "--force", "--image", "custom:latest", "--env", "A=1"]
+    )
+
+    assert result.exit_code == 1
+    assert "does not accept overrides: --env, --image" in result.output
+
+
 def test_agents_restore_posts_bodyless_via_sdk(monkeypatch):
     calls: list[str] = []
 
@@ -1034,3 +1202,194 @@ def test_agents_list_uses_transitional_and_terminal_state_colors():
     assert agents_module._agent_state_style("STOPPED") == "dim"
     assert agents_module._agent_state_style("ARCHIVED") == "dim"
     assert agents_module._agent_state_style("FAILED") == "red"
+
+
+def test_jobs_exec_all_fans_out_to_tagged_jobs(monkeypatch):
+    from hypercli.exec_batch import ExecBatchItem
+
+    captured = {}
+
+    class FakeJobs:
+        def iter_all(self, state=None, tags=None):
+            captured["filter"] = (state, tags)
+            return [SimpleNamespace(job_id="aaaaaaaa-1"), SimpleNamespace(job_id="bbbbbbbb-2")]
+
+        def exec_many(self, job_ids, command, timeout=30, concurrency=16, target_timeout=None):
+            captured["exec"] = (job_ids, command, concurrency)
+            yield ExecBatchItem("aaaaaaaa-1", result=SimpleNamespace(stdout="fixed\n", stderr="", exit_code=0))
+            yield ExecBatchItem("bbbbbbbb-2", result=SimpleNamespace(stdout="", stderr="nope\n", exit_code=3))
+
+    monkeypatch.setattr("hypercli_cli.jobs.get_client", lambda: SimpleNamespace(jobs=FakeJobs()))
+
+    result = runner.invoke(
+        app, ["jobs", "exec", "--all", "--tag", "team=ml", "-j", "4", "--", "git", "pull"]
+    )
+
+    assert result.exit_code == 1
+    assert captured["filter"] == ("running", ["team=ml"])
+    assert captured["exec"] == (["aaaaaaaa-1", "bbbbbbbb-2"], ["git", "pull"], 4)
+    assert "[aaaaaaaa] fixed" in result.stdout
+    assert "1 ok, 1 failed (exit 3: 1)" in result.stdout
+
+
+def test_agents_exec_all_labels_results_by_agent_name(monkeypatch):
+    from hypercli.exec_batch import ExecBatchItem
+
+    pods = [SimpleNamespace(id="agent-1", name="alpha"), SimpleNamespace(id="agent-2", name="beta")]
+    listed = []
+
+    class FakeDeployments:
+        def list(self, state=None):
+            listed.append(state)
+            return pods
+
+        def exec_many(self, targets, command, timeout=30, concurrency=16, target_timeout=None):
+            assert targets == pods
+            assert command == ["uptime"]
+            for pod in targets:
+                yield ExecBatchItem(pod.id, result=SimpleNamespace(stdout="up\n", stderr="", exit_code=0))
+
+    monkeypatch.setattr(agents_module, "_get_deployments_client", lambda: FakeDeployments())
+
+    result = runner.invoke(app, ["agents", "exec", "--all", "uptime"])
+
+    assert result.exit_code == 0
+    assert "[alpha] up" in result.stdout
+    assert "[beta] up" in result.stdout
+    assert "2 ok, 0 failed, 0 error(s)" in result.stdout
+
+    result = runner.invoke(app, ["agents", "exec", "--all", "--state", "stopped", "uptime"])
+
+    assert result.exit_code == 0
+    assert listed == ["RUNNING", "STOPPED"]
+
+
+def test_exec_fan_out_prints_errors_without_markup():
+    from hypercli.exec_batch import ExecBatchItem
+
+    from hypercli_cli.output import console, exec_fan_out
+
+    items = [ExecBatchItem("agent-1", error=OSError("cannot open [/tmp/x]"))]
+
+    with console.capture() as capture:
+        assert exec_fan_out(items, label=lambda target: "[bold]alpha") is False
+
+    assert "✗ [bold]alpha: cannot open [/tmp/x]" in capture.get()
+
+
+def test_jobs_launch_from_sweep_file_uses_default_ledger(monkeypatch, tmp_path):
+    from hypercli.jobs import JobBatchItem
+
+    sweep = tmp_path / "sweep.jsonl"
+    sweep.write_text('{"image": "pytorch", "env": {"LR": "1"}}\n\n{"image": "pytorch", "env": {"LR": "2"}}\n')
+    captured = {}
+
+    class FakeJobs:
+        def create_many(self, specs, concurrency=8, rate_limit=None, ledger=None, on_result=None):
+            captured.update(specs=specs, concurrency=concurrency, rate_limit=rate_limit, ledger=ledger)
+            items = [
+                JobBatchItem("k1", specs[0], job_id="job-1", resumed=True),
+                JobBatchItem("k2", specs[1], job=SimpleNamespace(), job_id="job-2"),
+            ]
+            for item in items:
+                on_result(item)
+            return items
+
+    monkeypatch.setattr("hypercli_cli.jobs.get_client", lambda: SimpleNamespace(jobs=FakeJobs()))
+
+    result = runner.invoke(app, ["jobs", "launch", "--from", str(sweep), "-j", "4", "--rate", "2"])
+
+    assert result.exit_code == 0, result.stdout
+    assert [spec["env"]["LR"] for spec in captured["specs"]] == ["1", "2"]
+    assert (captured["concurrency"], captured["rate_limit"]) == (4, 2.0)
+    assert captured["ledger"] == tmp_path / "sweep.jsonl.launched.jsonl"
+    assert "1 launched, 1 already launched, 0 failed" in result.stdout
+
+
+def test_jobs_logs_follow_merges_explicit_and_tagged_jobs(monkeypatch):
+    from hypercli.logs import LogEvent
+
+    captured = {}
+
+    class FakeJobs:
+        def iter_all(self, tags=None):
+            captured["tags"] = tags
+            return [
+                SimpleNamespace(job_id="cccccccc-3", state="running"),
+                SimpleNamespace(job_id="dddddddd-4", state="succeeded"),
+                SimpleNamespace(job_id="aaaaaaaa-1", state="running"),
+            ]
+
+    class FakeHub:
+        def __init__(self, client, job_ids, max_initial_lines=1000, archive=None, line_filter=None):
+            captured["job_ids"] = job_ids
+
+        async def run(self, on_event):
+            on_event(LogEvent("aaaaaaaa-1", line="epoch 1"))
+            on_event(LogEvent("cccccccc-3", state="succeeded"))
+
+    monkeypatch.setattr("hypercli_cli.jobs.get_client", lambda: SimpleNamespace(jobs=FakeJobs()))
+    monkeypatch.setattr("hypercli_cli.jobs._resolve_job_id", lambda client, job_id: job_id)
+    monkeypatch.setattr("hypercli.LogHub", FakeHub)
+
+    result = runner.invoke(
+        app, ["jobs", "logs", "--follow", "aaaaaaaa-1", "bbbbbbbb-2", "--tag", "team=ml"]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert captured["tags"] == ["team=ml"]
+    assert captured["job_ids"] == ["aaaaaaaa-1", "bbbbbbbb-2", "cccccccc-3"]
+    assert "[aaaaaaaa] epoch 1" in result.stdout
+    assert "[cccccccc] state: succeeded" in result.stdout
+
+
+def test_jobs_logs_archive_writes_fetched_lines(monkeypatch, tmp_path):
+    from hypercli.jobs import LogChunk
+    from hypercli.log_archive import read_archive
+
+    class FakeJobs:
+        def log_chunk(self, job_id, tail=None):
+            return LogChunk(["boot", "ready"], 0, 2)
+
+    monkeypatch.setattr("hypercli_cli.jobs.get_client", lambda: SimpleNamespace(jobs=FakeJobs()))
+    monkeypatch.setattr("hypercli_cli.jobs._resolve_job_id", lambda client, job_id: job_id)
+
+    result = runner.invoke(app, ["jobs", "logs", "job-a", "--archive", str(tmp_path)])
+
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout == "boot\nready\n"
+    records = read_archive(tmp_path / "jobs-00001.jsonl.gz")
+    assert [(r["source"], r["line"]) for r in records] == [("job-a", "boot"), ("job-a", "ready")]
+
+
+def test_jobs_logs_grep_fetches_whole_log_and_tails_matches(monkeypatch):
+    from hypercli.jobs import LogChunk
+
+    captured = {}
+
+    class FakeJobs:
+        def log_chunk(self, job_id, tail=None):
+            captured["tail"] = tail
+            return LogChunk(["step 1 loss", "NCCL warn a", "step 2 loss", "nccl warn b"], 0, 4)
+
+    monkeypatch.setattr("hypercli_cli.jobs.get_client", lambda: SimpleNamespace(jobs=FakeJobs()))
+    monkeypatch.setattr("hypercli_cli.jobs._resolve_job_id", lambda client, job_id: job_id)
+
+    result = runner.invoke(app, ["jobs", "logs", "job-a", "--grep", "nccl", "-i", "--tail", "1"])
+
+    assert result.exit_code == 0, result.stdout
+    assert captured["tail"] is None
+    assert result.stdout == "nccl warn b\n"
+
+    result = runner.invoke(app, ["jobs", "logs", "job-a", "--since", "soon"])
+    assert result.exit_code == 1
+    assert "invalid time" in result.stdout
+
+
+def test_jobs_logs_multiple_jobs_require_follow(monkeypatch):
+    monkeypatch.setattr("hypercli_cli.jobs.get_client", lambda: SimpleNamespace(jobs=None))
+
+    result = runner.invoke(app, ["jobs", "logs", "job-a", "job-b"])
+
+    assert result.exit_code == 1
+    assert "require --follow" in result.stdout
@@ -0,0 +1,69 @@
+from typer.testing import CliRunner
+
+from hypercli.files import File
+from hypercli_cli.cli import app
+
+
+runner = CliRunner()
+
+
+def _file(size: int) -> File:
+    return File(
+        id="file-123",
+        user_id="user-1",
+        filename="clip.mp4",
+        content_type="video/mp4",
+        file_size=size,
+        url="s3://bucket/clip.mp4",
+        state="done",
+    )
+
+
+class _FakeFiles:
+    def __init__(self):
+        self.calls = []
+
+    def upload(self, file_path, *, progress=None):
+        self.calls.append(("upload", file_path, None, None))
+        progress(10, 10)
+        return _file(10)
+
+    def upload_resumable(self, file_path, *, part_size, concurrency, progress=None):
+        self.calls.append(("upload_resumable", file_path, part_size, concurrency))
+        progress(part_size, part_size)
+        return _file(part_size)
+
+
+def _install(monkeypatch) -> _FakeFiles:
+    import hypercli_cli.files as files
+
+    fake = _FakeFiles()
+
+    class _FakeClient:
+        files = fake
+
+    monkeypatch.setattr(files, "_get_client", lambda: _FakeClient())
+    return fake
+
+
+def test_files_upload_small_file_uses_single_streamed_upload(monkeypatch, tmp_path):
+    fake = _install(monkeypatch)
+    source = tmp_path / "image.png"
+    source.write_bytes(b"x" * 10)
+
+    result = runner.invoke(app, ["files", "upload", str(source)])
+
+    assert result.exit_code == 0, result.stdout
+    assert fake.calls == [("upload", str(source), None, None)]
+    assert "file-123" in result.stdout
+
+
+def test_files_upload_large_file_uses_resumable_parts(monkeypatch, tmp_path):
+    fake = _install(monkeypatch)
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"x" * (5 * 1024 * 1024))
+
+    result = runner.invoke(app, ["files", "upload", str(source), "--part-size", "5", "-j", "2"])
+
+    assert result.exit_code == 0, result.stdout
+    assert fake.calls == [("upload_resumable", str(source), 5 * 1024 * 1024, 2)]
@@ -21,12 +21,17 @@ from .config import (
     get_agents_api_base_url,
     get_agents_ws_url,
 )
+from .exec_batch import ExecBatchItem, ExecSummary
 from .http import APIError, AsyncHTTPClient
 from .instances import GPUType, GPUConfig, Region, GPUPricing, PricingTier
+from .job_index import JobIndex
 from .jobs import (
+    AsyncJobs,
     Job,
+    JobBatchItem,
     JobListPage,
     JobMetrics,
+    LogChunk,
     GPUMetrics,
     find_job,
     find_by_id,
@@ -36,7 +41,7 @@ from .jobs import (
     job_has_tags,
     normalize_job_tags,
 )
-from .renders import Render, RenderStatus
+from .renders import AsyncRenders, Render, RenderStatus
 from .voice import VoiceAPI
 from .voice_stream import VoiceChunk, VoiceSession, VoiceStreamError
 from .models import Model, ModelsAPI
@@ -55,10 +60,22 @@ from .workspaces import (
     WorkspacesAPI,
 )
 from .x402 import X402Client, X402JobLaunch, X402FlowCreate, X402RenderCreate, FlowCatalogItem
-from .files import File, AsyncFiles
+from .files import File, AsyncFiles, FileBatchItem
+from .upload_cache import UploadCache
+from .rate_limit import TokenBucket
 from .user import AuthMe, RuntimeIdentity, User, UserAPI
 from .job import BaseJob, ComfyUIJob, GradioJob, apply_params, apply_graph_modes, find_node, find_nodes, load_template, graph_to_api, expand_subgraphs, DEFAULT_OBJECT_INFO
-from .logs import LogStream, stream_logs, fetch_logs
+from .log_archive import LogArchive, read_archive
+from .log_filter import LogFilter, parse_since
+from .logs import LogCursor, LogEvent, LogHub, LogStream, stream_logs, fetch_logs, fetch_logs_async
+from .agent_index import AgentIndex
+from .agent_metrics import (
+    AgentMetricsSummary,
+    MetricRing,
+    MetricsCollector,
+    parse_cpu_quantity,
+    parse_memory_quantity,
+)
 from .agents import (
     AGENT_RUNTIME_INACTIVE_STATES,
     AGENT_TRANSITIONAL_STATES,
@@ -73,6 +90,7 @@ from .agents import (
     AgentSlot,
     AgentSlotInventory,
     AgentSize,
+    BulkItem,
     BuzzAgent,
     BuzzLaunchConfig,
     CANONICAL_AGENT_STATES,
@@ -87,8 +105,13 @@ from .agents import (
     DEFAULT_CODING_AGENT_IMAGES,
     DEFAULT_CODING_AGENT_SYNC_INCLUDES,
     DeploymentEvent,
+    DeploymentEventBus,
+    DeploymentSubscription,
     Deployments,
+    AsyncDeployments,
     ExecResult,
+    ExecSession,
+    AsyncExecSession,
     GooseAgent,
     HermesAgent,
     KimiCodeAgent,
@@ -99,6 +122,7 @@ from .agents import (
     RuntimeAuthMethod,
     RuntimeAuthStatus,
     RuntimeLoginSession,
+    agent_selector,
     build_agent_config,
     build_browser_desktop_url,
     build_hermes_agent_routes,
@@ -108,6 +132,8 @@ from .agents import (
     is_agent_runtime_inactive_state,
     is_agent_transitional_state,
 )
+from .fleet import FleetChange, FleetMirror
+from .file_sync import FileSyncAction, FileSyncPlan
 from .hermes import (
     HermesAPIError,
     HermesApiClient,
@@ -201,6 +227,7 @@ __all__ = [
     "PricingTier",
     # Jobs API
     "Job",
+    "AsyncJobs",
     "JobListPage",
     "JobMetrics",
     "GPUMetrics",
@@ -210,6 +237,7 @@ __all__ = [
     # Renders API
     "Render",
     "RenderStatus",
+    "AsyncRenders",
     "VoiceAPI",
     "VoiceChunk",
     "VoiceSession",
@@ -236,6 +264,8 @@ __all__ = [
     # Files API
     "File",
     "AsyncFiles",
+    "FileBatchItem",
+    "UploadCache",
     "User",
     "UserAPI",
     "AuthMe",
@@ -243,9 +273,16 @@ __all__ = [
     "AsyncHTTPClient",
     # Job lookup utils
     "find_job",
+    "JobIndex",
     "find_by_id",
     "find_by_hostname",
     "find_by_ip",
+    # Exec fan-out
+    "ExecBatchItem",
+    "ExecSummary",
+    # Batch job submission
+    "JobBatchItem",
+    "TokenBucket",
     # Job helpers
     "BaseJob",
     "ComfyUIJob",
@@ -261,17 +298,39 @@ __all__ = [
     "DEFAULT_OBJECT_INFO",
     # Log streaming
     "LogStream",
+    "LogHub",
+    "LogEvent",
+    "LogCursor",
+    "LogChunk",
+    "LogArchive",
+    "read_archive",
+    "LogFilter",
+    "parse_since",
     "stream_logs",
     "fetch_logs",
+    "fetch_logs_async",
     # Agents (Reef Pods)
     "CANONICAL_AGENT_STATES",
+    "AgentIndex",
     "AGENT_TRANSITIONAL_STATES",
     "AGENT_RUNTIME_INACTIVE_STATES",
     "AGENT_WAIT_RUNNING_FAILURE_STATES",
     "is_agent_transitional_state",
     "is_agent_runtime_inactive_state",
     "Deployments",
+    "AsyncDeployments",
     "DeploymentEvent",
+    "DeploymentEventBus",
+    "DeploymentSubscription",
+    "BulkItem",
+    "agent_selector",
+    "FleetMirror",
+    "FleetChange",
+    "MetricsCollector",
+    "MetricRing",
+    "AgentMetricsSummary",
+    "parse_cpu_quantity",
+    "parse_memory_quantity",
     "Agent",
     "AgentAccessIdentity",
     "AgentCapacity",
@@ -305,6 +364,10 @@ __all__ = [
     "RuntimeAuthStatus",
     "RuntimeLoginSession",
     "ExecResult",
+    "ExecSession",
+    "AsyncExecSession",
+    "FileSyncAction",
+    "FileSyncPlan",
     "build_agent_config",
     "build_browser_desktop_url",
     "build_hermes_agent_routes",
@@ -0,0 +1,49 @@
+"""Helpers shared by the client-side caches (job index, agent index, upload cache)."""
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable
+
+
+_TRIE_END = "\0"
+
+
+def account_scope(api_base: str, api_key: str) -> str:
+    """Short stable name for one credential on one API.
+
+    Cached IDs belong to one account on one API, so cache files are keyed by
+    this rather than shared between either.
+    """
+    return hashlib.sha256(f"{api_base}\0{api_key}".encode()).hexdigest()[:16]
+
+
+class _PrefixTrie:
+    """Character trie mapping string keys to the IDs stored under them."""
+
+    def __init__(self, items: Iterable[tuple[str, str]] = ()):
+        self._root: dict = {}
+        for key, value in items:
+            self.insert(key, value)
+
+    def insert(self, key: str, value: str) -> None:
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(_TRIE_END, set()).add(value)
+
+    def search(self, prefix: str) -> set[str]:
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return set()
+        found: set[str] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for char, child in current.items():
+                if char == _TRIE_END:
+                    found.update(child)
+                else:
+                    stack.append(child)
+        return found
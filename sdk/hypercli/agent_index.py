@@ -0,0 +1,169 @@
+"""Cached resolution of agent names, handles and hostnames to agent IDs."""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING, Iterable
+
+from ._local_cache import _PrefixTrie, account_scope
+from .config import CONFIG_DIR
+
+if TYPE_CHECKING:
+    from .agents import Agent, DeploymentEvent
+
+
+AGENT_INDEX_DIR = CONFIG_DIR / "agent-index"
+DEFAULT_AGENT_INDEX_TTL = 300.0
+_AGENT_REF_FIELDS = ("name", "handle", "hostname")
+
+
+class AgentIndex:
+    """Index of agent ID, name, handle and hostname, kept in memory and optionally on disk.
+
+    Pass one to ``Deployments(..., agent_index=...)`` and references that are
+    not agent IDs resolve from the index instead of listing the whole fleet.
+    Every agent the client receives is folded in with ``observe``; names and
+    handles are unique per account, so an exact match on an agent seen within
+    ``ttl`` is trusted. Prefix matches need the complete listing stored by
+    ``replace`` to be younger than ``ttl``, since an agent created elsewhere
+    could make them ambiguous. Deployment events drop deleted agents, and
+    ``invalidate`` forces the next lookup to the server.
+    """
+
+    def __init__(self, path: str | Path | None = None, *, ttl: float = DEFAULT_AGENT_INDEX_TTL):
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self.synced_at: float | None = None
+        self._agents: dict[str, dict] = {}
+        self._trie: _PrefixTrie | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def for_account(cls, api_base: str, api_key: str, **kwargs) -> "AgentIndex":
+        """Open the on-disk index for one agents API and credential."""
+        return cls(AGENT_INDEX_DIR / f"{account_scope(api_base, api_key)}.json", **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    @property
+    def fresh(self) -> bool:
+        return self.synced_at is not None and time.time() - self.synced_at < self.ttl
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._agents = dict(data.get("agents") or {})
+            self.synced_at = data.get("synced_at")
+
+    def save(self) -> None:
+        """Persist the index if it has a path and changed since the last save."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            payload = json.dumps({"agents": self._agents, "synced_at": self.synced_at})
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(payload)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # a read-only config dir only costs the cache
+
+    def _entry(self, agent: "Agent", seen_at: float) -> dict:
+        return {
+            "name": agent.name,
+            "handle": agent.handle,
+            "hostname": agent.hostname,
+            "state": agent.state,
+            "seen_at": seen_at,
+        }
+
+    def observe(self, agent: "Agent") -> None:
+        """Fold one agent seen in any API response into the index."""
+        if not agent.id or agent.id == "self":
+            return
+        with self._lock:
+            previous = self._agents.pop(agent.id, None)
+            if str(agent.state or "").upper() != "DELETED":
+                entry = self._agents[agent.id] = self._entry(agent, time.time())
+                renamed = previous is None or any(
+                    previous.get(key) != entry[key] for key in _AGENT_REF_FIELDS
+                )
+            else:
+                renamed = previous is not None
+            if renamed:
+                self._trie = None
+            self._dirty = True
+
+    def replace(self, agents: Iterable["Agent"]) -> None:
+        """Replace the index with a complete listing (call ``save`` to persist)."""
+        now = time.time()
+        with self._lock:
+            self._agents = {
+                agent.id: self._entry(agent, now)
+                for agent in agents
+                if agent.id and str(agent.state or "").upper() != "DELETED"
+            }
+            self.synced_at = now
+            self._trie = None
+            self._dirty = True
+
+    def remove(self, agent_id: str) -> None:
+        with self._lock:
+            if self._agents.pop(agent_id, None) is not None:
+                self._trie = None
+                self._dirty = True
+
+    def invalidate(self) -> None:
+        """Stop answering from the index until the next complete listing."""
+        with self._lock:
+            self.synced_at = None
+            self._dirty = True
+
+    def apply_event(self, event: "DeploymentEvent") -> None:
+        """Track a deployment event: drop deleted agents, record new states."""
+        state = str(event.state or "").upper()
+        if state == "DELETED":
+            self.remove(event.agent_id)
+            return
+        with self._lock:
+            entry = self._agents.get(event.agent_id)
+            if entry is not None and state and entry.get("state") != state:
+                entry["state"] = state
+                self._dirty = True
+
+    def match(self, ref: str) -> list[str]:
+        """IDs whose ID, name, handle or hostname equals or starts with *ref*.
+
+        Without a fresh complete listing only exact matches on recently seen
+        agents count; an empty result sends the caller to the server.
+        """
+        with self._lock:
+            if not self.fresh:
+                cutoff = time.time() - self.ttl
+                return sorted(
+                    agent_id
+                    for agent_id, entry in self._agents.items()
+                    if entry.get("seen_at", 0) > cutoff
+                    and ref in (agent_id, *(entry.get(key) for key in _AGENT_REF_FIELDS))
+                )
+            if self._trie is None:
+                self._trie = _PrefixTrie(
+                    (str(value), agent_id)
+                    for agent_id, entry in self._agents.items()
+                    for value in (agent_id, *(entry.get(key) for key in _AGENT_REF_FIELDS))
+                    if value
+                )
+            return sorted(self._trie.search(ref))
@@ -0,0 +1,411 @@
+"""Sample CPU and memory across many agents into fixed-size ring buffers."""
+from __future__ import annotations
+
+from array import array
+import asyncio
+import csv
+from dataclasses import dataclass
+import math
+from pathlib import Path
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Iterable, TextIO
+
+from .agents import Agent, AsyncDeployments, Deployments
+
+
+DEFAULT_METRICS_INTERVAL = 5.0
+DEFAULT_METRICS_CAPACITY = 720  # one hour at the default interval
+DEFAULT_METRICS_CONCURRENCY = 32
+METRICS_SORT_KEYS = ("cpu", "memory")
+
+_QUANTITY = re.compile(r"^([0-9]+(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?)([a-zA-Z]*)$")
+_CPU_SUFFIXES = {"": 1.0, "m": 1e-3, "u": 1e-6, "n": 1e-9}
+_MEMORY_SUFFIXES = {
+    "": 1,
+    "k": 10**3,
+    "M": 10**6,
+    "G": 10**9,
+    "T": 10**12,
+    "P": 10**15,
+    "Ki": 2**10,
+    "Mi": 2**20,
+    "Gi": 2**30,
+    "Ti": 2**40,
+    "Pi": 2**50,
+}
+
+
+def _quantity(text: str, suffixes: dict, kind: str) -> float:
+    match = _QUANTITY.match(str(text or "").strip())
+    if not match or match.group(2) not in suffixes:
+        raise ValueError(f"invalid {kind} quantity {text!r}")
+    return float(match.group(1)) * suffixes[match.group(2)]
+
+
+def parse_cpu_quantity(text: str) -> float:
+    """CPU cores in a Kubernetes quantity such as ``250m`` or ``2``."""
+    return _quantity(text, _CPU_SUFFIXES, "CPU")
+
+
+def parse_memory_quantity(text: str) -> int:
+    """Bytes in a Kubernetes quantity such as ``128Mi`` or ``1G``."""
+    return int(_quantity(text, _MEMORY_SUFFIXES, "memory"))
+
+
+class MetricRing:
+    """Fixed-size time series backed by two ``array('d')`` buffers.
+
+    Appending past ``capacity`` overwrites the oldest sample, so memory stays
+    at ``16 * capacity`` bytes however long a collector runs. ``window``
+    arguments count the most recent samples; ``None`` means all of them.
+    """
+
+    __slots__ = ("capacity", "_times", "_values", "_start", "_size")
+
+    def __init__(self, capacity: int = DEFAULT_METRICS_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> None:
+        end = (self._start + self._size) % self.capacity
+        self._times[end] = timestamp
+        self._values[end] = value
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def _slice(self, buffer: array, window: int | None) -> array:
+        count = self._size if window is None else max(0, min(window, self._size))
+        first = (self._start + self._size - count) % self.capacity
+        if first + count <= self.capacity:
+            return buffer[first : first + count]
+        return buffer[first:] + buffer[: first + count - self.capacity]
+
+    def times(self, window: int | None = None) -> array:
+        """Sample timestamps, oldest first."""
+        return self._slice(self._times, window)
+
+    def values(self, window: int | None = None) -> array:
+        """Sample values, oldest first."""
+        return self._slice(self._values, window)
+
+    @property
+    def latest(self) -> float | None:
+        if not self._size:
+            return None
+        return self._values[(self._start + self._size - 1) % self.capacity]
+
+    def mean(self, window: int | None = None) -> float | None:
+        values = self.values(window)
+        return sum(values) / len(values) if values else None
+
+    def percentile(self, q: float, window: int | None = None) -> float | None:
+        """Linearly interpolated *q*-th percentile (0-100) of the window."""
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100")
+        values = sorted(self.values(window))
+        if not values:
+            return None
+        rank = (len(values) - 1) * q / 100
+        low = math.floor(rank)
+        high = min(low + 1, len(values) - 1)
+        return values[low] + (values[high] - values[low]) * (rank - low)
+
+    def rate(self, window: int | None = None) -> float | None:
+        """Change per second between the first and last sample of the window."""
+        times = self.times(window)
+        if len(times) < 2 or times[-1] <= times[0]:
+            return None
+        values = self.values(window)
+        return (values[-1] - values[0]) / (times[-1] - times[0])
+
+
+@dataclass
+class AgentMetricSeries:
+    """CPU (cores) and memory (bytes) history for one agent."""
+
+    agent_id: str
+    cpu: MetricRing
+    memory: MetricRing
+    errors: int = 0
+    last_error: str | None = None
+    active: bool = True  # False once rediscovery no longer finds the agent running
+
+
+@dataclass(frozen=True)
+class AgentMetricsSummary:
+    """Latest values and rolling statistics for one agent's series."""
+
+    agent_id: str
+    samples: int
+    cpu: float | None
+    cpu_p50: float | None
+    cpu_p95: float | None
+    memory: float | None
+    memory_p95: float | None
+    memory_rate: float | None
+    errors: int
+    last_error: str | None
+    active: bool = True
+
+
+class MetricsCollector:
+    """Sample many agents' metrics concurrently on an interval.
+
+    Usage:
+        async with MetricsCollector(client.deployments, interval=5) as collector:
+            await asyncio.sleep(60)
+            for row in collector.top(by="memory", limit=10):
+                print(row.agent_id, row.memory, row.memory_rate)
+            collector.to_csv("metrics.csv")
+
+    Each round calls ``metrics`` for every target, ``concurrency`` at a time,
+    and appends the parsed CPU cores and memory bytes to that agent's
+    :class:`MetricRing` pair. A failed sample is counted against the agent
+    and the round goes on. With ``targets=None`` the running agents are
+    listed again every ``discover_interval`` seconds; an agent that is no
+    longer running keeps its history for export but is marked inactive and
+    left out of ``top``. Works with both ``Deployments`` (calls run in worker
+    threads) and ``AsyncDeployments``.
+    """
+
+    def __init__(
+        self,
+        deployments: Deployments | AsyncDeployments,
+        targets: Iterable[Agent | str] | None = None,
+        *,
+        interval: float = DEFAULT_METRICS_INTERVAL,
+        capacity: int = DEFAULT_METRICS_CAPACITY,
+        concurrency: int = DEFAULT_METRICS_CONCURRENCY,
+        discover_interval: float = 60.0,
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._deployments = deployments
+        self._agents: dict[str, Agent] = {}
+        self._targets: list[str] | None = None
+        if targets is not None:
+            targets = list(targets)
+            self._remember(target for target in targets if isinstance(target, Agent))
+            self._targets = list(dict.fromkeys(getattr(target, "id", target) for target in targets))
+        self.interval = interval
+        self.capacity = capacity
+        self.concurrency = concurrency
+        self.discover_interval = discover_interval
+        self.rounds = 0
+        self._series: dict[str, AgentMetricSeries] = {}
+        self._discovered_at: float | None = None
+        self._discovered: list[str] = []
+        self._task: asyncio.Task | None = None
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._series
+
+    def series(self, agent_id: str) -> AgentMetricSeries:
+        """The series for *agent_id*; raises ``KeyError`` if it was never sampled."""
+        return self._series[agent_id]
+
+    def _series_for(self, agent_id: str) -> AgentMetricSeries:
+        series = self._series.get(agent_id)
+        if series is None:
+            series = self._series[agent_id] = AgentMetricSeries(
+                agent_id, MetricRing(self.capacity), MetricRing(self.capacity)
+            )
+        series.active = True
+        return series
+
+    @property
+    def agent_ids(self) -> list[str]:
+        return list(self._series)
+
+    @property
+    def agents(self) -> dict[str, Agent]:
+        """The latest ``Agent`` seen for each target, by ID (for names and labels)."""
+        return self._agents
+
+    def _remember(self, agents: Iterable[Agent]) -> None:
+        self._agents.update((agent.id, agent) for agent in agents)
+
+    async def _call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if isinstance(self._deployments, AsyncDeployments):
+            return await method(*args, **kwargs)
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def _current_targets(self) -> list[str]:
+        if self._targets is not None:
+            return self._targets
+        now = time.monotonic()
+        if self._discovered_at is None or now - self._discovered_at >= self.discover_interval:
+            agents = await self._call(self._deployments.list, state="RUNNING")
+            self._remember(agents)
+            self._discovered = [agent.id for agent in agents]
+            self._discovered_at = now
+            running = set(self._discovered)
+            for agent_id, series in self._series.items():
+                if agent_id not in running:
+                    series.active = False
+        return self._discovered
+
+    async def sample_once(self) -> None:
+        """Take one sample of every target."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def sample(agent_id: str) -> None:
+            series = self._series_for(agent_id)
+            async with semaphore:
+                try:
+                    frame = await self._call(self._deployments.metrics, agent_id)
+                    cpu = parse_cpu_quantity(frame["cpu"])
+                    memory = parse_memory_quantity(frame["memory"])
+                except Exception as exc:
+                    series.errors += 1
+                    series.last_error = str(exc) or type(exc).__name__
+                    return
+            stamp = frame.get("timestamp")
+            stamp = float(stamp) if isinstance(stamp, (int, float)) and stamp > 0 else time.time()
+            series.cpu.append(stamp, cpu)
+            series.memory.append(stamp, float(memory))
+
+        await asyncio.gather(*(sample(agent_id) for agent_id in await self._current_targets()))
+        self.rounds += 1
+
+    async def run(self, rounds: int | None = None) -> AsyncIterator[int]:
+        """Sample every ``interval`` seconds, yielding the round count after each."""
+        loop = asyncio.get_running_loop()
+        done = 0
+        while rounds is None or done < rounds:
+            started = loop.time()
+            await self.sample_once()
+            done += 1
+            yield self.rounds
+            if rounds is None or done < rounds:
+                await asyncio.sleep(max(0.0, self.interval - (loop.time() - started)))
+
+    async def start(self) -> "MetricsCollector":
+        """Sample in a background task until :meth:`aclose`."""
+        if self._task is None or self._task.done():
+
+            async def drain() -> None:
+                async for _ in self.run():
+                    pass
+
+            self._task = asyncio.get_running_loop().create_task(drain())
+        return self
+
+    async def aclose(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def __aenter__(self) -> "MetricsCollector":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def summary(self, agent_id: str, window: int | None = None) -> AgentMetricsSummary:
+        """Latest values, p50/p95 and memory growth (bytes/s) over *window* samples.
+
+        Raises ``KeyError`` for an agent the collector has never sampled.
+        """
+        series = self.series(agent_id)
+        return AgentMetricsSummary(
+            agent_id=agent_id,
+            samples=len(series.cpu),
+            cpu=series.cpu.latest,
+            cpu_p50=series.cpu.percentile(50, window),
+            cpu_p95=series.cpu.percentile(95, window),
+            memory=series.memory.latest,
+            memory_p95=series.memory.percentile(95, window),
+            memory_rate=series.memory.rate(window),
+            errors=series.errors,
+            last_error=series.last_error,
+            active=series.active,
+        )
+
+    def top(
+        self,
+        *,
+        by: str = "cpu",
+        limit: int | None = None,
+        window: int | None = None,
+        include_inactive: bool = False,
+    ) -> list[AgentMetricsSummary]:
+        """Summaries sorted by latest CPU or memory, highest first; unsampled agents last.
+
+        Agents that stopped running are left out unless *include_inactive*.
+        """
+        if by not in METRICS_SORT_KEYS:
+            raise ValueError(f"by must be one of: {', '.join(METRICS_SORT_KEYS)}")
+        rows = [
+            self.summary(agent_id, window)
+            for agent_id, series in self._series.items()
+            if include_inactive or series.active
+        ]
+        rows.sort(key=lambda row: -(getattr(row, by) if getattr(row, by) is not None else -1.0))
+        return rows if limit is None else rows[:limit]
+
+    def _rows(self) -> Iterable[tuple[str, float, float, float]]:
+        for agent_id, series in self._series.items():
+            yield from zip(
+                [agent_id] * len(series.cpu),
+                series.cpu.times(),
+                series.cpu.values(),
+                series.memory.values(),
+            )
+
+    def to_csv(self, destination: str | Path | TextIO) -> int:
+        """Write ``agent_id,timestamp,cpu_cores,memory_bytes`` rows; returns the row count."""
+        if isinstance(destination, (str, Path)):
+            with open(destination, "w", newline="") as handle:
+                return self.to_csv(handle)
+        writer = csv.writer(destination)
+        writer.writerow(["agent_id", "timestamp", "cpu_cores", "memory_bytes"])
+        count = 0
+        for agent_id, stamp, cpu, memory in self._rows():
+            writer.writerow([agent_id, stamp, cpu, int(memory)])
+            count += 1
+        return count
+
+    def to_parquet(self, path: str | Path) -> int:
+        """Write the same columns as :meth:`to_csv` to a Parquet file (needs pyarrow)."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "Parquet export requires the pyarrow package. "
+                "Install with: pip install 'hypercli-sdk[parquet]'"
+            ) from exc
+        agent_ids: list[str] = []
+        times = array("d")
+        cpu = array("d")
+        memory = array("d")
+        for agent_id, series in self._series.items():
+            agent_ids.extend([agent_id] * len(series.cpu))
+            times.extend(series.cpu.times())
+            cpu.extend(series.cpu.values())
+            memory.extend(series.memory.values())
+        table = pa.table(
+            {
+                "agent_id": pa.array(agent_ids, pa.string()),
+                "timestamp": pa.array(times, pa.float64()),
+                "cpu_cores": pa.array(cpu, pa.float64()),
+                "memory_bytes": pa.array(memory, pa.float64()).cast(pa.int64()),
+            }
+        )
+        pq.write_table(table, str(path))
+        return table.num_rows
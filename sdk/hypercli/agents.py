@@ -11,8 +11,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 import asyncio
 import copy
+import fnmatch
 import inspect
 import json
 import mimetypes
@@ -20,7 +22,9 @@ import os
 import re
 import secrets
 import shlex
+import threading
 import time
+import weakref
 from typing import (
     TYPE_CHECKING,
     Awaitable,
@@ -29,20 +33,45 @@ from typing import (
     Literal,
     Optional,
     Any,
+    AsyncIterable,
     AsyncIterator,
+    BinaryIO,
+    Iterable,
+    Iterator,
     NotRequired,
     TypeVar,
     TypedDict,
     cast,
 )
 from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from uuid import UUID
 
 import httpx
 
+from .agent_index import AgentIndex
 from .config import get_agents_api_base_url, get_config_value
-from .http import HTTPClient, APIError
+from .exec_batch import (
+    DEFAULT_EXEC_CONCURRENCY,
+    ExecBatchItem,
+    async_fan_out,
+    fan_out,
+    target_deadline,
+    validate_exec_request,
+)
+from .file_sync import (
+    DEFAULT_SYNC_CONCURRENCY,
+    FileSyncAction,
+    FileSyncEntry,
+    FileSyncPlan,
+    plan_sync,
+    run_transfers,
+    walk_local,
+    walk_remote,
+)
+from .http import HTTPClient, APIError, AsyncClientPool, ClientPool
+from .log_archive import LogArchive
+from .log_filter import LogFilter
 from .openclaw.gateway import create_openclaw_sdk_session_key
 
 if TYPE_CHECKING:
@@ -146,9 +175,14 @@ AGENT_FILE_MAX_BYTES = 250 * 1024 * 1024
 AGENT_FILE_WRITE_MAX_BYTES = 100 * 1024 * 1024
 AGENT_FILE_TRANSFER_CHUNK_BYTES = 64 * 1024
 AGENT_FILE_OPERATION_TIMEOUT_SECONDS = 300
+# Reef file tokens are reused until this many seconds before ``expires_at`` so
+# a request never leaves the client carrying a credential about to lapse.
+AGENT_FILE_TOKEN_REFRESH_MARGIN_SECONDS = 30
 AGENT_EXEC_OUTPUT_MAX_BYTES = 1_048_576
 # Every valid raw output byte can become a six-byte ``\u00xx`` JSON escape.
 AGENT_EXEC_RESULT_MAX_MESSAGE_BYTES = (6 * AGENT_EXEC_OUTPUT_MAX_BYTES) + 4096
+# Concurrent exec WebSockets one ExecSession keeps open against its agent.
+DEFAULT_EXEC_SESSION_IN_FLIGHT = 4
 _UNSET = object()
 _T = TypeVar("_T")
 
@@ -451,9 +485,15 @@ class AgentFiles:
     def read(self, path: str) -> str:
         return self._deployments.file_read(self._agent, path)
 
+    def read_stream(self, path: str) -> Iterator[bytes]:
+        return self._deployments.file_read_stream(self._agent, path)
+
     def write_bytes(self, path: str, content: bytes) -> dict:
         return self._deployments.file_write_bytes(self._agent, path, content)
 
+    def write_stream(self, path: str, data: Iterable[bytes] | BinaryIO) -> dict:
+        return self._deployments.file_write_stream(self._agent, path, data)
+
     def write(self, path: str, content: str) -> dict:
         return self._deployments.file_write(self._agent, path, content)
 
@@ -2210,9 +2250,15 @@ class Agent:
     def file_read(self, path: str) -> str:
         return self.files.read(path)
 
+    def file_read_stream(self, path: str) -> Iterator[bytes]:
+        return self.files.read_stream(path)
+
     def file_write_bytes(self, path: str, content: bytes) -> dict:
         return self.files.write_bytes(path, content)
 
+    def file_write_stream(self, path: str, data: Iterable[bytes] | BinaryIO) -> dict:
+        return self.files.write_stream(path, data)
+
     def file_write(self, path: str, content: str) -> dict:
         return self.files.write(path, content)
 
@@ -2225,17 +2271,27 @@ class Agent:
     def cp_from(self, remote_path: str, local_path: str | Path) -> Path:
         return self._require_deployments().cp_from(self, remote_path, local_path)
 
+    def sync_to(self, local_dir: str | Path, remote_dir: str = "", **kwargs) -> FileSyncPlan:
+        return self._require_deployments().sync_to(self, local_dir, remote_dir, **kwargs)
+
+    def sync_from(self, remote_dir: str, local_dir: str | Path, **kwargs) -> FileSyncPlan:
+        return self._require_deployments().sync_from(self, remote_dir, local_dir, **kwargs)
+
     async def logs_stream_ws(
         self,
         tail_lines: int = 100,
         container: str = "reef",
         follow: bool = True,
+        archive: LogArchive | None = None,
+        line_filter: LogFilter | None = None,
     ) -> AsyncIterator[str]:
         async for line in self._require_deployments().logs_stream_ws(
             self.id,
             tail_lines=tail_lines,
             container=container,
             follow=follow,
+            archive=archive,
+            line_filter=line_filter,
         ):
             yield line
 
@@ -3043,617 +3099,2624 @@ def _validate_exec_result(data: object) -> ExecResult:
     raise RuntimeError("Agent exec WebSocket returned an invalid result frame")
 
 
-class Deployments:
-    """
-    HyperClaw deployments API — manage agent runtimes.
+def _agent_from_dict(data: dict) -> Agent:
+    """Build the runtime-specific Agent subclass for one backend projection."""
+    runtime = str(data.get("runtime") or "").strip().lower()
+    if runtime == "buzz-agent":
+        return BuzzAgent.from_dict(data)
+    if runtime == "opencode":
+        return OpenCodeAgent.from_dict(data)
+    if runtime == "codex":
+        return CodexAgent.from_dict(data)
+    if runtime == "claude-code":
+        return ClaudeCodeAgent.from_dict(data)
+    if runtime == "goose":
+        return GooseAgent.from_dict(data)
+    if runtime == "kimi-code":
+        return KimiCodeAgent.from_dict(data)
+    if runtime == "hermes-agent" or _is_hermes_agent_data(data):
+        return HermesAgent.from_dict(data)
+    if runtime == "openclaw-pro" or _is_openclaw_pro_agent_data(data):
+        return OpenClawProAgent.from_dict(data)
+    if runtime == "openclaw" or _is_openclaw_agent_data(data):
+        return OpenClawAgent.from_dict(data)
+    return Agent.from_dict(data)
+
+
+def _raise_api_error(resp: httpx.Response) -> None:
+    try:
+        detail = resp.json().get("detail", resp.text)
+    except Exception:
+        detail = resp.text
+    raise APIError(resp.status_code, detail)
+
+
+def _agent_capacity_from_payload(data: object, items: list[Agent]) -> AgentCapacity:
+    payload = data if isinstance(data, dict) else {"items": data}
+    running_fallback = sum(not is_agent_runtime_inactive_state(agent.state) for agent in items)
+    return AgentCapacity(
+        items=items,
+        total_agents=int(payload.get("total_agents", len(items)) or 0),
+        max_agents_per_account=int(payload.get("max_agents_per_account", 0) or 0),
+        running_agents=int(payload.get("running_agents", running_fallback) or 0),
+        slots={
+            str(size): AgentSlotInventory.from_dict(inventory)
+            for size, inventory in (payload.get("slots") or {}).items()
+        },
+        agent_slots=[AgentSlot.from_dict(slot) for slot in payload.get("agent_slots", [])],
+        pooled_tpd=int(payload.get("pooled_tpd", 0) or 0),
+    )
 
-    Usage:
-        from hypercli import HyperCLI
-        client = HyperCLI(api_key="...", agent_api_key="sk-...")
 
-        # Launch
-        pod = client.deployments.create()
-        print(f"Desktop: {pod.vnc_url}")
+def _agent_list_items(data: object) -> list[dict]:
+    payload = data if isinstance(data, dict) else {"items": data}
+    return list(payload.get("items", []))
 
-        # Execute a command
-        result = client.deployments.exec(pod, ["echo", "hello"])
 
-        # List
-        pods = client.deployments.list()
+def _agent_list_params(
+    *,
+    state: str | None,
+    handle: str | None,
+    name: str | None,
+    query: str | None,
+    include_deleted: bool | None,
+) -> dict[str, Any]:
+    params = {
+        "state": state,
+        "handle": handle,
+        "name": name,
+        "q": query,
+        "include_deleted": include_deleted,
+    }
+    return {key: value for key, value in params.items() if value is not None}
 
-        # Stop
-        client.deployments.stop(pod.id)
-    """
 
-    def __init__(
-        self,
-        http: HTTPClient,
-        api_key: str = None,
-        api_base: str = None,
-        agents_ws_url: str = None,
-        timeout: float = None,
-    ):
-        self._http = http
-        self._api_key = api_key or http.api_key
-        self._timeout = timeout if timeout is not None else getattr(http, "timeout", 30.0)
-        self._api_base = _normalize_agents_api_base(api_base or get_agents_api_base_url()).rstrip(
-            "/"
-        )
-        resolved_agents_ws_url = agents_ws_url or get_config_value("AGENTS_WS_URL")
-        self._agents_ws_url = (
-            _normalize_agents_ws_url(resolved_agents_ws_url)
-            if resolved_agents_ws_url
-            else _default_agents_ws_url(self._api_base)
-        )
+def _resolve_agent_match(raw: str, agents: list[Agent]) -> Agent:
+    matches: list[Agent] = []
+    for agent in agents:
+        values = [agent.id, agent.name, agent.handle, agent.hostname]
+        if any(str(value or "") == raw for value in values):
+            matches.append(agent)
+            continue
+        if any(str(value or "").startswith(raw) for value in values):
+            matches.append(agent)
 
-    def _hydrate_agent(self, data: dict) -> Agent:
-        runtime = str(data.get("runtime") or "").strip().lower()
-        if runtime == "buzz-agent":
-            agent = BuzzAgent.from_dict(data)
-        elif runtime == "opencode":
-            agent = OpenCodeAgent.from_dict(data)
-        elif runtime == "codex":
-            agent = CodexAgent.from_dict(data)
-        elif runtime == "claude-code":
-            agent = ClaudeCodeAgent.from_dict(data)
-        elif runtime == "goose":
-            agent = GooseAgent.from_dict(data)
-        elif runtime == "kimi-code":
-            agent = KimiCodeAgent.from_dict(data)
-        elif runtime == "hermes-agent" or _is_hermes_agent_data(data):
-            agent = HermesAgent.from_dict(data)
-        elif runtime == "openclaw-pro" or _is_openclaw_pro_agent_data(data):
-            agent = OpenClawProAgent.from_dict(data)
-        elif runtime == "openclaw" or _is_openclaw_agent_data(data):
-            agent = OpenClawAgent.from_dict(data)
-        else:
-            agent = Agent.from_dict(data)
-        agent._deployments = self
-        return agent
+    if not matches:
+        raise ValueError(f"Agent not found: {raw}")
+    if len(matches) > 1:
+        refs = ", ".join(agent.id for agent in matches[:5])
+        raise ValueError(f"Agent reference is ambiguous: {raw} ({refs})")
+    return matches[0]
 
-    @property
-    def _headers(self) -> dict:
-        return {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-        }
 
-    def _get(self, path: str, params: dict = None) -> Any:
-        with httpx.Client(timeout=self._timeout) as client:
-            resp = client.get(f"{self._api_base}{path}", headers=self._headers, params=params)
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
-        return resp.json()
+def _agent_matches_ref(agent: Agent, raw: str) -> bool:
+    return any(
+        str(value or "").startswith(raw)
+        for value in (agent.id, agent.name, agent.handle, agent.hostname)
+    )
 
-    def _post(self, path: str, json: dict = None) -> Any:
-        with httpx.Client(timeout=self._timeout) as client:
-            resp = client.post(f"{self._api_base}{path}", headers=self._headers, json=json)
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
-        return resp.json()
 
-    def bootstrap_inference(
-        self,
-        messages: list[dict[str, str]],
-        *,
-        response_format: dict[str, Any] | None = None,
-        timeout: float = 330.0,
-    ) -> dict:
-        """Run the JWT-authenticated onboarding inference endpoint."""
-        body = {
-            "messages": messages,
-            "response_format": response_format or {"type": "json_object"},
-        }
-        with httpx.Client(timeout=timeout) as client:
-            resp = client.post(
-                f"{self._api_base}/bootstrap",
-                headers=self._headers,
-                json=body,
-            )
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
-        return resp.json()
+def _index_events(
+    index: AgentIndex | None, handler: Callable[[DeploymentEvent], Any]
+) -> Callable[[DeploymentEvent], Any]:
+    """Wrap *handler* so deployment events also keep *index* current."""
+    if index is None:
+        return handler
 
-    def _patch(self, path: str, json: dict = None) -> Any:
-        with httpx.Client(timeout=self._timeout) as client:
-            resp = client.patch(f"{self._api_base}{path}", headers=self._headers, json=json)
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
-        return resp.json()
+    def indexed(event: DeploymentEvent) -> Any:
+        index.apply_event(event)
+        return handler(event)
 
-    def _put(self, path: str, json: dict = None) -> Any:
-        with httpx.Client(timeout=self._timeout) as client:
-            resp = client.put(f"{self._api_base}{path}", headers=self._headers, json=json)
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
-        return resp.json()
+    return indexed
 
-    def _delete(self, path: str) -> Any:
-        with httpx.Client(timeout=self._timeout) as client:
-            resp = client.delete(f"{self._api_base}{path}", headers=self._headers)
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
-        return resp.json()
 
-    def _agent_id_for_target(self, target: Agent | str) -> str:
-        if isinstance(target, Agent):
-            return target.id
-        return self.resolve_agent_id(str(target))
+def _build_create_request(
+    config: dict | None,
+    *,
+    name: str | None,
+    handle: str | None,
+    size: str | None,
+    runtime: ManagedAgentRuntime | None,
+    tags: list[str] | None,
+    meta_ui: dict | None,
+    dry_run: bool,
+    **launch_options: Any,
+) -> tuple[dict, dict]:
+    """Return the create request body and the complete submitted launch config."""
+    launch_payload = _build_agent_launch(config, **launch_options)
+    complete_launch = _build_agent_launch(config, _complete=True, **launch_options)
+    body: dict = {**launch_payload}
+    if dry_run:
+        body["dry_run"] = True
+    if name:
+        body["name"] = name
+    if handle is not None:
+        body["handle"] = handle
+    if size:
+        body["size"] = size
+    if runtime is not None:
+        body["runtime"] = runtime
+    if meta_ui:
+        body["meta"] = {"ui": copy.deepcopy(meta_ui)}
+    if tags:
+        body["tags"] = list(tags)
+    return body, complete_launch
+
+
+def _redacted_launch_config_gaps(launch_config: dict) -> set[str]:
+    """Return the redacted START keys worth recovering, or an empty set."""
+    if not isinstance(launch_config, dict):
+        raise TypeError("launch_config must be a complete object")
+    absent = REQUIRED_START_LAUNCH_CONFIG_KEYS - launch_config.keys()
+    # Nothing missing, or missing more than the projection ever redacts:
+    # in both cases hand the object straight to the validator. Only a
+    # config whose *sole* gaps are the two redacted keys is a projection
+    # round-trip worth spending API calls to repair.
+    if not absent or absent - {"secrets", "registry_auth"}:
+        return set()
+    return set(absent)
+
+
+def _default_registry_auth(resolved_agent_id: str, prepared: dict) -> dict:
+    registry_url = str(prepared.get("registry_url") or "").strip()
+    if registry_url:
+        raise ValueError(
+            f"Agent {resolved_agent_id} pulls from registry_url "
+            f"{registry_url!r} but launch_config carries no registry_auth; "
+            "registry_auth is caller-held and write-only, so the owner-facing "
+            "projection can never return it and the SDK will not substitute an "
+            "empty credential that would break the private-registry pull -- "
+            "pass registry_auth explicitly to START"
+        )
+    return {}
 
-    def _get_by_id(self, agent_id: str) -> Agent:
-        data = self._get(f"{AGENTS_API_PREFIX}/{agent_id}")
-        return self._hydrate_agent(data)
 
-    def resolve_agent(self, agent_id_or_name: str) -> Agent:
-        """Resolve an agent UUID, unique name, handle, or hostname to an Agent."""
-        raw = str(agent_id_or_name or "").strip()
-        if not raw:
-            raise ValueError("agent_id_or_name is required")
-        try:
-            return self._get_by_id(str(UUID(raw)))
-        except ValueError:
-            pass
+def _validate_reef_file_access(payload: object) -> tuple[str, str, str]:
+    """Validate a ``/files/token`` response; return its Reef locator, token and expiry."""
+    if not isinstance(payload, dict):
+        raise ValueError("Backend returned an invalid Agent file token response")
+    url = str(payload.get("url") or "").rstrip("/")
+    token = str(payload.get("token") or "").strip()
+    expires_at = str(payload.get("expires_at") or "").strip()
+    parsed = urlsplit(url)
+    if (
+        parsed.scheme != "https"
+        or not parsed.hostname
+        or parsed.username is not None
+        or parsed.password is not None
+        or parsed.query
+        or parsed.fragment
+        or parsed.path != "/_reef"
+        or not token
+        or not expires_at
+    ):
+        raise ValueError("Backend returned an invalid Agent file token response")
+    return url, token, expires_at
 
-        matches: list[Agent] = []
-        for agent in self.list():
-            values = [agent.id, agent.name, agent.handle, agent.hostname]
-            if any(str(value or "") == raw for value in values):
-                matches.append(agent)
-                continue
-            if any(str(value or "").startswith(raw) for value in values):
-                matches.append(agent)
 
-        if not matches:
-            raise ValueError(f"Agent not found: {raw}")
-        if len(matches) > 1:
-            refs = ", ".join(agent.id for agent in matches[:5])
-            raise ValueError(f"Agent reference is ambiguous: {raw} ({refs})")
-        return self._get_by_id(matches[0].id)
+class _ReefTokenCache:
+    """Per-agent Reef file credentials, reused until shortly before they expire.
 
-    def resolve_agent_id(self, agent_id_or_name: str) -> str:
-        raw = str(agent_id_or_name or "").strip()
-        if not raw:
-            raise ValueError("agent_id_or_name is required")
-        if _is_self_agent_ref(raw):
-            # An Agent reads its own status and manages its own routes -- it
-            # is the only party that knows the port it just bound. It does not
-            # start or stop itself; that is the owner's. Both self operations
-            # are served by dedicated /self endpoints, so nothing resolves a
-            # self reference to an id here.
-            raise ValueError("self is only supported for status and routes")
-        if _is_direct_agent_id_ref(raw):
-            return raw
-        return self.resolve_agent(raw).id
+    Shared by every thread using one ``Deployments``. ``mint_lock`` serialises
+    minting per agent so a burst of concurrent file operations against a cold
+    cache mints one token rather than one per request.
+    """
 
-    def _file_headers(self, *, content_type: str | None = None) -> dict[str, str]:
-        headers = {"Authorization": f"Bearer {self._api_key}"}
-        if content_type:
-            headers["Content-Type"] = content_type
-        return headers
+    def __init__(self, refresh_margin: float = AGENT_FILE_TOKEN_REFRESH_MARGIN_SECONDS):
+        self._refresh_margin = refresh_margin
+        self._entries: dict[str, tuple[str, str, float]] = {}
+        self._mint_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
 
-    def _encode_file_path(self, path: str) -> str:
-        return quote(path.lstrip("/"), safe="/")
+    def get(self, agent_id: str) -> tuple[str, str] | None:
+        with self._lock:
+            entry = self._entries.get(agent_id)
+        if entry is None or time.time() >= entry[2] - self._refresh_margin:
+            return None
+        return entry[0], entry[1]
 
-    def wait_for_file_api_ready(
-        self,
-        agent_id: str,
-        *,
-        timeout: float = 90.0,
-        consecutive: int = 2,
-        poll_seconds: float = 1.0,
-    ) -> None:
-        """Wait until an Agent's Reef file API is actually serving.
+    def put(self, agent_id: str, reef_url: str, token: str, expires_at: str) -> None:
+        try:
+            expiry = _parse_dt(expires_at).timestamp()
+        except (AttributeError, ValueError):
+            return
+        with self._lock:
+            self._entries[agent_id] = (reef_url, token, expiry)
 
-        Probing the Agent hostname alone cannot answer this. The Agent domain is
-        a wildcard, so a host with no route still resolves and the edge answers a
-        plain-text ``404 page not found`` -- byte for byte what a route that has
-        not converged yet returns. A caller polling the hostname therefore cannot
-        tell "not ready" from "never will be", and will happily retry until its
-        deadline against a host that was never going to work.
+    def invalidate(self, agent_id: str, token: str) -> None:
+        """Forget *token*, unless another caller already replaced it."""
+        with self._lock:
+            entry = self._entries.get(agent_id)
+            if entry is not None and entry[1] == token:
+                del self._entries[agent_id]
 
-        So ask the API for the authoritative Agent state first: a deleted or
-        failed Agent fails immediately with that state rather than timing out.
-        Then require consecutive successful reads, because one success only
-        proves the route answered once -- the next request can still 404 while
-        the edge settles.
-        """
+    def mint_lock(self, agent_id: str) -> threading.Lock:
+        with self._lock:
+            return self._mint_locks.setdefault(agent_id, threading.Lock())
 
-        deadline = time.monotonic() + timeout
-        streak = 0
-        last_error: Exception | None = None
-        last_state = ""
-        while True:
-            agent = self.get(agent_id)
-            last_state = str(getattr(agent, "state", "") or "").upper()
-            if last_state in {"DELETED", "FAILED"}:
-                raise RuntimeError(
-                    f"Agent {agent_id} is {last_state}; its Reef file API will "
-                    "not serve. Waiting longer cannot help."
-                )
-            try:
-                self.files_list(agent_id, "")
-            except Exception as exc:  # noqa: BLE001 - any read failure resets the streak
-                last_error = exc
-                streak = 0
-            else:
-                streak += 1
-                if streak >= consecutive:
-                    return
-            if time.monotonic() >= deadline:
-                raise TimeoutError(
-                    f"Agent {agent_id} Reef file API did not serve {consecutive} "
-                    f"consecutive reads within {timeout:.0f}s "
-                    f"(agent state={last_state or 'unknown'}, "
-                    f"last error={last_error})"
-                )
-            time.sleep(poll_seconds)
 
-    def _reef_file_access(self, agent_id: str) -> tuple[str, str]:
-        """Mint one fresh file credential and validate its direct Reef locator."""
-        payload = self._post(f"{AGENTS_API_PREFIX}/{agent_id}/files/token")
-        if not isinstance(payload, dict):
-            raise ValueError("Backend returned an invalid Agent file token response")
-        url = str(payload.get("url") or "").rstrip("/")
-        token = str(payload.get("token") or "").strip()
-        expires_at = str(payload.get("expires_at") or "").strip()
-        parsed = urlsplit(url)
-        if (
-            parsed.scheme != "https"
-            or not parsed.hostname
-            or parsed.username is not None
-            or parsed.password is not None
-            or parsed.query
-            or parsed.fragment
-            or parsed.path != "/_reef"
-            or not token
-            or not expires_at
-        ):
-            raise ValueError("Backend returned an invalid Agent file token response")
-        return url, token
+def _reef_error(response: httpx.Response) -> APIError:
+    try:
+        payload = response.json()
+        detail = (
+            payload.get("detail", response.text) if isinstance(payload, dict) else response.text
+        )
+    except Exception:
+        detail = response.text
+    return APIError(response.status_code, str(detail))
 
-    @staticmethod
-    def _reef_headers(token: str, *, content_type: str | None = None) -> dict[str, str]:
-        headers = {"Authorization": f"Bearer {token}"}
-        if content_type:
-            headers["Content-Type"] = content_type
-        return headers
 
-    @staticmethod
-    def _raise_reef_error(response: httpx.Response) -> None:
-        try:
-            payload = response.json()
-            detail = payload.get("detail", response.text) if isinstance(payload, dict) else response.text
-        except Exception:
-            detail = response.text
-        raise APIError(response.status_code, str(detail))
+def _directory_entries(payload: object) -> list[dict]:
+    if not _is_directory_listing_payload(payload):
+        raise ValueError("Reef returned an invalid directory listing")
+    return [
+        *(payload.get("directories") or []),
+        *(payload.get("files") or []),
+    ]
 
-    def _one_shot_ws_result(
-        self,
-        *,
-        agent_id: str,
-        purpose: Literal["metrics", "exec"],
-        request: dict[str, Any] | None = None,
-        timeout: float,
-    ) -> object:
-        from websockets.exceptions import ConnectionClosed, WebSocketException
-        from websockets.sync.client import connect
 
-        token_data = self._post(f"{AGENTS_API_PREFIX}/{agent_id}/{purpose}/token")
-        ws_url, jwt, _ = _validate_agent_ws_token(
-            token_data,
-            agent_id=agent_id,
-            purpose=purpose,
+def _append_file_chunk(content: bytearray, chunk: bytes) -> None:
+    remaining = (AGENT_FILE_MAX_BYTES + 1) - len(content)
+    content.extend(chunk[:remaining])
+    if len(content) > AGENT_FILE_MAX_BYTES:
+        raise ValueError(
+            "Agent file reads are limited to "
+            f"{AGENT_FILE_MAX_BYTES // 1024 // 1024} MiB"
         )
-        separator = "&" if "?" in ws_url else "?"
-        url = f"{ws_url}{separator}jwt={quote(jwt, safe='')}"
 
+
+def _file_read_result(content_bytes: bytes, content_type: str, path: str) -> dict[str, Any]:
+    if "application/json" in content_type.lower():
         try:
-            with connect(
-                url,
-                open_timeout=min(timeout, 10),
-                close_timeout=10,
-                max_size=AGENT_EXEC_RESULT_MAX_MESSAGE_BYTES,
-            ) as ws:
-                if request is not None:
-                    ws.send(json.dumps(request, separators=(",", ":")))
-                message = ws.recv(timeout=timeout)
-                if not isinstance(message, str):
-                    raise RuntimeError(
-                        f"Agent {purpose} WebSocket returned a non-text result frame"
-                    )
-                try:
-                    result = json.loads(message)
-                except json.JSONDecodeError as exc:
-                    raise RuntimeError(
-                        f"Agent {purpose} WebSocket returned invalid JSON"
-                    ) from exc
-                try:
-                    ws.recv(timeout=10)
-                except ConnectionClosed as exc:
-                    code = exc.rcvd.code if exc.rcvd is not None else None
-                    if code != 1000:
-                        reason = exc.rcvd.reason if exc.rcvd is not None else ""
-                        suffix = f": {reason}" if reason else ""
-                        raise RuntimeError(
-                            f"Agent {purpose} WebSocket closed with code {code}{suffix}"
-                        ) from exc
-                else:
-                    raise RuntimeError(
-                        f"Agent {purpose} WebSocket returned more than one result frame"
-                    )
-                return result
-        except ConnectionClosed as exc:
-            code = exc.rcvd.code if exc.rcvd is not None else None
-            reason = exc.rcvd.reason if exc.rcvd is not None else ""
-            suffix = f": {reason}" if reason else ""
-            raise RuntimeError(
-                f"Agent {purpose} WebSocket closed before its result with code {code}{suffix}"
-            ) from exc
-        except (TimeoutError, OSError, WebSocketException) as exc:
+            payload = json.loads(content_bytes.decode(errors="replace"))
+        except Exception:
+            payload = None
+        if _is_directory_listing_payload(payload):
+            raise ValueError(f"Path is a directory: {path}. Use files_list(path) instead.")
+    return {"content": content_bytes, "mime_type": content_type or None}
+
+
+def _validate_file_write(path: str, content: bytes) -> str:
+    path = normalize_writable_backend_file_path(path)
+    if not path:
+        raise ValueError("agent file path is required")
+    if len(content) > AGENT_FILE_WRITE_MAX_BYTES:
+        raise _file_write_limit_error()
+    return path
+
+
+def _file_write_limit_error() -> ValueError:
+    return ValueError(
+        "Agent file writes are limited to "
+        f"{AGENT_FILE_WRITE_MAX_BYTES // 1024 // 1024} MiB "
+        "(Cloudflare request-body cap on the agent hostname); "
+        "split larger data or sync it via the agent's own tooling"
+    )
+
+
+def _is_json_content_type(content_type: str) -> bool:
+    return "application/json" in content_type.lower()
+
+
+def _file_chunks(
+    source: bytes | Iterable[bytes] | BinaryIO,
+    chunk_size: int = AGENT_FILE_TRANSFER_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield bytes(source)
+        return
+    read = getattr(source, "read", None)
+    if callable(read):
+        while chunk := read(chunk_size):
+            yield chunk
+        return
+    yield from source
+
+
+def _capped_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Pass *chunks* through, failing once the write body exceeds the edge cap."""
+    sent = 0
+    for chunk in chunks:
+        sent += len(chunk)
+        if sent > AGENT_FILE_WRITE_MAX_BYTES:
+            raise _file_write_limit_error()
+        yield chunk
+
+
+def _ws_url_with_jwt(ws_url: str, jwt: str) -> str:
+    separator = "&" if "?" in ws_url else "?"
+    return f"{ws_url}{separator}jwt={quote(jwt, safe='')}"
+
+
+def _ws_credential_rejected(exc: BaseException) -> bool:
+    """True when a WebSocket handshake was refused for its credential."""
+    from websockets.exceptions import InvalidStatus
+
+    cause = exc.__cause__
+    return isinstance(cause, InvalidStatus) and cause.response.status_code in (401, 403)
+
+
+def _ws_close_error(exc: Exception, purpose: str, *, before_result: bool) -> RuntimeError:
+    rcvd = getattr(exc, "rcvd", None)
+    code = rcvd.code if rcvd is not None else None
+    reason = rcvd.reason if rcvd is not None else ""
+    suffix = f": {reason}" if reason else ""
+    if before_result:
+        return RuntimeError(
+            f"Agent {purpose} WebSocket closed before its result with code {code}{suffix}"
+        )
+    return RuntimeError(f"Agent {purpose} WebSocket closed with code {code}{suffix}")
+
+
+def _decode_ws_result(message: object, purpose: str) -> object:
+    if not isinstance(message, str):
+        raise RuntimeError(f"Agent {purpose} WebSocket returned a non-text result frame")
+    try:
+        return json.loads(message)
+    except json.JSONDecodeError as exc:
+        raise RuntimeError(f"Agent {purpose} WebSocket returned invalid JSON") from exc
+
+
+def _logs_ws_url(
+    agents_ws_url: str,
+    agent_id: str,
+    jwt: str,
+    container: str,
+    tail_lines: int,
+) -> str:
+    return (
+        f"{agents_ws_url}/logs/{agent_id}"
+        f"?jwt={quote(jwt, safe='')}"
+        f"&container={quote(container, safe='')}"
+        f"&tail_lines={tail_lines}"
+    )
+
+
+def _encode_file_path(path: str) -> str:
+    """Quote a Reef file path for use in a ``/files/...`` URL, keeping separators."""
+    return quote(path.lstrip("/"), safe="/")
+
+
+def _parse_log_message(msg: object, follow: bool) -> tuple[str | None, bool]:
+    """Return ``(line, done)`` for one raw log WebSocket frame."""
+    try:
+        payload = json.loads(msg)
+    except (TypeError, json.JSONDecodeError):
+        return str(msg), False
+    if not isinstance(payload, dict):
+        return None, False
+    event = payload.get("event")
+    if event == "log":
+        return str(payload.get("log") or ""), False
+    if event == "history_end" and not follow:
+        return None, True
+    if event == "error":
+        raise RuntimeError(str(payload.get("detail") or "Log stream failed"))
+    return None, False
+
+
+async def _archived_log_lines(
+    url: str,
+    follow: bool,
+    archive: LogArchive | None,
+    source: str,
+    line_filter: LogFilter | None = None,
+) -> AsyncIterator[str]:
+    """Yield lines from one agent log WebSocket, copying them all to *archive*."""
+    import websockets
+
+    try:
+        async with websockets.connect(url) as ws:
+            async for msg in ws:
+                line, done = _parse_log_message(msg, follow)
+                if done:
+                    return
+                if line is not None:
+                    if archive is not None:
+                        await archive.awrite(line, source=source)
+                    if line_filter is None or line_filter(line, source):
+                        yield line
+    finally:
+        if archive is not None:
+            await asyncio.shield(archive.aflush())
+
+
+async def _subscribe_deployment_events(
+    mint_token: Callable[[], Awaitable[Any]],
+    handler: Callable[[DeploymentEvent], Any],
+    *,
+    stop_event: asyncio.Event | None = None,
+    on_ready: Callable[[], Any] | None = None,
+) -> None:
+    """Run the deployment event subscription loop shared by sync and async clients."""
+    import websockets
+
+    retry_delay = 0.25
+    while stop_event is None or not stop_event.is_set():
+        try:
+            token_data = await mint_token()
+            ws_url = str(token_data.get("ws_url") or "").strip()
+            token = str(token_data.get("token") or "").strip()
+            if not ws_url or not token:
+                raise RuntimeError("Deployment event token response is incomplete")
+            async with websockets.connect(
+                ws_url, ping_interval=20, ping_timeout=20
+            ) as websocket:
+                await websocket.send(json.dumps({"type": "auth", "token": token}))
+                ready = json.loads(await asyncio.wait_for(websocket.recv(), timeout=10))
+                if ready != {"type": "ready"}:
+                    raise RuntimeError("Deployment event socket did not send ready")
+                if on_ready is not None:
+                    result = on_ready()
+                    if inspect.isawaitable(result):
+                        await result
+                retry_delay = 0.25
+                while stop_event is None or not stop_event.is_set():
+                    try:
+                        raw = await asyncio.wait_for(
+                            websocket.recv(), timeout=0.5 if stop_event is not None else None
+                        )
+                    except asyncio.TimeoutError:
+                        continue
+                    event = DeploymentEvent.from_dict(json.loads(raw))
+                    if (
+                        event.type
+                        not in {"deployment.transition", "deployment.import_status"}
+                        or not event.agent_id
+                    ):
+                        continue
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+        except asyncio.CancelledError:
+            raise
+        except APIError as exc:
+            if exc.status_code in {401, 403}:
+                raise
+            if stop_event is None:
+                await asyncio.sleep(retry_delay)
+            else:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=retry_delay)
+                except asyncio.TimeoutError:
+                    pass
+            retry_delay = min(retry_delay * 2, 5.0)
+        except Exception:
+            if stop_event is None:
+                await asyncio.sleep(retry_delay)
+            else:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=retry_delay)
+                except asyncio.TimeoutError:
+                    pass
+            retry_delay = min(retry_delay * 2, 5.0)
+
+
+DEPLOYMENT_RESYNC_EVENT = "deployment.resync"
+
+
+class DeploymentSubscription:
+    """Bounded queue of deployment events delivered by a :class:`DeploymentEventBus`.
+
+    When the queue is full the oldest event is dropped and counted in
+    ``dropped``; events are wakeup hints, so a slow consumer re-reads REST
+    rather than stalling the shared socket. Iterate with ``async for`` and
+    call :meth:`close` (or use ``async with``) to unsubscribe.
+    """
+
+    def __init__(
+        self, bus: "DeploymentEventBus", agent_ids: frozenset[str] | None, maxsize: int
+    ):
+        self._bus = bus
+        self.agent_ids = agent_ids
+        self._queue: asyncio.Queue[DeploymentEvent] = asyncio.Queue(maxsize)
+        self.dropped = 0
+        self.closed = False
+
+    def _offer(self, event: DeploymentEvent) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def get(self) -> DeploymentEvent:
+        return await self._queue.get()
+
+    def drain(self) -> list[DeploymentEvent]:
+        """Every event already queued, without waiting."""
+        events = []
+        while not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._bus._unsubscribe(self)
+
+    def __aiter__(self) -> "DeploymentSubscription":
+        return self
+
+    async def __anext__(self) -> DeploymentEvent:
+        return await self.get()
+
+    async def __aenter__(self) -> "DeploymentSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+
+class DeploymentEventBus:
+    """One deployment event subscription fanned out to many waiters and handlers.
+
+    Usage:
+        bus = client.deployments.event_bus()
+        async with bus.subscribe(agent.id) as events:
+            async for event in events:
+                ...
+
+    The bus opens its WebSocket when the first subscriber or handler arrives
+    and closes it when the last one leaves, so any number of concurrent
+    ``wait_running`` calls share one token and one socket. Subscribers and
+    handlers may be keyed by agent ID; ``None`` receives every agent. The
+    latest event per agent is kept (up to ``replay_size`` agents) and
+    replayed to new subscribers. After a reconnect every subscriber and
+    handler receives a ``deployment.resync`` event with an empty ``agent_id``
+    because transitions may have been missed; re-read REST when you see it.
+    Coroutine handlers run as tasks the bus holds until they finish; the last
+    one to fail is kept in ``handler_error``.
+
+    A bus belongs to one event loop; ``Deployments.event_bus()`` returns the
+    bus for the running loop.
+    """
+
+    def __init__(
+        self,
+        subscribe: Callable[..., Awaitable[None]],
+        *,
+        queue_size: int = 256,
+        replay_size: int = 1024,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be positive")
+        self._subscribe = subscribe
+        self.queue_size = queue_size
+        self.replay_size = replay_size
+        self._subscriptions: dict[str | None, set[DeploymentSubscription]] = {}
+        self._handlers: dict[str | None, list[Callable[[DeploymentEvent], Any]]] = {}
+        self._latest: dict[str, DeploymentEvent] = {}
+        self._task: asyncio.Task | None = None
+        self._handler_tasks: set[asyncio.Task] = set()
+        self._users = 0
+        self.connections = 0
+        self.error: BaseException | None = None
+        self.handler_error: BaseException | None = None  # last failure of an async handler
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(
+        self,
+        agent_ids: str | Iterable[str] | None = None,
+        *,
+        maxsize: int | None = None,
+        replay: bool = True,
+    ) -> DeploymentSubscription:
+        """Queue events for *agent_ids* (every agent when ``None``)."""
+        keys = _event_keys(agent_ids)
+        subscription = DeploymentSubscription(
+            self, None if keys == (None,) else frozenset(keys), maxsize or self.queue_size
+        )
+        for key in keys:
+            self._subscriptions.setdefault(key, set()).add(subscription)
+        if replay:
+            latest = (
+                list(self._latest.values())
+                if subscription.agent_ids is None
+                else [self._latest[key] for key in keys if key in self._latest]
+            )
+            for event in latest:
+                subscription._offer(event)
+        self._acquire()
+        return subscription
+
+    def add_handler(
+        self,
+        handler: Callable[[DeploymentEvent], Any],
+        agent_ids: str | Iterable[str] | None = None,
+    ) -> Callable[[], None]:
+        """Call *handler* for each event on *agent_ids*; returns a remover.
+
+        Handlers run on the bus task, so they should be quick; awaitable
+        results are scheduled as tasks rather than awaited.
+        """
+        keys = _event_keys(agent_ids)
+        for key in keys:
+            self._handlers.setdefault(key, []).append(handler)
+        self._acquire()
+        removed = False
+
+        def remove() -> None:
+            nonlocal removed
+            if removed:
+                return
+            removed = True
+            for key in keys:
+                handlers = self._handlers.get(key, [])
+                if handler in handlers:
+                    handlers.remove(handler)
+                if not handlers:
+                    self._handlers.pop(key, None)
+            self._release()
+
+        return remove
+
+    async def aclose(self) -> None:
+        """Stop the shared subscription; later subscribers start a new one."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _unsubscribe(self, subscription: DeploymentSubscription) -> None:
+        for key in (None,) if subscription.agent_ids is None else subscription.agent_ids:
+            members = self._subscriptions.get(key)
+            if members is not None:
+                members.discard(subscription)
+                if not members:
+                    del self._subscriptions[key]
+        self._release()
+
+    def _acquire(self) -> None:
+        self._users += 1
+        if not self.running:
+            self.error = None
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _release(self) -> None:
+        self._users -= 1
+        if self._users <= 0 and self._task is not None:
+            self._users = 0
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        try:
+            await self._subscribe(self._dispatch, on_ready=self._on_ready)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Subscribers fall back to REST polling; the next one retries.
+            self.error = exc
+
+    def _on_ready(self) -> None:
+        self.connections += 1
+        if self.connections > 1:
+            self._dispatch(DeploymentEvent(type=DEPLOYMENT_RESYNC_EVENT, agent_id=""))
+
+    def _dispatch(self, event: DeploymentEvent) -> None:
+        if event.agent_id:
+            self._latest.pop(event.agent_id, None)
+            self._latest[event.agent_id] = event
+            if len(self._latest) > self.replay_size:
+                del self._latest[next(iter(self._latest))]
+            keys: tuple[str | None, ...] = (event.agent_id, None)
+            subscriptions = set().union(*(self._subscriptions.get(key, ()) for key in keys))
+            handlers = [h for key in keys for h in self._handlers.get(key, ())]
+        else:
+            subscriptions = set().union(*self._subscriptions.values())
+            handlers = list(dict.fromkeys(h for hs in self._handlers.values() for h in hs))
+        for subscription in subscriptions:
+            subscription._offer(event)
+        for handler in handlers:
+            result = handler(event)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._handler_tasks.add(task)
+                task.add_done_callback(self._handler_done)
+
+    def _handler_done(self, task: asyncio.Task) -> None:
+        self._handler_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.handler_error = task.exception()
+
+
+def _event_keys(agent_ids: str | Iterable[str] | None) -> tuple[str | None, ...]:
+    if agent_ids is None:
+        return (None,)
+    if isinstance(agent_ids, str):
+        return (agent_ids,)
+    return tuple(dict.fromkeys(agent_ids))
+
+
+def _event_may_settle(event: DeploymentEvent, settling: set[str]) -> bool:
+    """Whether *event* could end a wait, so a REST snapshot is worth fetching."""
+    if event.type != "deployment.transition" or not event.state:
+        return True
+    return event.state.lower() in settling
+
+
+async def _wait_for_agent_state(
+    agent_id: str,
+    states: set[str],
+    *,
+    fetch: Callable[[str], Awaitable[Agent]],
+    events: DeploymentEventBus,
+    timeout: float,
+    poll_interval: float,
+    failure_states: set[str] | None,
+    minimum_launch_epoch: int | None,
+) -> Agent:
+    """Wait for one state using shared-bus event wakeups confirmed by ``fetch`` snapshots.
+
+    Transition events that name a state which can neither satisfy nor fail
+    the wait are consumed without a REST read; everything else, and every
+    ``poll_interval`` without events, re-reads the agent.
+    """
+    deadline = asyncio.get_running_loop().time() + timeout
+    last_agent: Agent | None = None
+    desired = {state.lower() for state in states}
+    failures = {state.lower() for state in (failure_states or set())}
+    effective_poll_interval = max(float(poll_interval), 0.001)
+    if not desired:
+        raise ValueError("states must not be empty")
+    if minimum_launch_epoch is not None and minimum_launch_epoch < 0:
+        raise ValueError("minimum_launch_epoch must be non-negative")
+
+    def check(agent: Agent) -> Agent | None:
+        nonlocal last_agent
+        last_agent = agent
+        if (
+            minimum_launch_epoch is not None
+            and int(agent.launch_epoch or 0) < minimum_launch_epoch
+        ):
+            return None
+        state = str(agent.state or "")
+        if state.lower() in desired:
+            return agent
+        if state.lower() in failures:
             raise RuntimeError(
-                f"Agent {purpose} WebSocket connection failed: {exc}"
-            ) from exc
+                f"Agent entered {state} while waiting for {', '.join(sorted(states))}"
+            )
+        return None
+
+    loop = asyncio.get_running_loop()
+    settling = desired | failures
+    subscription = events.subscribe(agent_id, replay=False)
+    try:
+        while loop.time() < deadline:
+            current = check(await fetch(agent_id))
+            if current is not None:
+                return current
+            reconcile_at = min(deadline, loop.time() + effective_poll_interval)
+            while (remaining := reconcile_at - loop.time()) > 0:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if any(
+                    _event_may_settle(item, settling)
+                    for item in (event, *subscription.drain())
+                ):
+                    break
+    finally:
+        subscription.close()
+
+    final = check(await fetch(agent_id))
+    if final is not None:
+        return final
+    last_state = str(last_agent.state or "") if last_agent is not None else "unknown"
+    raise TimeoutError(
+        f"Timed out waiting for agent {agent_id} to reach "
+        f"{', '.join(sorted(states))} (last={last_state})"
+    )
+
+
+BULK_OPERATIONS = ("start", "stop", "archive", "delete")
+DEFAULT_BULK_CONCURRENCY = 16
+# Desired and failure states a bulk operation waits for; delete completes on
+# acceptance because the Backend cleans up in the background.
+_BULK_WAIT_STATES: dict[str, tuple[frozenset[str], frozenset[str]]] = {
+    "start": (
+        frozenset({"running"}),
+        frozenset(s.lower() for s in AGENT_WAIT_RUNNING_FAILURE_STATES),
+    ),
+    "stop": (frozenset({"stopped"}), frozenset({"failed", "deleted"})),
+    "archive": (frozenset({"archived"}), frozenset({"failed", "deleted"})),
+}
+_SELECTOR_FIELDS = ("id", "name", "handle", "hostname", "state", "runtime", "tag")
+
+
+@dataclass
+class BulkItem:
+    """Outcome of one agent in a ``Deployments.bulk`` operation.
+
+    ``agent`` is the last snapshot seen for the agent: the settled state when
+    the operation was waited on, otherwise the operation's response.
+    ``error`` holds the exception when the call failed, the agent entered a
+    failure state, or the wait timed out.
+    """
+
+    agent_id: str
+    operation: str
+    agent: Agent | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def state(self) -> str | None:
+        return None if self.agent is None else self.agent.state
+
+
+def agent_selector(selector: str) -> Callable[[Agent], bool]:
+    """Compile ``name=web-*,state=running`` into an ``Agent`` predicate.
+
+    Terms are comma-separated ``field=glob`` pairs that must all match; a
+    bare glob matches the name. Fields: id, name, handle, hostname, state,
+    runtime and tag (any tag). ``state`` is compared case-insensitively.
+    """
+    terms: list[tuple[str, str]] = []
+    for raw in str(selector or "").split(","):
+        term = raw.strip()
+        if not term:
+            continue
+        key, sep, pattern = term.partition("=")
+        key, pattern = (key.strip().lower(), pattern.strip()) if sep else ("name", term)
+        if key not in _SELECTOR_FIELDS:
+            raise ValueError(
+                f"unknown selector field {key!r}; expected one of: {', '.join(_SELECTOR_FIELDS)}"
+            )
+        terms.append((key, pattern))
+    if not terms:
+        raise ValueError("selector must contain at least one field=pattern term")
+
+    def matches(agent: Agent) -> bool:
+        for key, pattern in terms:
+            if key == "tag":
+                if not any(fnmatch.fnmatchcase(tag, pattern) for tag in agent.tags or ()):
+                    return False
+            elif key == "state":
+                if not fnmatch.fnmatchcase(str(agent.state or "").upper(), pattern.upper()):
+                    return False
+            elif not fnmatch.fnmatchcase(str(getattr(agent, key) or ""), pattern):
+                return False
+        return True
+
+    return matches
+
+
+def _bulk_launch_config(
+    launch_config: dict | Callable[[Agent], dict] | None, agent: Agent
+) -> dict:
+    """The complete launch configuration a bulk start sends for *agent*."""
+    if callable(launch_config):
+        config = launch_config(agent)
+    elif launch_config is not None:
+        config = copy.deepcopy(launch_config)
+    else:
+        config = agent.launch_config
+    if not isinstance(config, dict):
+        raise ValueError(f"Agent {agent.id} has no launch configuration to start with")
+    return config
+
+
+def _check_bulk_operation(operation: str) -> str:
+    if operation not in BULK_OPERATIONS:
+        raise ValueError(f"operation must be one of: {', '.join(BULK_OPERATIONS)}")
+    return operation
+
+
+async def _bulk_operation(
+    operation: str,
+    agent_ids: list[str],
+    *,
+    perform: Callable[[str], Awaitable[Any]],
+    fetch: Callable[[str], Awaitable[Agent]],
+    list_agents: Callable[[], Awaitable[list[Agent]]],
+    events: DeploymentEventBus,
+    concurrency: int,
+    wait: bool,
+    timeout: float,
+    poll_interval: float,
+) -> list[BulkItem]:
+    """Run *perform* on every agent under a limit, then await all of them on one subscription.
+
+    The subscription opens before the first call so no transition is lost.
+    Events that could settle an agent confirm it with one REST read; quiet
+    periods reconcile every pending agent with one listing rather than a
+    read per agent.
+    """
+    _check_bulk_operation(operation)
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    loop = asyncio.get_running_loop()
+    agent_ids = list(dict.fromkeys(agent_ids))
+    items = {agent_id: BulkItem(agent_id, operation) for agent_id in agent_ids}
+    started: dict[str, float] = {}
+    waiting = wait and operation in _BULK_WAIT_STATES
+    subscription = (
+        events.subscribe(agent_ids, maxsize=max(256, 4 * len(agent_ids)), replay=False)
+        if waiting and agent_ids
+        else None
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(agent_id: str) -> None:
+        async with semaphore:
+            started[agent_id] = loop.time()
+            try:
+                result = await perform(agent_id)
+            except Exception as exc:
+                items[agent_id].error = exc
+            else:
+                if isinstance(result, Agent):
+                    items[agent_id].agent = result
+            items[agent_id].elapsed = loop.time() - started[agent_id]
+
+    try:
+        await asyncio.gather(*(run(agent_id) for agent_id in agent_ids))
+        if subscription is None:
+            return list(items.values())
+
+        desired, failures = _BULK_WAIT_STATES[operation]
+        pending = {agent_id for agent_id, item in items.items() if item.error is None}
+        deadline = loop.time() + timeout
+
+        def settle(agent: Agent) -> None:
+            if agent.id not in pending:
+                return
+            item = items[agent.id]
+            item.agent = agent
+            state = str(agent.state or "").lower()
+            if state in desired or state in failures:
+                pending.discard(agent.id)
+                item.elapsed = loop.time() - started[agent.id]
+                if state in failures:
+                    item.error = RuntimeError(
+                        f"Agent entered {agent.state} while waiting for "
+                        f"{', '.join(sorted(s.upper() for s in desired))}"
+                    )
+
+        async def confirm(agent_id: str) -> None:
+            async with semaphore:
+                try:
+                    settle(await fetch(agent_id))
+                except Exception:
+                    pass  # the next reconcile listing retries it
+
+        async def reconcile() -> None:
+            try:
+                listed = await list_agents()
+            except Exception:
+                return
+            for agent in listed:
+                settle(agent)
+            listed_ids = {agent.id for agent in listed}
+            for agent_id in [agent_id for agent_id in pending if agent_id not in listed_ids]:
+                pending.discard(agent_id)
+                items[agent_id].error = RuntimeError(f"Agent {agent_id} is no longer listed")
+                items[agent_id].elapsed = loop.time() - started[agent_id]
+
+        for item in list(items.values()):
+            if item.agent is not None:
+                settle(item.agent)
+        if pending:
+            await reconcile()
+        while pending and (remaining := deadline - loop.time()) > 0:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), timeout=min(remaining, max(poll_interval, 0.001))
+                )
+            except asyncio.TimeoutError:
+                await reconcile()
+                continue
+            batch = (event, *subscription.drain())
+            if any(item.type == DEPLOYMENT_RESYNC_EVENT for item in batch):
+                await reconcile()
+                continue
+            dirty = {
+                item.agent_id
+                for item in batch
+                if item.agent_id in pending and _event_may_settle(item, desired | failures)
+            }
+            await asyncio.gather(*(confirm(agent_id) for agent_id in dirty))
+        for agent_id in pending:
+            item = items[agent_id]
+            last = item.state or "unknown"
+            item.error = TimeoutError(
+                f"Timed out waiting for agent {agent_id} to reach "
+                f"{', '.join(sorted(s.upper() for s in desired))} (last={last})"
+            )
+            item.elapsed = loop.time() - started[agent_id]
+        return list(items.values())
+    finally:
+        if subscription is not None:
+            subscription.close()
+
+
+class ExecSession:
+    """Run many commands on one agent, reusing its exec credential.
+
+    The Backend exec WebSocket answers one request per connection, so instead
+    of holding a socket the session keeps the agent's exec token until shortly
+    before ``expires_at`` and pipelines commands over up to ``max_in_flight``
+    concurrent connections. Every submission gets a request ID; collect its
+    ``ExecResult`` with :meth:`result`. A handshake refused with 401/403 drops
+    the cached token and retries once with a fresh one.
+
+    Use as a context manager, or call :meth:`close` when done.
+    """
+
+    def __init__(
+        self,
+        deployments: "Deployments",
+        agent_id: str,
+        *,
+        max_in_flight: int = DEFAULT_EXEC_SESSION_IN_FLIGHT,
+        refresh_margin: float = AGENT_FILE_TOKEN_REFRESH_MARGIN_SECONDS,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.agent_id = agent_id
+        self.tokens_minted = 0
+        self._deployments = deployments
+        self._tokens = _ReefTokenCache(refresh_margin)
+        self._pool = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "ExecSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> list[str]:
+        """Request IDs submitted but not yet collected."""
+        with self._lock:
+            return list(self._pending)
+
+    def _credential(self) -> tuple[str, str]:
+        cached = self._tokens.get(self.agent_id)
+        if cached is not None:
+            return cached
+        with self._tokens.mint_lock(self.agent_id):
+            cached = self._tokens.get(self.agent_id)
+            if cached is not None:
+                return cached
+            ws_url, jwt, expires_at = self._deployments._mint_ws_token(self.agent_id, "exec")
+            self.tokens_minted += 1
+            self._tokens.put(self.agent_id, ws_url, jwt, expires_at)
+            return ws_url, jwt
+
+    def _run(self, request: dict[str, Any]) -> ExecResult:
+        ws_url, jwt = self._credential()
+        try:
+            result = self._deployments._ws_round_trip(
+                _ws_url_with_jwt(ws_url, jwt),
+                purpose="exec",
+                request=request,
+                timeout=request["timeout"] + 10,
+            )
+        except RuntimeError as exc:
+            if not _ws_credential_rejected(exc):
+                raise
+            self._tokens.invalidate(self.agent_id, jwt)
+            ws_url, jwt = self._credential()
+            result = self._deployments._ws_round_trip(
+                _ws_url_with_jwt(ws_url, jwt),
+                purpose="exec",
+                request=request,
+                timeout=request["timeout"] + 10,
+            )
+        return _validate_exec_result(result)
+
+    def submit(self, command: list[str], *, timeout: int = 30, dry_run: bool = False) -> str:
+        """Queue *command* and return its request ID without waiting."""
+        command = validate_exec_request(command, timeout)
+        request = {"command": command, "timeout": timeout, "dry_run": bool(dry_run)}
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ExecSession is closed")
+            request_id = secrets.token_hex(8)
+            self._pending[request_id] = self._pool.submit(self._run, request)
+        return request_id
+
+    def result(self, request_id: str, timeout: float | None = None) -> ExecResult:
+        """Wait for and return the result of *request_id*."""
+        with self._lock:
+            future = self._pending.get(request_id)
+        if future is None:
+            raise KeyError(f"Unknown or already collected exec request: {request_id}")
+        try:
+            return future.result(timeout=timeout)
+        finally:
+            if future.done():
+                with self._lock:
+                    self._pending.pop(request_id, None)
+
+    def run(self, command: list[str], *, timeout: int = 30, dry_run: bool = False) -> ExecResult:
+        """Run *command* and wait for its result."""
+        return self.result(self.submit(command, timeout=timeout, dry_run=dry_run))
+
+    def run_many(
+        self, commands: Iterable[list[str]], *, timeout: int = 30, dry_run: bool = False
+    ) -> list[ExecResult]:
+        """Pipeline *commands* and return their results in input order."""
+        request_ids = [
+            self.submit(command, timeout=timeout, dry_run=dry_run) for command in commands
+        ]
+        return [self.result(request_id) for request_id in request_ids]
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting commands; by default wait for in-flight ones."""
+        with self._lock:
+            self._closed = True
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+
+class AsyncExecSession:
+    """Async twin of :class:`ExecSession` for :class:`AsyncDeployments`."""
+
+    def __init__(
+        self,
+        deployments: "AsyncDeployments",
+        agent_id: str,
+        *,
+        max_in_flight: int = DEFAULT_EXEC_SESSION_IN_FLIGHT,
+        refresh_margin: float = AGENT_FILE_TOKEN_REFRESH_MARGIN_SECONDS,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.agent_id = agent_id
+        self.tokens_minted = 0
+        self._deployments = deployments
+        self._refresh_margin = refresh_margin
+        self._credential_entry: tuple[str, str, float] | None = None
+        self._mint_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._pending: dict[str, asyncio.Task] = {}
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncExecSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def pending(self) -> list[str]:
+        return list(self._pending)
+
+    def _cached_credential(self) -> tuple[str, str] | None:
+        entry = self._credential_entry
+        if entry is None or time.time() >= entry[2] - self._refresh_margin:
+            return None
+        return entry[0], entry[1]
+
+    async def _credential(self) -> tuple[str, str]:
+        cached = self._cached_credential()
+        if cached is not None:
+            return cached
+        async with self._mint_lock:
+            cached = self._cached_credential()
+            if cached is not None:
+                return cached
+            ws_url, jwt, expires_at = await self._deployments._mint_ws_token(self.agent_id, "exec")
+            self.tokens_minted += 1
+            try:
+                self._credential_entry = (ws_url, jwt, _parse_dt(expires_at).timestamp())
+            except (AttributeError, ValueError):
+                self._credential_entry = None
+            return ws_url, jwt
+
+    async def _round_trip(self, request: dict[str, Any], ws_url: str, jwt: str) -> object:
+        return await self._deployments._ws_round_trip(
+            _ws_url_with_jwt(ws_url, jwt),
+            purpose="exec",
+            request=request,
+            timeout=request["timeout"] + 10,
+        )
+
+    async def _run(self, request: dict[str, Any]) -> ExecResult:
+        async with self._slots:
+            ws_url, jwt = await self._credential()
+            try:
+                result = await self._round_trip(request, ws_url, jwt)
+            except RuntimeError as exc:
+                if not _ws_credential_rejected(exc):
+                    raise
+                entry = self._credential_entry
+                if entry is not None and entry[1] == jwt:
+                    self._credential_entry = None
+                result = await self._round_trip(request, *await self._credential())
+            return _validate_exec_result(result)
+
+    def submit(self, command: list[str], *, timeout: int = 30, dry_run: bool = False) -> str:
+        """Schedule *command* on the running loop and return its request ID."""
+        command = validate_exec_request(command, timeout)
+        if self._closed:
+            raise RuntimeError("ExecSession is closed")
+        request_id = secrets.token_hex(8)
+        request = {"command": command, "timeout": timeout, "dry_run": bool(dry_run)}
+        self._pending[request_id] = asyncio.ensure_future(self._run(request))
+        return request_id
+
+    async def result(self, request_id: str) -> ExecResult:
+        task = self._pending.get(request_id)
+        if task is None:
+            raise KeyError(f"Unknown or already collected exec request: {request_id}")
+        try:
+            return await task
+        finally:
+            if task.done():
+                self._pending.pop(request_id, None)
+
+    async def run(
+        self, command: list[str], *, timeout: int = 30, dry_run: bool = False
+    ) -> ExecResult:
+        return await self.result(self.submit(command, timeout=timeout, dry_run=dry_run))
+
+    async def run_many(
+        self, commands: Iterable[list[str]], *, timeout: int = 30, dry_run: bool = False
+    ) -> list[ExecResult]:
+        request_ids = [
+            self.submit(command, timeout=timeout, dry_run=dry_run) for command in commands
+        ]
+        return [await self.result(request_id) for request_id in request_ids]
+
+    async def close(self) -> None:
+        """Stop accepting commands and wait for in-flight ones."""
+        self._closed = True
+        if self._pending:
+            await asyncio.gather(*self._pending.values(), return_exceptions=True)
+
+
+class Deployments:
+    """
+    HyperClaw deployments API — manage agent runtimes.
+
+    Usage:
+        from hypercli import HyperCLI
+        client = HyperCLI(api_key="...", agent_api_key="sk-...")
+
+        # Launch
+        pod = client.deployments.create()
+        print(f"Desktop: {pod.vnc_url}")
+
+        # Execute a command
+        result = client.deployments.exec(pod, ["echo", "hello"])
+
+        # List
+        pods = client.deployments.list()
+
+        # Stop
+        client.deployments.stop(pod.id)
+
+    REST and Reef file calls reuse one keep-alive connection pool per host;
+    call ``close()`` (or use the instance as a context manager) to release it.
+
+    With an ``agent_index``, names, handles and hostnames resolve from that
+    cache; a miss tries the server's exact ``name``/``handle`` filters before
+    falling back to a full listing, which refreshes the index.
+    """
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        api_key: str = None,
+        api_base: str = None,
+        agents_ws_url: str = None,
+        timeout: float = None,
+        agent_index: AgentIndex | None = None,
+    ):
+        self._http = http
+        self._api_key = api_key or http.api_key
+        self._timeout = timeout if timeout is not None else getattr(http, "timeout", 30.0)
+        self._api_base = _normalize_agents_api_base(api_base or get_agents_api_base_url()).rstrip(
+            "/"
+        )
+        resolved_agents_ws_url = agents_ws_url or get_config_value("AGENTS_WS_URL")
+        self._agents_ws_url = (
+            _normalize_agents_ws_url(resolved_agents_ws_url)
+            if resolved_agents_ws_url
+            else _default_agents_ws_url(self._api_base)
+        )
+        self._clients = ClientPool(self._timeout)
+        self._reef_tokens = _ReefTokenCache()
+        self._agent_index = agent_index
+        self._event_buses: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def close(self) -> None:
+        """Close every pooled connection held by this client."""
+        self._clients.close()
+
+    def __enter__(self) -> "Deployments":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def async_client(self) -> "AsyncDeployments":
+        """Return an async-native twin sharing this client's credentials and endpoints."""
+        return AsyncDeployments(
+            api_key=self._api_key,
+            api_base=self._api_base,
+            agents_ws_url=self._agents_ws_url,
+            timeout=self._timeout,
+            deployments=self,
+        )
+
+    def _client(self, url: str) -> httpx.Client:
+        return self._clients.client(url)
+
+    def _hydrate_agent(self, data: dict) -> Agent:
+        agent = _agent_from_dict(data)
+        agent._deployments = self
+        if self._agent_index is not None:
+            self._agent_index.observe(agent)
+        return agent
+
+    @property
+    def _headers(self) -> dict:
+        return {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _get(self, path: str, params: dict = None) -> Any:
+        resp = self._client(self._api_base).get(
+            f"{self._api_base}{path}", headers=self._headers, params=params, timeout=self._timeout
+        )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
+
+    def _post(self, path: str, json: dict = None) -> Any:
+        resp = self._client(self._api_base).post(
+            f"{self._api_base}{path}", headers=self._headers, json=json, timeout=self._timeout
+        )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
+
+    def bootstrap_inference(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        response_format: dict[str, Any] | None = None,
+        timeout: float = 330.0,
+    ) -> dict:
+        """Run the JWT-authenticated onboarding inference endpoint."""
+        body = {
+            "messages": messages,
+            "response_format": response_format or {"type": "json_object"},
+        }
+        resp = self._client(self._api_base).post(
+            f"{self._api_base}/bootstrap",
+            headers=self._headers,
+            json=body,
+            timeout=timeout,
+        )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
+
+    def _patch(self, path: str, json: dict = None) -> Any:
+        resp = self._client(self._api_base).patch(
+            f"{self._api_base}{path}", headers=self._headers, json=json, timeout=self._timeout
+        )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
+
+    def _put(self, path: str, json: dict = None) -> Any:
+        resp = self._client(self._api_base).put(
+            f"{self._api_base}{path}", headers=self._headers, json=json, timeout=self._timeout
+        )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
+
+    def _delete(self, path: str) -> Any:
+        resp = self._client(self._api_base).delete(
+            f"{self._api_base}{path}", headers=self._headers, timeout=self._timeout
+        )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
+
+    def _agent_id_for_target(self, target: Agent | str) -> str:
+        if isinstance(target, Agent):
+            return target.id
+        return self.resolve_agent_id(str(target))
+
+    def _get_by_id(self, agent_id: str) -> Agent:
+        data = self._get(f"{AGENTS_API_PREFIX}/{agent_id}")
+        return self._hydrate_agent(data)
+
+    def resolve_agent(self, agent_id_or_name: str) -> Agent:
+        """Resolve an agent UUID, unique name, handle, or hostname to an Agent."""
+        raw = str(agent_id_or_name or "").strip()
+        if not raw:
+            raise ValueError("agent_id_or_name is required")
+        try:
+            return self._get_by_id(str(UUID(raw)))
+        except ValueError:
+            pass
+        if self._agent_index is None:
+            return self._get_by_id(_resolve_agent_match(raw, self.list()).id)
+
+        agent_id = self._resolve_indexed(raw)
+        try:
+            agent = self._get_by_id(agent_id)
+        except APIError as exc:
+            if exc.status_code != 404:
+                raise
+            agent = None
+        if agent is None or not _agent_matches_ref(agent, raw):
+            # Deleted or renamed since it was cached
+            self._agent_index.remove(agent_id)
+            self._agent_index.invalidate()
+            agent = self._get_by_id(self._resolve_indexed(raw))
+        return agent
+
+    def _resolve_indexed(self, raw: str) -> str:
+        """Resolve *raw* through the agent index, then server filters, then a full listing."""
+        index = self._agent_index
+        try:
+            cached = index.match(raw)
+            if len(cached) == 1:
+                return cached[0]
+            for key in ("name", "handle"):
+                found = self.list_with_capacity(**{key: raw}).items
+                if len(found) == 1:
+                    return found[0].id
+            agents = self.list()
+            index.replace(agents)
+            return _resolve_agent_match(raw, agents).id
+        finally:
+            index.save()
+
+    def resolve_agent_id(self, agent_id_or_name: str) -> str:
+        raw = str(agent_id_or_name or "").strip()
+        if not raw:
+            raise ValueError("agent_id_or_name is required")
+        if _is_self_agent_ref(raw):
+            # An Agent reads its own status and manages its own routes -- it
+            # is the only party that knows the port it just bound. It does not
+            # start or stop itself; that is the owner's. Both self operations
+            # are served by dedicated /self endpoints, so nothing resolves a
+            # self reference to an id here.
+            raise ValueError("self is only supported for status and routes")
+        if _is_direct_agent_id_ref(raw):
+            return raw
+        if self._agent_index is not None:
+            return self._resolve_indexed(raw)
+        return self.resolve_agent(raw).id
+
+    def _file_headers(self, *, content_type: str | None = None) -> dict[str, str]:
+        headers = {"Authorization": f"Bearer {self._api_key}"}
+        if content_type:
+            headers["Content-Type"] = content_type
+        return headers
+
+    def wait_for_file_api_ready(
+        self,
+        agent_id: str,
+        *,
+        timeout: float = 90.0,
+        consecutive: int = 2,
+        poll_seconds: float = 1.0,
+    ) -> None:
+        """Wait until an Agent's Reef file API is actually serving.
+
+        Probing the Agent hostname alone cannot answer this. The Agent domain is
+        a wildcard, so a host with no route still resolves and the edge answers a
+        plain-text ``404 page not found`` -- byte for byte what a route that has
+        not converged yet returns. A caller polling the hostname therefore cannot
+        tell "not ready" from "never will be", and will happily retry until its
+        deadline against a host that was never going to work.
+
+        So ask the API for the authoritative Agent state first: a deleted or
+        failed Agent fails immediately with that state rather than timing out.
+        Then require consecutive successful reads, because one success only
+        proves the route answered once -- the next request can still 404 while
+        the edge settles.
+        """
+
+        deadline = time.monotonic() + timeout
+        streak = 0
+        last_error: Exception | None = None
+        last_state = ""
+        while True:
+            agent = self.get(agent_id)
+            last_state = str(getattr(agent, "state", "") or "").upper()
+            if last_state in {"DELETED", "FAILED"}:
+                raise RuntimeError(
+                    f"Agent {agent_id} is {last_state}; its Reef file API will "
+                    "not serve. Waiting longer cannot help."
+                )
+            try:
+                self.files_list(agent_id, "")
+            except Exception as exc:  # noqa: BLE001 - any read failure resets the streak
+                last_error = exc
+                streak = 0
+            else:
+                streak += 1
+                if streak >= consecutive:
+                    return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Agent {agent_id} Reef file API did not serve {consecutive} "
+                    f"consecutive reads within {timeout:.0f}s "
+                    f"(agent state={last_state or 'unknown'}, "
+                    f"last error={last_error})"
+                )
+            time.sleep(poll_seconds)
+
+    def _reef_file_access(self, agent_id: str) -> tuple[str, str]:
+        """Return a cached file credential, minting one when none is still fresh."""
+        cached = self._reef_tokens.get(agent_id)
+        if cached is not None:
+            return cached
+        with self._reef_tokens.mint_lock(agent_id):
+            cached = self._reef_tokens.get(agent_id)
+            if cached is not None:
+                return cached
+            payload = self._post(f"{AGENTS_API_PREFIX}/{agent_id}/files/token")
+            reef_url, token, expires_at = _validate_reef_file_access(payload)
+            self._reef_tokens.put(agent_id, reef_url, token, expires_at)
+            return reef_url, token
+
+    def _reef_request(
+        self,
+        agent_id: str,
+        send: Callable[[str, str], httpx.Response],
+        *,
+        retry_unauthorized: bool = True,
+    ) -> httpx.Response:
+        """Call Reef with the cached credential, re-minting it once on ``401``."""
+        reef_url, token = self._reef_file_access(agent_id)
+        resp = send(reef_url, token)
+        if resp.status_code == 401:
+            self._reef_tokens.invalidate(agent_id, token)
+        if resp.status_code == 401 and retry_unauthorized:
+            reef_url, token = self._reef_file_access(agent_id)
+            resp = send(reef_url, token)
+        if not 200 <= resp.status_code < 300:
+            self._raise_reef_error(resp)
+        return resp
+
+    @staticmethod
+    def _reef_headers(token: str, *, content_type: str | None = None) -> dict[str, str]:
+        headers = {"Authorization": f"Bearer {token}"}
+        if content_type:
+            headers["Content-Type"] = content_type
+        return headers
+
+    @staticmethod
+    def _raise_reef_error(response: httpx.Response) -> None:
+        raise _reef_error(response)
+
+    def _mint_ws_token(
+        self, agent_id: str, purpose: Literal["metrics", "exec"]
+    ) -> tuple[str, str, str]:
+        """Mint a WebSocket credential; returns ``(ws_url, jwt, expires_at)``."""
+        token_data = self._post(f"{AGENTS_API_PREFIX}/{agent_id}/{purpose}/token")
+        ws_url, jwt, _ = _validate_agent_ws_token(
+            token_data,
+            agent_id=agent_id,
+            purpose=purpose,
+        )
+        return ws_url, jwt, token_data["expires_at"]
+
+    def _one_shot_ws_result(
+        self,
+        *,
+        agent_id: str,
+        purpose: Literal["metrics", "exec"],
+        request: dict[str, Any] | None = None,
+        timeout: float,
+    ) -> object:
+        ws_url, jwt, _ = self._mint_ws_token(agent_id, purpose)
+        return self._ws_round_trip(
+            _ws_url_with_jwt(ws_url, jwt), purpose=purpose, request=request, timeout=timeout
+        )
+
+    def _ws_round_trip(
+        self,
+        url: str,
+        *,
+        purpose: Literal["metrics", "exec"],
+        request: dict[str, Any] | None,
+        timeout: float,
+    ) -> object:
+        """Send one request frame and read the single result frame."""
+        from websockets.exceptions import ConnectionClosed, WebSocketException
+        from websockets.sync.client import connect
+
+        try:
+            with connect(
+                url,
+                open_timeout=min(timeout, 10),
+                close_timeout=10,
+                max_size=AGENT_EXEC_RESULT_MAX_MESSAGE_BYTES,
+            ) as ws:
+                if request is not None:
+                    ws.send(json.dumps(request, separators=(",", ":")))
+                result = _decode_ws_result(ws.recv(timeout=timeout), purpose)
+                try:
+                    ws.recv(timeout=10)
+                except ConnectionClosed as exc:
+                    code = exc.rcvd.code if exc.rcvd is not None else None
+                    if code != 1000:
+                        raise _ws_close_error(exc, purpose, before_result=False) from exc
+                else:
+                    raise RuntimeError(
+                        f"Agent {purpose} WebSocket returned more than one result frame"
+                    )
+                return result
+        except ConnectionClosed as exc:
+            raise _ws_close_error(exc, purpose, before_result=True) from exc
+        except (TimeoutError, OSError, WebSocketException) as exc:
+            raise RuntimeError(
+                f"Agent {purpose} WebSocket connection failed: {exc}"
+            ) from exc
+
+    # -----------------------------------------------------------------------
+    # Agent lifecycle (HyperClaw backend → Lagoon)
+    # -----------------------------------------------------------------------
+
+    def create(
+        self,
+        name: str = None,
+        handle: str = None,
+        size: str = None,
+        runtime: ManagedAgentRuntime | None = None,
+        config: dict = None,
+        tags: list[str] = None,
+        env: dict = None,
+        secrets: dict = None,
+        routes: dict = None,
+        command: list[str] = None,
+        entrypoint: list[str] = None,
+        image: str = None,
+        sync_root: str = None,
+        sync_include: list[str] | None | object = _UNSET,
+        sync_exclude: list[str] | None | object = _UNSET,
+        sync_uid: int = None,
+        sync_gid: int = None,
+        registry_url: str = None,
+        registry_auth: dict = None,
+        restart: bool = False,
+        runtime_scopes: list[str] | None = None,
+        meta_ui: dict = None,
+        dry_run: bool = False,
+    ) -> Agent:
+        """Submit provisioning for a new agent and return its admission snapshot.
+
+        Args:
+            name: Agent name.
+            size: Size preset (small/medium/large). When omitted, the backend defaults to small.
+            config: Optional config overrides.
+            env: Optional environment variables to pass through to the pod.
+            secrets: Optional secret environment variables to pass through to the pod.
+            sync_root: Absolute runtime mount path for retained PVC storage.
+            sync_include: Relative paths to upload/restore. Must contain at
+                least one path when supplied; ``None`` selects the whole root.
+            sync_exclude: Relative patterns omitted from whole-root mode. An
+                empty list excludes nothing. Ignored when an include is active.
+        Returns:
+            Agent, normally in ``CREATING``. Wait for ``STOPPED`` before file
+            access or calling :meth:`start`.
+
+        Steady Reef synchronization is PVC-to-object-storage upload/overwrite,
+        not a continuous two-way mirror. Ordinary filesystem deletes are not
+        propagated; Files API deletes are. Remote-to-PVC copying occurs only
+        during explicit cold restore.
+        """
+        launch_options: dict[str, Any] = {
+            "env": env,
+            "secrets": secrets,
+            "routes": routes,
+            "command": command,
+            "entrypoint": entrypoint,
+            "image": image,
+            "sync_root": sync_root,
+            "sync_include": sync_include,
+            "sync_exclude": sync_exclude,
+            "sync_uid": sync_uid,
+            "sync_gid": sync_gid,
+            "registry_url": registry_url,
+            "registry_auth": registry_auth,
+            "restart": restart,
+            "runtime_scopes": runtime_scopes,
+        }
+        body, complete_launch = _build_create_request(
+            config,
+            name=name,
+            handle=handle,
+            size=size,
+            runtime=runtime,
+            tags=tags,
+            meta_ui=meta_ui,
+            dry_run=dry_run,
+            **launch_options,
+        )
+        data = self._post(AGENTS_API_PREFIX, json=body)
+        agent = self._hydrate_agent(data)
+        agent.__dict__["_submitted_launch_config"] = complete_launch
+        return agent
+
+    def create_openclaw(
+        self,
+        name: str = None,
+        handle: str = None,
+        size: str = None,
+        config: dict = None,
+        tags: list[str] = None,
+        env: dict = None,
+        secrets: dict = None,
+        routes: dict = None,
+        command: list[str] = None,
+        entrypoint: list[str] = None,
+        image: str = None,
+        sync_root: str = None,
+        sync_include: list[str] | None | object = _UNSET,
+        sync_exclude: list[str] | None | object = _UNSET,
+        sync_uid: int = None,
+        sync_gid: int = None,
+        registry_url: str = None,
+        registry_auth: dict = None,
+        runtime_scopes: list[str] | None = None,
+        gateway_token: str = None,
+        heartbeat: dict = None,
+        meta_ui: dict = None,
+        dry_run: bool = False,
+        openclaw_routes: dict | None = None,
+        openclaw_route_options: dict | None = None,
+        memory_index: dict | None = None,
+        workspaces_sync: dict | bool | None = None,
+        runtime: ManagedAgentRuntime = "openclaw",
+    ) -> Agent:
+        """Create OpenClaw with retained ``/home/node`` and cache exclusions.
+
+        Unlike generic create, omitted sync policy arguments select the
+        OpenClaw cache/Workspace exclusion policy. Pass ``sync_include=None``
+        or ``sync_exclude=None`` to request whole-root persistence explicitly.
+        """
+        effective_sync_include, effective_sync_exclude = _resolve_openclaw_sync_policy(
+            sync_include=sync_include,
+            sync_exclude=sync_exclude,
+        )
+        effective_env, secret_map, effective_gateway_token = _inject_openclaw_gateway_token(
+            env,
+            secrets,
+            gateway_token,
+            generate=True,
+        )
+        effective_env = {
+            **build_openclaw_workspaces_sync_env(workspaces_sync),
+            **build_openclaw_memory_index_env(memory_index),
+            **effective_env,
+        }
+        agent = self.create(
+            name=name,
+            handle=handle,
+            size=size,
+            runtime=runtime,
+            config=_build_openclaw_runtime_config(config, heartbeat),
+            tags=tags,
+            env=effective_env,
+            secrets=secret_map,
+            routes=_resolve_openclaw_routes(
+                routes,
+                openclaw_routes=openclaw_routes,
+                openclaw_route_options=openclaw_route_options,
+            ),
+            command=command,
+            entrypoint=entrypoint,
+            image=_default_openclaw_image(image),
+            sync_root=sync_root if sync_root is not None else DEFAULT_OPENCLAW_SYNC_ROOT,
+            sync_include=effective_sync_include,
+            sync_exclude=effective_sync_exclude,
+            sync_uid=sync_uid,
+            sync_gid=sync_gid,
+            registry_url=registry_url,
+            registry_auth=registry_auth,
+            runtime_scopes=runtime_scopes,
+            meta_ui=meta_ui,
+            dry_run=dry_run,
+        )
+        if isinstance(agent, OpenClawAgent):
+            agent.gateway_token = effective_gateway_token
+        return agent
+
+    def create_hermes_agent(
+        self,
+        name: str = None,
+        handle: str = None,
+        size: str = None,
+        config: dict = None,
+        tags: list[str] = None,
+        env: dict = None,
+        secrets: dict = None,
+        routes: dict = None,
+        command: list[str] = None,
+        entrypoint: list[str] = None,
+        image: str = None,
+        sync_root: str = None,
+        sync_include: list[str] | None | object = _UNSET,
+        sync_exclude: list[str] | None | object = _UNSET,
+        sync_uid: int = None,
+        sync_gid: int = None,
+        registry_url: str = None,
+        registry_auth: dict = None,
+        restart: bool = False,
+        runtime_scopes: list[str] | None = None,
+        api_server_key: str = None,
+        meta_ui: dict = None,
+        dry_run: bool = False,
+        hermes_routes: dict | None = None,
+        hermes_route_options: dict | None = None,
+    ) -> HermesAgent:
+        """Create a first-class Hermes Agent runtime."""
+        effective_env, effective_secrets, effective_key = _inject_hermes_api_server_key(
+            env,
+            secrets,
+            api_server_key,
+        )
+        agent = self.create(
+            name=name,
+            handle=handle,
+            size=size,
+            runtime="hermes-agent",
+            config=config,
+            tags=tags,
+            env=effective_env,
+            secrets=effective_secrets,
+            routes=_resolve_hermes_agent_routes(
+                routes,
+                hermes_routes=hermes_routes,
+                hermes_route_options=hermes_route_options,
+            ),
+            command=command,
+            entrypoint=entrypoint,
+            image=DEFAULT_HERMES_AGENT_IMAGE if image is None else image,
+            sync_root=sync_root if sync_root is not None else DEFAULT_HERMES_AGENT_SYNC_ROOT,
+            sync_include=sync_include,
+            sync_exclude=sync_exclude,
+            sync_uid=10000 if sync_uid is None else sync_uid,
+            sync_gid=10000 if sync_gid is None else sync_gid,
+            registry_url=registry_url,
+            registry_auth=registry_auth,
+            restart=restart,
+            runtime_scopes=runtime_scopes,
+            meta_ui=meta_ui,
+            dry_run=dry_run,
+        )
+        if not isinstance(agent, HermesAgent):
+            raise TypeError("backend did not return a HermesAgent deployment")
+        agent.api_server_key = effective_key
+        return agent
+
+    def create_openclaw_pro(
+        self,
+        name: str = None,
+        handle: str = None,
+        size: str = None,
+        config: dict = None,
+        tags: list[str] = None,
+        env: dict = None,
+        secrets: dict = None,
+        routes: dict = None,
+        command: list[str] = None,
+        entrypoint: list[str] = None,
+        image: str = None,
+        sync_root: str = None,
+        sync_include: list[str] | None | object = _UNSET,
+        sync_exclude: list[str] | None | object = _UNSET,
+        sync_uid: int = None,
+        sync_gid: int = None,
+        registry_url: str = None,
+        registry_auth: dict = None,
+        runtime_scopes: list[str] | None = None,
+        gateway_token: str = None,
+        heartbeat: dict = None,
+        meta_ui: dict = None,
+        dry_run: bool = False,
+        openclaw_routes: dict | None = None,
+        openclaw_route_options: dict | None = None,
+        memory_index: dict | None = None,
+        workspaces_sync: dict | bool | None = None,
+    ) -> Agent:
+        effective_env = {"OPENCLAW_DESKTOP_ENABLED": "1", **dict(env or {})}
+        effective_route_options = {"include_desktop": True, **dict(openclaw_route_options or {})}
+        return self.create_openclaw(
+            name=name,
+            handle=handle,
+            size=size,
+            config=config,
+            tags=tags,
+            env=effective_env,
+            secrets=secrets,
+            routes=routes,
+            command=command,
+            entrypoint=entrypoint,
+            image=_default_openclaw_pro_image(image),
+            sync_root=sync_root,
+            sync_include=sync_include,
+            sync_exclude=sync_exclude,
+            sync_uid=sync_uid,
+            sync_gid=sync_gid,
+            registry_url=registry_url,
+            registry_auth=registry_auth,
+            runtime_scopes=(
+                list(DEFAULT_AGENT_RUNTIME_SCOPES) if runtime_scopes is None else runtime_scopes
+            ),
+            gateway_token=gateway_token,
+            heartbeat=heartbeat,
+            meta_ui=meta_ui,
+            dry_run=dry_run,
+            openclaw_routes=openclaw_routes,
+            openclaw_route_options=effective_route_options,
+            memory_index=memory_index,
+            workspaces_sync=workspaces_sync,
+            runtime="openclaw-pro",
+        )
+
+    def _create_coding_agent(
+        self,
+        *,
+        runtime: CodingAgentRuntime,
+        name: str | None = None,
+        handle: str | None = None,
+        size: str | None = None,
+        config: dict | None = None,
+        tags: list[str] | None = None,
+        env: dict | None = None,
+        secrets: dict | None = None,
+        routes: dict | None = None,
+        command: list[str] | None = None,
+        entrypoint: list[str] | None = None,
+        image: str | None = None,
+        sync_root: str | None = None,
+        sync_include: list[str] | None | object = _UNSET,
+        sync_exclude: list[str] | None | object = _UNSET,
+        sync_uid: int | None = None,
+        sync_gid: int | None = None,
+        registry_url: str | None = None,
+        registry_auth: dict | None = None,
+        restart: bool = False,
+        runtime_scopes: list[str] | None = None,
+        meta_ui: dict | None = None,
+        dry_run: bool = False,
+        workspaces_sync: dict | bool | None = None,
+        buzz_enabled: bool = False,
+        buzz: BuzzLaunchConfig | None = None,
+    ) -> Agent:
+        """Create a coding runtime with its runtime-specific include default.
+
+        An explicit nullable sync policy opts out of that helper default and
+        selects whole-root persistence. ``sync_include=[]`` is invalid.
+        """
+        if buzz_enabled and buzz is not None:
+            raise ValueError("buzz_enabled cannot be combined with buzz")
+        if (buzz_enabled or buzz is not None) and command is not None:
+            raise ValueError("Buzz launch cannot be combined with an explicit command")
+        buzz_launch = buzz_enabled or buzz is not None
+        if buzz_launch and size not in (None, "large"):
+            raise ValueError("Buzz coding agents require size='large'")
+        effective_env = {
+            **build_openclaw_workspaces_sync_env(workspaces_sync),
+            **dict(env or {}),
+        }
+        effective_secrets = dict(secrets or {})
+        for key in ("BUZZ_PRIVATE_KEY", "NOSTR_PRIVATE_KEY"):
+            value = effective_env.pop(key, None)
+            if value is not None:
+                existing = effective_secrets.get(key)
+                if existing is not None and existing != value:
+                    raise ValueError(f"{key} conflicts between env and secrets")
+                effective_secrets[key] = value
+        if buzz is not None:
+            for key in BUZZ_RESERVED_ENV_KEYS:
+                effective_env.pop(key, None)
+            effective_env.update(buzz.environment(runtime, default_session_title=name))
+            effective_secrets.update(buzz.secrets())
+        if buzz_launch:
+            effective_env.setdefault("RUST_LOG", DEFAULT_BUZZ_RUST_LOG)
+        (
+            effective_sync_include,
+            effective_sync_exclude,
+        ) = _resolve_coding_agent_sync_policy(
+            runtime,
+            sync_include=sync_include,
+            sync_exclude=sync_exclude,
+        )
+        # Hosted Buzz shutdown is process-driven. Never let a generic coding
+        # launch override resurrect the adapter after `!shutdown`.
+        effective_restart = False if buzz_launch else restart
+        return self.create(
+            name=name,
+            handle=handle,
+            size="large" if buzz_launch else size,
+            runtime=runtime,
+            config=config,
+            tags=tags,
+            env=effective_env,
+            secrets=effective_secrets,
+            routes={} if routes is None else routes,
+            command=(["/usr/local/bin/buzz-acp"] if buzz_enabled or buzz is not None else command),
+            entrypoint=entrypoint,
+            image=image
+            or (
+                DEFAULT_BUZZ_CODING_AGENT_IMAGES[runtime]
+                if buzz_launch
+                else DEFAULT_CODING_AGENT_IMAGES[runtime]
+            ),
+            sync_root=sync_root if sync_root is not None else DEFAULT_CODING_AGENT_SYNC_ROOT,
+            sync_include=effective_sync_include,
+            sync_exclude=effective_sync_exclude,
+            sync_uid=1000 if sync_uid is None else sync_uid,
+            sync_gid=1000 if sync_gid is None else sync_gid,
+            registry_url=registry_url,
+            registry_auth=registry_auth,
+            restart=effective_restart,
+            runtime_scopes=(
+                list(DEFAULT_AGENT_RUNTIME_SCOPES) if runtime_scopes is None else runtime_scopes
+            ),
+            meta_ui=meta_ui,
+            dry_run=dry_run,
+        )
+
+    def create_opencode(self, **kwargs: Any) -> OpenCodeAgent:
+        """Create a hosted OpenCode ACP runtime with workspace boot sync."""
+        return self._create_coding_agent(
+            runtime="opencode",
+            **kwargs,
+        )  # type: ignore[return-value]
+
+    def create_buzz_agent(self, **kwargs: Any) -> BuzzAgent:
+        """Create the native Buzz ACP runtime with workspace boot sync."""
+        return self._create_coding_agent(
+            runtime="buzz-agent",
+            **kwargs,
+        )  # type: ignore[return-value]
+
+    def create_codex(self, **kwargs: Any) -> CodexAgent:
+        """Create a hosted Codex ACP runtime with workspace boot sync."""
+        return self._create_coding_agent(
+            runtime="codex",
+            **kwargs,
+        )  # type: ignore[return-value]
+
+    def create_claude_code(self, **kwargs: Any) -> ClaudeCodeAgent:
+        """Create a hosted Claude Code ACP runtime with workspace boot sync."""
+        return self._create_coding_agent(
+            runtime="claude-code",
+            **kwargs,
+        )  # type: ignore[return-value]
+
+    def create_goose(self, **kwargs: Any) -> GooseAgent:
+        """Create a hosted Goose native ACP runtime with workspace boot sync."""
+        return self._create_coding_agent(
+            runtime="goose",
+            **kwargs,
+        )  # type: ignore[return-value]
+
+    def create_kimi_code(self, **kwargs: Any) -> KimiCodeAgent:
+        """Create a hosted Kimi Code ACP runtime using Moonshot upstream."""
+        return self._create_coding_agent(
+            runtime="kimi-code",
+            **kwargs,
+        )  # type: ignore[return-value]
+
+    def budget(self) -> dict:
+        """Get the user's current agent resource budget and usage.
+
+        Returns:
+            Dict with budget, used, available (all in cores/GB).
+        """
+        return self._get(f"{AGENTS_API_PREFIX}/budget")
+
+    def metrics(self, agent_id_or_name: str) -> dict:
+        """Get one live CPU/memory sample through the Backend WebSocket facade.
+
+        Args:
+            agent_id: Agent UUID.
+
+        Returns:
+            Exact successful ``agent_metrics_result`` frame for the Reef runtime.
+        """
+        agent_id = self.resolve_agent_id(agent_id_or_name)
+        result = self._one_shot_ws_result(
+            agent_id=agent_id,
+            purpose="metrics",
+            timeout=max(self._timeout, 35),
+        )
+        return _validate_metrics_result(result)
+
+    def list(
+        self,
+        *,
+        state: str | None = None,
+        handle: str | None = None,
+        name: str | None = None,
+        query: str | None = None,
+        include_deleted: bool | None = None,
+    ) -> list[Agent]:
+        """List all agents for the authenticated user.
+
+        Returns:
+            List of Agent objects.
+        """
+        return self.list_with_capacity(
+            state=state,
+            handle=handle,
+            name=name,
+            query=query,
+            include_deleted=include_deleted,
+        ).items
+
+    def list_with_capacity(
+        self,
+        *,
+        state: str | None = None,
+        handle: str | None = None,
+        name: str | None = None,
+        query: str | None = None,
+        include_deleted: bool | None = None,
+    ) -> AgentCapacity:
+        """List agents without discarding the account capacity envelope."""
+        data = self._get(
+            AGENTS_API_PREFIX,
+            params=_agent_list_params(
+                state=state,
+                handle=handle,
+                name=name,
+                query=query,
+                include_deleted=include_deleted,
+            ),
+        )
+        items = [self._hydrate_agent(item) for item in _agent_list_items(data)]
+        return _agent_capacity_from_payload(data, items)
+
+    def get(self, agent_id_or_name: str) -> Agent:
+        """Get agent details by UUID or unique name.
+
+        Args:
+            agent_id_or_name: Agent UUID, unique name, handle, or hostname.
+
+        Returns:
+            Agent with current status.
+        """
+        raw = str(agent_id_or_name or "").strip()
+        if not raw:
+            raise ValueError("agent_id_or_name is required")
+        if _is_self_agent_ref(raw):
+            return self._get_by_id("self")
+        if not _is_direct_agent_id_ref(raw):
+            return self.resolve_agent(raw)
+        try:
+            return self._get_by_id(raw)
+        except APIError as exc:
+            if exc.status_code not in {404, 422}:
+                raise
+            try:
+                UUID(raw)
+            except ValueError:
+                return self.resolve_agent(raw)
+            raise
+
+    def access_identity(self) -> AgentAccessIdentity:
+        """Resolve who the presented credential is, per the Backend.
+
+        Answers the three questions a credential should be able to ask about
+        itself: which Agent it is (``agent_id``, set only for an Agent runtime
+        key), which account owns it (``user_id``, ``team_id``, ``plan_id``), and
+        what it may do (``tags``, ``capabilities``). It returns only what the
+        credential already carries, so it is unscoped and safe for any caller.
+
+        Returns:
+            AgentAccessIdentity for the credential this client authenticates
+            with. ``is_agent_runtime_key`` is True when it belongs to one Agent.
+        """
+        return AgentAccessIdentity.from_dict(self._get(f"{AGENTS_API_PREFIX}/auth/me"))
+
+    def create_external_agent(
+        self,
+        *,
+        name: str,
+        display_name: str | None = None,
+        handle: str | None = None,
+        runtime: str = "openclaw",
+        status: str = "active",
+        meta: dict | None = None,
+    ) -> Agent:
+        """Register a customer-hosted external agent and return its show-once relay key."""
+        body: dict[str, Any] = {
+            "name": name,
+            "runtime": runtime,
+            "status": status,
+        }
+        if display_name is not None:
+            body["display_name"] = display_name
+        if handle is not None:
+            body["handle"] = handle
+        if meta is not None:
+            body["meta"] = meta
+        return self._hydrate_agent(self._post("/external-agents", body))
+
+    def update_external_agent(
+        self,
+        external_agent_id: str,
+        *,
+        name: str | None | object = _UNSET,
+        display_name: str | None | object = _UNSET,
+        handle: str | None | object = _UNSET,
+        runtime: Literal["openclaw"] | None | object = _UNSET,
+        status: Literal["active", "inactive", "error"] | None | object = _UNSET,
+        meta: dict | None | object = _UNSET,
+    ) -> Agent:
+        """Update a customer-hosted external agent by its exact backend ID."""
+        body: dict[str, Any] = {}
+        if name is not _UNSET:
+            body["name"] = name
+        if display_name is not _UNSET:
+            body["display_name"] = display_name
+        if handle is not _UNSET:
+            body["handle"] = handle
+        if runtime is not _UNSET:
+            body["runtime"] = runtime
+        if status is not _UNSET:
+            body["status"] = status
+        if meta is not _UNSET:
+            body["meta"] = meta
+        data = self._patch(f"/external-agents/{external_agent_id}", body)
+        return self._hydrate_agent(data)
+
+    def rotate_external_agent_key(self, agent_id_or_name: str) -> dict:
+        """Rotate an external agent relay key and return the new plaintext key once."""
+        agent_id = self.resolve_agent_id(agent_id_or_name)
+        return self._post(f"/external-agents/{agent_id}/keys/rotate")
+
+    def attach_slack_relay_agent(
+        self,
+        agent_id_or_name: str,
+        *,
+        relay_base_url: str,
+        token: str | None = None,
+        allowed_channel_id: str | None = None,
+        allowed_user_id: str | None = None,
+    ) -> dict:
+        """Attach an agent to the hosted HyperCLI Slack relay.
+
+        The relay verifies the caller's Slack install and persists the OpenClaw
+        Slack relay launch config on the backend. Running agents still need a
+        restart before OpenClaw reads the updated channel config.
+        """
+        resolved_agent_id = self.resolve_agent_id(agent_id_or_name)
+        relay_base = _normalize_slack_relay_base_url(relay_base_url)
+        auth_token = token or self._api_key
+        headers = {"Authorization": f"Bearer {auth_token}", "Content-Type": "application/json"}
+        body: dict[str, str] = {}
+        if allowed_channel_id:
+            body["allowed_channel_id"] = allowed_channel_id
+        if allowed_user_id:
+            body["allowed_user_id"] = allowed_user_id
+        resp = self._client(relay_base).post(
+            f"{relay_base}/slack/agents/{resolved_agent_id}/relay",
+            headers=headers,
+            json=body,
+            timeout=30,
+        )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
+
+    def list_slack_directory_conversations(
+        self,
+        *,
+        relay_base_url: str,
+        token: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        types: str | None = None,
+    ) -> dict:
+        """List sanitized Slack conversations visible to the hosted relay install."""
+        relay_base = _normalize_slack_relay_base_url(relay_base_url)
+        auth_token = token or self._api_key
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        params: dict[str, Any] = {}
+        if cursor:
+            params["cursor"] = cursor
+        if limit is not None:
+            params["limit"] = int(limit)
+        if types:
+            params["types"] = types
+        resp = self._client(relay_base).get(
+            f"{relay_base}/slack/directory/conversations",
+            headers=headers,
+            params=params,
+            timeout=30,
+        )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
 
-    # -----------------------------------------------------------------------
-    # Agent lifecycle (HyperClaw backend → Lagoon)
-    # -----------------------------------------------------------------------
+    def list_slack_directory_users(
+        self,
+        *,
+        relay_base_url: str,
+        token: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> dict:
+        """List sanitized Slack users visible to the hosted relay install."""
+        relay_base = _normalize_slack_relay_base_url(relay_base_url)
+        auth_token = token or self._api_key
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        params: dict[str, Any] = {}
+        if cursor:
+            params["cursor"] = cursor
+        if limit is not None:
+            params["limit"] = int(limit)
+        resp = self._client(relay_base).get(
+            f"{relay_base}/slack/directory/users", headers=headers, params=params, timeout=30
+        )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
 
-    def create(
+    async def subscribe(
         self,
-        name: str = None,
-        handle: str = None,
-        size: str = None,
-        runtime: ManagedAgentRuntime | None = None,
-        config: dict = None,
-        tags: list[str] = None,
-        env: dict = None,
-        secrets: dict = None,
-        routes: dict = None,
-        command: list[str] = None,
-        entrypoint: list[str] = None,
-        image: str = None,
-        sync_root: str = None,
-        sync_include: list[str] | None | object = _UNSET,
-        sync_exclude: list[str] | None | object = _UNSET,
-        sync_uid: int = None,
-        sync_gid: int = None,
-        registry_url: str = None,
-        registry_auth: dict = None,
-        restart: bool = False,
-        runtime_scopes: list[str] | None = None,
-        meta_ui: dict = None,
-        dry_run: bool = False,
+        handler: Callable[[DeploymentEvent], Any],
+        *,
+        stop_event: asyncio.Event | None = None,
+        on_ready: Callable[[], Any] | None = None,
+    ) -> None:
+        """Subscribe to persisted deployment transitions until cancelled."""
+        await _subscribe_deployment_events(
+            lambda: asyncio.to_thread(self._post, f"{AGENTS_API_PREFIX}/events/token"),
+            _index_events(self._agent_index, handler),
+            stop_event=stop_event,
+            on_ready=on_ready,
+        )
+
+    def event_bus(self) -> DeploymentEventBus:
+        """The shared :class:`DeploymentEventBus` for the running event loop."""
+        loop = asyncio.get_running_loop()
+        bus = self._event_buses.get(loop)
+        if bus is None:
+            bus = self._event_buses[loop] = DeploymentEventBus(
+                lambda handler, **kwargs: self.subscribe(handler, **kwargs)
+            )
+        return bus
+
+    async def wait_for_state_async(
+        self,
+        agent_id_or_name: str,
+        states: set[str],
+        *,
+        timeout: float = 300.0,
+        poll_interval: float = 5.0,
+        failure_states: set[str] | None = None,
+        minimum_launch_epoch: int | None = None,
     ) -> Agent:
-        """Submit provisioning for a new agent and return its admission snapshot.
+        """Wait for one state in the requested runtime incarnation."""
+        agent_id = await asyncio.to_thread(self.resolve_agent_id, agent_id_or_name)
+        return await _wait_for_agent_state(
+            agent_id,
+            states,
+            fetch=lambda value: asyncio.to_thread(self.get, value),
+            events=self.event_bus(),
+            timeout=timeout,
+            poll_interval=poll_interval,
+            failure_states=failure_states,
+            minimum_launch_epoch=minimum_launch_epoch,
+        )
 
-        Args:
-            name: Agent name.
-            size: Size preset (small/medium/large). When omitted, the backend defaults to small.
-            config: Optional config overrides.
-            env: Optional environment variables to pass through to the pod.
-            secrets: Optional secret environment variables to pass through to the pod.
-            sync_root: Absolute runtime mount path for retained PVC storage.
-            sync_include: Relative paths to upload/restore. Must contain at
-                least one path when supplied; ``None`` selects the whole root.
-            sync_exclude: Relative patterns omitted from whole-root mode. An
-                empty list excludes nothing. Ignored when an include is active.
-        Returns:
-            Agent, normally in ``CREATING``. Wait for ``STOPPED`` before file
-            access or calling :meth:`start`.
+    async def wait_running_async(
+        self,
+        agent_id_or_name: str,
+        timeout: float = 300.0,
+        *,
+        poll_interval: float = 5.0,
+        minimum_launch_epoch: int | None = None,
+    ) -> Agent:
+        """Wait for RUNNING using WebSocket wakeups and REST confirmation."""
+        return await self.wait_for_state_async(
+            agent_id_or_name,
+            {"running"},
+            timeout=timeout,
+            poll_interval=poll_interval,
+            # Stable runtime-free states cannot satisfy this invocation's goal.
+            failure_states=set(AGENT_WAIT_RUNNING_FAILURE_STATES),
+            minimum_launch_epoch=minimum_launch_epoch,
+        )
 
-        Steady Reef synchronization is PVC-to-object-storage upload/overwrite,
-        not a continuous two-way mirror. Ordinary filesystem deletes are not
-        propagated; Files API deletes are. Remote-to-PVC copying occurs only
-        during explicit cold restore.
+    def wait_for_state(
+        self,
+        agent_id_or_name: str,
+        states: set[str],
+        *,
+        timeout: float = 300.0,
+        poll_interval: float = 5.0,
+        failure_states: set[str] | None = None,
+        minimum_launch_epoch: int | None = None,
+    ) -> Agent:
+        """Synchronous event-assisted state wait; use the async variant in an event loop."""
+        return _run_sync(
+            lambda: self.wait_for_state_async(
+                agent_id_or_name,
+                states,
+                timeout=timeout,
+                poll_interval=poll_interval,
+                failure_states=failure_states,
+                minimum_launch_epoch=minimum_launch_epoch,
+            ),
+            running_loop_error=(
+                "wait_for_state() cannot run inside an event loop; use wait_for_state_async()"
+            ),
+        )
+
+    def wait_running(
+        self,
+        agent_id_or_name: str,
+        timeout: float = 300.0,
+        poll_interval: float = 5.0,
+        *,
+        minimum_launch_epoch: int | None = None,
+    ) -> Agent:
+        """Wait for RUNNING via deployment events and REST reconciliation."""
+        return _run_sync(
+            lambda: self.wait_running_async(
+                agent_id_or_name,
+                timeout=timeout,
+                poll_interval=poll_interval,
+                minimum_launch_epoch=minimum_launch_epoch,
+            ),
+            running_loop_error=(
+                "wait_running() cannot run inside an event loop; use wait_running_async()"
+            ),
+        )
+
+    def _recover_redacted_secrets(self, agent_id: str, launch_epoch: int) -> dict[str, str]:
+        """Read back every launch secret value the projection refuses to return.
+
+        Agent projections list secret *names* and expose values only through
+        the per-secret retrieval endpoint, so a complete ``secrets`` mapping
+        has to be reassembled one key at a time. Every response is checked
+        against *launch_epoch* so a rebuild never silently mixes values from
+        an older launch generation into a new one.
         """
-        launch_options: dict[str, Any] = {
-            "env": env,
-            "secrets": secrets,
-            "routes": routes,
-            "command": command,
-            "entrypoint": entrypoint,
-            "image": image,
-            "sync_root": sync_root,
-            "sync_include": sync_include,
-            "sync_exclude": sync_exclude,
-            "sync_uid": sync_uid,
-            "sync_gid": sync_gid,
-            "registry_url": registry_url,
-            "registry_auth": registry_auth,
-            "restart": restart,
-            "runtime_scopes": runtime_scopes,
-        }
-        launch_payload = _build_agent_launch(config, **launch_options)
-        complete_launch = _build_agent_launch(config, _complete=True, **launch_options)
-        body: dict = {**launch_payload}
-        if dry_run:
-            body["dry_run"] = True
-        if name:
-            body["name"] = name
-        if handle is not None:
-            body["handle"] = handle
-        if size:
-            body["size"] = size
-        if runtime is not None:
-            body["runtime"] = runtime
-        if meta_ui:
-            body["meta"] = {"ui": copy.deepcopy(meta_ui)}
-        if tags:
-            body["tags"] = list(tags)
-        data = self._post(AGENTS_API_PREFIX, json=body)
-        agent = self._hydrate_agent(data)
-        agent.__dict__["_submitted_launch_config"] = complete_launch
-        return agent
+        names_data = self.secret_names(agent_id)
+        if int(names_data.get("launch_epoch") or 0) < launch_epoch:
+            raise RuntimeError("agent secret names belong to an older launch epoch")
+        secrets: dict[str, str] = {}
+        for name in names_data.get("names") or []:
+            secret_data = self.secret(agent_id, str(name))
+            if int(secret_data.get("launch_epoch") or 0) < launch_epoch:
+                raise RuntimeError("agent secret belongs to an older launch epoch")
+            secrets[str(name)] = str(secret_data.get("value") or "")
+        return secrets
+
+    def _rehydrate_redacted_launch_config(
+        self,
+        resolved_agent_id: str,
+        launch_config: dict,
+    ) -> dict:
+        """Restore the two launch_config keys an Agent projection redacts.
+
+        WHY THIS EXISTS -- do not delete it as redundant validation sugar.
+        The Backend's owner-facing Agent projection deliberately strips
+        ``secrets`` and ``registry_auth`` before returning an Agent to a
+        user-scoped caller (``hydrate_managed_agent`` in the Backend's
+        ``unified_agents`` module pops both). START, by contrast, is a *full
+        replacement* and demands every key in
+        ``REQUIRED_START_LAUNCH_CONFIG_KEYS``. Without this step the obvious
+        round-trip can never succeed, because the read side is structurally
+        incapable of returning what the write side requires::
+
+            agent = client.deployments.get(agent_id)
+            client.deployments.start(agent_id, agent.launch_config)
+            # ValueError: launch_config is incomplete; missing:
+            #             registry_auth, secrets
+
+        The fix is to complete the object honestly, never to weaken the
+        completeness contract -- START must stay a replacement, not a merge.
+
+        Only keys that are genuinely ABSENT are rebuilt. A caller-supplied
+        ``secrets`` or ``registry_auth`` is honoured verbatim, including an
+        explicit empty dict, so "redacted by the projection" and "deliberately
+        empty" remain distinguishable.
+
+        ``secrets`` is recoverable because values can be read back one name at
+        a time. ``registry_auth`` is NOT: it is caller-held, write-only, and
+        never stored server-side. It therefore defaults to ``{}`` only when
+        the configuration pulls from no ``registry_url``; when a registry is
+        configured an empty credential would silently break the image pull, so
+        the caller is told to supply it instead.
+        """
+        absent = _redacted_launch_config_gaps(launch_config)
+        if not absent:
+            return launch_config
+
+        prepared = copy.deepcopy(launch_config)
+        if "secrets" in absent:
+            agent = self._get_by_id(resolved_agent_id)
+            prepared["secrets"] = self._recover_redacted_secrets(
+                resolved_agent_id, agent.launch_epoch
+            )
+        if "registry_auth" in absent:
+            prepared["registry_auth"] = _default_registry_auth(resolved_agent_id, prepared)
+        return prepared
 
-    def create_openclaw(
+    def start(
         self,
-        name: str = None,
-        handle: str = None,
-        size: str = None,
-        config: dict = None,
-        tags: list[str] = None,
-        env: dict = None,
-        secrets: dict = None,
-        routes: dict = None,
-        command: list[str] = None,
-        entrypoint: list[str] = None,
-        image: str = None,
-        sync_root: str = None,
-        sync_include: list[str] | None | object = _UNSET,
-        sync_exclude: list[str] | None | object = _UNSET,
-        sync_uid: int = None,
-        sync_gid: int = None,
-        registry_url: str = None,
-        registry_auth: dict = None,
-        runtime_scopes: list[str] | None = None,
-        gateway_token: str = None,
-        heartbeat: dict = None,
-        meta_ui: dict = None,
+        agent_id: str,
+        launch_config: dict,
+        *,
         dry_run: bool = False,
-        openclaw_routes: dict | None = None,
-        openclaw_route_options: dict | None = None,
-        memory_index: dict | None = None,
-        workspaces_sync: dict | bool | None = None,
-        runtime: ManagedAgentRuntime = "openclaw",
     ) -> Agent:
-        """Create OpenClaw with retained ``/home/node`` and cache exclusions.
+        """Start with one complete replacement launch configuration.
 
-        Unlike generic create, omitted sync policy arguments select the
-        OpenClaw cache/Workspace exclusion policy. Pass ``sync_include=None``
-        or ``sync_exclude=None`` to request whole-root persistence explicitly.
+        ``launch_config`` is sent wholesale. The SDK never merges it with the
+        prior Agent snapshot or asks the Backend to inherit omitted fields.
         """
-        effective_sync_include, effective_sync_exclude = _resolve_openclaw_sync_policy(
-            sync_include=sync_include,
-            sync_exclude=sync_exclude,
-        )
-        effective_env, secret_map, effective_gateway_token = _inject_openclaw_gateway_token(
-            env,
-            secrets,
-            gateway_token,
-            generate=True,
-        )
-        effective_env = {
-            **build_openclaw_workspaces_sync_env(workspaces_sync),
-            **build_openclaw_memory_index_env(memory_index),
-            **effective_env,
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        body: dict[str, Any] = {
+            "launch_config": _copy_complete_launch_config(
+                self._rehydrate_redacted_launch_config(resolved_agent_id, launch_config)
+            )
         }
-        agent = self.create(
-            name=name,
-            handle=handle,
-            size=size,
-            runtime=runtime,
-            config=_build_openclaw_runtime_config(config, heartbeat),
-            tags=tags,
-            env=effective_env,
-            secrets=secret_map,
-            routes=_resolve_openclaw_routes(
-                routes,
-                openclaw_routes=openclaw_routes,
-                openclaw_route_options=openclaw_route_options,
-            ),
-            command=command,
-            entrypoint=entrypoint,
-            image=_default_openclaw_image(image),
-            sync_root=sync_root if sync_root is not None else DEFAULT_OPENCLAW_SYNC_ROOT,
-            sync_include=effective_sync_include,
-            sync_exclude=effective_sync_exclude,
-            sync_uid=sync_uid,
-            sync_gid=sync_gid,
-            registry_url=registry_url,
-            registry_auth=registry_auth,
-            runtime_scopes=runtime_scopes,
-            meta_ui=meta_ui,
-            dry_run=dry_run,
-        )
-        if isinstance(agent, OpenClawAgent):
-            agent.gateway_token = effective_gateway_token
+        if dry_run:
+            body["dry_run"] = True
+        data = self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/start", json=body)
+        agent = self._hydrate_agent(data)
+        agent.__dict__["_submitted_launch_config"] = copy.deepcopy(body["launch_config"])
         return agent
 
-    def create_hermes_agent(
+    def start_hermes_agent(
         self,
-        name: str = None,
-        handle: str = None,
-        size: str = None,
-        config: dict = None,
-        tags: list[str] = None,
-        env: dict = None,
-        secrets: dict = None,
-        routes: dict = None,
-        command: list[str] = None,
-        entrypoint: list[str] = None,
-        image: str = None,
-        sync_root: str = None,
-        sync_include: list[str] | None | object = _UNSET,
-        sync_exclude: list[str] | None | object = _UNSET,
-        sync_uid: int = None,
-        sync_gid: int = None,
-        registry_url: str = None,
-        registry_auth: dict = None,
-        restart: bool = False,
-        runtime_scopes: list[str] | None = None,
+        agent_id: str,
+        launch_config: dict,
+        *,
         api_server_key: str = None,
-        meta_ui: dict = None,
         dry_run: bool = False,
-        hermes_routes: dict | None = None,
-        hermes_route_options: dict | None = None,
     ) -> HermesAgent:
-        """Create a first-class Hermes Agent runtime."""
-        effective_env, effective_secrets, effective_key = _inject_hermes_api_server_key(
-            env,
-            secrets,
-            api_server_key,
+        """Start Hermes without silently rotating its application gateway key."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        prepared = _copy_complete_launch_config(
+            self._rehydrate_redacted_launch_config(resolved_agent_id, launch_config)
         )
-        agent = self.create(
-            name=name,
-            handle=handle,
-            size=size,
-            runtime="hermes-agent",
-            config=config,
-            tags=tags,
-            env=effective_env,
-            secrets=effective_secrets,
-            routes=_resolve_hermes_agent_routes(
-                routes,
-                hermes_routes=hermes_routes,
-                hermes_route_options=hermes_route_options,
-            ),
-            command=command,
-            entrypoint=entrypoint,
-            image=DEFAULT_HERMES_AGENT_IMAGE if image is None else image,
-            sync_root=sync_root if sync_root is not None else DEFAULT_HERMES_AGENT_SYNC_ROOT,
-            sync_include=sync_include,
-            sync_exclude=sync_exclude,
-            sync_uid=10000 if sync_uid is None else sync_uid,
-            sync_gid=10000 if sync_gid is None else sync_gid,
-            registry_url=registry_url,
-            registry_auth=registry_auth,
-            restart=restart,
-            runtime_scopes=runtime_scopes,
-            meta_ui=meta_ui,
+        supplied_key = (
+            api_server_key
+            or (prepared.get("secrets") or {}).get("API_SERVER_KEY")
+            or (prepared.get("env") or {}).get("API_SERVER_KEY")
+        )
+        effective_key: str | None = None
+        if supplied_key is not None:
+            effective_env, effective_secrets, effective_key = _inject_hermes_api_server_key(
+                prepared.get("env"),
+                prepared.get("secrets"),
+                api_server_key,
+            )
+            prepared["env"] = effective_env
+            prepared["secrets"] = effective_secrets
+        agent = self.start(
+            resolved_agent_id,
+            prepared,
             dry_run=dry_run,
         )
         if not isinstance(agent, HermesAgent):
@@ -3661,1236 +5724,1490 @@ class Deployments:
         agent.api_server_key = effective_key
         return agent
 
-    def create_openclaw_pro(
+    def start_openclaw(
         self,
-        name: str = None,
-        handle: str = None,
-        size: str = None,
-        config: dict = None,
-        tags: list[str] = None,
-        env: dict = None,
-        secrets: dict = None,
-        routes: dict = None,
-        command: list[str] = None,
-        entrypoint: list[str] = None,
-        image: str = None,
-        sync_root: str = None,
-        sync_include: list[str] | None | object = _UNSET,
-        sync_exclude: list[str] | None | object = _UNSET,
-        sync_uid: int = None,
-        sync_gid: int = None,
-        registry_url: str = None,
-        registry_auth: dict = None,
-        runtime_scopes: list[str] | None = None,
+        agent_id: str,
+        launch_config: dict,
+        *,
         gateway_token: str = None,
-        heartbeat: dict = None,
-        meta_ui: dict = None,
         dry_run: bool = False,
-        openclaw_routes: dict | None = None,
-        openclaw_route_options: dict | None = None,
-        memory_index: dict | None = None,
-        workspaces_sync: dict | bool | None = None,
+        _desktop: bool | None = None,
     ) -> Agent:
-        effective_env = {"OPENCLAW_DESKTOP_ENABLED": "1", **dict(env or {})}
-        effective_route_options = {"include_desktop": True, **dict(openclaw_route_options or {})}
-        return self.create_openclaw(
-            name=name,
-            handle=handle,
-            size=size,
-            config=config,
-            tags=tags,
-            env=effective_env,
-            secrets=secrets,
-            routes=routes,
-            command=command,
-            entrypoint=entrypoint,
-            image=_default_openclaw_pro_image(image),
-            sync_root=sync_root,
-            sync_include=sync_include,
-            sync_exclude=sync_exclude,
-            sync_uid=sync_uid,
-            sync_gid=sync_gid,
-            registry_url=registry_url,
-            registry_auth=registry_auth,
-            runtime_scopes=(
-                list(DEFAULT_AGENT_RUNTIME_SCOPES) if runtime_scopes is None else runtime_scopes
-            ),
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        prepared = _copy_complete_launch_config(
+            self._rehydrate_redacted_launch_config(resolved_agent_id, launch_config)
+        )
+        prepared = _repair_openclaw_start_launch_config(prepared, desktop=_desktop)
+        effective_env, effective_secrets, effective_gateway_token = _inject_openclaw_gateway_token(
+            prepared.get("env"),
+            prepared.get("secrets"),
+            gateway_token,
+            generate=False,
+        )
+        prepared["env"] = effective_env
+        prepared["secrets"] = effective_secrets
+        agent = self.start(
+            resolved_agent_id,
+            prepared,
+            dry_run=dry_run,
+        )
+        if isinstance(agent, OpenClawAgent):
+            agent.gateway_token = effective_gateway_token
+        return agent
+
+    def start_openclaw_pro(
+        self,
+        agent_id: str,
+        launch_config: dict,
+        *,
+        gateway_token: str = None,
+        dry_run: bool = False,
+    ) -> Agent:
+        return self.start_openclaw(
+            agent_id,
+            launch_config,
             gateway_token=gateway_token,
-            heartbeat=heartbeat,
-            meta_ui=meta_ui,
             dry_run=dry_run,
-            openclaw_routes=openclaw_routes,
-            openclaw_route_options=effective_route_options,
-            memory_index=memory_index,
-            workspaces_sync=workspaces_sync,
-            runtime="openclaw-pro",
+            _desktop=True,
         )
 
-    def _create_coding_agent(
+    def update(
         self,
+        agent_id: str,
         *,
-        runtime: CodingAgentRuntime,
         name: str | None = None,
+        size: str | None = None,
+        launch_config: dict | None = None,
+        refresh_from_lagoon: bool | None = None,
+        error: str | None = None,
         handle: str | None = None,
+    ) -> Agent:
+        body: dict[str, Any] = {}
+        if name is not None:
+            body["name"] = name
+        if handle is not None:
+            body["handle"] = handle
+        if size is not None:
+            body["size"] = size
+        if launch_config is not None:
+            body["launch_config"] = launch_config
+        if refresh_from_lagoon is not None:
+            body["refresh_from_lagoon"] = refresh_from_lagoon
+        if error is not None:
+            body["error"] = error
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        data = self._http.patch(f"{AGENTS_API_PREFIX}/{resolved_agent_id}", json=body)
+        return self._hydrate_agent(data)
+
+    def resize(
+        self,
+        agent_id: str,
+        *,
         size: str | None = None,
-        config: dict | None = None,
-        tags: list[str] | None = None,
-        env: dict | None = None,
-        secrets: dict | None = None,
-        routes: dict | None = None,
-        command: list[str] | None = None,
-        entrypoint: list[str] | None = None,
-        image: str | None = None,
-        sync_root: str | None = None,
-        sync_include: list[str] | None | object = _UNSET,
-        sync_exclude: list[str] | None | object = _UNSET,
-        sync_uid: int | None = None,
-        sync_gid: int | None = None,
-        registry_url: str | None = None,
-        registry_auth: dict | None = None,
-        restart: bool = False,
-        runtime_scopes: list[str] | None = None,
-        meta_ui: dict | None = None,
-        dry_run: bool = False,
-        workspaces_sync: dict | bool | None = None,
-        buzz_enabled: bool = False,
-        buzz: BuzzLaunchConfig | None = None,
     ) -> Agent:
-        """Create a coding runtime with its runtime-specific include default.
+        return self.update(agent_id, size=size)
 
-        An explicit nullable sync policy opts out of that helper default and
-        selects whole-root persistence. ``sync_include=[]`` is invalid.
+    def stop(self, agent_id: str) -> Agent:
+        """Stop an agent (tears down pod, keeps DB record).
+
+        Args:
+            agent_id: Agent UUID.
+
+        Returns:
+            Agent in ``stopping`` state while runtime cleanup is in progress.
+            Use ``wait_for_state(agent_id, {"stopped"})`` to wait through the
+            deployment event stream before treating the slot as released.
         """
-        if buzz_enabled and buzz is not None:
-            raise ValueError("buzz_enabled cannot be combined with buzz")
-        if (buzz_enabled or buzz is not None) and command is not None:
-            raise ValueError("Buzz launch cannot be combined with an explicit command")
-        buzz_launch = buzz_enabled or buzz is not None
-        if buzz_launch and size not in (None, "large"):
-            raise ValueError("Buzz coding agents require size='large'")
-        effective_env = {
-            **build_openclaw_workspaces_sync_env(workspaces_sync),
-            **dict(env or {}),
-        }
-        effective_secrets = dict(secrets or {})
-        for key in ("BUZZ_PRIVATE_KEY", "NOSTR_PRIVATE_KEY"):
-            value = effective_env.pop(key, None)
-            if value is not None:
-                existing = effective_secrets.get(key)
-                if existing is not None and existing != value:
-                    raise ValueError(f"{key} conflicts between env and secrets")
-                effective_secrets[key] = value
-        if buzz is not None:
-            for key in BUZZ_RESERVED_ENV_KEYS:
-                effective_env.pop(key, None)
-            effective_env.update(buzz.environment(runtime, default_session_title=name))
-            effective_secrets.update(buzz.secrets())
-        if buzz_launch:
-            effective_env.setdefault("RUST_LOG", DEFAULT_BUZZ_RUST_LOG)
-        (
-            effective_sync_include,
-            effective_sync_exclude,
-        ) = _resolve_coding_agent_sync_policy(
-            runtime,
-            sync_include=sync_include,
-            sync_exclude=sync_exclude,
-        )
-        # Hosted Buzz shutdown is process-driven. Never let a generic coding
-        # launch override resurrect the adapter after `!shutdown`.
-        effective_restart = False if buzz_launch else restart
-        return self.create(
-            name=name,
-            handle=handle,
-            size="large" if buzz_launch else size,
-            runtime=runtime,
-            config=config,
-            tags=tags,
-            env=effective_env,
-            secrets=effective_secrets,
-            routes={} if routes is None else routes,
-            command=(["/usr/local/bin/buzz-acp"] if buzz_enabled or buzz is not None else command),
-            entrypoint=entrypoint,
-            image=image
-            or (
-                DEFAULT_BUZZ_CODING_AGENT_IMAGES[runtime]
-                if buzz_launch
-                else DEFAULT_CODING_AGENT_IMAGES[runtime]
-            ),
-            sync_root=sync_root if sync_root is not None else DEFAULT_CODING_AGENT_SYNC_ROOT,
-            sync_include=effective_sync_include,
-            sync_exclude=effective_sync_exclude,
-            sync_uid=1000 if sync_uid is None else sync_uid,
-            sync_gid=1000 if sync_gid is None else sync_gid,
-            registry_url=registry_url,
-            registry_auth=registry_auth,
-            restart=effective_restart,
-            runtime_scopes=(
-                list(DEFAULT_AGENT_RUNTIME_SCOPES) if runtime_scopes is None else runtime_scopes
-            ),
-            meta_ui=meta_ui,
-            dry_run=dry_run,
-        )
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        data = self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/stop")
+        return self._hydrate_agent(data)
 
-    def create_opencode(self, **kwargs: Any) -> OpenCodeAgent:
-        """Create a hosted OpenCode ACP runtime with workspace boot sync."""
-        return self._create_coding_agent(
-            runtime="opencode",
-            **kwargs,
-        )  # type: ignore[return-value]
+    def archive(self, agent_id: str) -> Agent:
+        """Archive durable storage for a stopped agent without launching it."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        data = self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/archive")
+        return self._hydrate_agent(data)
 
-    def create_buzz_agent(self, **kwargs: Any) -> BuzzAgent:
-        """Create the native Buzz ACP runtime with workspace boot sync."""
-        return self._create_coding_agent(
-            runtime="buzz-agent",
-            **kwargs,
-        )  # type: ignore[return-value]
+    def restore(self, agent_id: str) -> Agent:
+        """Restore durable storage for a stopped or archived agent."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        data = self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/restore")
+        return self._hydrate_agent(data)
 
-    def create_codex(self, **kwargs: Any) -> CodexAgent:
-        """Create a hosted Codex ACP runtime with workspace boot sync."""
-        return self._create_coding_agent(
-            runtime="codex",
-            **kwargs,
-        )  # type: ignore[return-value]
+    def _routes_target(self, agent_id: str) -> str:
+        """Return the path segment for route calls, honouring ``self``.
 
-    def create_claude_code(self, **kwargs: Any) -> ClaudeCodeAgent:
-        """Create a hosted Claude Code ACP runtime with workspace boot sync."""
-        return self._create_coding_agent(
-            runtime="claude-code",
-            **kwargs,
-        )  # type: ignore[return-value]
+        An Agent manages its own routes -- it is the only party that knows the
+        port it just bound. A runtime key is authorised on the parameterised
+        path for its own agent, so ``self`` is passed through to the
+        /deployments/self/routes alias, which resolves the caller's id server
+        side. Resolving it here via access_identity() would reach the same
+        handler at the cost of an extra round trip.
+        """
 
-    def create_goose(self, **kwargs: Any) -> GooseAgent:
-        """Create a hosted Goose native ACP runtime with workspace boot sync."""
-        return self._create_coding_agent(
-            runtime="goose",
-            **kwargs,
-        )  # type: ignore[return-value]
+        if _is_self_agent_ref(agent_id):
+            return "self"
+        return self.resolve_agent_id(agent_id)
+
+    def get_routes(self, agent_id: str) -> AgentRoutes:
+        """Return the desired routes and live reconciliation state for an agent."""
+        resolved_agent_id = self._routes_target(agent_id)
+        data = self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/routes")
+        return AgentRoutes.from_dict(data)
+
+    def set_routes(
+        self,
+        agent_id: str,
+        routes: dict[str, AgentRouteConfig],
+        *,
+        cors: AgentCorsConfig | dict | None | object = _UNSET,
+    ) -> AgentRoutes:
+        """Atomically replace the complete declarative route map."""
+        resolved_agent_id = self._routes_target(agent_id)
+        body: dict[str, Any] = {
+            "routes": {str(name): dict(config) for name, config in routes.items()},
+        }
+        if cors is not _UNSET:
+            body["cors"] = None if cors is None else dict(cors)
+        data = self._put(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/routes", body)
+        return AgentRoutes.from_dict(data)
+
+    def set_route(
+        self,
+        agent_id: str,
+        name: str,
+        route: AgentRouteConfig,
+    ) -> AgentRoutes:
+        """Atomically create or replace one named route."""
+        resolved_agent_id = self._routes_target(agent_id)
+        body = dict(route)
+        encoded_name = quote(str(name), safe="")
+        data = self._put(
+            f"{AGENTS_API_PREFIX}/{resolved_agent_id}/routes/{encoded_name}",
+            body,
+        )
+        return AgentRoutes.from_dict(data)
+
+    def remove_route(
+        self,
+        agent_id: str,
+        name: str,
+    ) -> AgentRoutes:
+        """Atomically remove one named route."""
+        resolved_agent_id = self._routes_target(agent_id)
+        encoded_name = quote(str(name), safe="")
+        path = f"{AGENTS_API_PREFIX}/{resolved_agent_id}/routes/{encoded_name}"
+        return AgentRoutes.from_dict(self._delete(path))
 
-    def create_kimi_code(self, **kwargs: Any) -> KimiCodeAgent:
-        """Create a hosted Kimi Code ACP runtime using Moonshot upstream."""
-        return self._create_coding_agent(
-            runtime="kimi-code",
-            **kwargs,
-        )  # type: ignore[return-value]
+    def delete(self, agent_id: str) -> dict:
+        """Accept a durable soft delete and background local cleanup.
 
-    def budget(self) -> dict:
-        """Get the user's current agent resource budget and usage.
+        Args:
+            agent_id: Agent UUID.
 
         Returns:
-            Dict with budget, used, available (all in cores/GB).
+            The Backend's HTTP 200 accepted projection. Runtime storage cleanup
+            continues in the background; the response is not proof of cleanup.
         """
-        return self._get(f"{AGENTS_API_PREFIX}/budget")
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        result = self._delete(f"{AGENTS_API_PREFIX}/{resolved_agent_id}")
+        if self._agent_index is not None:
+            self._agent_index.remove(resolved_agent_id)
+            self._agent_index.save()
+        return result
 
-    def metrics(self, agent_id_or_name: str) -> dict:
-        """Get one live CPU/memory sample through the Backend WebSocket facade.
+    def bulk(
+        self,
+        operation: str,
+        targets: Iterable[Agent | str],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        wait: bool = True,
+        timeout: float = 900.0,
+        poll_interval: float = 30.0,
+        launch_config: dict | Callable[[Agent], dict] | None = None,
+    ) -> list[BulkItem]:
+        """Run one lifecycle operation on many agents concurrently.
 
         Args:
-            agent_id: Agent UUID.
+            operation: ``start``, ``stop``, ``archive`` or ``delete``.
+            targets: Agents, IDs, names, handles or hostnames.
+            concurrency: Maximum calls in flight at once.
+            wait: Wait for start/stop/archive to reach RUNNING/STOPPED/ARCHIVED.
+            timeout: Seconds to wait for every agent to settle.
+            poll_interval: Seconds without events before one listing
+                reconciles every agent still pending.
+            launch_config: For ``start``: one complete launch configuration,
+                or a callable returning one per ``Agent``. Defaults to each
+                agent's stored configuration.
 
         Returns:
-            Exact successful ``agent_metrics_result`` frame for the Reef runtime.
+            One BulkItem per agent, in target order.
         """
-        agent_id = self.resolve_agent_id(agent_id_or_name)
-        result = self._one_shot_ws_result(
-            agent_id=agent_id,
-            purpose="metrics",
-            timeout=max(self._timeout, 35),
+        return _run_sync(
+            lambda: self.bulk_async(
+                operation,
+                targets,
+                concurrency=concurrency,
+                wait=wait,
+                timeout=timeout,
+                poll_interval=poll_interval,
+                launch_config=launch_config,
+            ),
+            running_loop_error="bulk() cannot run inside an event loop; use bulk_async()",
         )
-        return _validate_metrics_result(result)
 
-    def list(
+    async def bulk_async(
         self,
+        operation: str,
+        targets: Iterable[Agent | str],
         *,
-        state: str | None = None,
-        handle: str | None = None,
-        name: str | None = None,
-        query: str | None = None,
-        include_deleted: bool | None = None,
-    ) -> list[Agent]:
-        """List all agents for the authenticated user.
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        wait: bool = True,
+        timeout: float = 900.0,
+        poll_interval: float = 30.0,
+        launch_config: dict | Callable[[Agent], dict] | None = None,
+    ) -> list[BulkItem]:
+        """Async variant of :meth:`bulk`; REST calls run on worker threads."""
+        _check_bulk_operation(operation)
+        targets = list(targets)
+        snapshots = {target.id: target for target in targets if isinstance(target, Agent)}
+        agent_ids = await asyncio.to_thread(self._agent_ids_for_targets, targets)
+
+        def call(agent_id: str) -> Any:
+            if operation == "start":
+                agent = snapshots.get(agent_id) or self.get(agent_id)
+                return self.start(agent_id, _bulk_launch_config(launch_config, agent))
+            return getattr(self, operation)(agent_id)
+
+        return await _bulk_operation(
+            operation,
+            agent_ids,
+            perform=lambda agent_id: asyncio.to_thread(call, agent_id),
+            fetch=lambda agent_id: asyncio.to_thread(self.get, agent_id),
+            list_agents=lambda: asyncio.to_thread(self.list),
+            events=self.event_bus(),
+            concurrency=concurrency,
+            wait=wait,
+            timeout=timeout,
+            poll_interval=poll_interval,
+        )
+
+    def refresh_token(self, agent_id: str) -> dict:
+        """Refresh the JWT token for an agent.
+
+        Args:
+            agent_id: Agent UUID.
 
         Returns:
-            List of Agent objects.
+            Dict with agent_id, token, expires_at, and launch epoch.
         """
-        return self.list_with_capacity(
-            state=state,
-            handle=handle,
-            name=name,
-            query=query,
-            include_deleted=include_deleted,
-        ).items
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        return self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/token")
 
-    def list_with_capacity(
+    def create_scoped_key(self, agent_id: str, name: str | None = None) -> dict:
+        payload = {"name": name} if name is not None else {}
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        return self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/keys", json=payload or None)
+
+    def upload_profile_image(
         self,
+        agent_id: str,
+        content: bytes | bytearray | memoryview | str | Path,
         *,
-        state: str | None = None,
-        handle: str | None = None,
-        name: str | None = None,
-        query: str | None = None,
-        include_deleted: bool | None = None,
-    ) -> AgentCapacity:
-        """List agents without discarding the account capacity envelope."""
-        params = {
-            "state": state,
-            "handle": handle,
-            "name": name,
-            "q": query,
-            "include_deleted": include_deleted,
-        }
-        data = self._get(
-            AGENTS_API_PREFIX,
-            params={key: value for key, value in params.items() if value is not None},
+        content_type: str | None = None,
+    ) -> dict:
+        """Upload an agent avatar/profile image through the deployments API."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        guessed_content_type = content_type
+        if isinstance(content, (str, Path)):
+            path = Path(content)
+            payload = path.read_bytes()
+            guessed_content_type = guessed_content_type or mimetypes.guess_type(path.name)[0]
+        else:
+            payload = bytes(content)
+
+        resp = self._client(self._api_base).post(
+            f"{self._api_base}{AGENTS_API_PREFIX}/{resolved_agent_id}/profile-image",
+            headers=self._file_headers(content_type=guessed_content_type or "image/png"),
+            content=payload,
+            timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS,
         )
-        payload = data if isinstance(data, dict) else {"items": data}
-        items = [self._hydrate_agent(item) for item in payload.get("items", [])]
-        running_fallback = sum(not is_agent_runtime_inactive_state(agent.state) for agent in items)
-        return AgentCapacity(
-            items=items,
-            total_agents=int(payload.get("total_agents", len(items)) or 0),
-            max_agents_per_account=int(payload.get("max_agents_per_account", 0) or 0),
-            running_agents=int(payload.get("running_agents", running_fallback) or 0),
-            slots={
-                str(size): AgentSlotInventory.from_dict(inventory)
-                for size, inventory in (payload.get("slots") or {}).items()
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
+
+    def web_search(self, query: str, *, count: int = 5, **params: Any) -> dict:
+        """Run Brave web search through the HyperClaw agents API proxy.
+
+        Returns the raw Brave-compatible JSON payload. The request uses the
+        agent API key as `X-Subscription-Token`; the backend substitutes its
+        configured Brave API key upstream.
+        """
+        search_params: dict[str, Any] = {"q": query, "count": int(count)}
+        for key, value in params.items():
+            if value is not None:
+                search_params[key] = value
+        resp = self._client(self._api_base).get(
+            f"{self._api_base}/brave/res/v1/web/search",
+            headers={
+                "Accept": "application/json",
+                "X-Subscription-Token": self._api_key,
             },
-            agent_slots=[AgentSlot.from_dict(slot) for slot in payload.get("agent_slots", [])],
-            pooled_tpd=int(payload.get("pooled_tpd", 0) or 0),
+            params=search_params,
+            timeout=30,
         )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
 
-    def get(self, agent_id_or_name: str) -> Agent:
-        """Get agent details by UUID or unique name.
+    def purchase_entitlement_from_balance(
+        self,
+        plan_id: str,
+        *,
+        duration: int,
+        tags: list[str] | None = None,
+        extend_existing: bool | None = None,
+    ) -> dict:
+        payload: dict[str, Any] = {"duration": int(duration)}
+        if tags is not None:
+            payload["tags"] = list(tags)
+        if extend_existing is not None:
+            payload["extend_existing"] = bool(extend_existing)
+        return self._post(f"/billing/balance/{quote(str(plan_id), safe='')}", json=payload)
 
-        Args:
-            agent_id_or_name: Agent UUID, unique name, handle, or hostname.
+    def redeem_grant_code(self, code: str, *, extend_existing: bool | None = None) -> dict:
+        payload: dict[str, Any] = {"code": str(code)}
+        if extend_existing is not None:
+            payload["extend_existing"] = bool(extend_existing)
+        return self._post("/billing/grants/redeem", json=payload)
 
-        Returns:
-            Agent with current status.
-        """
-        raw = str(agent_id_or_name or "").strip()
-        if not raw:
-            raise ValueError("agent_id_or_name is required")
-        if _is_self_agent_ref(raw):
-            return self._get_by_id("self")
-        if not _is_direct_agent_id_ref(raw):
-            return self.resolve_agent(raw)
-        try:
-            return self._get_by_id(raw)
-        except APIError as exc:
-            if exc.status_code not in {404, 422}:
-                raise
-            try:
-                UUID(raw)
-            except ValueError:
-                return self.resolve_agent(raw)
-            raise
+    def logs_token(self, agent_id: str) -> dict:
+        """Mint a short-lived JWT token for backend log streaming."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        return self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/logs/token")
 
-    def access_identity(self) -> AgentAccessIdentity:
-        """Resolve who the presented credential is, per the Backend.
+    def env(self, agent_id: str) -> dict[str, Any]:
+        """Fetch the deployment's non-secret environment."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        return self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/env")
 
-        Answers the three questions a credential should be able to ask about
-        itself: which Agent it is (``agent_id``, set only for an Agent runtime
-        key), which account owns it (``user_id``, ``team_id``, ``plan_id``), and
-        what it may do (``tags``, ``capabilities``). It returns only what the
-        credential already carries, so it is unscoped and safe for any caller.
+    def set_env(self, agent_id: str, key: str, value: str) -> AgentLaunchValueMutation:
+        """Set one non-secret launch environment value while the agent is stopped."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        resolved_key = quote(str(key), safe="")
+        data = self._patch(
+            f"{AGENTS_API_PREFIX}/{resolved_agent_id}/env/{resolved_key}",
+            json={"value": str(value)},
+        )
+        return AgentLaunchValueMutation.from_dict(data)
 
-        Returns:
-            AgentAccessIdentity for the credential this client authenticates
-            with. ``is_agent_runtime_key`` is True when it belongs to one Agent.
-        """
-        return AgentAccessIdentity.from_dict(self._get(f"{AGENTS_API_PREFIX}/auth/me"))
+    def delete_env(self, agent_id: str, key: str) -> AgentLaunchValueMutation:
+        """Delete one non-secret launch environment value while the agent is stopped."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        resolved_key = quote(str(key), safe="")
+        data = self._delete(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/env/{resolved_key}")
+        return AgentLaunchValueMutation.from_dict(data)
 
-    def create_external_agent(
+    def secret_names(self, agent_id: str) -> dict[str, Any]:
+        """List the deployment's secret names without exposing their values."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        return self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets")
+
+    def secret(self, agent_id: str, key: str) -> dict[str, Any]:
+        """Fetch one deployment secret by its exact environment key."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        resolved_key = quote(str(key), safe="")
+        return self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets/{resolved_key}")
+
+    def set_secret(self, agent_id: str, key: str, value: str) -> AgentLaunchValueMutation:
+        """Set one launch secret while stopped without expecting its value back."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        resolved_key = quote(str(key), safe="")
+        data = self._patch(
+            f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets/{resolved_key}",
+            json={"value": str(value)},
+        )
+        return AgentLaunchValueMutation.from_dict(data)
+
+    def delete_secret(self, agent_id: str, key: str) -> AgentLaunchValueMutation:
+        """Delete one launch secret while the agent is stopped."""
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        resolved_key = quote(str(key), safe="")
+        data = self._delete(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets/{resolved_key}")
+        return AgentLaunchValueMutation.from_dict(data)
+
+    def exec(
         self,
-        *,
-        name: str,
-        display_name: str | None = None,
-        handle: str | None = None,
-        runtime: str = "openclaw",
-        status: str = "active",
-        meta: dict | None = None,
-    ) -> Agent:
-        """Register a customer-hosted external agent and return its show-once relay key."""
-        body: dict[str, Any] = {
-            "name": name,
-            "runtime": runtime,
-            "status": status,
-        }
-        if display_name is not None:
-            body["display_name"] = display_name
-        if handle is not None:
-            body["handle"] = handle
-        if meta is not None:
-            body["meta"] = meta
-        return self._hydrate_agent(self._post("/external-agents", body))
+        pod: Agent | str,
+        command: list[str],
+        timeout: int = 30,
+        dry_run: bool = False,
+    ) -> ExecResult:
+        """Execute a one-shot command through the Backend WebSocket facade.
+
+        Args:
+            pod: Agent to execute on.
+            command: Exact executable and argument vector to run.
+            timeout: Command timeout in seconds.
+
+        Returns:
+            ExecResult with exit_code, stdout, stderr.
+        """
+        command = validate_exec_request(command, timeout)
+        agent_id = self._agent_id_for_target(pod)
+        result = self._one_shot_ws_result(
+            agent_id=agent_id,
+            purpose="exec",
+            request={"command": command, "timeout": timeout, "dry_run": bool(dry_run)},
+            timeout=timeout + 10,
+        )
+        return _validate_exec_result(result)
 
-    def update_external_agent(
+    def _agent_ids_for_targets(self, targets: Iterable[Agent | str]) -> list[str]:
+        """Resolve many targets with at most one agent listing."""
+        listed: list[Agent] | None = None
+        agent_ids: list[str] = []
+        for target in targets:
+            if isinstance(target, Agent):
+                agent_ids.append(target.id)
+                continue
+            raw = str(target or "").strip()
+            if _is_direct_agent_id_ref(raw):
+                agent_ids.append(raw)
+                continue
+            if self._agent_index is not None:
+                agent_ids.append(self._resolve_indexed(raw))
+                continue
+            if listed is None:
+                listed = self.list()
+            agent_ids.append(_resolve_agent_match(raw, listed).id)
+        return agent_ids
+
+    def exec_many(
         self,
-        external_agent_id: str,
+        pods: Iterable[Agent | str],
+        command: list[str],
         *,
-        name: str | None | object = _UNSET,
-        display_name: str | None | object = _UNSET,
-        handle: str | None | object = _UNSET,
-        runtime: Literal["openclaw"] | None | object = _UNSET,
-        status: Literal["active", "inactive", "error"] | None | object = _UNSET,
-        meta: dict | None | object = _UNSET,
-    ) -> Agent:
-        """Update a customer-hosted external agent by its exact backend ID."""
-        body: dict[str, Any] = {}
-        if name is not _UNSET:
-            body["name"] = name
-        if display_name is not _UNSET:
-            body["display_name"] = display_name
-        if handle is not _UNSET:
-            body["handle"] = handle
-        if runtime is not _UNSET:
-            body["runtime"] = runtime
-        if status is not _UNSET:
-            body["status"] = status
-        if meta is not _UNSET:
-            body["meta"] = meta
-        data = self._patch(f"/external-agents/{external_agent_id}", body)
-        return self._hydrate_agent(data)
+        timeout: int = 30,
+        concurrency: int = DEFAULT_EXEC_CONCURRENCY,
+        target_timeout: float | None = None,
+        dry_run: bool = False,
+    ) -> Iterator[ExecBatchItem]:
+        """Run one command on many agents, yielding results as each finishes.
 
-    def rotate_external_agent_key(self, agent_id_or_name: str) -> dict:
-        """Rotate an external agent relay key and return the new plaintext key once."""
-        agent_id = self.resolve_agent_id(agent_id_or_name)
-        return self._post(f"/external-agents/{agent_id}/keys/rotate")
+        Targets are resolved up front, then each agent gets its own exec
+        token and one-shot WebSocket on a bounded worker pool.
 
-    def attach_slack_relay_agent(
+        Args:
+            pods: Agents, IDs, names, handles or hostnames to run on.
+            command: Exact executable and argument vector to run.
+            timeout: Per-command timeout in seconds.
+            concurrency: Maximum commands in flight at once.
+            target_timeout: Wall-clock budget per agent; defaults to
+                ``timeout`` plus connection grace.
+
+        Yields:
+            ExecBatchItem per agent ID in completion order.
+        """
+        command = validate_exec_request(command, timeout)
+        agent_ids = self._agent_ids_for_targets(pods)
+        return fan_out(
+            lambda agent_id: self.exec(agent_id, command, timeout=timeout, dry_run=dry_run),
+            agent_ids,
+            concurrency=concurrency,
+            deadline=target_deadline(timeout, target_timeout),
+        )
+
+    def exec_session(
+        self, pod: Agent | str, *, max_in_flight: int = DEFAULT_EXEC_SESSION_IN_FLIGHT
+    ) -> ExecSession:
+        """Open an :class:`ExecSession` that reuses one exec token for many commands."""
+        return ExecSession(self, self._agent_id_for_target(pod), max_in_flight=max_in_flight)
+
+    def files_list(self, pod: Agent | str, path: str = "") -> list[dict]:
+        """List a path directly through the Agent's retained Reef server."""
+        agent_id = self._agent_id_for_target(pod)
+        resolved_path = resolve_sync_root_file_path(path)
+        suffix = f"/{_encode_file_path(resolved_path)}" if resolved_path else ""
+        resp = self._reef_request(
+            agent_id,
+            lambda reef_url, token: self._client(reef_url).get(
+                f"{reef_url}/directories{suffix}",
+                headers=self._reef_headers(token),
+                follow_redirects=False,
+                timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS,
+            ),
+        )
+        return _directory_entries(resp.json())
+
+    def file_read_bytes_with_metadata(self, pod: Agent | str, path: str) -> dict[str, Any]:
+        """Read a sync-root-relative file directly from Reef."""
+        agent_id = self._agent_id_for_target(pod)
+        resolved_path = resolve_sync_root_file_path(path)
+        if not resolved_path:
+            raise ValueError("agent file path is required")
+        content = bytearray()
+        with self._reef_file_response(agent_id, resolved_path) as resp:
+            content_type = resp.headers.get("content-type", "")
+            for chunk in resp.iter_bytes(chunk_size=AGENT_FILE_TRANSFER_CHUNK_BYTES):
+                _append_file_chunk(content, chunk)
+        return _file_read_result(bytes(content), content_type, path)
+
+    @contextmanager
+    def _reef_file_response(self, agent_id: str, resolved_path: str) -> Iterator[httpx.Response]:
+        """Open a streamed Reef GET, re-minting the file token once on ``401``."""
+        for attempt in range(2):
+            reef_url, token = self._reef_file_access(agent_id)
+            with self._client(reef_url).stream(
+                "GET",
+                f"{reef_url}/files/{_encode_file_path(resolved_path)}",
+                headers=self._reef_headers(token),
+                follow_redirects=False,
+                timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS,
+            ) as resp:
+                if resp.status_code == 401 and attempt == 0:
+                    self._reef_tokens.invalidate(agent_id, token)
+                    continue
+                if not 200 <= resp.status_code < 300:
+                    resp.read()
+                    self._raise_reef_error(resp)
+                yield resp
+                return
+
+    def file_read_stream(
         self,
-        agent_id_or_name: str,
+        pod: Agent | str,
+        path: str,
         *,
-        relay_base_url: str,
-        token: str | None = None,
-        allowed_channel_id: str | None = None,
-        allowed_user_id: str | None = None,
-    ) -> dict:
-        """Attach an agent to the hosted HyperCLI Slack relay.
+        chunk_size: int = AGENT_FILE_TRANSFER_CHUNK_BYTES,
+    ) -> Iterator[bytes]:
+        """Yield a sync-root-relative file from Reef chunk by chunk.
+
+        Unlike :meth:`file_read_bytes`, nothing is buffered beyond one chunk, so
+        the ``AGENT_FILE_MAX_BYTES`` in-memory read cap does not apply. The
+        request is sent when iteration starts; close the iterator early to
+        abandon the transfer.
+        """
+        agent_id = self._agent_id_for_target(pod)
+        resolved_path = resolve_sync_root_file_path(path)
+        if not resolved_path:
+            raise ValueError("agent file path is required")
 
-        The relay verifies the caller's Slack install and persists the OpenClaw
-        Slack relay launch config on the backend. Running agents still need a
-        restart before OpenClaw reads the updated channel config.
+        def chunks() -> Iterator[bytes]:
+            with self._reef_file_response(agent_id, resolved_path) as resp:
+                content_type = resp.headers.get("content-type", "")
+                if _is_json_content_type(content_type):
+                    # Reef answers a directory path with a JSON listing; only a
+                    # buffered look at the body can tell it from a JSON file.
+                    content = bytearray()
+                    for chunk in resp.iter_bytes(chunk_size=chunk_size):
+                        _append_file_chunk(content, chunk)
+                    yield _file_read_result(bytes(content), content_type, path)["content"]
+                    return
+                yield from resp.iter_bytes(chunk_size=chunk_size)
+
+        return chunks()
+
+    def file_read_bytes(self, pod: Agent | str, path: str) -> bytes:
+        """Read a sync-root-relative file through the Reef file API."""
+        return self.file_read_bytes_with_metadata(pod, path).get("content", b"")
+
+    def file_read(self, pod: Agent | str, path: str) -> str:
+        """Read a UTF-8 text file from an agent."""
+        return self.file_read_bytes(pod, path).decode(errors="replace")
+
+    def file_write_bytes(self, pod: Agent | str, path: str, content: bytes) -> dict:
+        """Write bytes directly to a sync-root-relative path through Reef.
+
+        Per-file writes are limited to 100 MiB (``AGENT_FILE_WRITE_MAX_BYTES``,
+        the Cloudflare edge request-body cap on the agent hostname). Larger
+        data should be split across files or synced via the agent's own
+        tooling.
         """
-        resolved_agent_id = self.resolve_agent_id(agent_id_or_name)
-        relay_base = _normalize_slack_relay_base_url(relay_base_url)
-        auth_token = token or self._api_key
-        headers = {"Authorization": f"Bearer {auth_token}", "Content-Type": "application/json"}
-        body: dict[str, str] = {}
-        if allowed_channel_id:
-            body["allowed_channel_id"] = allowed_channel_id
-        if allowed_user_id:
-            body["allowed_user_id"] = allowed_user_id
-        with httpx.Client(timeout=30) as client:
-            resp = client.post(
-                f"{relay_base}/slack/agents/{resolved_agent_id}/relay", headers=headers, json=body
-            )
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
+        path = _validate_file_write(path, content)
+        agent_id = self._agent_id_for_target(pod)
+        resp = self._reef_request(
+            agent_id,
+            lambda reef_url, token: self._client(reef_url).put(
+                f"{reef_url}/files/{_encode_file_path(path)}",
+                headers=self._reef_headers(token, content_type="application/octet-stream"),
+                content=content,
+                follow_redirects=False,
+                timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS,
+            ),
+        )
         return resp.json()
 
-    def list_slack_directory_conversations(
+    def file_write_stream(
         self,
-        *,
-        relay_base_url: str,
-        token: str | None = None,
-        cursor: str | None = None,
-        limit: int | None = None,
-        types: str | None = None,
+        pod: Agent | str,
+        path: str,
+        data: Iterable[bytes] | BinaryIO,
     ) -> dict:
-        """List sanitized Slack conversations visible to the hosted relay install."""
-        relay_base = _normalize_slack_relay_base_url(relay_base_url)
-        auth_token = token or self._api_key
-        headers = {"Authorization": f"Bearer {auth_token}"}
-        params: dict[str, Any] = {}
-        if cursor:
-            params["cursor"] = cursor
-        if limit is not None:
-            params["limit"] = int(limit)
-        if types:
-            params["types"] = types
-        with httpx.Client(timeout=30) as client:
-            resp = client.get(
-                f"{relay_base}/slack/directory/conversations", headers=headers, params=params
+        """Write an iterable of byte chunks or a binary file object through Reef.
+
+        The body is sent with chunked transfer encoding, so only one chunk is
+        held in memory at a time. The 100 MiB per-file limit is enforced as
+        bytes are sent. A seekable file object is rewound and resent if the
+        cached file token is rejected; a one-shot iterable is not, so the
+        ``401`` is raised instead.
+        """
+        path = normalize_writable_backend_file_path(path)
+        if not path:
+            raise ValueError("agent file path is required")
+        agent_id = self._agent_id_for_target(pod)
+        replayable = callable(getattr(data, "seek", None)) and bool(
+            getattr(data, "seekable", lambda: False)()
+        )
+        start = data.tell() if replayable else 0
+
+        def send(reef_url: str, token: str) -> httpx.Response:
+            if replayable:
+                data.seek(start)
+            return self._client(reef_url).put(
+                f"{reef_url}/files/{_encode_file_path(path)}",
+                headers=self._reef_headers(token, content_type="application/octet-stream"),
+                content=_capped_chunks(_file_chunks(data)),
+                follow_redirects=False,
+                timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS,
             )
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
+
+        resp = self._reef_request(agent_id, send, retry_unauthorized=replayable)
         return resp.json()
 
-    def list_slack_directory_users(
+    def file_write(self, pod: Agent | str, path: str, content: str) -> dict:
+        """Write a UTF-8 text file to an agent.
+
+        Subject to the 100 MiB per-file write limit; see ``file_write_bytes``.
+        """
+        return self.file_write_bytes(pod, path, content.encode())
+
+    def file_delete(
         self,
-        *,
-        relay_base_url: str,
-        token: str | None = None,
-        cursor: str | None = None,
-        limit: int | None = None,
+        pod: Agent | str,
+        path: str,
+        recursive: bool = False,
     ) -> dict:
-        """List sanitized Slack users visible to the hosted relay install."""
-        relay_base = _normalize_slack_relay_base_url(relay_base_url)
-        auth_token = token or self._api_key
-        headers = {"Authorization": f"Bearer {auth_token}"}
-        params: dict[str, Any] = {}
-        if cursor:
-            params["cursor"] = cursor
-        if limit is not None:
-            params["limit"] = int(limit)
-        with httpx.Client(timeout=30) as client:
-            resp = client.get(f"{relay_base}/slack/directory/users", headers=headers, params=params)
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
+        """Delete a sync-root-relative file or directory directly through Reef."""
+        path = normalize_writable_backend_file_path(path)
+        if not path:
+            raise ValueError("agent file path is required")
+        agent_id = self._agent_id_for_target(pod)
+        resp = self._reef_request(
+            agent_id,
+            lambda reef_url, token: self._client(reef_url).delete(
+                f"{reef_url}/files/{_encode_file_path(path)}",
+                headers=self._reef_headers(token),
+                params={"recursive": "true"} if recursive else None,
+                follow_redirects=False,
+                timeout=10,
+            ),
+        )
         return resp.json()
 
-    async def subscribe(
-        self,
-        handler: Callable[[DeploymentEvent], Any],
-        *,
-        stop_event: asyncio.Event | None = None,
-        on_ready: Callable[[], Any] | None = None,
-    ) -> None:
-        """Subscribe to persisted deployment transitions until cancelled."""
-        import websockets
-
-        retry_delay = 0.25
-        while stop_event is None or not stop_event.is_set():
-            try:
-                token_data = await asyncio.to_thread(
-                    self._post, f"{AGENTS_API_PREFIX}/events/token"
-                )
-                ws_url = str(token_data.get("ws_url") or "").strip()
-                token = str(token_data.get("token") or "").strip()
-                if not ws_url or not token:
-                    raise RuntimeError("Deployment event token response is incomplete")
-                async with websockets.connect(
-                    ws_url, ping_interval=20, ping_timeout=20
-                ) as websocket:
-                    await websocket.send(json.dumps({"type": "auth", "token": token}))
-                    ready = json.loads(await asyncio.wait_for(websocket.recv(), timeout=10))
-                    if ready != {"type": "ready"}:
-                        raise RuntimeError("Deployment event socket did not send ready")
-                    if on_ready is not None:
-                        result = on_ready()
-                        if inspect.isawaitable(result):
-                            await result
-                    retry_delay = 0.25
-                    while stop_event is None or not stop_event.is_set():
-                        try:
-                            raw = await asyncio.wait_for(
-                                websocket.recv(), timeout=0.5 if stop_event is not None else None
-                            )
-                        except asyncio.TimeoutError:
-                            continue
-                        event = DeploymentEvent.from_dict(json.loads(raw))
-                        if (
-                            event.type
-                            not in {"deployment.transition", "deployment.import_status"}
-                            or not event.agent_id
-                        ):
-                            continue
-                        result = handler(event)
-                        if inspect.isawaitable(result):
-                            await result
-            except asyncio.CancelledError:
-                raise
-            except APIError as exc:
-                if exc.status_code in {401, 403}:
-                    raise
-                if stop_event is None:
-                    await asyncio.sleep(retry_delay)
-                else:
-                    try:
-                        await asyncio.wait_for(stop_event.wait(), timeout=retry_delay)
-                    except asyncio.TimeoutError:
-                        pass
-                retry_delay = min(retry_delay * 2, 5.0)
-            except Exception:
-                if stop_event is None:
-                    await asyncio.sleep(retry_delay)
-                else:
-                    try:
-                        await asyncio.wait_for(stop_event.wait(), timeout=retry_delay)
-                    except asyncio.TimeoutError:
-                        pass
-                retry_delay = min(retry_delay * 2, 5.0)
+    def cp_to(self, pod: Agent | str, local_path: str | Path, remote_path: str) -> dict:
+        """Copy a local file to an agent.
 
-    async def wait_for_state_async(
-        self,
-        agent_id_or_name: str,
-        states: set[str],
-        *,
-        timeout: float = 300.0,
-        poll_interval: float = 5.0,
-        failure_states: set[str] | None = None,
-        minimum_launch_epoch: int | None = None,
-    ) -> Agent:
-        """Wait for one state in the requested runtime incarnation."""
-        agent_id = await asyncio.to_thread(self.resolve_agent_id, agent_id_or_name)
-        deadline = asyncio.get_running_loop().time() + timeout
-        wake = asyncio.Event()
-        last_agent: Agent | None = None
-        desired = {state.lower() for state in states}
-        failures = {state.lower() for state in (failure_states or set())}
-        effective_poll_interval = max(float(poll_interval), 0.001)
-        if not desired:
-            raise ValueError("states must not be empty")
-        if minimum_launch_epoch is not None and minimum_launch_epoch < 0:
-            raise ValueError("minimum_launch_epoch must be non-negative")
-
-        def check(agent: Agent) -> Agent | None:
-            nonlocal last_agent
-            last_agent = agent
-            if (
-                minimum_launch_epoch is not None
-                and int(agent.launch_epoch or 0) < minimum_launch_epoch
-            ):
-                return None
-            state = str(agent.state or "")
-            if state.lower() in desired:
-                return agent
-            if state.lower() in failures:
-                raise RuntimeError(
-                    f"Agent entered {state} while waiting for {', '.join(sorted(states))}"
-                )
-            return None
+        Subject to the 100 MiB per-file write limit; see ``file_write_bytes``.
+        """
+        source = Path(local_path)
+        if source.stat().st_size > AGENT_FILE_WRITE_MAX_BYTES:
+            raise _file_write_limit_error()
+        with source.open("rb") as handle:
+            return self.file_write_stream(pod, remote_path, handle)
 
-        def on_event(event: DeploymentEvent) -> None:
-            if event.agent_id == agent_id:
-                wake.set()
+    def cp_from(self, pod: Agent | str, remote_path: str, local_path: str | Path) -> Path:
+        """Copy a file from an agent to the local filesystem.
 
-        subscription = asyncio.create_task(self.subscribe(on_event))
+        Chunks are written straight to a temporary file beside *local_path*,
+        which replaces the destination only once the download completes.
+        """
+        dest = Path(local_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        chunks = self.file_read_stream(pod, remote_path)
+        partial = dest.with_name(f".{dest.name}.{secrets.token_hex(4)}.part")
         try:
-            while (remaining := deadline - asyncio.get_running_loop().time()) > 0:
-                current = check(await asyncio.to_thread(self.get, agent_id))
-                if current is not None:
-                    return current
-                waiter = asyncio.create_task(wake.wait())
-                waiters = {waiter}
-                if not subscription.done():
-                    waiters.add(subscription)
-                done, _ = await asyncio.wait(
-                    waiters,
-                    timeout=min(remaining, effective_poll_interval),
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                if waiter not in done:
-                    waiter.cancel()
-                    await asyncio.gather(waiter, return_exceptions=True)
-                    if asyncio.get_running_loop().time() >= deadline:
-                        break
-                else:
-                    wake.clear()
+            with partial.open("wb") as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+            os.replace(partial, dest)
         finally:
-            subscription.cancel()
-            await asyncio.gather(subscription, return_exceptions=True)
-
-        final = check(await asyncio.to_thread(self.get, agent_id))
-        if final is not None:
-            return final
-        last_state = str(last_agent.state or "") if last_agent is not None else "unknown"
-        raise TimeoutError(
-            f"Timed out waiting for agent {agent_id} to reach "
-            f"{', '.join(sorted(states))} (last={last_state})"
-        )
+            partial.unlink(missing_ok=True)
+        return dest
 
-    async def wait_running_async(
-        self,
-        agent_id_or_name: str,
-        timeout: float = 300.0,
-        *,
-        poll_interval: float = 5.0,
-        minimum_launch_epoch: int | None = None,
-    ) -> Agent:
-        """Wait for RUNNING using WebSocket wakeups and REST confirmation."""
-        return await self.wait_for_state_async(
-            agent_id_or_name,
-            {"running"},
-            timeout=timeout,
-            poll_interval=poll_interval,
-            # Stable runtime-free states cannot satisfy this invocation's goal.
-            failure_states=set(AGENT_WAIT_RUNNING_FAILURE_STATES),
-            minimum_launch_epoch=minimum_launch_epoch,
-        )
+    def _walk_remote_tree(self, agent_id: str, remote_dir: str) -> dict[str, FileSyncEntry]:
+        def list_dir(path: str) -> list[dict]:
+            try:
+                return self.files_list(agent_id, path)
+            except APIError as exc:
+                if exc.status_code == 404 and path == remote_dir.strip("/"):
+                    return []
+                raise
 
-    def wait_for_state(
+        return walk_remote(list_dir, remote_dir)
+
+    def sync_to(
         self,
-        agent_id_or_name: str,
-        states: set[str],
+        pod: Agent | str,
+        local_dir: str | Path,
+        remote_dir: str = "",
         *,
-        timeout: float = 300.0,
-        poll_interval: float = 5.0,
-        failure_states: set[str] | None = None,
-        minimum_launch_epoch: int | None = None,
-    ) -> Agent:
-        """Synchronous event-assisted state wait; use the async variant in an event loop."""
-        return _run_sync(
-            lambda: self.wait_for_state_async(
-                agent_id_or_name,
-                states,
-                timeout=timeout,
-                poll_interval=poll_interval,
-                failure_states=failure_states,
-                minimum_launch_epoch=minimum_launch_epoch,
-            ),
-            running_loop_error=(
-                "wait_for_state() cannot run inside an event loop; use wait_for_state_async()"
+        checksum: bool = False,
+        force: bool = False,
+        dry_run: bool = False,
+        concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+    ) -> FileSyncPlan:
+        """Recursively push *local_dir* into *remote_dir*, skipping unchanged files.
+
+        The remote tree is listed once and diffed by size, then by sha256 when
+        Reef reports one (or when ``checksum`` is set), otherwise by mtime.
+        Changed files upload on a pool of ``concurrency`` workers sharing one
+        keep-alive connection and one cached file token. ``dry_run`` returns
+        the plan without writing; ``force`` uploads every file.
+        """
+        local_root = Path(local_dir)
+        remote_root = resolve_sync_root_file_path(remote_dir)
+        agent_id = self._agent_id_for_target(pod)
+        local = walk_local(local_root)
+        remote = self._walk_remote_tree(agent_id, remote_root)
+        plan = FileSyncPlan(
+            direction="upload",
+            actions=plan_sync(
+                "upload",
+                local,
+                remote,
+                local_root=local_root,
+                remote_root=remote_root,
+                checksum=checksum,
+                force=force,
             ),
+            dry_run=dry_run,
         )
+        oversized = [
+            action.path
+            for action in plan.transfers
+            if (action.size or 0) > AGENT_FILE_WRITE_MAX_BYTES
+        ]
+        if oversized:
+            raise ValueError(
+                f"Agent file writes are limited to {AGENT_FILE_WRITE_MAX_BYTES} bytes: "
+                + ", ".join(oversized)
+            )
+        if not dry_run:
+            run_transfers(
+                plan.transfers,
+                lambda action: self.cp_to(agent_id, action.source, action.destination),
+                concurrency=concurrency,
+            )
+        return plan
 
-    def wait_running(
+    def sync_from(
         self,
-        agent_id_or_name: str,
-        timeout: float = 300.0,
-        poll_interval: float = 5.0,
+        pod: Agent | str,
+        remote_dir: str,
+        local_dir: str | Path,
         *,
-        minimum_launch_epoch: int | None = None,
-    ) -> Agent:
-        """Wait for RUNNING via deployment events and REST reconciliation."""
-        return _run_sync(
-            lambda: self.wait_running_async(
-                agent_id_or_name,
-                timeout=timeout,
-                poll_interval=poll_interval,
-                minimum_launch_epoch=minimum_launch_epoch,
-            ),
-            running_loop_error=(
-                "wait_running() cannot run inside an event loop; use wait_running_async()"
+        checksum: bool = False,
+        force: bool = False,
+        dry_run: bool = False,
+        concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+    ) -> FileSyncPlan:
+        """Recursively pull *remote_dir* into *local_dir*, skipping unchanged files.
+
+        Mirrors :meth:`sync_to`. Downloaded files take the remote mtime when
+        Reef reports one, so the next sync can skip them without hashing.
+        """
+        local_root = Path(local_dir)
+        remote_root = resolve_sync_root_file_path(remote_dir)
+        agent_id = self._agent_id_for_target(pod)
+        local = walk_local(local_root) if local_root.is_dir() else {}
+        remote = self._walk_remote_tree(agent_id, remote_root)
+        plan = FileSyncPlan(
+            direction="download",
+            actions=plan_sync(
+                "download",
+                local,
+                remote,
+                local_root=local_root,
+                remote_root=remote_root,
+                checksum=checksum,
+                force=force,
             ),
+            dry_run=dry_run,
         )
 
-    def _recover_redacted_secrets(self, agent_id: str, launch_epoch: int) -> dict[str, str]:
-        """Read back every launch secret value the projection refuses to return.
+        def download(action: FileSyncAction) -> None:
+            dest = self.cp_from(agent_id, action.source, action.destination)
+            mtime = remote[action.path].mtime
+            if mtime is not None:
+                os.utime(dest, (mtime, mtime))
 
-        Agent projections list secret *names* and expose values only through
-        the per-secret retrieval endpoint, so a complete ``secrets`` mapping
-        has to be reassembled one key at a time. Every response is checked
-        against *launch_epoch* so a rebuild never silently mixes values from
-        an older launch generation into a new one.
-        """
-        names_data = self.secret_names(agent_id)
-        if int(names_data.get("launch_epoch") or 0) < launch_epoch:
-            raise RuntimeError("agent secret names belong to an older launch epoch")
-        secrets: dict[str, str] = {}
-        for name in names_data.get("names") or []:
-            secret_data = self.secret(agent_id, str(name))
-            if int(secret_data.get("launch_epoch") or 0) < launch_epoch:
-                raise RuntimeError("agent secret belongs to an older launch epoch")
-            secrets[str(name)] = str(secret_data.get("value") or "")
-        return secrets
+        if not dry_run:
+            run_transfers(plan.transfers, download, concurrency=concurrency)
+        return plan
 
-    def _rehydrate_redacted_launch_config(
+    # -----------------------------------------------------------------------
+    # WebSocket API (via HyperClaw backend)
+    # -----------------------------------------------------------------------
+
+    async def logs_stream_ws(
         self,
-        resolved_agent_id: str,
-        launch_config: dict,
-    ) -> dict:
-        """Restore the two launch_config keys an Agent projection redacts.
+        agent_id: str,
+        tail_lines: int = 100,
+        container: str = "reef",
+        follow: bool = True,
+        archive: LogArchive | None = None,
+        line_filter: LogFilter | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream logs via backend WebSocket.
 
-        WHY THIS EXISTS -- do not delete it as redundant validation sugar.
-        The Backend's owner-facing Agent projection deliberately strips
-        ``secrets`` and ``registry_auth`` before returning an Agent to a
-        user-scoped caller (``hydrate_managed_agent`` in the Backend's
-        ``unified_agents`` module pops both). START, by contrast, is a *full
-        replacement* and demands every key in
-        ``REQUIRED_START_LAUNCH_CONFIG_KEYS``. Without this step the obvious
-        round-trip can never succeed, because the read side is structurally
-        incapable of returning what the write side requires::
+        Connects to the HyperClaw backend WebSocket endpoint which proxies
+        to the lagoon log buffer.
 
-            agent = client.deployments.get(agent_id)
-            client.deployments.start(agent_id, agent.launch_config)
-            # ValueError: launch_config is incomplete; missing:
-            #             registry_auth, secrets
+        Args:
+            agent_id: Agent UUID.
+            tail_lines: Number of historical lines to fetch first.
+            container: Container name (default: reef).
+            follow: Keep streaming after buffered history.
+            archive: Also write every line to this LogArchive, tagged with the
+                agent ID; it is flushed when the stream ends.
+            line_filter: Only yield lines this LogFilter keeps. The log
+                WebSocket has no server-side filter, so lines are still
+                received (and archived) but never rendered.
 
-        The fix is to complete the object honestly, never to weaken the
-        completeness contract -- START must stay a replacement, not a merge.
+        Yields:
+            Log lines as they arrive.
+        """
+        # Get JWT token
+        resolved_agent_id = self.resolve_agent_id(agent_id)
+        token_data = self.logs_token(resolved_agent_id)
+        jwt = token_data["jwt"]
 
-        Only keys that are genuinely ABSENT are rebuilt. A caller-supplied
-        ``secrets`` or ``registry_auth`` is honoured verbatim, including an
-        explicit empty dict, so "redacted by the projection" and "deliberately
-        empty" remain distinguishable.
+        url = _logs_ws_url(self._agents_ws_url, resolved_agent_id, jwt, container, tail_lines)
 
-        ``secrets`` is recoverable because values can be read back one name at
-        a time. ``registry_auth`` is NOT: it is caller-held, write-only, and
-        never stored server-side. It therefore defaults to ``{}`` only when
-        the configuration pulls from no ``registry_url``; when a registry is
-        configured an empty credential would silently break the image pull, so
-        the caller is told to supply it instead.
-        """
-        if not isinstance(launch_config, dict):
-            raise TypeError("launch_config must be a complete object")
-        absent = REQUIRED_START_LAUNCH_CONFIG_KEYS - launch_config.keys()
-        # Nothing missing, or missing more than the projection ever redacts:
-        # in both cases hand the object straight to the validator. Only a
-        # config whose *sole* gaps are the two redacted keys is a projection
-        # round-trip worth spending API calls to repair.
-        if not absent or absent - {"secrets", "registry_auth"}:
-            return launch_config
+        async for line in _archived_log_lines(
+            url, follow, archive, resolved_agent_id, line_filter
+        ):
+            yield line
 
-        prepared = copy.deepcopy(launch_config)
-        if "secrets" in absent:
-            agent = self._get_by_id(resolved_agent_id)
-            prepared["secrets"] = self._recover_redacted_secrets(
-                resolved_agent_id, agent.launch_epoch
-            )
-        if "registry_auth" in absent:
-            registry_url = str(prepared.get("registry_url") or "").strip()
-            if registry_url:
-                raise ValueError(
-                    f"Agent {resolved_agent_id} pulls from registry_url "
-                    f"{registry_url!r} but launch_config carries no registry_auth; "
-                    "registry_auth is caller-held and write-only, so the owner-facing "
-                    "projection can never return it and the SDK will not substitute an "
-                    "empty credential that would break the private-registry pull -- "
-                    "pass registry_auth explicitly to START"
-                )
-            prepared["registry_auth"] = {}
-        return prepared
+    async def shell_connect(self, agent_id: str, shell: str | None = None):
+        """Connect to agent shell via backend WebSocket proxy.
 
-    def start(
-        self,
-        agent_id: str,
-        launch_config: dict,
-        *,
-        dry_run: bool = False,
-    ) -> Agent:
-        """Start with one complete replacement launch configuration.
+        Connects to the HyperClaw backend shell WebSocket which proxies
+        to lagoon → k8s exec for bidirectional PTY access.
 
-        ``launch_config`` is sent wholesale. The SDK never merges it with the
-        prior Agent snapshot or asks the Backend to inherit omitted fields.
+        Args:
+            agent_id: Agent UUID.
+
+        Returns:
+            WebSocket connection for bidirectional shell I/O.
         """
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        body: dict[str, Any] = {
-            "launch_config": _copy_complete_launch_config(
-                self._rehydrate_redacted_launch_config(resolved_agent_id, launch_config)
-            )
-        }
-        if dry_run:
-            body["dry_run"] = True
-        data = self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/start", json=body)
-        agent = self._hydrate_agent(data)
-        agent.__dict__["_submitted_launch_config"] = copy.deepcopy(body["launch_config"])
-        return agent
+        import websockets
 
-    def start_hermes_agent(
-        self,
-        agent_id: str,
-        launch_config: dict,
-        *,
-        api_server_key: str = None,
-        dry_run: bool = False,
-    ) -> HermesAgent:
-        """Start Hermes without silently rotating its application gateway key."""
         resolved_agent_id = self.resolve_agent_id(agent_id)
-        prepared = _copy_complete_launch_config(
-            self._rehydrate_redacted_launch_config(resolved_agent_id, launch_config)
+        selected_shell = shell or "/bin/bash"
+
+        token_data = self._post(
+            f"{AGENTS_API_PREFIX}/{resolved_agent_id}/shell/token",
+            json={"shell": selected_shell},
         )
-        supplied_key = (
-            api_server_key
-            or (prepared.get("secrets") or {}).get("API_SERVER_KEY")
-            or (prepared.get("env") or {}).get("API_SERVER_KEY")
+        ws_url, jwt, resolved_shell = _validate_agent_ws_token(
+            token_data,
+            agent_id=resolved_agent_id,
+            purpose="shell",
+            shell=selected_shell,
         )
-        effective_key: str | None = None
-        if supplied_key is not None:
-            effective_env, effective_secrets, effective_key = _inject_hermes_api_server_key(
-                prepared.get("env"),
-                prepared.get("secrets"),
-                api_server_key,
-            )
-            prepared["env"] = effective_env
-            prepared["secrets"] = effective_secrets
-        agent = self.start(
-            resolved_agent_id,
-            prepared,
-            dry_run=dry_run,
+        separator = "&" if "?" in ws_url else "?"
+        url = (
+            f"{ws_url}{separator}jwt={quote(jwt, safe='')}"
+            f"&shell={quote(resolved_shell, safe='')}"
         )
-        if not isinstance(agent, HermesAgent):
-            raise TypeError("backend did not return a HermesAgent deployment")
-        agent.api_server_key = effective_key
-        return agent
 
-    def start_openclaw(
+        return await websockets.connect(url, ping_interval=20, ping_timeout=20)
+
+
+class AsyncDeployments:
+    """
+    Async-native HyperClaw deployments API.
+
+    Every call awaits one shared ``httpx.AsyncClient`` per host and async
+    WebSockets directly, so managing hundreds of agents concurrently does not
+    consume a worker thread per in-flight request.
+
+    Usage:
+        from hypercli import HyperCLI
+
+        client = HyperCLI()
+        async with client.deployments.async_client() as deployments:
+            agents = await deployments.list(state="RUNNING")
+            results = await asyncio.gather(
+                *(deployments.exec(agent, ["uptime"]) for agent in agents)
+            )
+
+    Agents returned here keep their synchronous convenience methods bound to
+    the originating ``Deployments`` when one is supplied.
+    """
+
+    def __init__(
         self,
-        agent_id: str,
-        launch_config: dict,
+        api_key: str,
+        api_base: str = None,
+        agents_ws_url: str = None,
+        timeout: float = None,
         *,
-        gateway_token: str = None,
-        dry_run: bool = False,
-        _desktop: bool | None = None,
-    ) -> Agent:
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        prepared = _copy_complete_launch_config(
-            self._rehydrate_redacted_launch_config(resolved_agent_id, launch_config)
+        deployments: Deployments | None = None,
+        agent_index: AgentIndex | None = None,
+    ):
+        self._api_key = api_key
+        self._timeout = timeout if timeout is not None else 30.0
+        self._api_base = _normalize_agents_api_base(api_base or get_agents_api_base_url()).rstrip(
+            "/"
         )
-        prepared = _repair_openclaw_start_launch_config(prepared, desktop=_desktop)
-        effective_env, effective_secrets, effective_gateway_token = _inject_openclaw_gateway_token(
-            prepared.get("env"),
-            prepared.get("secrets"),
-            gateway_token,
-            generate=False,
+        resolved_agents_ws_url = agents_ws_url or get_config_value("AGENTS_WS_URL")
+        self._agents_ws_url = (
+            _normalize_agents_ws_url(resolved_agents_ws_url)
+            if resolved_agents_ws_url
+            else _default_agents_ws_url(self._api_base)
         )
-        prepared["env"] = effective_env
-        prepared["secrets"] = effective_secrets
-        agent = self.start(
-            resolved_agent_id,
-            prepared,
-            dry_run=dry_run,
+        self._deployments = deployments
+        if agent_index is None and deployments is not None:
+            agent_index = deployments._agent_index
+        self._agent_index = agent_index
+        self._clients = AsyncClientPool(self._timeout)
+        self._reef_tokens = (
+            deployments._reef_tokens if deployments is not None else _ReefTokenCache()
         )
-        if isinstance(agent, OpenClawAgent):
-            agent.gateway_token = effective_gateway_token
+        self._reef_mint_locks: dict[str, asyncio.Lock] = {}
+        self._event_buses: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def aclose(self) -> None:
+        """Close every pooled connection held by this client."""
+        await self._clients.aclose()
+
+    async def __aenter__(self) -> "AsyncDeployments":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _client(self, url: str) -> httpx.AsyncClient:
+        return self._clients.client(url)
+
+    def _hydrate_agent(self, data: dict) -> Agent:
+        agent = _agent_from_dict(data)
+        agent._deployments = self._deployments
+        if self._agent_index is not None:
+            self._agent_index.observe(agent)
         return agent
 
-    def start_openclaw_pro(
+    @property
+    def _headers(self) -> dict:
+        return {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+        }
+
+    async def _request(
         self,
-        agent_id: str,
-        launch_config: dict,
+        method: str,
+        path: str,
         *,
-        gateway_token: str = None,
-        dry_run: bool = False,
-    ) -> Agent:
-        return self.start_openclaw(
-            agent_id,
-            launch_config,
-            gateway_token=gateway_token,
-            dry_run=dry_run,
-            _desktop=True,
+        json: dict | None = None,
+        params: dict | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        kwargs: dict[str, Any] = {
+            "headers": self._headers,
+            "timeout": self._timeout if timeout is None else timeout,
+        }
+        if json is not None:
+            kwargs["json"] = json
+        if params is not None:
+            kwargs["params"] = params
+        resp = await self._client(self._api_base).request(
+            method, f"{self._api_base}{path}", **kwargs
         )
+        if resp.status_code >= 400:
+            _raise_api_error(resp)
+        return resp.json()
 
-    def update(
-        self,
-        agent_id: str,
-        *,
-        name: str | None = None,
-        size: str | None = None,
-        launch_config: dict | None = None,
-        refresh_from_lagoon: bool | None = None,
-        error: str | None = None,
-        handle: str | None = None,
-    ) -> Agent:
-        body: dict[str, Any] = {}
-        if name is not None:
-            body["name"] = name
-        if handle is not None:
-            body["handle"] = handle
-        if size is not None:
-            body["size"] = size
-        if launch_config is not None:
-            body["launch_config"] = launch_config
-        if refresh_from_lagoon is not None:
-            body["refresh_from_lagoon"] = refresh_from_lagoon
-        if error is not None:
-            body["error"] = error
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        data = self._http.patch(f"{AGENTS_API_PREFIX}/{resolved_agent_id}", json=body)
-        return self._hydrate_agent(data)
+    async def _get(self, path: str, params: dict = None) -> Any:
+        return await self._request("GET", path, params=params)
 
-    def resize(
-        self,
-        agent_id: str,
-        *,
-        size: str | None = None,
-    ) -> Agent:
-        return self.update(agent_id, size=size)
+    async def _post(self, path: str, json: dict = None) -> Any:
+        return await self._request("POST", path, json=json)
 
-    def stop(self, agent_id: str) -> Agent:
-        """Stop an agent (tears down pod, keeps DB record).
+    async def _delete(self, path: str) -> Any:
+        return await self._request("DELETE", path)
 
-        Args:
-            agent_id: Agent UUID.
+    # -----------------------------------------------------------------------
+    # Resolution
+    # -----------------------------------------------------------------------
 
-        Returns:
-            Agent in ``stopping`` state while runtime cleanup is in progress.
-            Use ``wait_for_state(agent_id, {"stopped"})`` to wait through the
-            deployment event stream before treating the slot as released.
-        """
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        data = self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/stop")
-        return self._hydrate_agent(data)
+    async def _agent_id_for_target(self, target: Agent | str) -> str:
+        if isinstance(target, Agent):
+            return target.id
+        return await self.resolve_agent_id(str(target))
 
-    def archive(self, agent_id: str) -> Agent:
-        """Archive durable storage for a stopped agent without launching it."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        data = self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/archive")
+    async def _get_by_id(self, agent_id: str) -> Agent:
+        data = await self._get(f"{AGENTS_API_PREFIX}/{agent_id}")
         return self._hydrate_agent(data)
 
-    def restore(self, agent_id: str) -> Agent:
-        """Restore durable storage for a stopped or archived agent."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        data = self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/restore")
-        return self._hydrate_agent(data)
+    async def resolve_agent(self, agent_id_or_name: str) -> Agent:
+        """Resolve an agent UUID, unique name, handle, or hostname to an Agent."""
+        raw = str(agent_id_or_name or "").strip()
+        if not raw:
+            raise ValueError("agent_id_or_name is required")
+        try:
+            return await self._get_by_id(str(UUID(raw)))
+        except ValueError:
+            pass
+        if self._agent_index is None:
+            return await self._get_by_id(_resolve_agent_match(raw, await self.list()).id)
 
-    def _routes_target(self, agent_id: str) -> str:
-        """Return the path segment for route calls, honouring ``self``.
+        agent_id = await self._resolve_indexed(raw)
+        try:
+            agent = await self._get_by_id(agent_id)
+        except APIError as exc:
+            if exc.status_code != 404:
+                raise
+            agent = None
+        if agent is None or not _agent_matches_ref(agent, raw):
+            self._agent_index.remove(agent_id)
+            self._agent_index.invalidate()
+            agent = await self._get_by_id(await self._resolve_indexed(raw))
+        return agent
 
-        An Agent manages its own routes -- it is the only party that knows the
-        port it just bound. A runtime key is authorised on the parameterised
-        path for its own agent, so ``self`` is passed through to the
-        /deployments/self/routes alias, which resolves the caller's id server
-        side. Resolving it here via access_identity() would reach the same
-        handler at the cost of an extra round trip.
-        """
+    async def _resolve_indexed(self, raw: str) -> str:
+        """Async twin of :meth:`Deployments._resolve_indexed`."""
+        index = self._agent_index
+        try:
+            cached = index.match(raw)
+            if len(cached) == 1:
+                return cached[0]
+            for key in ("name", "handle"):
+                found = (await self.list_with_capacity(**{key: raw})).items
+                if len(found) == 1:
+                    return found[0].id
+            agents = await self.list()
+            index.replace(agents)
+            return _resolve_agent_match(raw, agents).id
+        finally:
+            await asyncio.to_thread(index.save)
+
+    async def resolve_agent_id(self, agent_id_or_name: str) -> str:
+        raw = str(agent_id_or_name or "").strip()
+        if not raw:
+            raise ValueError("agent_id_or_name is required")
+        if _is_self_agent_ref(raw):
+            raise ValueError("self is only supported for status and routes")
+        if _is_direct_agent_id_ref(raw):
+            return raw
+        if self._agent_index is not None:
+            return await self._resolve_indexed(raw)
+        return (await self.resolve_agent(raw)).id
+
+    # -----------------------------------------------------------------------
+    # Agent lifecycle
+    # -----------------------------------------------------------------------
+
+    async def list(
+        self,
+        *,
+        state: str | None = None,
+        handle: str | None = None,
+        name: str | None = None,
+        query: str | None = None,
+        include_deleted: bool | None = None,
+    ) -> list[Agent]:
+        """List all agents for the authenticated user."""
+        capacity = await self.list_with_capacity(
+            state=state,
+            handle=handle,
+            name=name,
+            query=query,
+            include_deleted=include_deleted,
+        )
+        return capacity.items
+
+    async def list_with_capacity(
+        self,
+        *,
+        state: str | None = None,
+        handle: str | None = None,
+        name: str | None = None,
+        query: str | None = None,
+        include_deleted: bool | None = None,
+    ) -> AgentCapacity:
+        """List agents without discarding the account capacity envelope."""
+        data = await self._get(
+            AGENTS_API_PREFIX,
+            params=_agent_list_params(
+                state=state,
+                handle=handle,
+                name=name,
+                query=query,
+                include_deleted=include_deleted,
+            ),
+        )
+        items = [self._hydrate_agent(item) for item in _agent_list_items(data)]
+        return _agent_capacity_from_payload(data, items)
+
+    async def get(self, agent_id_or_name: str) -> Agent:
+        """Get agent details by UUID, unique name, handle, or hostname."""
+        raw = str(agent_id_or_name or "").strip()
+        if not raw:
+            raise ValueError("agent_id_or_name is required")
+        if _is_self_agent_ref(raw):
+            return await self._get_by_id("self")
+        if not _is_direct_agent_id_ref(raw):
+            return await self.resolve_agent(raw)
+        try:
+            return await self._get_by_id(raw)
+        except APIError as exc:
+            if exc.status_code not in {404, 422}:
+                raise
+            try:
+                UUID(raw)
+            except ValueError:
+                return await self.resolve_agent(raw)
+            raise
+
+    async def create(
+        self,
+        name: str = None,
+        handle: str = None,
+        size: str = None,
+        runtime: ManagedAgentRuntime | None = None,
+        config: dict = None,
+        tags: list[str] = None,
+        env: dict = None,
+        secrets: dict = None,
+        routes: dict = None,
+        command: list[str] = None,
+        entrypoint: list[str] = None,
+        image: str = None,
+        sync_root: str = None,
+        sync_include: list[str] | None | object = _UNSET,
+        sync_exclude: list[str] | None | object = _UNSET,
+        sync_uid: int = None,
+        sync_gid: int = None,
+        registry_url: str = None,
+        registry_auth: dict = None,
+        restart: bool = False,
+        runtime_scopes: list[str] | None = None,
+        meta_ui: dict = None,
+        dry_run: bool = False,
+    ) -> Agent:
+        """Submit provisioning for a new agent; see :meth:`Deployments.create`."""
+        body, complete_launch = _build_create_request(
+            config,
+            name=name,
+            handle=handle,
+            size=size,
+            runtime=runtime,
+            tags=tags,
+            meta_ui=meta_ui,
+            dry_run=dry_run,
+            env=env,
+            secrets=secrets,
+            routes=routes,
+            command=command,
+            entrypoint=entrypoint,
+            image=image,
+            sync_root=sync_root,
+            sync_include=sync_include,
+            sync_exclude=sync_exclude,
+            sync_uid=sync_uid,
+            sync_gid=sync_gid,
+            registry_url=registry_url,
+            registry_auth=registry_auth,
+            restart=restart,
+            runtime_scopes=runtime_scopes,
+        )
+        data = await self._post(AGENTS_API_PREFIX, json=body)
+        agent = self._hydrate_agent(data)
+        agent.__dict__["_submitted_launch_config"] = complete_launch
+        return agent
 
-        if _is_self_agent_ref(agent_id):
-            return "self"
-        return self.resolve_agent_id(agent_id)
+    async def secret_names(self, agent_id: str) -> dict[str, Any]:
+        """List the deployment's secret names without exposing their values."""
+        resolved_agent_id = await self.resolve_agent_id(agent_id)
+        return await self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets")
 
-    def get_routes(self, agent_id: str) -> AgentRoutes:
-        """Return the desired routes and live reconciliation state for an agent."""
-        resolved_agent_id = self._routes_target(agent_id)
-        data = self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/routes")
-        return AgentRoutes.from_dict(data)
+    async def secret(self, agent_id: str, key: str) -> dict[str, Any]:
+        """Fetch one deployment secret by its exact environment key."""
+        resolved_agent_id = await self.resolve_agent_id(agent_id)
+        resolved_key = quote(str(key), safe="")
+        return await self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets/{resolved_key}")
 
-    def set_routes(
+    async def _recover_redacted_secrets(
         self,
         agent_id: str,
-        routes: dict[str, AgentRouteConfig],
-        *,
-        cors: AgentCorsConfig | dict | None | object = _UNSET,
-    ) -> AgentRoutes:
-        """Atomically replace the complete declarative route map."""
-        resolved_agent_id = self._routes_target(agent_id)
-        body: dict[str, Any] = {
-            "routes": {str(name): dict(config) for name, config in routes.items()},
-        }
-        if cors is not _UNSET:
-            body["cors"] = None if cors is None else dict(cors)
-        data = self._put(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/routes", body)
-        return AgentRoutes.from_dict(data)
+        launch_epoch: int,
+    ) -> dict[str, str]:
+        names_data = await self.secret_names(agent_id)
+        if int(names_data.get("launch_epoch") or 0) < launch_epoch:
+            raise RuntimeError("agent secret names belong to an older launch epoch")
+        secrets: dict[str, str] = {}
+        for name in names_data.get("names") or []:
+            secret_data = await self.secret(agent_id, str(name))
+            if int(secret_data.get("launch_epoch") or 0) < launch_epoch:
+                raise RuntimeError("agent secret belongs to an older launch epoch")
+            secrets[str(name)] = str(secret_data.get("value") or "")
+        return secrets
 
-    def set_route(
+    async def _rehydrate_redacted_launch_config(
         self,
-        agent_id: str,
-        name: str,
-        route: AgentRouteConfig,
-    ) -> AgentRoutes:
-        """Atomically create or replace one named route."""
-        resolved_agent_id = self._routes_target(agent_id)
-        body = dict(route)
-        encoded_name = quote(str(name), safe="")
-        data = self._put(
-            f"{AGENTS_API_PREFIX}/{resolved_agent_id}/routes/{encoded_name}",
-            body,
-        )
-        return AgentRoutes.from_dict(data)
+        resolved_agent_id: str,
+        launch_config: dict,
+    ) -> dict:
+        """Async twin of :meth:`Deployments._rehydrate_redacted_launch_config`."""
+        absent = _redacted_launch_config_gaps(launch_config)
+        if not absent:
+            return launch_config
 
-    def remove_route(
+        prepared = copy.deepcopy(launch_config)
+        if "secrets" in absent:
+            agent = await self._get_by_id(resolved_agent_id)
+            prepared["secrets"] = await self._recover_redacted_secrets(
+                resolved_agent_id, agent.launch_epoch
+            )
+        if "registry_auth" in absent:
+            prepared["registry_auth"] = _default_registry_auth(resolved_agent_id, prepared)
+        return prepared
+
+    async def start(
         self,
         agent_id: str,
-        name: str,
-    ) -> AgentRoutes:
-        """Atomically remove one named route."""
-        resolved_agent_id = self._routes_target(agent_id)
-        encoded_name = quote(str(name), safe="")
-        path = f"{AGENTS_API_PREFIX}/{resolved_agent_id}/routes/{encoded_name}"
-        return AgentRoutes.from_dict(self._delete(path))
-
-    def delete(self, agent_id: str) -> dict:
-        """Accept a durable soft delete and background local cleanup.
-
-        Args:
-            agent_id: Agent UUID.
-
-        Returns:
-            The Backend's HTTP 200 accepted projection. Runtime storage cleanup
-            continues in the background; the response is not proof of cleanup.
-        """
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        return self._delete(f"{AGENTS_API_PREFIX}/{resolved_agent_id}")
+        launch_config: dict,
+        *,
+        dry_run: bool = False,
+    ) -> Agent:
+        """Start with one complete replacement launch configuration."""
+        resolved_agent_id = await self.resolve_agent_id(agent_id)
+        body: dict[str, Any] = {
+            "launch_config": _copy_complete_launch_config(
+                await self._rehydrate_redacted_launch_config(resolved_agent_id, launch_config)
+            )
+        }
+        if dry_run:
+            body["dry_run"] = True
+        data = await self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/start", json=body)
+        agent = self._hydrate_agent(data)
+        agent.__dict__["_submitted_launch_config"] = copy.deepcopy(body["launch_config"])
+        return agent
 
-    def refresh_token(self, agent_id: str) -> dict:
-        """Refresh the JWT token for an agent.
+    async def stop(self, agent_id: str) -> Agent:
+        """Stop an agent; the returned snapshot is normally ``STOPPING``."""
+        resolved_agent_id = await self.resolve_agent_id(agent_id)
+        data = await self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/stop")
+        return self._hydrate_agent(data)
 
-        Args:
-            agent_id: Agent UUID.
+    async def archive(self, agent_id: str) -> Agent:
+        """Archive durable storage for a stopped agent without launching it."""
+        resolved_agent_id = await self.resolve_agent_id(agent_id)
+        data = await self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/archive")
+        return self._hydrate_agent(data)
 
-        Returns:
-            Dict with agent_id, token, expires_at, and launch epoch.
-        """
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        return self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/token")
+    async def restore(self, agent_id: str) -> Agent:
+        """Restore durable storage for a stopped or archived agent."""
+        resolved_agent_id = await self.resolve_agent_id(agent_id)
+        data = await self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/restore")
+        return self._hydrate_agent(data)
 
-    def create_scoped_key(self, agent_id: str, name: str | None = None) -> dict:
-        payload = {"name": name} if name is not None else {}
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        return self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/keys", json=payload or None)
+    async def delete(self, agent_id: str) -> dict:
+        """Accept a durable soft delete and background local cleanup."""
+        resolved_agent_id = await self.resolve_agent_id(agent_id)
+        result = await self._delete(f"{AGENTS_API_PREFIX}/{resolved_agent_id}")
+        if self._agent_index is not None:
+            self._agent_index.remove(resolved_agent_id)
+            await asyncio.to_thread(self._agent_index.save)
+        return result
 
-    def upload_profile_image(
+    async def bulk(
         self,
-        agent_id: str,
-        content: bytes | bytearray | memoryview | str | Path,
+        operation: str,
+        targets: Iterable[Agent | str],
         *,
-        content_type: str | None = None,
-    ) -> dict:
-        """Upload an agent avatar/profile image through the deployments API."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        guessed_content_type = content_type
-        if isinstance(content, (str, Path)):
-            path = Path(content)
-            payload = path.read_bytes()
-            guessed_content_type = guessed_content_type or mimetypes.guess_type(path.name)[0]
-        else:
-            payload = bytes(content)
-
-        with httpx.Client(timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS) as client:
-            resp = client.post(
-                f"{self._api_base}{AGENTS_API_PREFIX}/{resolved_agent_id}/profile-image",
-                headers=self._file_headers(content_type=guessed_content_type or "image/png"),
-                content=payload,
-            )
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
-        return resp.json()
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        wait: bool = True,
+        timeout: float = 900.0,
+        poll_interval: float = 30.0,
+        launch_config: dict | Callable[[Agent], dict] | None = None,
+    ) -> list[BulkItem]:
+        """Async twin of :meth:`Deployments.bulk`."""
+        _check_bulk_operation(operation)
+        targets = list(targets)
+        snapshots = {target.id: target for target in targets if isinstance(target, Agent)}
+        agent_ids = await self._agent_ids_for_targets(targets)
+
+        async def call(agent_id: str) -> Any:
+            if operation == "start":
+                agent = snapshots.get(agent_id) or await self.get(agent_id)
+                return await self.start(agent_id, _bulk_launch_config(launch_config, agent))
+            return await getattr(self, operation)(agent_id)
+
+        return await _bulk_operation(
+            operation,
+            agent_ids,
+            perform=call,
+            fetch=self.get,
+            list_agents=self.list,
+            events=self.event_bus(),
+            concurrency=concurrency,
+            wait=wait,
+            timeout=timeout,
+            poll_interval=poll_interval,
+        )
 
-    def web_search(self, query: str, *, count: int = 5, **params: Any) -> dict:
-        """Run Brave web search through the HyperClaw agents API proxy.
+    async def subscribe(
+        self,
+        handler: Callable[[DeploymentEvent], Any],
+        *,
+        stop_event: asyncio.Event | None = None,
+        on_ready: Callable[[], Any] | None = None,
+    ) -> None:
+        """Subscribe to persisted deployment transitions until cancelled."""
+        await _subscribe_deployment_events(
+            lambda: self._post(f"{AGENTS_API_PREFIX}/events/token"),
+            _index_events(self._agent_index, handler),
+            stop_event=stop_event,
+            on_ready=on_ready,
+        )
 
-        Returns the raw Brave-compatible JSON payload. The request uses the
-        agent API key as `X-Subscription-Token`; the backend substitutes its
-        configured Brave API key upstream.
-        """
-        search_params: dict[str, Any] = {"q": query, "count": int(count)}
-        for key, value in params.items():
-            if value is not None:
-                search_params[key] = value
-        with httpx.Client(timeout=30) as client:
-            resp = client.get(
-                f"{self._api_base}/brave/res/v1/web/search",
-                headers={
-                    "Accept": "application/json",
-                    "X-Subscription-Token": self._api_key,
-                },
-                params=search_params,
+    def event_bus(self) -> DeploymentEventBus:
+        """The shared :class:`DeploymentEventBus` for the running event loop."""
+        loop = asyncio.get_running_loop()
+        bus = self._event_buses.get(loop)
+        if bus is None:
+            bus = self._event_buses[loop] = DeploymentEventBus(
+                lambda handler, **kwargs: self.subscribe(handler, **kwargs)
             )
-        if resp.status_code >= 400:
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                detail = resp.text
-            raise APIError(resp.status_code, detail)
-        return resp.json()
+        return bus
 
-    def purchase_entitlement_from_balance(
+    async def wait_for_state(
         self,
-        plan_id: str,
+        agent_id_or_name: str,
+        states: set[str],
         *,
-        duration: int,
-        tags: list[str] | None = None,
-        extend_existing: bool | None = None,
-    ) -> dict:
-        payload: dict[str, Any] = {"duration": int(duration)}
-        if tags is not None:
-            payload["tags"] = list(tags)
-        if extend_existing is not None:
-            payload["extend_existing"] = bool(extend_existing)
-        return self._post(f"/billing/balance/{quote(str(plan_id), safe='')}", json=payload)
-
-    def redeem_grant_code(self, code: str, *, extend_existing: bool | None = None) -> dict:
-        payload: dict[str, Any] = {"code": str(code)}
-        if extend_existing is not None:
-            payload["extend_existing"] = bool(extend_existing)
-        return self._post("/billing/grants/redeem", json=payload)
-
-    def logs_token(self, agent_id: str) -> dict:
-        """Mint a short-lived JWT token for backend log streaming."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        return self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/logs/token")
-
-    def env(self, agent_id: str) -> dict[str, Any]:
-        """Fetch the deployment's non-secret environment."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        return self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/env")
-
-    def set_env(self, agent_id: str, key: str, value: str) -> AgentLaunchValueMutation:
-        """Set one non-secret launch environment value while the agent is stopped."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        resolved_key = quote(str(key), safe="")
-        data = self._patch(
-            f"{AGENTS_API_PREFIX}/{resolved_agent_id}/env/{resolved_key}",
-            json={"value": str(value)},
+        timeout: float = 300.0,
+        poll_interval: float = 5.0,
+        failure_states: set[str] | None = None,
+        minimum_launch_epoch: int | None = None,
+    ) -> Agent:
+        """Wait for one state in the requested runtime incarnation."""
+        agent_id = await self.resolve_agent_id(agent_id_or_name)
+        return await _wait_for_agent_state(
+            agent_id,
+            states,
+            fetch=self.get,
+            events=self.event_bus(),
+            timeout=timeout,
+            poll_interval=poll_interval,
+            failure_states=failure_states,
+            minimum_launch_epoch=minimum_launch_epoch,
         )
-        return AgentLaunchValueMutation.from_dict(data)
 
-    def delete_env(self, agent_id: str, key: str) -> AgentLaunchValueMutation:
-        """Delete one non-secret launch environment value while the agent is stopped."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        resolved_key = quote(str(key), safe="")
-        data = self._delete(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/env/{resolved_key}")
-        return AgentLaunchValueMutation.from_dict(data)
+    async def wait_running(
+        self,
+        agent_id_or_name: str,
+        timeout: float = 300.0,
+        *,
+        poll_interval: float = 5.0,
+        minimum_launch_epoch: int | None = None,
+    ) -> Agent:
+        """Wait for RUNNING using WebSocket wakeups and REST confirmation."""
+        return await self.wait_for_state(
+            agent_id_or_name,
+            {"running"},
+            timeout=timeout,
+            poll_interval=poll_interval,
+            failure_states=set(AGENT_WAIT_RUNNING_FAILURE_STATES),
+            minimum_launch_epoch=minimum_launch_epoch,
+        )
 
-    def secret_names(self, agent_id: str) -> dict[str, Any]:
-        """List the deployment's secret names without exposing their values."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        return self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets")
+    # -----------------------------------------------------------------------
+    # Exec and metrics (Backend WebSocket facade)
+    # -----------------------------------------------------------------------
 
-    def secret(self, agent_id: str, key: str) -> dict[str, Any]:
-        """Fetch one deployment secret by its exact environment key."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        resolved_key = quote(str(key), safe="")
-        return self._get(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets/{resolved_key}")
+    async def _mint_ws_token(
+        self, agent_id: str, purpose: Literal["metrics", "exec"]
+    ) -> tuple[str, str, str]:
+        token_data = await self._post(f"{AGENTS_API_PREFIX}/{agent_id}/{purpose}/token")
+        ws_url, jwt, _ = _validate_agent_ws_token(
+            token_data,
+            agent_id=agent_id,
+            purpose=purpose,
+        )
+        return ws_url, jwt, token_data["expires_at"]
 
-    def set_secret(self, agent_id: str, key: str, value: str) -> AgentLaunchValueMutation:
-        """Set one launch secret while stopped without expecting its value back."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        resolved_key = quote(str(key), safe="")
-        data = self._patch(
-            f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets/{resolved_key}",
-            json={"value": str(value)},
+    async def _one_shot_ws_result(
+        self,
+        *,
+        agent_id: str,
+        purpose: Literal["metrics", "exec"],
+        request: dict[str, Any] | None = None,
+        timeout: float,
+    ) -> object:
+        ws_url, jwt, _ = await self._mint_ws_token(agent_id, purpose)
+        return await self._ws_round_trip(
+            _ws_url_with_jwt(ws_url, jwt), purpose=purpose, request=request, timeout=timeout
         )
-        return AgentLaunchValueMutation.from_dict(data)
 
-    def delete_secret(self, agent_id: str, key: str) -> AgentLaunchValueMutation:
-        """Delete one launch secret while the agent is stopped."""
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        resolved_key = quote(str(key), safe="")
-        data = self._delete(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/secrets/{resolved_key}")
-        return AgentLaunchValueMutation.from_dict(data)
+    async def _ws_round_trip(
+        self,
+        url: str,
+        *,
+        purpose: Literal["metrics", "exec"],
+        request: dict[str, Any] | None,
+        timeout: float,
+    ) -> object:
+        import websockets
+        from websockets.exceptions import ConnectionClosed, WebSocketException
 
-    def exec(
+        try:
+            async with websockets.connect(
+                url,
+                open_timeout=min(timeout, 10),
+                close_timeout=10,
+                max_size=AGENT_EXEC_RESULT_MAX_MESSAGE_BYTES,
+            ) as ws:
+                if request is not None:
+                    await ws.send(json.dumps(request, separators=(",", ":")))
+                result = _decode_ws_result(
+                    await asyncio.wait_for(ws.recv(), timeout=timeout), purpose
+                )
+                try:
+                    await asyncio.wait_for(ws.recv(), timeout=10)
+                except ConnectionClosed as exc:
+                    code = exc.rcvd.code if exc.rcvd is not None else None
+                    if code != 1000:
+                        raise _ws_close_error(exc, purpose, before_result=False) from exc
+                else:
+                    raise RuntimeError(
+                        f"Agent {purpose} WebSocket returned more than one result frame"
+                    )
+                return result
+        except ConnectionClosed as exc:
+            raise _ws_close_error(exc, purpose, before_result=True) from exc
+        except (asyncio.TimeoutError, OSError, WebSocketException) as exc:
+            raise RuntimeError(
+                f"Agent {purpose} WebSocket connection failed: {exc}"
+            ) from exc
+
+    async def exec(
         self,
         pod: Agent | str,
         command: list[str],
         timeout: int = 30,
         dry_run: bool = False,
     ) -> ExecResult:
-        """Execute a one-shot command through the Backend WebSocket facade.
-
-        Args:
-            pod: Agent to execute on.
-            command: Exact executable and argument vector to run.
-            timeout: Command timeout in seconds.
-
-        Returns:
-            ExecResult with exit_code, stdout, stderr.
-        """
-        if (
-            not isinstance(command, list)
-            or not command
-            or any(not isinstance(argument, str) for argument in command)
-            or not command[0]
-            or any("\x00" in argument for argument in command)
-            or sum(len(argument.encode("utf-8")) for argument in command) > 65_536
-        ):
-            raise ValueError(
-                "command must be a nonempty argv list of strings with a nonempty "
-                "executable, at most 65536 UTF-8 bytes, and no NUL"
-            )
-        command = list(command)
-        if isinstance(timeout, bool) or not isinstance(timeout, int) or not 1 <= timeout <= 300:
-            raise ValueError("timeout must be an integer from 1 through 300")
-
-        agent_id = self._agent_id_for_target(pod)
-        result = self._one_shot_ws_result(
+        """Execute a one-shot argv command; see :meth:`Deployments.exec`."""
+        command = validate_exec_request(command, timeout)
+        agent_id = await self._agent_id_for_target(pod)
+        result = await self._one_shot_ws_result(
             agent_id=agent_id,
             purpose="exec",
             request={"command": command, "timeout": timeout, "dry_run": bool(dry_run)},
@@ -4898,112 +7215,255 @@ class Deployments:
         )
         return _validate_exec_result(result)
 
-    def files_list(self, pod: Agent | str, path: str = "") -> list[dict]:
+    async def _agent_ids_for_targets(self, targets: Iterable[Agent | str]) -> list[str]:
+        listed: list[Agent] | None = None
+        agent_ids: list[str] = []
+        for target in targets:
+            if isinstance(target, Agent):
+                agent_ids.append(target.id)
+                continue
+            raw = str(target or "").strip()
+            if _is_direct_agent_id_ref(raw):
+                agent_ids.append(raw)
+                continue
+            if self._agent_index is not None:
+                agent_ids.append(await self._resolve_indexed(raw))
+                continue
+            if listed is None:
+                listed = await self.list()
+            agent_ids.append(_resolve_agent_match(raw, listed).id)
+        return agent_ids
+
+    async def exec_many(
+        self,
+        pods: Iterable[Agent | str],
+        command: list[str],
+        *,
+        timeout: int = 30,
+        concurrency: int = DEFAULT_EXEC_CONCURRENCY,
+        target_timeout: float | None = None,
+        dry_run: bool = False,
+    ) -> AsyncIterator[ExecBatchItem]:
+        """Fan a command out to many agents; see :meth:`Deployments.exec_many`."""
+        command = validate_exec_request(command, timeout)
+        agent_ids = await self._agent_ids_for_targets(pods)
+        async for item in async_fan_out(
+            lambda agent_id: self.exec(agent_id, command, timeout=timeout, dry_run=dry_run),
+            agent_ids,
+            concurrency=concurrency,
+            deadline=target_deadline(timeout, target_timeout),
+        ):
+            yield item
+
+    async def exec_session(
+        self, pod: Agent | str, *, max_in_flight: int = DEFAULT_EXEC_SESSION_IN_FLIGHT
+    ) -> AsyncExecSession:
+        """Open an :class:`AsyncExecSession`; see :meth:`Deployments.exec_session`."""
+        return AsyncExecSession(
+            self, await self._agent_id_for_target(pod), max_in_flight=max_in_flight
+        )
+
+    async def metrics(self, agent_id_or_name: str) -> dict:
+        """Get one live CPU/memory sample through the Backend WebSocket facade."""
+        agent_id = await self.resolve_agent_id(agent_id_or_name)
+        result = await self._one_shot_ws_result(
+            agent_id=agent_id,
+            purpose="metrics",
+            timeout=max(self._timeout, 35),
+        )
+        return _validate_metrics_result(result)
+
+    # -----------------------------------------------------------------------
+    # Files (direct Reef access)
+    # -----------------------------------------------------------------------
+
+    async def _reef_file_access(self, agent_id: str) -> tuple[str, str]:
+        cached = self._reef_tokens.get(agent_id)
+        if cached is not None:
+            return cached
+        async with self._reef_mint_locks.setdefault(agent_id, asyncio.Lock()):
+            cached = self._reef_tokens.get(agent_id)
+            if cached is not None:
+                return cached
+            payload = await self._post(f"{AGENTS_API_PREFIX}/{agent_id}/files/token")
+            reef_url, token, expires_at = _validate_reef_file_access(payload)
+            self._reef_tokens.put(agent_id, reef_url, token, expires_at)
+            return reef_url, token
+
+    async def _reef_request(
+        self,
+        agent_id: str,
+        send: Callable[[str, str], Awaitable[httpx.Response]],
+        *,
+        retry_unauthorized: bool = True,
+    ) -> httpx.Response:
+        """Call Reef with the cached credential, re-minting it once on ``401``."""
+        reef_url, token = await self._reef_file_access(agent_id)
+        resp = await send(reef_url, token)
+        if resp.status_code == 401:
+            self._reef_tokens.invalidate(agent_id, token)
+        if resp.status_code == 401 and retry_unauthorized:
+            reef_url, token = await self._reef_file_access(agent_id)
+            resp = await send(reef_url, token)
+        if not 200 <= resp.status_code < 300:
+            raise _reef_error(resp)
+        return resp
+
+    async def files_list(self, pod: Agent | str, path: str = "") -> list[dict]:
         """List a path directly through the Agent's retained Reef server."""
-        agent_id = self._agent_id_for_target(pod)
+        agent_id = await self._agent_id_for_target(pod)
         resolved_path = resolve_sync_root_file_path(path)
-        reef_url, token = self._reef_file_access(agent_id)
-        suffix = f"/{self._encode_file_path(resolved_path)}" if resolved_path else ""
-        with httpx.Client(timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS) as client:
-            resp = client.get(
+        suffix = f"/{_encode_file_path(resolved_path)}" if resolved_path else ""
+        resp = await self._reef_request(
+            agent_id,
+            lambda reef_url, token: self._client(reef_url).get(
                 f"{reef_url}/directories{suffix}",
-                headers=self._reef_headers(token),
+                headers=Deployments._reef_headers(token),
                 follow_redirects=False,
-            )
-        if not 200 <= resp.status_code < 300:
-            self._raise_reef_error(resp)
-        payload = resp.json()
-        if not _is_directory_listing_payload(payload):
-            raise ValueError("Reef returned an invalid directory listing")
-        return [
-            *(payload.get("directories") or []),
-            *(payload.get("files") or []),
-        ]
+                timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS,
+            ),
+        )
+        return _directory_entries(resp.json())
 
-    def file_read_bytes_with_metadata(self, pod: Agent | str, path: str) -> dict[str, Any]:
+    async def file_read_bytes_with_metadata(
+        self,
+        pod: Agent | str,
+        path: str,
+    ) -> dict[str, Any]:
         """Read a sync-root-relative file directly from Reef."""
-        agent_id = self._agent_id_for_target(pod)
+        agent_id = await self._agent_id_for_target(pod)
         resolved_path = resolve_sync_root_file_path(path)
         if not resolved_path:
             raise ValueError("agent file path is required")
-        reef_url, token = self._reef_file_access(agent_id)
         content = bytearray()
-        with httpx.Client(timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS) as client:
-            with client.stream(
+        async with self._reef_file_response(agent_id, resolved_path) as resp:
+            content_type = resp.headers.get("content-type", "")
+            async for chunk in resp.aiter_bytes(chunk_size=AGENT_FILE_TRANSFER_CHUNK_BYTES):
+                _append_file_chunk(content, chunk)
+        return _file_read_result(bytes(content), content_type, path)
+
+    @asynccontextmanager
+    async def _reef_file_response(
+        self,
+        agent_id: str,
+        resolved_path: str,
+    ) -> AsyncIterator[httpx.Response]:
+        for attempt in range(2):
+            reef_url, token = await self._reef_file_access(agent_id)
+            async with self._client(reef_url).stream(
                 "GET",
-                f"{reef_url}/files/{self._encode_file_path(resolved_path)}",
-                headers=self._reef_headers(token),
+                f"{reef_url}/files/{_encode_file_path(resolved_path)}",
+                headers=Deployments._reef_headers(token),
                 follow_redirects=False,
+                timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS,
             ) as resp:
+                if resp.status_code == 401 and attempt == 0:
+                    self._reef_tokens.invalidate(agent_id, token)
+                    continue
                 if not 200 <= resp.status_code < 300:
-                    resp.read()
-                    self._raise_reef_error(resp)
-                content_type = resp.headers.get("content-type", "")
-                for chunk in resp.iter_bytes(chunk_size=AGENT_FILE_TRANSFER_CHUNK_BYTES):
-                    remaining = (AGENT_FILE_MAX_BYTES + 1) - len(content)
-                    content.extend(chunk[:remaining])
-                    if len(content) > AGENT_FILE_MAX_BYTES:
-                        raise ValueError(
-                            "Agent file reads are limited to "
-                            f"{AGENT_FILE_MAX_BYTES // 1024 // 1024} MiB"
-                        )
-        content_bytes = bytes(content)
-        if "application/json" in content_type.lower():
-            try:
-                payload = json.loads(content_bytes.decode(errors="replace"))
-            except Exception:
-                payload = None
-            if _is_directory_listing_payload(payload):
-                raise ValueError(f"Path is a directory: {path}. Use files_list(path) instead.")
-        return {"content": content_bytes, "mime_type": content_type or None}
+                    await resp.aread()
+                    raise _reef_error(resp)
+                yield resp
+                return
 
-    def file_read_bytes(self, pod: Agent | str, path: str) -> bytes:
+    async def file_read_stream(
+        self,
+        pod: Agent | str,
+        path: str,
+        *,
+        chunk_size: int = AGENT_FILE_TRANSFER_CHUNK_BYTES,
+    ) -> AsyncIterator[bytes]:
+        """Yield a file from Reef chunk by chunk; see :meth:`Deployments.file_read_stream`."""
+        agent_id = await self._agent_id_for_target(pod)
+        resolved_path = resolve_sync_root_file_path(path)
+        if not resolved_path:
+            raise ValueError("agent file path is required")
+        async with self._reef_file_response(agent_id, resolved_path) as resp:
+            content_type = resp.headers.get("content-type", "")
+            if _is_json_content_type(content_type):
+                content = bytearray()
+                async for chunk in resp.aiter_bytes(chunk_size=chunk_size):
+                    _append_file_chunk(content, chunk)
+                yield _file_read_result(bytes(content), content_type, path)["content"]
+                return
+            async for chunk in resp.aiter_bytes(chunk_size=chunk_size):
+                yield chunk
+
+    async def file_read_bytes(self, pod: Agent | str, path: str) -> bytes:
         """Read a sync-root-relative file through the Reef file API."""
-        return self.file_read_bytes_with_metadata(pod, path).get("content", b"")
+        result = await self.file_read_bytes_with_metadata(pod, path)
+        return result.get("content", b"")
 
-    def file_read(self, pod: Agent | str, path: str) -> str:
+    async def file_read(self, pod: Agent | str, path: str) -> str:
         """Read a UTF-8 text file from an agent."""
-        return self.file_read_bytes(pod, path).decode(errors="replace")
+        return (await self.file_read_bytes(pod, path)).decode(errors="replace")
 
-    def file_write_bytes(self, pod: Agent | str, path: str, content: bytes) -> dict:
-        """Write bytes directly to a sync-root-relative path through Reef.
+    async def file_write_bytes(self, pod: Agent | str, path: str, content: bytes) -> dict:
+        """Write bytes directly to a sync-root-relative path through Reef."""
+        path = _validate_file_write(path, content)
+        agent_id = await self._agent_id_for_target(pod)
+        resp = await self._reef_request(
+            agent_id,
+            lambda reef_url, token: self._client(reef_url).put(
+                f"{reef_url}/files/{_encode_file_path(path)}",
+                headers=Deployments._reef_headers(
+                    token, content_type="application/octet-stream"
+                ),
+                content=content,
+                follow_redirects=False,
+                timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS,
+            ),
+        )
+        return resp.json()
 
-        Per-file writes are limited to 100 MiB (``AGENT_FILE_WRITE_MAX_BYTES``,
-        the Cloudflare edge request-body cap on the agent hostname). Larger
-        data should be split across files or synced via the agent's own
-        tooling.
+    async def file_write_stream(
+        self,
+        pod: Agent | str,
+        path: str,
+        data: AsyncIterable[bytes] | Iterable[bytes],
+    ) -> dict:
+        """Write byte chunks through Reef without buffering the whole body.
+
+        The iterable is consumed once, so a rejected file token surfaces as
+        the ``401`` rather than being retried.
         """
         path = normalize_writable_backend_file_path(path)
         if not path:
             raise ValueError("agent file path is required")
-        if len(content) > AGENT_FILE_WRITE_MAX_BYTES:
-            raise ValueError(
-                "Agent file writes are limited to "
-                f"{AGENT_FILE_WRITE_MAX_BYTES // 1024 // 1024} MiB "
-                "(Cloudflare request-body cap on the agent hostname); "
-                "split larger data or sync it via the agent's own tooling"
-            )
-        agent_id = self._agent_id_for_target(pod)
-        reef_url, token = self._reef_file_access(agent_id)
-        with httpx.Client(timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS) as client:
-            resp = client.put(
-                f"{reef_url}/files/{self._encode_file_path(path)}",
-                headers=self._reef_headers(token, content_type="application/octet-stream"),
-                content=content,
+        agent_id = await self._agent_id_for_target(pod)
+
+        async def capped() -> AsyncIterator[bytes]:
+            if not isinstance(data, AsyncIterable):
+                for chunk in _capped_chunks(data):
+                    yield chunk
+                return
+            sent = 0
+            async for chunk in data:
+                sent += len(chunk)
+                if sent > AGENT_FILE_WRITE_MAX_BYTES:
+                    raise _file_write_limit_error()
+                yield chunk
+
+        resp = await self._reef_request(
+            agent_id,
+            lambda reef_url, token: self._client(reef_url).put(
+                f"{reef_url}/files/{_encode_file_path(path)}",
+                headers=Deployments._reef_headers(
+                    token, content_type="application/octet-stream"
+                ),
+                content=capped(),
                 follow_redirects=False,
-            )
-        if not 200 <= resp.status_code < 300:
-            self._raise_reef_error(resp)
+                timeout=AGENT_FILE_OPERATION_TIMEOUT_SECONDS,
+            ),
+            retry_unauthorized=False,
+        )
         return resp.json()
 
-    def file_write(self, pod: Agent | str, path: str, content: str) -> dict:
-        """Write a UTF-8 text file to an agent.
-
-        Subject to the 100 MiB per-file write limit; see ``file_write_bytes``.
-        """
-        return self.file_write_bytes(pod, path, content.encode())
+    async def file_write(self, pod: Agent | str, path: str, content: str) -> dict:
+        """Write a UTF-8 text file to an agent."""
+        return await self.file_write_bytes(pod, path, content.encode())
 
-    def file_delete(
+    async def file_delete(
         self,
         pod: Agent | str,
         path: str,
@@ -5013,121 +7473,45 @@ class Deployments:
         path = normalize_writable_backend_file_path(path)
         if not path:
             raise ValueError("agent file path is required")
-        agent_id = self._agent_id_for_target(pod)
-        reef_url, token = self._reef_file_access(agent_id)
-        with httpx.Client(timeout=10) as client:
-            resp = client.delete(
-                f"{reef_url}/files/{self._encode_file_path(path)}",
-                headers=self._reef_headers(token),
+        agent_id = await self._agent_id_for_target(pod)
+        resp = await self._reef_request(
+            agent_id,
+            lambda reef_url, token: self._client(reef_url).delete(
+                f"{reef_url}/files/{_encode_file_path(path)}",
+                headers=Deployments._reef_headers(token),
                 params={"recursive": "true"} if recursive else None,
                 follow_redirects=False,
-            )
-        if not 200 <= resp.status_code < 300:
-            self._raise_reef_error(resp)
+                timeout=10,
+            ),
+        )
         return resp.json()
 
-    def cp_to(self, pod: Agent | str, local_path: str | Path, remote_path: str) -> dict:
-        """Copy a local file to an agent.
-
-        Subject to the 100 MiB per-file write limit; see ``file_write_bytes``.
-        """
-        source = Path(local_path)
-        return self.file_write_bytes(pod, remote_path, source.read_bytes())
-
-    def cp_from(self, pod: Agent | str, remote_path: str, local_path: str | Path) -> Path:
-        """Copy a file from an agent to the local filesystem."""
-        dest = Path(local_path)
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_bytes(self.file_read_bytes(pod, remote_path))
-        return dest
-
     # -----------------------------------------------------------------------
-    # WebSocket API (via HyperClaw backend)
+    # Logs
     # -----------------------------------------------------------------------
 
+    async def logs_token(self, agent_id: str) -> dict:
+        """Mint a short-lived JWT token for backend log streaming."""
+        resolved_agent_id = await self.resolve_agent_id(agent_id)
+        return await self._post(f"{AGENTS_API_PREFIX}/{resolved_agent_id}/logs/token")
+
     async def logs_stream_ws(
         self,
         agent_id: str,
         tail_lines: int = 100,
         container: str = "reef",
         follow: bool = True,
+        archive: LogArchive | None = None,
+        line_filter: LogFilter | None = None,
     ) -> AsyncIterator[str]:
-        """Stream logs via backend WebSocket.
-
-        Connects to the HyperClaw backend WebSocket endpoint which proxies
-        to the lagoon log buffer.
-
-        Args:
-            agent_id: Agent UUID.
-            tail_lines: Number of historical lines to fetch first.
-            container: Container name (default: reef).
-            follow: Keep streaming after buffered history.
-
-        Yields:
-            Log lines as they arrive.
-        """
-        import websockets
-
-        # Get JWT token
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        token_data = self.logs_token(resolved_agent_id)
-        jwt = token_data["jwt"]
-
-        url = (
-            f"{self._agents_ws_url}/logs/{resolved_agent_id}"
-            f"?jwt={quote(jwt, safe='')}"
-            f"&container={quote(container, safe='')}"
-            f"&tail_lines={tail_lines}"
-        )
-
-        async with websockets.connect(url) as ws:
-            async for msg in ws:
-                try:
-                    payload = json.loads(msg)
-                except (TypeError, json.JSONDecodeError):
-                    yield str(msg)
-                    continue
-                if not isinstance(payload, dict):
-                    continue
-                event = payload.get("event")
-                if event == "log":
-                    yield str(payload.get("log") or "")
-                elif event == "history_end" and not follow:
-                    return
-                elif event == "error":
-                    raise RuntimeError(str(payload.get("detail") or "Log stream failed"))
-
-    async def shell_connect(self, agent_id: str, shell: str | None = None):
-        """Connect to agent shell via backend WebSocket proxy.
-
-        Connects to the HyperClaw backend shell WebSocket which proxies
-        to lagoon → k8s exec for bidirectional PTY access.
-
-        Args:
-            agent_id: Agent UUID.
-
-        Returns:
-            WebSocket connection for bidirectional shell I/O.
-        """
-        import websockets
-
-        resolved_agent_id = self.resolve_agent_id(agent_id)
-        selected_shell = shell or "/bin/bash"
-
-        token_data = self._post(
-            f"{AGENTS_API_PREFIX}/{resolved_agent_id}/shell/token",
-            json={"shell": selected_shell},
-        )
-        ws_url, jwt, resolved_shell = _validate_agent_ws_token(
-            token_data,
-            agent_id=resolved_agent_id,
-            purpose="shell",
-            shell=selected_shell,
-        )
-        separator = "&" if "?" in ws_url else "?"
-        url = (
-            f"{ws_url}{separator}jwt={quote(jwt, safe='')}"
-            f"&shell={quote(resolved_shell, safe='')}"
+        """Stream logs via the backend WebSocket; see :meth:`Deployments.logs_stream_ws`."""
+        resolved_agent_id = await self.resolve_agent_id(agent_id)
+        token_data = await self.logs_token(resolved_agent_id)
+        url = _logs_ws_url(
+            self._agents_ws_url, resolved_agent_id, token_data["jwt"], container, tail_lines
         )
 
-        return await websockets.connect(url, ping_interval=20, ping_timeout=20)
+        async for line in _archived_log_lines(
+            url, follow, archive, resolved_agent_id, line_filter
+        ):
+            yield line
@@ -1,4 +1,6 @@
 """Main HyperCLI client"""
+import httpx
+
 from .config import (
     get_agent_api_key,
     get_agents_api_base_url,
@@ -7,6 +9,7 @@ from .config import (
     get_agents_ws_url_from_product_base,
     get_api_key,
     get_api_url,
+    get_upload_cache_enabled,
 )
 from .http import HTTPClient
 from .billing import Billing
@@ -15,6 +18,7 @@ from .user import UserAPI
 from .instances import Instances
 from .renders import Renders
 from .files import Files
+from .upload_cache import UploadCache
 from .voice import VoiceAPI
 from .agents import Deployments
 from .agent import HyperAgent
@@ -56,6 +60,13 @@ class HyperCLI:
 
         # User
         user = client.user.get()
+
+    All namespaces share one keep-alive connection pool. Tune it with
+    ``limits``/``http2`` and release it with ``close()`` or a ``with`` block.
+
+    ``upload_cache=True`` (or ``HYPER_UPLOAD_CACHE=1``) makes ``files`` reuse
+    earlier uploads of identical content; pass an ``UploadCache`` to choose
+    its location or expiry.
     """
 
     def __init__(
@@ -67,6 +78,9 @@ class HyperCLI:
         agents_api_base_url: str = None,
         agents_ws_url: str = None,
         timeout: float = None,
+        limits: httpx.Limits = None,
+        http2: bool = False,
+        upload_cache: "bool | UploadCache | None" = None,
     ):
         resolved_product_api_key = api_key or get_api_key()
         resolved_agent_api_key = agent_api_key or api_key or get_agent_api_key()
@@ -79,7 +93,13 @@ class HyperCLI:
 
         self._api_url = api_url or get_api_url()
         resolved_timeout = timeout if timeout is not None else 30.0
-        self._http = HTTPClient(self._api_url, self._api_key, timeout=resolved_timeout)
+        self._http = HTTPClient(
+            self._api_url,
+            self._api_key,
+            timeout=resolved_timeout,
+            limits=limits,
+            http2=http2,
+        )
 
         # API namespaces
         resolved_agents_api_base = (
@@ -91,7 +111,12 @@ class HyperCLI:
             or (_derive_agents_ws_url(self._api_url, agent_dev) if api_url else get_agents_ws_url(agent_dev))
         )
         self._agents_api_base_url = resolved_agents_api_base
-        self._agents_http = HTTPClient(self._agents_api_base_url, self._api_key, timeout=resolved_timeout)
+        self._agents_http = HTTPClient(
+            self._agents_api_base_url,
+            self._api_key,
+            timeout=resolved_timeout,
+            session=self._http._session,
+        )
         self.deployments = Deployments(
             self._http,
             api_key=resolved_agent_api_key,
@@ -104,7 +129,11 @@ class HyperCLI:
         self.user = UserAPI(self._http)
         self.instances = Instances(self._http)
         self.renders = Renders(self._http)
-        self.files = Files(self._http)
+        if upload_cache is None:
+            upload_cache = get_upload_cache_enabled()
+        if upload_cache is True:
+            upload_cache = UploadCache()
+        self.files = Files(self._http, upload_cache=upload_cache or None)
         self.voice = VoiceAPI(self._agents_http)
         self.keys = KeysAPI(self._http)
         self.models = ModelsAPI(self._http)
@@ -119,6 +148,17 @@ class HyperCLI:
             agents_api_base_url=resolved_agents_api_base,
         )
 
+    def close(self) -> None:
+        """Close the shared connection pool."""
+        self.deployments.close()
+        self._http.close()
+
+    def __enter__(self) -> "HyperCLI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     @property
     def api_url(self) -> str:
         return self._api_url
@@ -55,6 +55,12 @@ def get_agent_api_key() -> Optional[str]:
     )
 
 
+def get_upload_cache_enabled() -> bool:
+    """Whether the opt-in upload dedup cache is enabled (HYPER_UPLOAD_CACHE)."""
+    value = get_config_value("HYPER_UPLOAD_CACHE", "")
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 def get_api_url() -> str:
     """Get product API URL."""
     return (
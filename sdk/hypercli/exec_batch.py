@@ -0,0 +1,193 @@
+"""Fan one command out to many jobs or agents with bounded concurrency."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+
+DEFAULT_EXEC_CONCURRENCY = 16
+EXEC_TARGET_GRACE_SECONDS = 15
+
+
+@dataclass
+class ExecBatchItem:
+    """Outcome of one target in an ``exec_many`` fan-out.
+
+    ``result`` is the target's ``ExecResult`` when the command ran; ``error``
+    holds the exception when it could not be run or overran its deadline.
+    """
+
+    target: str
+    result: Any | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def exit_code(self) -> int | None:
+        return None if self.result is None else self.result.exit_code
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.exit_code == 0
+
+
+@dataclass
+class ExecSummary:
+    """Exit-code tally over a set of ``ExecBatchItem`` results."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    errors: int = 0
+    exit_codes: dict[int, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_items(cls, items: Iterable[ExecBatchItem]) -> "ExecSummary":
+        items = list(items)
+        codes = Counter(item.exit_code for item in items if item.error is None)
+        return cls(
+            total=len(items),
+            succeeded=codes.get(0, 0),
+            failed=sum(count for code, count in codes.items() if code != 0),
+            errors=sum(1 for item in items if item.error is not None),
+            exit_codes=dict(sorted(codes.items())),
+        )
+
+    @property
+    def ok(self) -> bool:
+        return self.succeeded == self.total
+
+
+def target_deadline(timeout: int, target_timeout: float | None) -> float:
+    """Per-target wall-clock budget: the command timeout plus connection grace."""
+    if target_timeout is None:
+        return float(timeout + EXEC_TARGET_GRACE_SECONDS)
+    if target_timeout <= 0:
+        raise ValueError("target_timeout must be positive")
+    return float(target_timeout)
+
+
+def validate_exec_request(command: list[str], timeout: int) -> list[str]:
+    """Check an exec argv and timeout; return a copy of the argv."""
+    if (
+        not isinstance(command, list)
+        or not command
+        or any(not isinstance(argument, str) for argument in command)
+        or not command[0]
+        or any("\x00" in argument for argument in command)
+        or sum(len(argument.encode("utf-8")) for argument in command) > 65_536
+    ):
+        raise ValueError(
+            "command must be a nonempty argv list of strings with a nonempty "
+            "executable, at most 65536 UTF-8 bytes, and no NUL"
+        )
+    if isinstance(timeout, bool) or not isinstance(timeout, int) or not 1 <= timeout <= 300:
+        raise ValueError("timeout must be an integer from 1 through 300")
+    return list(command)
+
+
+def _check_concurrency(concurrency: int) -> int:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    return concurrency
+
+
+def _timed_out(target: str, deadline: float) -> TimeoutError:
+    return TimeoutError(f"{target}: no result within {deadline:g}s")
+
+
+def fan_out(
+    run: Callable[[str], Any],
+    targets: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_EXEC_CONCURRENCY,
+    deadline: float,
+) -> Iterator[ExecBatchItem]:
+    """Run ``run(target)`` on a thread pool and yield items as they finish.
+
+    A target whose call has not returned *deadline* seconds after it started
+    is reported as a ``TimeoutError``; its worker thread is abandoned rather
+    than waited for, and the underlying client timeouts reap it.
+    """
+    targets = list(dict.fromkeys(targets))
+    concurrency = _check_concurrency(concurrency)
+    if not targets:
+        return
+    started: dict[str, float] = {}
+    lock = threading.Lock()
+
+    def call(target: str) -> Any:
+        with lock:
+            started[target] = time.monotonic()
+        return run(target)
+
+    pool = ThreadPoolExecutor(max_workers=min(concurrency, len(targets)))
+    try:
+        pending: dict[Future, str] = {pool.submit(call, target): target for target in targets}
+        while pending:
+            with lock:
+                running = [started[target] for target in pending.values() if target in started]
+            wait_for = None
+            if running:
+                wait_for = max(0.0, min(running) + deadline - time.monotonic())
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in done:
+                target = pending.pop(future)
+                elapsed = now - started.get(target, now)
+                try:
+                    yield ExecBatchItem(target, result=future.result(), elapsed=elapsed)
+                except Exception as exc:
+                    yield ExecBatchItem(target, error=exc, elapsed=elapsed)
+            with lock:
+                overdue = [
+                    future
+                    for future, target in pending.items()
+                    if target in started and now - started[target] >= deadline
+                ]
+            for future in overdue:
+                target = pending.pop(future)
+                future.cancel()
+                yield ExecBatchItem(
+                    target, error=_timed_out(target, deadline), elapsed=now - started[target]
+                )
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_fan_out(
+    run: Callable[[str], Awaitable[Any]],
+    targets: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_EXEC_CONCURRENCY,
+    deadline: float,
+) -> AsyncIterator[ExecBatchItem]:
+    """Async twin of :func:`fan_out`; overrunning targets are cancelled."""
+    targets = list(dict.fromkeys(targets))
+    semaphore = asyncio.Semaphore(_check_concurrency(concurrency))
+
+    async def call(target: str) -> ExecBatchItem:
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                result = await asyncio.wait_for(run(target), timeout=deadline)
+            except asyncio.TimeoutError:
+                error: Exception = _timed_out(target, deadline)
+            except Exception as exc:
+                error = exc
+            else:
+                return ExecBatchItem(target, result=result, elapsed=time.monotonic() - started)
+            return ExecBatchItem(target, error=error, elapsed=time.monotonic() - started)
+
+    tasks = [asyncio.ensure_future(call(target)) for target in targets]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
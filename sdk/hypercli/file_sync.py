@@ -0,0 +1,246 @@
+"""Recursive directory sync between local disk and an agent's Reef sync root."""
+from __future__ import annotations
+
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+import hashlib
+import os
+import posixpath
+from typing import Any, Callable, Literal
+
+
+DEFAULT_SYNC_CONCURRENCY = 8
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+SyncDirection = Literal["upload", "download"]
+
+
+@dataclass(frozen=True)
+class FileSyncEntry:
+    """Size/mtime/sha256 facts for one file on either side of a sync."""
+
+    path: str
+    size: int | None = None
+    mtime: float | None = None
+    sha256: str | None = None
+
+
+@dataclass(frozen=True)
+class FileSyncAction:
+    """One planned transfer or skip.
+
+    ``path`` is relative to both the local and remote directory. ``reason`` is
+    ``missing``, ``size``, ``mtime``, ``checksum``, ``unknown`` or ``forced``
+    for transfers and ``unchanged`` for skips.
+    """
+
+    path: str
+    source: str
+    destination: str
+    size: int | None
+    reason: str
+
+    @property
+    def transfer(self) -> bool:
+        return self.reason != "unchanged"
+
+
+@dataclass
+class FileSyncPlan:
+    """Outcome of ``sync_to``/``sync_from``; unexecuted when ``dry_run`` is set."""
+
+    direction: SyncDirection
+    actions: list[FileSyncAction] = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def transfers(self) -> list[FileSyncAction]:
+        return [action for action in self.actions if action.transfer]
+
+    @property
+    def skipped(self) -> list[FileSyncAction]:
+        return [action for action in self.actions if not action.transfer]
+
+    @property
+    def bytes_to_transfer(self) -> int:
+        return sum(action.size or 0 for action in self.transfers)
+
+
+def _parse_mtime(value: Any) -> float | None:
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _parse_size(value: Any) -> int | None:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def remote_entry(path: str, item: dict) -> FileSyncEntry:
+    """Build a ``FileSyncEntry`` from one Reef directory listing item."""
+    mtime = None
+    for key in ("mtime", "modified_at", "last_modified", "updated_at"):
+        mtime = _parse_mtime(item.get(key))
+        if mtime is not None:
+            break
+    sha256 = item.get("sha256")
+    return FileSyncEntry(
+        path=path,
+        size=_parse_size(item.get("size")),
+        mtime=mtime,
+        sha256=str(sha256).lower() if sha256 else None,
+    )
+
+
+def file_sha256(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def walk_local(root: str | Path) -> dict[str, FileSyncEntry]:
+    """Return every regular file under *root* keyed by its POSIX relative path."""
+    base = Path(root)
+    if not base.is_dir():
+        raise NotADirectoryError(f"Not a directory: {base}")
+    entries: dict[str, FileSyncEntry] = {}
+    for dirpath, dirnames, filenames in os.walk(base):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            full = Path(dirpath) / filename
+            if not full.is_file():
+                continue
+            stat = full.stat()
+            rel = full.relative_to(base).as_posix()
+            entries[rel] = FileSyncEntry(path=rel, size=stat.st_size, mtime=stat.st_mtime)
+    return entries
+
+
+def walk_remote(
+    list_dir: Callable[[str], list[dict]],
+    root: str,
+) -> dict[str, FileSyncEntry]:
+    """Walk a Reef directory tree breadth-first through *list_dir*."""
+    root = root.strip("/")
+    entries: dict[str, FileSyncEntry] = {}
+    pending = [root]
+    while pending:
+        current = pending.pop(0)
+        for item in list_dir(current):
+            name = str(item.get("name") or "").strip("/")
+            if not name:
+                continue
+            child = posixpath.join(current, name) if current else name
+            rel = child[len(root) :].lstrip("/") if root else child
+            if item.get("type") == "directory":
+                pending.append(child)
+            else:
+                entries[rel] = remote_entry(rel, item)
+    return entries
+
+
+def _change_reason(
+    direction: SyncDirection,
+    local: FileSyncEntry | None,
+    remote: FileSyncEntry | None,
+    local_path: Path,
+    *,
+    checksum: bool,
+) -> str:
+    if local is None or remote is None:
+        return "missing"
+    if remote.size is not None and remote.size != local.size:
+        return "size"
+    if remote.sha256:
+        return "unchanged" if file_sha256(local_path) == remote.sha256 else "checksum"
+    if checksum or remote.size is None or remote.mtime is None or local.mtime is None:
+        return "unknown"
+    source, destination = (local, remote) if direction == "upload" else (remote, local)
+    return "unchanged" if destination.mtime >= source.mtime else "mtime"
+
+
+def plan_sync(
+    direction: SyncDirection,
+    local: dict[str, FileSyncEntry],
+    remote: dict[str, FileSyncEntry],
+    *,
+    local_root: str | Path,
+    remote_root: str,
+    checksum: bool = False,
+    force: bool = False,
+) -> list[FileSyncAction]:
+    """Diff the two trees and return one action per file on the source side.
+
+    A file is skipped only when the destination provably holds the same bytes:
+    equal sizes plus a matching sha256 whenever the remote reports one, or
+    otherwise a destination mtime no older than the source's. With
+    ``checksum`` set, mtimes are never trusted, so anything the remote cannot
+    vouch for by sha256 is transferred. ``force`` transfers everything.
+    """
+    local_base = Path(local_root)
+    remote_base = remote_root.strip("/")
+    source = local if direction == "upload" else remote
+    actions: list[FileSyncAction] = []
+    for rel in sorted(source):
+        local_path = local_base / rel
+        remote_path = posixpath.join(remote_base, rel) if remote_base else rel
+        if force:
+            reason = "forced"
+        else:
+            reason = _change_reason(
+                direction, local.get(rel), remote.get(rel), local_path, checksum=checksum
+            )
+        src, dst = (
+            (str(local_path), remote_path)
+            if direction == "upload"
+            else (remote_path, str(local_path))
+        )
+        actions.append(
+            FileSyncAction(
+                path=rel, source=src, destination=dst, size=source[rel].size, reason=reason
+            )
+        )
+    return actions
+
+
+def run_transfers(
+    actions: list[FileSyncAction],
+    transfer: Callable[[FileSyncAction], Any],
+    *,
+    concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+) -> None:
+    """Run *transfer* for every action on a bounded pool, failing fast."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if not actions:
+        return
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(actions))) as pool:
+        futures = [pool.submit(transfer, action) for action in actions]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+        for future in done:
+            exc = future.exception()
+            if exc is not None:
+                raise exc
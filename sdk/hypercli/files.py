@@ -1,15 +1,40 @@
 """Files API"""
 import os
+import json
 import time
 import asyncio
+import hashlib
 import mimetypes
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable
+
+import httpx
+
+from ._local_cache import account_scope
+from .config import CONFIG_DIR
+from .file_sync import file_sha256
+from .http import APIError
+from .upload_cache import UploadCache
 
 if TYPE_CHECKING:
     from .http import HTTPClient, AsyncHTTPClient
 
 
+UPLOAD_PART_SIZE = 16 * 1024 * 1024
+MIN_UPLOAD_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_UPLOAD_CONCURRENCY = 4
+UPLOAD_PART_RETRIES = 3
+UPLOAD_TIMEOUT_SECONDS = 300.0
+UPLOAD_STATE_DIR = CONFIG_DIR / "uploads"
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# progress(bytes_sent, total_bytes)
+UploadProgress = Callable[[int, int], None]
+
+
 @dataclass
 class File:
     """Uploaded file metadata.
@@ -58,17 +83,212 @@ class File:
         return self.state == "processing"
 
 
+@dataclass
+class UploadSession:
+    """Resume state for a chunked upload, persisted between attempts.
+
+    ``parts`` maps 1-based part numbers to the etag the backend returned for
+    them; parts already present are skipped when the upload is resumed.
+    """
+    upload_id: str
+    file_path: str
+    file_size: int
+    part_size: int
+    parts: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def part_count(self) -> int:
+        return max(1, -(-self.file_size // self.part_size))
+
+    def part_range(self, number: int) -> tuple[int, int]:
+        """Return ``(offset, length)`` of a 1-based part."""
+        offset = (number - 1) * self.part_size
+        return offset, min(self.part_size, self.file_size - offset)
+
+    @property
+    def bytes_done(self) -> int:
+        return sum(self.part_range(number)[1] for number in self.parts)
+
+    def to_dict(self) -> dict:
+        return {
+            "upload_id": self.upload_id,
+            "file_path": self.file_path,
+            "file_size": self.file_size,
+            "part_size": self.part_size,
+            "parts": {str(number): etag for number, etag in sorted(self.parts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UploadSession":
+        return cls(
+            upload_id=data["upload_id"],
+            file_path=data.get("file_path", ""),
+            file_size=int(data.get("file_size", 0)),
+            part_size=int(data.get("part_size", UPLOAD_PART_SIZE)),
+            parts={int(number): str(etag) for number, etag in (data.get("parts") or {}).items()},
+        )
+
+
+@dataclass
+class FileBatchItem:
+    """Outcome for one input of ``upload_many``/``wait_ready_many``.
+
+    ``key`` is the input path or file ID. Exactly one of ``file``/``error`` is
+    meaningful: ``error`` is set when that item failed, without aborting the
+    rest of the batch. A failed processing state keeps the last ``File`` seen.
+    """
+    key: str
+    file: File | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.file is not None
+
+
+def _record_poll(item: FileBatchItem, file: File) -> None:
+    item.file = file
+    if file.is_failed:
+        item.error = ValueError(f"File upload failed: {file.error}")
+
+
+def _is_settled(item: FileBatchItem) -> bool:
+    return item.error is not None or (item.file is not None and item.file.is_ready)
+
+
+def _copy_item(item: FileBatchItem) -> FileBatchItem:
+    # Duplicate IDs share one poll but get their own result objects.
+    return FileBatchItem(key=item.key, file=item.file, error=item.error)
+
+
+def _content_type(file_path: str) -> str:
+    content_type, _ = mimetypes.guess_type(file_path)
+    return content_type or "application/octet-stream"
+
+
+def _upload_state_path(state_dir: Path, file_path: str, part_size: int) -> Path:
+    """State file keyed by path, size, mtime and part size so edits start over."""
+    stat = os.stat(file_path)
+    key = "\0".join(
+        [os.path.abspath(file_path), str(stat.st_size), str(stat.st_mtime_ns), str(part_size)]
+    )
+    return state_dir / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.json"
+
+
+def _load_upload_session(path: Path) -> UploadSession | None:
+    try:
+        return UploadSession.from_dict(json.loads(path.read_text()))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_upload_session(path: Path, session: UploadSession) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(session.to_dict()))
+    os.replace(tmp, path)
+
+
+def _server_parts(payload: dict | None) -> dict[int, str] | None:
+    """Parse the ``parts`` list an upload session reports, if it reports one."""
+    if not isinstance(payload, dict) or not isinstance(payload.get("parts"), list):
+        return None
+    parts: dict[int, str] = {}
+    for item in payload["parts"]:
+        if isinstance(item, dict) and item.get("part_number") is not None:
+            parts[int(item["part_number"])] = str(item.get("etag") or "")
+        elif isinstance(item, int):
+            parts[item] = ""
+    return parts
+
+
+def _is_retryable_upload_error(exc: Exception) -> bool:
+    if isinstance(exc, APIError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _read_part(file_path: str, offset: int, length: int) -> bytes:
+    with open(file_path, "rb") as handle:
+        handle.seek(offset)
+        return handle.read(length)
+
+
+class _ProgressReader:
+    """File wrapper reporting bytes read so a streamed multipart body has progress."""
+
+    def __init__(self, handle: BinaryIO, total: int, progress: UploadProgress):
+        self._handle = handle
+        self._total = total
+        self._progress = progress
+        self._sent = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._handle.read(size)
+        if chunk:
+            self._sent += len(chunk)
+            self._progress(self._sent, self._total)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._sent = self._handle.seek(offset, whence)
+        return self._sent
+
+    def __getattr__(self, name: str):
+        return getattr(self._handle, name)
+
+
 class Files:
-    """Files API wrapper for uploading assets"""
+    """Files API wrapper for uploading assets
+
+    Pass an ``UploadCache`` to skip re-uploading content already uploaded by
+    this account: uploads are keyed by sha256, filename and content type, and
+    a cached file is reused only after ``get`` confirms it still exists and
+    has not failed.
+    """
 
-    def __init__(self, http: "HTTPClient"):
+    def __init__(self, http: "HTTPClient", upload_cache: UploadCache | None = None):
         self._http = http
+        self._upload_cache = upload_cache
+
+    def _with_upload_cache(
+        self,
+        digest: Callable[[], str],
+        upload: Callable[[], File],
+        *,
+        filename: str,
+        content_type: str,
+    ) -> File:
+        if self._upload_cache is None:
+            return upload()
+        # Same bytes under another name or type are a different File to the backend.
+        scope = account_scope(self._http.base_url, self._http.api_key)
+        key = f"{scope}:{digest()}:{content_type}:{filename}"
+        cached = self._upload_cache.get(key)
+        if cached is not None:
+            try:
+                file = self.get(File.from_dict(cached).id)
+            except APIError:
+                file = None
+            if file is not None and not file.is_failed:
+                return file
+            self._upload_cache.discard(key)
+        file = upload()
+        if file.id and not file.is_failed:
+            self._upload_cache.put(key, asdict(file))
+        return file
 
-    def upload(self, file_path: str) -> File:
+    def upload(self, file_path: str, *, progress: UploadProgress | None = None) -> File:
         """Upload a file for use in renders.
 
+        The file is streamed from disk as one multipart body rather than read
+        into memory. Use ``upload_resumable`` for large video/audio assets.
+        With an upload cache, content uploaded before is returned without
+        re-uploading.
+
         Args:
             file_path: Path to local file (image, audio, or video)
+            progress: Optional ``progress(bytes_sent, total_bytes)`` callback
 
         Returns:
             File object with id and internal url for use in render calls.
@@ -78,22 +298,190 @@ class Files:
             file = client.files.upload("./my_image.png")
             render = client.renders.image_to_video("dancing", file.url)
         """
-        # Read file
-        with open(file_path, "rb") as f:
-            content = f.read()
+        return self._with_upload_cache(
+            lambda: file_sha256(file_path),
+            lambda: self._upload_streamed(file_path, progress),
+            filename=os.path.basename(file_path),
+            content_type=_content_type(file_path),
+        )
 
+    def _upload_streamed(self, file_path: str, progress: UploadProgress | None) -> File:
         filename = os.path.basename(file_path)
+        total = os.path.getsize(file_path)
+        with open(file_path, "rb") as handle:
+            body = _ProgressReader(handle, total, progress) if progress else handle
+            files = {"file": (filename, body, _content_type(file_path))}
+            data = self._http.post_multipart(
+                "/api/files/multi", files=files, timeout=UPLOAD_TIMEOUT_SECONDS
+            )
+        return File.from_dict(data)
 
-        # Guess content type
-        content_type, _ = mimetypes.guess_type(file_path)
-        if not content_type:
-            content_type = "application/octet-stream"
+    def upload_resumable(
+        self,
+        file_path: str,
+        *,
+        part_size: int = UPLOAD_PART_SIZE,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        retries: int = UPLOAD_PART_RETRIES,
+        progress: UploadProgress | None = None,
+        state_dir: str | Path | None = None,
+    ) -> File:
+        """Upload a large file in parts that survive interruption.
 
-        # Upload via multipart
-        files = {"file": (filename, content, content_type)}
-        data = self._http.post_multipart("/api/files/multi", files=files)
+        The file is split into ``part_size`` chunks sent up to ``concurrency``
+        at a time, each retried on 429/5xx and transport errors. The upload
+        session is recorded under ``~/.hypercli/uploads`` after every part, so
+        calling this again for the same unmodified file skips parts the
+        backend already has. If the backend does not offer chunked upload
+        sessions, this falls back to a single streamed ``upload``. The upload
+        cache applies as it does for ``upload``.
+
+        Args:
+            file_path: Path to local file
+            part_size: Bytes per part (at least 5 MiB)
+            concurrency: Parts uploaded in parallel
+            retries: Attempts per part before giving up
+            progress: Optional ``progress(bytes_sent, total_bytes)`` callback
+            state_dir: Where resume state is kept (default ``~/.hypercli/uploads``)
+
+        Returns:
+            File object for the assembled upload.
+
+        Example:
+            file = client.files.upload_resumable(
+                "./talk.mp4", progress=lambda sent, total: print(sent, total)
+            )
+        """
+        if part_size < MIN_UPLOAD_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_UPLOAD_PART_SIZE} bytes")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if retries < 1:
+            raise ValueError("retries must be at least 1")
+        return self._with_upload_cache(
+            lambda: file_sha256(file_path),
+            lambda: self._upload_parts(
+                file_path, part_size, concurrency, retries, progress, state_dir
+            ),
+            filename=os.path.basename(file_path),
+            content_type=_content_type(file_path),
+        )
+
+    def _upload_parts(
+        self,
+        file_path: str,
+        part_size: int,
+        concurrency: int,
+        retries: int,
+        progress: UploadProgress | None,
+        state_dir: str | Path | None,
+    ) -> File:
+        total = os.path.getsize(file_path)
+        state_path = _upload_state_path(Path(state_dir or UPLOAD_STATE_DIR), file_path, part_size)
+        session = self._resume_session(state_path)
+        if session is None:
+            try:
+                session = self._start_session(file_path, total, part_size)
+            except APIError as e:
+                if e.status_code in (404, 405, 501):
+                    return self._upload_streamed(file_path, progress)
+                raise
+            _save_upload_session(state_path, session)
+
+        lock = threading.Lock()
+        sent = session.bytes_done
+        if progress:
+            progress(sent, total)
+
+        def send(number: int) -> None:
+            nonlocal sent
+            offset, length = session.part_range(number)
+            etag = self._put_part(session, number, _read_part(file_path, offset, length), retries)
+            with lock:
+                session.parts[number] = etag
+                _save_upload_session(state_path, session)
+                sent += length
+                if progress:
+                    progress(sent, total)
+
+        pending = [n for n in range(1, session.part_count + 1) if n not in session.parts]
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(pending))) as pool:
+                futures = [pool.submit(send, number) for number in pending]
+                done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                for future in done:
+                    exc = future.exception()
+                    if exc is not None:
+                        raise exc
+
+        data = self._http.post(
+            f"/api/files/uploads/{session.upload_id}/complete",
+            json={
+                "parts": [
+                    {"part_number": number, "etag": etag}
+                    for number, etag in sorted(session.parts.items())
+                ]
+            },
+        )
+        state_path.unlink(missing_ok=True)
         return File.from_dict(data)
 
+    def _start_session(self, file_path: str, total: int, part_size: int) -> UploadSession:
+        data = self._http.post(
+            "/api/files/uploads",
+            json={
+                "filename": os.path.basename(file_path),
+                "content_type": _content_type(file_path),
+                "file_size": total,
+                "part_size": part_size,
+            },
+        )
+        return UploadSession(
+            upload_id=str(data.get("upload_id") or data.get("id")),
+            file_path=os.path.abspath(file_path),
+            file_size=total,
+            part_size=int(data.get("part_size") or part_size),
+        )
+
+    def _resume_session(self, state_path: Path) -> UploadSession | None:
+        session = _load_upload_session(state_path)
+        if session is None:
+            return None
+        try:
+            payload = self._http.get(f"/api/files/uploads/{session.upload_id}")
+        except APIError as e:
+            if e.status_code in (404, 410):
+                state_path.unlink(missing_ok=True)
+                return None
+            raise
+        parts = _server_parts(payload)
+        if parts is not None:
+            # The backend is authoritative; keep local etags where it omits them.
+            session.parts = {
+                number: etag or session.parts.get(number, "") for number, etag in parts.items()
+            }
+        return session
+
+    def _put_part(self, session: UploadSession, number: int, content: bytes, retries: int) -> str:
+        attempt = 0
+        while True:
+            try:
+                # This loop owns the retries; one transport attempt per pass.
+                data = self._http.put_content(
+                    f"/api/files/uploads/{session.upload_id}/parts/{number}",
+                    content,
+                    timeout=UPLOAD_TIMEOUT_SECONDS,
+                    retries=1,
+                )
+                return str((data or {}).get("etag") or "")
+            except (APIError, httpx.TransportError) as e:
+                attempt += 1
+                if attempt >= retries or not _is_retryable_upload_error(e):
+                    raise
+                time.sleep(attempt)
+
     def upload_bytes(self, content: bytes, filename: str, content_type: str) -> File:
         """Upload file bytes directly.
 
@@ -108,9 +496,16 @@ class Files:
         Example:
             file = client.files.upload_bytes(image_bytes, "image.png", "image/png")
         """
-        files = {"file": (filename, content, content_type)}
-        data = self._http.post_multipart("/api/files/multi", files=files)
-        return File.from_dict(data)
+        def upload() -> File:
+            files = {"file": (filename, content, content_type)}
+            return File.from_dict(self._http.post_multipart("/api/files/multi", files=files))
+
+        return self._with_upload_cache(
+            lambda: hashlib.sha256(content).hexdigest(),
+            upload,
+            filename=filename,
+            content_type=content_type,
+        )
 
     def upload_url(self, url: str, path: str | None = None) -> File:
         """Upload a file from a URL (async backend processing).
@@ -230,6 +625,89 @@ class Files:
             time.sleep(poll_interval)
         raise TimeoutError(f"File {file_id} did not complete within {timeout}s")
 
+    def upload_many(
+        self,
+        file_paths: Iterable[str | Path],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[FileBatchItem]:
+        """Upload several files at once over the client's pooled connections.
+
+        Args:
+            file_paths: Local files to upload
+            concurrency: Uploads in flight at a time
+
+        Returns:
+            One ``FileBatchItem`` per path, in input order. A failed upload
+            sets that item's ``error`` instead of raising.
+
+        Example:
+            items = client.files.upload_many(paths, concurrency=16)
+            failed = [item.key for item in items if not item.ok]
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        paths = [str(path) for path in file_paths]
+        if not paths:
+            return []
+
+        def upload_one(path: str) -> FileBatchItem:
+            try:
+                return FileBatchItem(key=path, file=self.upload(path))
+            except (APIError, OSError, httpx.HTTPError) as e:
+                return FileBatchItem(key=path, error=e)
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(paths))) as pool:
+            return list(pool.map(upload_one, paths))
+
+    def wait_ready_many(
+        self,
+        file_ids: Iterable[str],
+        timeout: float = 60.0,
+        poll_interval: float = 1.0,
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[FileBatchItem]:
+        """Wait for several async uploads in one polling loop.
+
+        Each round polls every still-processing file (``concurrency`` at a
+        time), then sleeps ``poll_interval`` once, so the whole batch costs
+        one interval per round rather than one per file.
+
+        Returns:
+            One ``FileBatchItem`` per ID, in input order. Failed uploads carry
+            a ``ValueError``, lookups that errored their ``APIError`` and files
+            still processing at the deadline a ``TimeoutError``.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        items = [FileBatchItem(key=file_id) for file_id in file_ids]
+        pending = list(dict.fromkeys(item.key for item in items))
+        outcomes = {file_id: FileBatchItem(key=file_id) for file_id in pending}
+
+        def poll(file_id: str) -> None:
+            outcome = outcomes[file_id]
+            try:
+                _record_poll(outcome, self.get(file_id))
+            except (APIError, httpx.HTTPError) as e:
+                outcome.error = e
+
+        deadline = time.time() + timeout
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(pending)))) as pool:
+            while pending:
+                list(pool.map(poll, pending))
+                pending = [file_id for file_id in pending if not _is_settled(outcomes[file_id])]
+                if not pending:
+                    break
+                if time.time() >= deadline:
+                    for file_id in pending:
+                        outcomes[file_id].error = TimeoutError(
+                            f"File {file_id} did not complete within {timeout}s"
+                        )
+                    break
+                time.sleep(poll_interval)
+        return [_copy_item(outcomes[item.key]) for item in items]
+
 
 class AsyncFiles:
     """Async Files API wrapper for uploading assets in async contexts.
@@ -266,6 +744,51 @@ class AsyncFiles:
         data = await self._http.post_multipart("/api/files/multi", files=files, params=params)
         return File.from_dict(data)
 
+    async def upload(self, file_path: str, path: str | None = None) -> File:
+        """Upload a local file, streaming it from disk.
+
+        Args:
+            file_path: Path to local file (image, audio, or video)
+            path: Optional path prefix for organizing files
+
+        Returns:
+            File object with id and url for use in render calls
+        """
+        params = {"path": path} if path else None
+        with open(file_path, "rb") as handle:
+            files = {"file": (os.path.basename(file_path), handle, _content_type(file_path))}
+            data = await self._http.post_multipart(
+                "/api/files/multi", files=files, params=params, timeout=UPLOAD_TIMEOUT_SECONDS
+            )
+        return File.from_dict(data)
+
+    async def upload_many(
+        self,
+        file_paths: Iterable[str | Path],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        path: str | None = None,
+    ) -> list[FileBatchItem]:
+        """Upload several files at once, at most ``concurrency`` in flight.
+
+        Returns:
+            One ``FileBatchItem`` per path, in input order, with per-item
+            errors instead of raising.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        gate = asyncio.Semaphore(concurrency)
+
+        async def upload_one(file_path: str) -> FileBatchItem:
+            async with gate:
+                try:
+                    file = await self.upload(file_path, path=path)
+                    return FileBatchItem(key=file_path, file=file)
+                except (APIError, OSError, httpx.HTTPError) as e:
+                    return FileBatchItem(key=file_path, error=e)
+
+        return list(await asyncio.gather(*(upload_one(str(p)) for p in file_paths)))
+
     async def upload_url(self, url: str, path: str | None = None) -> File:
         """Upload a file from a URL (async backend processing).
 
@@ -384,3 +907,46 @@ class AsyncFiles:
                 raise ValueError(f"File upload failed: {file.error}")
             await asyncio.sleep(poll_interval)
         raise TimeoutError(f"File {file_id} did not complete within {timeout}s")
+
+    async def wait_ready_many(
+        self,
+        file_ids: Iterable[str],
+        timeout: float = 60.0,
+        poll_interval: float = 1.0,
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[FileBatchItem]:
+        """Wait for several async uploads in one polling loop.
+
+        Same contract as ``Files.wait_ready_many``.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        items = [FileBatchItem(key=file_id) for file_id in file_ids]
+        pending = list(dict.fromkeys(item.key for item in items))
+        outcomes = {file_id: FileBatchItem(key=file_id) for file_id in pending}
+        gate = asyncio.Semaphore(concurrency)
+
+        async def poll(file_id: str) -> None:
+            outcome = outcomes[file_id]
+            async with gate:
+                try:
+                    _record_poll(outcome, await self.get(file_id))
+                except (APIError, httpx.HTTPError) as e:
+                    outcome.error = e
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while pending:
+            await asyncio.gather(*(poll(file_id) for file_id in pending))
+            pending = [file_id for file_id in pending if not _is_settled(outcomes[file_id])]
+            if not pending:
+                break
+            if loop.time() >= deadline:
+                for file_id in pending:
+                    outcomes[file_id].error = TimeoutError(
+                        f"File {file_id} did not complete within {timeout}s"
+                    )
+                break
+            await asyncio.sleep(poll_interval)
+        return [_copy_item(outcomes[item.key]) for item in items]
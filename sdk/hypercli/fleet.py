@@ -0,0 +1,242 @@
+"""Live in-memory mirror of an account's agents, kept current by deployment events."""
+from __future__ import annotations
+
+import asyncio
+import copy
+from dataclasses import dataclass
+import time
+from typing import Any, Callable, Literal, Optional
+
+from .agents import (
+    DEPLOYMENT_RESYNC_EVENT,
+    Agent,
+    AsyncDeployments,
+    DeploymentEvent,
+    Deployments,
+)
+from .http import APIError
+
+
+DEFAULT_FLEET_RESYNC_INTERVAL = 300.0
+
+
+@dataclass(frozen=True)
+class FleetChange:
+    """One change applied to a :class:`FleetMirror`."""
+
+    kind: Literal["added", "modified", "deleted"]
+    agent: Agent
+    previous: Optional[Agent] = None
+
+
+class FleetMirror:
+    """In-memory copy of every agent, updated from deployment events.
+
+    Usage:
+        async with FleetMirror(client.deployments) as fleet:
+            fleet.add_listener(lambda change: print(change.kind, change.agent.id))
+            running = fleet.list(state="RUNNING")
+
+    ``start`` lists the fleet once and then follows the shared
+    ``DeploymentEventBus``: a transition replaces the agent's state on a
+    shallow copy of the cached ``Agent``, so nothing is re-parsed. An event
+    for an agent the mirror has not seen, or one without a state, fetches
+    just that agent. ``get``, ``list`` and ``filter`` read the map and never
+    touch the network. A full ``resync`` runs every ``resync_interval``
+    seconds and after the event socket reconnects, to heal missed events;
+    events that arrive while it lists are applied on top of its result.
+
+    Listeners run on the event loop for every change and should be quick.
+    Works with both ``Deployments`` (REST calls run in a worker thread) and
+    ``AsyncDeployments``.
+    """
+
+    def __init__(
+        self,
+        deployments: Deployments | AsyncDeployments,
+        *,
+        resync_interval: float = DEFAULT_FLEET_RESYNC_INTERVAL,
+        include_deleted: bool = False,
+    ):
+        self._deployments = deployments
+        self.resync_interval = resync_interval
+        self.include_deleted = include_deleted
+        self.synced_at: float | None = None
+        self._agents: dict[str, Agent] = {}
+        self._listeners: list[Callable[[FleetChange], Any]] = []
+        self._buffer: list[DeploymentEvent] | None = None
+        self._fetching: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._resync_lock: asyncio.Lock | None = None
+        self._remove_handler: Callable[[], None] | None = None
+
+    async def start(self) -> "FleetMirror":
+        """Subscribe to deployment events and load the fleet."""
+        if self._remove_handler is not None:
+            return self
+        self._resync_lock = asyncio.Lock()
+        self._remove_handler = self._deployments.event_bus().add_handler(self._on_event)
+        try:
+            await self.resync()
+        except BaseException:
+            await self.aclose()
+            raise
+        self._spawn(self._resync_loop())
+        return self
+
+    async def aclose(self) -> None:
+        """Stop following events; the cached agents stay readable."""
+        remove, self._remove_handler = self._remove_handler, None
+        if remove is not None:
+            remove()
+        tasks, self._tasks = self._tasks, set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> "FleetMirror":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def get(self, agent_id_or_name: str) -> Agent | None:
+        """The cached agent with this ID, name, handle or hostname."""
+        agent = self._agents.get(agent_id_or_name)
+        if agent is not None:
+            return agent
+        for agent in self._agents.values():
+            if agent_id_or_name in (agent.name, agent.handle, agent.hostname):
+                return agent
+        return None
+
+    def list(self, *, state: str | None = None) -> list[Agent]:
+        """Cached agents, optionally only those in *state*, in listing order."""
+        if state is None:
+            return list(self._agents.values())
+        wanted = state.upper()
+        return [agent for agent in self._agents.values() if str(agent.state).upper() == wanted]
+
+    def filter(self, predicate: Callable[[Agent], bool]) -> list[Agent]:
+        return [agent for agent in self._agents.values() if predicate(agent)]
+
+    def add_listener(self, listener: Callable[[FleetChange], Any]) -> Callable[[], None]:
+        """Call *listener* with each :class:`FleetChange`; returns a remover."""
+        self._listeners.append(listener)
+
+        def remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove
+
+    async def resync(self) -> None:
+        """Replace the mirror with a fresh listing and report what changed."""
+        async with self._resync_lock:
+            self._buffer = []
+            try:
+                agents = await self._call(
+                    self._deployments.list, include_deleted=self.include_deleted or None
+                )
+            finally:
+                buffered, self._buffer = self._buffer, None
+            previous, self._agents = self._agents, {agent.id: agent for agent in agents}
+            self.synced_at = time.time()
+            for agent_id, agent in self._agents.items():
+                old = previous.get(agent_id)
+                if old is None:
+                    self._notify(FleetChange("added", agent))
+                elif old != agent:
+                    self._notify(FleetChange("modified", agent, old))
+            for agent_id, old in previous.items():
+                if agent_id not in self._agents:
+                    self._notify(FleetChange("deleted", old, old))
+            for event in buffered:
+                self._apply(event)
+
+    async def _call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if isinstance(self._deployments, AsyncDeployments):
+            return await method(*args, **kwargs)
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.resync_interval)
+            try:
+                await self.resync()
+            except Exception:
+                pass  # keep serving the cache; the next interval retries
+
+    async def _safe_resync(self) -> None:
+        try:
+            await self.resync()
+        except Exception:
+            pass
+
+    def _notify(self, change: FleetChange) -> None:
+        for listener in list(self._listeners):
+            listener(change)
+
+    def _on_event(self, event: DeploymentEvent) -> None:
+        if event.type == DEPLOYMENT_RESYNC_EVENT:
+            if self._buffer is None:
+                self._spawn(self._safe_resync())
+            return
+        if self._buffer is not None:
+            self._buffer.append(event)
+            return
+        self._apply(event)
+
+    def _apply(self, event: DeploymentEvent) -> None:
+        if event.type != "deployment.transition" or not event.agent_id:
+            return
+        state = event.state
+        deleted = str(state or "").upper() == "DELETED"
+        current = self._agents.get(event.agent_id)
+        if current is None or not state:
+            if not deleted and event.agent_id not in self._fetching:
+                self._fetching.add(event.agent_id)
+                self._spawn(self._fetch(event.agent_id))
+            return
+        if deleted and not self.include_deleted:
+            del self._agents[event.agent_id]
+            self._notify(FleetChange("deleted", current, current))
+        elif current.state != state:
+            updated = copy.copy(current)
+            updated.state = state
+            self._agents[event.agent_id] = updated
+            self._notify(FleetChange("modified", updated, current))
+
+    async def _fetch(self, agent_id: str) -> None:
+        try:
+            agent = await self._call(self._deployments.get, agent_id)
+        except APIError as exc:
+            if exc.status_code == 404:
+                self._drop(agent_id)
+            return
+        except Exception:
+            return  # the next resync heals it
+        finally:
+            self._fetching.discard(agent_id)
+        if str(agent.state or "").upper() == "DELETED" and not self.include_deleted:
+            self._drop(agent_id)
+            return
+        previous = self._agents.get(agent_id)
+        self._agents[agent_id] = agent
+        if previous is None:
+            self._notify(FleetChange("added", agent))
+        elif previous != agent:
+            self._notify(FleetChange("modified", agent, previous))
+
+    def _drop(self, agent_id: str) -> None:
+        previous = self._agents.pop(agent_id, None)
+        if previous is not None:
+            self._notify(FleetChange("deleted", previous, previous))
@@ -1,12 +1,136 @@
 """HTTP client utilities"""
+import threading
 import time
 import httpx
 import logging
 from typing import Any, Optional, Iterator, Callable
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by every namespace hanging off one HyperCLI client.
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+def _require_http2() -> None:
+    try:
+        import h2  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "HTTP/2 support requires the h2 package. Install with: pip install 'httpx[http2]'"
+        ) from exc
+
+
+def build_session(
+    timeout: float | None = 30.0,
+    *,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+) -> httpx.Client:
+    """Build a long-lived, keep-alive ``httpx.Client`` for SDK requests."""
+    if http2:
+        _require_http2()
+    return httpx.Client(
+        timeout=timeout,
+        limits=limits or DEFAULT_POOL_LIMITS,
+        http2=http2,
+    )
+
+
+def build_async_session(
+    timeout: float | None = 30.0,
+    *,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+) -> httpx.AsyncClient:
+    """Build a long-lived, keep-alive ``httpx.AsyncClient`` for SDK requests."""
+    if http2:
+        _require_http2()
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=limits or DEFAULT_POOL_LIMITS,
+        http2=http2,
+    )
+
+
+def _origin(url: str) -> str:
+    parsed = urlsplit(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+class ClientPool:
+    """Keep-alive ``httpx.Client`` per origin, built lazily and shared across threads.
+
+    Helpers that talk to several hosts (an API base plus per-agent hosts) look
+    up the client for each URL so connections to the same host are reused.
+    Per-request timeouts should be passed on each call.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = 30.0,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ):
+        self._timeout = timeout
+        self._limits = limits
+        self._http2 = http2
+        self._clients: dict[str, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def client(self, url: str) -> httpx.Client:
+        origin = _origin(url)
+        with self._lock:
+            client = self._clients.get(origin)
+            if client is None:
+                client = build_session(self._timeout, limits=self._limits, http2=self._http2)
+                self._clients[origin] = client
+            return client
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+class AsyncClientPool:
+    """Keep-alive ``httpx.AsyncClient`` per origin for one event loop."""
+
+    def __init__(
+        self,
+        timeout: float | None = 30.0,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ):
+        self._timeout = timeout
+        self._limits = limits
+        self._http2 = http2
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def client(self, url: str) -> httpx.AsyncClient:
+        origin = _origin(url)
+        client = self._clients.get(origin)
+        if client is None:
+            client = build_async_session(self._timeout, limits=self._limits, http2=self._http2)
+            self._clients[origin] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
 
 def request_with_retry(
     method: str,
@@ -15,6 +139,7 @@ def request_with_retry(
     retries: int = 3,
     backoff: float = 1.0,
     timeout: float = 30.0,
+    client: httpx.Client | None = None,
     **kwargs,
 ) -> httpx.Response:
     """Make an HTTP request with retry logic for transient errors.
@@ -26,6 +151,8 @@ def request_with_retry(
         retries: Number of retry attempts
         backoff: Backoff multiplier between retries
         timeout: Request timeout in seconds
+        client: Pooled client to send through. When omitted a one-shot
+            client is opened and closed for the request.
         **kwargs: Additional args passed to httpx (json, params, etc.)
 
     Returns:
@@ -37,8 +164,10 @@ def request_with_retry(
     last_error = None
     for attempt in range(retries):
         try:
-            with httpx.Client(timeout=timeout) as client:
-                resp = getattr(client, method)(url, headers=headers, **kwargs)
+            if client is not None:
+                return getattr(client, method)(url, headers=headers, timeout=timeout, **kwargs)
+            with httpx.Client(timeout=timeout) as one_shot:
+                resp = getattr(one_shot, method)(url, headers=headers, **kwargs)
                 return resp
         except (httpx.ProxyError, httpx.ConnectError, httpx.ReadTimeout) as e:
             last_error = e
@@ -57,6 +186,7 @@ class APIError(Exception):
     method: str | None = None
     url: str | None = None
     response_text: str | None = None
+    retry_after: float | None = None
 
     def __str__(self):
         context = []
@@ -74,6 +204,22 @@ def _truncate_for_log(value: str, limit: int = 1000) -> str:
     return value[:limit] + "...<truncated>"
 
 
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds the server asked us to wait (``Retry-After``), if it said."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
 def _handle_response(response: httpx.Response) -> Any:
     """Handle API response, raise on error"""
     if response.status_code >= 400:
@@ -98,6 +244,7 @@ def _handle_response(response: httpx.Response) -> Any:
             method=method,
             url=url,
             response_text=body,
+            retry_after=_retry_after(response),
         )
     if response.status_code == 204:
         return None
@@ -134,17 +281,38 @@ def _handle_bytes_response(response: httpx.Response, *, log_errors: bool = True)
 
 
 class HTTPClient:
-    """Sync HTTP client"""
+    """Sync HTTP client.
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 30.0):
+    Every verb goes through one keep-alive ``httpx.Client`` so repeated calls
+    reuse pooled connections instead of paying a TCP+TLS handshake each time.
+    Pass ``session`` to share one pool between clients with different base URLs.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        session: httpx.Client | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
-        # Some higher-level SDK surfaces still expect a requests/httpx-style session.
-        self._session = httpx.Client(timeout=timeout)
+        self._owns_session = session is None
+        self._session = session or build_session(timeout, limits=limits, http2=http2)
 
     def close(self) -> None:
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     @property
     def headers(self) -> dict:
@@ -156,79 +324,133 @@ class HTTPClient:
     def get(self, path: str, params: dict = None) -> Any:
         resp = request_with_retry(
             "get", f"{self.base_url}{path}",
-            headers=self.headers, timeout=self.timeout, params=params
+            headers=self.headers, timeout=self.timeout, client=self._session, params=params
         )
         return _handle_response(resp)
 
-    def post(self, path: str, json: dict = None) -> Any:
+    def post(self, path: str, json: dict = None, headers: dict | None = None) -> Any:
         resp = request_with_retry(
             "post", f"{self.base_url}{path}",
-            headers=self.headers, timeout=self.timeout, json=json
+            headers={**self.headers, **(headers or {})},
+            timeout=self.timeout, client=self._session, json=json
         )
         return _handle_response(resp)
 
     def post_bytes(self, path: str, json: dict = None, timeout: float | None = None) -> bytes:
         resp = request_with_retry(
             "post", f"{self.base_url}{path}",
-            headers=self.headers, timeout=timeout if timeout is not None else self.timeout, json=json
+            headers=self.headers,
+            timeout=timeout if timeout is not None else self.timeout,
+            client=self._session,
+            json=json,
         )
         return _handle_bytes_response(resp)
 
     def patch(self, path: str, json: dict = None) -> Any:
         resp = request_with_retry(
             "patch", f"{self.base_url}{path}",
-            headers=self.headers, timeout=self.timeout, json=json
+            headers=self.headers, timeout=self.timeout, client=self._session, json=json
+        )
+        return _handle_response(resp)
+
+    def put_content(
+        self,
+        path: str,
+        content: bytes,
+        content_type: str = "application/octet-stream",
+        timeout: float | None = None,
+        retries: int = 3,
+    ) -> Any:
+        """PUT a raw request body (e.g. one part of a chunked upload).
+
+        Pass ``retries=1`` when the caller runs its own retry loop.
+        """
+        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": content_type}
+        resp = request_with_retry(
+            "put", f"{self.base_url}{path}",
+            headers=headers,
+            retries=retries,
+            timeout=timeout if timeout is not None else self.timeout,
+            client=self._session,
+            content=content,
         )
         return _handle_response(resp)
 
     def delete(self, path: str) -> Any:
         resp = request_with_retry(
             "delete", f"{self.base_url}{path}",
-            headers=self.headers, timeout=self.timeout
+            headers=self.headers, timeout=self.timeout, client=self._session
         )
         return _handle_response(resp)
 
     def stream_post(self, path: str, json: dict) -> Iterator[str]:
         """Streaming POST for SSE responses"""
-        with httpx.Client(timeout=None) as client:
-            with client.stream(
-                "POST",
-                f"{self.base_url}{path}",
-                headers=self.headers,
-                json=json,
-            ) as response:
-                if response.status_code >= 400:
-                    raise APIError(response.status_code, response.read().decode())
-                for line in response.iter_lines():
-                    yield line
-
-    def post_multipart(self, path: str, files: dict) -> Any:
+        with self._session.stream(
+            "POST",
+            f"{self.base_url}{path}",
+            headers=self.headers,
+            json=json,
+            timeout=None,
+        ) as response:
+            if response.status_code >= 400:
+                raise APIError(response.status_code, response.read().decode())
+            for line in response.iter_lines():
+                yield line
+
+    def post_multipart(self, path: str, files: dict, timeout: float | None = None) -> Any:
         """POST with multipart form data for file uploads.
 
         Args:
             path: API path
             files: Dict of {field_name: file_tuple} where file_tuple is
-                   (filename, file_bytes, content_type) or just file_bytes
+                   (filename, file_bytes_or_fileobj, content_type) or just
+                   file bytes. File objects are streamed, not read up front.
+            timeout: Per-request timeout; defaults to the client timeout
         """
         # Build headers without Content-Type (httpx sets it for multipart)
         headers = {"Authorization": f"Bearer {self.api_key}"}
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                f"{self.base_url}{path}",
-                headers=headers,
-                files=files,
-            )
-            return _handle_response(response)
+        response = self._session.post(
+            f"{self.base_url}{path}",
+            headers=headers,
+            files=files,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        return _handle_response(response)
 
 
 class AsyncHTTPClient:
-    """Async HTTP client for use in async contexts (e.g., Telegram bot, web servers)"""
+    """Async HTTP client for use in async contexts (e.g., Telegram bot, web servers)
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 30.0):
+    Requests share one keep-alive ``httpx.AsyncClient``; close it with
+    ``aclose()`` or use the client as an async context manager.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        session: httpx.AsyncClient | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self._owns_session = session is None
+        self._session = session or build_async_session(timeout, limits=limits, http2=http2)
+
+    async def aclose(self) -> None:
+        if self._owns_session:
+            await self._session.aclose()
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     @property
     def headers(self) -> dict:
@@ -238,56 +460,64 @@ class AsyncHTTPClient:
         }
 
     async def get(self, path: str, params: dict = None) -> Any:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}{path}",
-                headers=self.headers,
-                params=params,
-            )
-            return _handle_response(response)
-
-    async def post(self, path: str, json: dict = None) -> Any:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}{path}",
-                headers=self.headers,
-                json=json,
-            )
-            return _handle_response(response)
+        response = await self._session.get(
+            f"{self.base_url}{path}",
+            headers=self.headers,
+            params=params,
+            timeout=self.timeout,
+        )
+        return _handle_response(response)
+
+    async def post(self, path: str, json: dict = None, headers: dict | None = None) -> Any:
+        response = await self._session.post(
+            f"{self.base_url}{path}",
+            headers={**self.headers, **(headers or {})},
+            json=json,
+            timeout=self.timeout,
+        )
+        return _handle_response(response)
 
     async def patch(self, path: str, json: dict = None) -> Any:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.patch(
-                f"{self.base_url}{path}",
-                headers=self.headers,
-                json=json,
-            )
-            return _handle_response(response)
+        response = await self._session.patch(
+            f"{self.base_url}{path}",
+            headers=self.headers,
+            json=json,
+            timeout=self.timeout,
+        )
+        return _handle_response(response)
 
     async def delete(self, path: str) -> Any:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.delete(
-                f"{self.base_url}{path}",
-                headers=self.headers,
-            )
-            return _handle_response(response)
-
-    async def post_multipart(self, path: str, files: dict, params: dict = None) -> Any:
+        response = await self._session.delete(
+            f"{self.base_url}{path}",
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        return _handle_response(response)
+
+    async def post_multipart(
+        self,
+        path: str,
+        files: dict,
+        params: dict = None,
+        timeout: float | None = None,
+    ) -> Any:
         """POST with multipart form data for file uploads.
 
         Args:
             path: API path
             files: Dict of {field_name: file_tuple} where file_tuple is
-                   (filename, file_bytes, content_type) or just file_bytes
+                   (filename, file_bytes_or_fileobj, content_type) or just
+                   file bytes. File objects are streamed, not read up front.
             params: Optional query parameters
+            timeout: Per-request timeout; defaults to the client timeout
         """
         headers = {"Authorization": f"Bearer {self.api_key}"}
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}{path}",
-                headers=headers,
-                files=files,
-                params=params,
-            )
-            return _handle_response(response)
+        response = await self._session.post(
+            f"{self.base_url}{path}",
+            headers=headers,
+            files=files,
+            params=params,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        return _handle_response(response)
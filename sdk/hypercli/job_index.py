@@ -0,0 +1,190 @@
+"""Persistent local index of jobs for fast ID-prefix, hostname and IP resolution."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from ._local_cache import _PrefixTrie, account_scope
+from .config import CONFIG_DIR
+from .jobs import JOB_PAGE_SIZE, TERMINAL_JOB_STATES, _parse_timestamp
+
+if TYPE_CHECKING:
+    from .jobs import Job, Jobs
+
+
+JOB_INDEX_DIR = CONFIG_DIR / "job-index"
+DEFAULT_IP_TTL_SECONDS = 3600.0
+DEFAULT_DNS_CONCURRENCY = 16
+
+
+class JobIndex:
+    """Local index of job ID, hostname and resolved IP, persisted as JSON.
+
+    ``refresh`` walks the job list newest first and stops once a full page of
+    already-indexed, unchanged jobs has gone by and the walk is past every job
+    the index still holds as live, so routine refreshes cost one or two list
+    requests. Matches name job IDs only; fetch the ``Job`` itself with
+    ``Jobs.get`` for current state.
+    """
+
+    def __init__(self, path: str | Path, *, ip_ttl: float = DEFAULT_IP_TTL_SECONDS):
+        self.path = Path(path)
+        self.ip_ttl = ip_ttl
+        self.synced_at: float | None = None
+        self._jobs: dict[str, dict] = {}
+        self._ips: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def for_jobs(cls, jobs: "Jobs", **kwargs) -> "JobIndex":
+        """Open the index for the account and API behind *jobs*."""
+        http = jobs._http
+        return cls(JOB_INDEX_DIR / f"{account_scope(http.base_url, http.api_key)}.json", **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        self._jobs = dict(data.get("jobs") or {})
+        self._ips = dict(data.get("ips") or {})
+        self.synced_at = data.get("synced_at")
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._id_trie = _PrefixTrie((job_id, job_id) for job_id in self._jobs)
+        self._host_trie = _PrefixTrie(
+            (entry["hostname"], job_id)
+            for job_id, entry in self._jobs.items()
+            if entry.get("hostname")
+        )
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        payload = {"jobs": self._jobs, "ips": self._ips, "synced_at": self.synced_at}
+        tmp.write_text(json.dumps(payload))
+        os.replace(tmp, self.path)
+
+    def add(self, job: "Job") -> bool:
+        """Index *job*; return True when it was new or its state/hostname changed."""
+        created = _parse_timestamp(job.created_at)
+        entry = {
+            "hostname": job.hostname,
+            "state": job.state,
+            "created_at": created.timestamp() if created else None,
+        }
+        if self._jobs.get(job.job_id) == entry:
+            return False
+        self._jobs[job.job_id] = entry
+        return True
+
+    def refresh(self, jobs: "Jobs", *, full: bool = False) -> int:
+        """Pull new and changed jobs into the index and save it.
+
+        Args:
+            jobs: Jobs API instance
+            full: Walk every page instead of stopping at the already-synced tail
+
+        Returns:
+            Number of jobs added or updated.
+        """
+        # Jobs that were still live can gain a hostname or finish, so the
+        # walk always reaches the oldest of them before it may stop early.
+        live = [
+            entry.get("created_at") or 0
+            for entry in self._jobs.values()
+            if (entry.get("state") or "").lower() not in TERMINAL_JOB_STATES
+        ]
+        oldest_live = min(live, default=None)
+        changed = 0
+        unchanged_run = 0
+        for job in jobs.iter_all(page_size=JOB_PAGE_SIZE):
+            if self.add(job):
+                changed += 1
+                unchanged_run = 0
+            else:
+                unchanged_run += 1
+            if full or unchanged_run < JOB_PAGE_SIZE:
+                continue
+            created = self._jobs[job.job_id].get("created_at")
+            if oldest_live is None or (created is not None and created < oldest_live):
+                break
+        self.synced_at = time.time()
+        if changed:
+            self._rebuild()
+        self.save()
+        return changed
+
+    def _newest_first(self, job_ids: Iterable[str]) -> list[str]:
+        return sorted(
+            job_ids,
+            key=lambda job_id: (self._jobs[job_id].get("created_at") or 0, job_id),
+            reverse=True,
+        )
+
+    def match_id(self, prefix: str) -> list[str]:
+        """Job IDs starting with *prefix*, newest first."""
+        return self._newest_first(self._id_trie.search(prefix))
+
+    def match_hostname(self, hostname: str) -> list[str]:
+        """Job IDs whose hostname equals (preferred) or starts with *hostname*, newest first."""
+        found = self._host_trie.search(hostname)
+        exact = [job_id for job_id in found if self._jobs[job_id].get("hostname") == hostname]
+        return self._newest_first(exact or found)
+
+    def match_ip(
+        self,
+        ip: str,
+        *,
+        resolver: Callable[[str], str] = socket.gethostbyname,
+        concurrency: int = DEFAULT_DNS_CONCURRENCY,
+    ) -> list[str]:
+        """Job IDs of live jobs whose hostname resolves to *ip*, newest first.
+
+        Hostnames of jobs not in a terminal state are resolved concurrently
+        when their cached address is older than ``ip_ttl``; failed lookups are
+        cached too, so unresolvable hosts are not retried on every call.
+        """
+        live = {
+            entry["hostname"]: job_id
+            for job_id, entry in self._jobs.items()
+            if entry.get("hostname")
+            and (entry.get("state") or "").lower() not in TERMINAL_JOB_STATES
+        }
+        now = time.time()
+        stale = [
+            hostname
+            for hostname in live
+            if now - float((self._ips.get(hostname) or {}).get("resolved_at", 0)) > self.ip_ttl
+        ]
+
+        def lookup(hostname: str) -> None:
+            try:
+                address = resolver(hostname)
+            except OSError:
+                address = None
+            with self._lock:
+                self._ips[hostname] = {"ip": address, "resolved_at": time.time()}
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(stale)))) as pool:
+                list(pool.map(lookup, stale))
+            self.save()
+        return self._newest_first(
+            job_id
+            for hostname, job_id in live.items()
+            if (self._ips.get(hostname) or {}).get("ip") == ip
+        )
@@ -1,16 +1,42 @@
 from __future__ import annotations
 
 """Jobs API"""
+import asyncio
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Iterator
+import hashlib
+import inspect
+import ipaddress
+import json
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator
+
+import httpx
+
+from .exec_batch import (
+    DEFAULT_EXEC_CONCURRENCY,
+    ExecBatchItem,
+    fan_out,
+    target_deadline,
+    validate_exec_request,
+)
+from .http import APIError
+from .rate_limit import TokenBucket
 
 if TYPE_CHECKING:
-    from .http import HTTPClient
+    from .http import HTTPClient, AsyncHTTPClient
+    from .job_index import JobIndex
 
 
 TERMINAL_JOB_STATES = {"succeeded", "failed", "terminated", "canceled", "cancelled"}
+JOB_PAGE_SIZE = 100  # backend maximum for /api/jobs
+DEFAULT_CREATE_CONCURRENCY = 8
+JOB_CREATE_MAX_RETRIES = 5
+JOB_CREATE_MAX_BACKOFF_SECONDS = 30.0
+_RETRYABLE_CREATE_STATUSES = {429, 503}
 
 
 def normalize_job_tags(tags: dict[str, str] | list[str] | None) -> dict[str, str]:
@@ -239,6 +265,111 @@ class ExecResult:
         )
 
 
+@dataclass
+class LogChunk:
+    """A window of a job's log, addressed by line offset.
+
+    ``offset`` is the index of ``lines[0]`` within the job's full log and
+    ``next_offset`` is where the following fetch should start.
+    """
+    lines: list[str]
+    offset: int
+    next_offset: int
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+def _log_params(since_offset: int | None, tail: int | None) -> dict | None:
+    if since_offset is not None and since_offset < 0:
+        raise ValueError("since_offset must be non-negative")
+    if tail is not None and tail < 0:
+        raise ValueError("tail must be non-negative")
+    params = {"since_offset": since_offset, "tail": tail}
+    return {key: value for key, value in params.items() if value is not None} or None
+
+
+def _log_chunk(data: dict, since_offset: int | None, tail: int | None) -> LogChunk:
+    """Window a ``/logs`` response to ``since_offset``/``tail``.
+
+    A server that honours the window reports ``next_offset`` and sends only
+    the requested lines; otherwise the full log came back and is sliced here.
+    """
+    lines = (data.get("logs") or "").splitlines()
+    if data.get("next_offset") is not None:
+        next_offset = int(data["next_offset"])
+        return LogChunk(lines, max(0, next_offset - len(lines)), next_offset)
+    start = min(since_offset or 0, len(lines))
+    if tail is not None:
+        start = max(start, len(lines) - tail)
+    return LogChunk(lines[start:], start, len(lines))
+
+
+@dataclass
+class JobBatchItem:
+    """Outcome for one spec of ``Jobs.create_many``.
+
+    ``key`` is the spec's idempotency key. ``resumed`` marks a spec skipped
+    because the launch ledger already recorded its job; then only ``job_id``
+    is set. A failed spec carries ``error`` without aborting the batch.
+    """
+    key: str
+    spec: dict[str, Any]
+    job: Job | None = None
+    job_id: str | None = None
+    error: Exception | None = None
+    resumed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.job_id is not None
+
+
+def job_spec_keys(specs: Iterable[dict[str, Any]]) -> list[str]:
+    """Stable idempotency keys for *specs*.
+
+    An explicit ``idempotency_key`` wins. Otherwise the key hashes the spec's
+    canonical JSON plus how many identical specs came before it, so rerunning
+    the same sweep file reproduces the same keys while repeated specs still
+    launch separately.
+    """
+    keys: list[str] = []
+    seen: dict[str, int] = {}
+    for spec in specs:
+        explicit = spec.get("idempotency_key")
+        if explicit:
+            keys.append(str(explicit))
+            continue
+        canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"), default=str)
+        digest = hashlib.sha256(canonical.encode()).hexdigest()[:32]
+        occurrence = seen.get(digest, 0)
+        seen[digest] = occurrence + 1
+        keys.append(f"{digest}-{occurrence}")
+    return keys
+
+
+def _read_launch_ledger(path: Path) -> dict[str, str]:
+    """Map idempotency key to job ID from a JSON-lines launch ledger."""
+    launched: dict[str, str] = {}
+    try:
+        text = path.read_text()
+    except FileNotFoundError:
+        return launched
+    if text and not text.endswith("\n"):
+        with path.open("a") as f:
+            f.write("\n")  # terminate a torn line so new records start clean
+    lines = text.splitlines()
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue  # torn final line from a crashed writer
+        if isinstance(entry, dict) and entry.get("idempotency_key") and entry.get("job_id"):
+            launched[str(entry["idempotency_key"])] = str(entry["job_id"])
+    return launched
+
+
 @dataclass
 class JobListPage:
     jobs: list[Job] = field(default_factory=list)
@@ -257,6 +388,30 @@ class JobListPage:
         )
 
 
+def _job_list_page(data: dict | list, page: int | None, page_size: int | None) -> JobListPage:
+    if isinstance(data, dict):
+        return JobListPage.from_dict(data)
+    jobs = [Job.from_dict(j) for j in data]
+    return JobListPage(jobs=jobs, total_count=len(jobs), page=page or 1, page_size=page_size or len(jobs) or 50)
+
+
+def _has_more_pages(page: JobListPage, fetched: int) -> bool:
+    """Whether another page can follow *page* after *fetched* jobs so far."""
+    if not page.jobs:
+        return False
+    if fetched >= page.total_count:
+        return False
+    return len(page.jobs) >= page.page_size
+
+
+def _unseen(jobs: list[Job], seen: set[str]) -> Iterator[Job]:
+    # New jobs shift older ones onto later pages mid-walk; skip the repeats.
+    for job in jobs:
+        if job.job_id not in seen:
+            seen.add(job.job_id)
+            yield job
+
+
 class Jobs:
     """Jobs API wrapper"""
 
@@ -271,8 +426,8 @@ class Jobs:
             return [f"{key}={value}" for key, value in tags.items()]
         return list(tags)
 
+    @staticmethod
     def _list_params(
-        self,
         *,
         state: str | None = None,
         tags: dict[str, str] | list[str] | None = None,
@@ -282,7 +437,7 @@ class Jobs:
         params = {}
         if state:
             params["state"] = state
-        normalized_tags = self._normalize_tags(tags)
+        normalized_tags = Jobs._normalize_tags(tags)
         if normalized_tags:
             params["tag"] = normalized_tags
         if page is not None:
@@ -305,10 +460,48 @@ class Jobs:
             "/api/jobs",
             params=self._list_params(state=state, tags=tags, page=page, page_size=page_size),
         )
-        if isinstance(data, dict):
-            return JobListPage.from_dict(data)
-        jobs = [Job.from_dict(j) for j in data]
-        return JobListPage(jobs=jobs, total_count=len(jobs), page=page or 1, page_size=page_size or len(jobs) or 50)
+        return _job_list_page(data, page, page_size)
+
+    def iter_all(
+        self,
+        state: str = None,
+        tags: dict[str, str] | list[str] | None = None,
+        *,
+        page_size: int = JOB_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[Job]:
+        """Iterate every matching job across all pages, newest first.
+
+        While the caller consumes one page, the next is fetched on a background
+        thread, so a full walk costs roughly one request latency per page
+        rather than request latency plus processing time. Jobs that shift
+        between pages during the walk are yielded once.
+
+        Example:
+            for job in client.jobs.iter_all(state="failed", tags={"team": "ml"}):
+                audit(job)
+        """
+        def fetch(number: int) -> JobListPage:
+            return self.list_page(state=state, tags=tags, page=number, page_size=page_size)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            number = 1
+            page = fetch(number)
+            fetched = 0
+            seen: set[str] = set()
+            while True:
+                fetched += len(page.jobs)
+                more = _has_more_pages(page, fetched)
+                upcoming = executor.submit(fetch, number + 1) if more and executor else None
+                yield from _unseen(page.jobs, seen)
+                if not more:
+                    return
+                number += 1
+                page = upcoming.result() if upcoming else fetch(number)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
 
     def list(
         self,
@@ -342,6 +535,7 @@ class Jobs:
         tags: dict[str, str] | list[str] = None,
         dockerfile: str = None,
         dry_run: bool = False,
+        idempotency_key: str | None = None,
     ) -> Job:
         """Create a new job.
 
@@ -360,6 +554,8 @@ class Jobs:
             registry_auth: Private registry credentials {"username": "...", "password": "..."}
             dockerfile: Base64-encoded Dockerfile (overrides docker_image if provided)
             dry_run: If True, validate everything but don't create job or reserve funds
+            idempotency_key: Sent as ``Idempotency-Key`` so a retried submit
+                does not launch a second job
         """
         payload = {
             "docker_image": image,
@@ -390,9 +586,110 @@ class Jobs:
         if dry_run:
             payload["dry_run"] = dry_run
 
-        data = self._http.post("/api/jobs", json=payload)
+        if idempotency_key:
+            data = self._http.post(
+                "/api/jobs", json=payload, headers={"Idempotency-Key": idempotency_key}
+            )
+        else:
+            data = self._http.post("/api/jobs", json=payload)
         return Job.from_dict(data)
 
+    def _create_with_backoff(
+        self,
+        spec: dict[str, Any],
+        key: str,
+        bucket: TokenBucket,
+        max_retries: int,
+    ) -> Job:
+        kwargs = {name: value for name, value in spec.items() if name != "idempotency_key"}
+        attempt = 0
+        while True:
+            bucket.acquire()
+            try:
+                return self.create(**kwargs, idempotency_key=key)
+            except APIError as e:
+                if e.status_code not in _RETRYABLE_CREATE_STATUSES or attempt >= max_retries:
+                    raise
+                delay = e.retry_after
+                if delay is None:
+                    delay = min(JOB_CREATE_MAX_BACKOFF_SECONDS, 2.0 ** attempt)
+                bucket.pause(delay)
+            attempt += 1
+
+    def create_many(
+        self,
+        specs: Iterable[dict[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CREATE_CONCURRENCY,
+        rate_limit: float | TokenBucket | None = None,
+        ledger: str | Path | None = None,
+        max_retries: int = JOB_CREATE_MAX_RETRIES,
+        on_result: Callable[[JobBatchItem], None] | None = None,
+    ) -> list[JobBatchItem]:
+        """Submit many jobs over the client's pooled connections.
+
+        Each spec is a dict of ``create`` keyword arguments, optionally with
+        an ``idempotency_key`` (see ``job_spec_keys`` for the default). A
+        ``429``/``503`` pauses every worker for the server's ``Retry-After``
+        (or an exponential backoff) before that spec is retried.
+
+        Args:
+            specs: Job specs, e.g. lines of a sweep file
+            concurrency: Submissions in flight at a time
+            rate_limit: Requests per second, or a shared ``TokenBucket``
+            ledger: JSON-lines file recording each launched job. Specs whose
+                key is already recorded are skipped, so a crashed driver can
+                rerun the same sweep without duplicating jobs.
+            max_retries: Retries per spec on 429/503
+            on_result: Called with each item as it finishes
+
+        Returns:
+            One ``JobBatchItem`` per spec, in input order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        specs = [dict(spec) for spec in specs]
+        allowed = set(inspect.signature(self.create).parameters)
+        for index, spec in enumerate(specs):
+            unknown = sorted(set(spec) - allowed)
+            if unknown:
+                raise ValueError(f"Job spec {index} has unknown fields: {', '.join(unknown)}")
+            if not spec.get("image"):
+                raise ValueError(f"Job spec {index} is missing 'image'")
+        if not specs:
+            return []
+
+        # Without a rate limit the bucket still lets one 429 pause every worker.
+        bucket = rate_limit if isinstance(rate_limit, TokenBucket) else TokenBucket(rate_limit)
+        ledger_path = Path(ledger) if ledger is not None else None
+        launched = _read_launch_ledger(ledger_path) if ledger_path is not None else {}
+        ledger_lock = threading.Lock()
+
+        def record(item: JobBatchItem) -> JobBatchItem:
+            if ledger_path is not None and item.job is not None and not item.spec.get("dry_run"):
+                with ledger_lock:
+                    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+                    with ledger_path.open("a") as f:
+                        entry = {"idempotency_key": item.key, "job_id": item.job_id}
+                        f.write(json.dumps(entry) + "\n")
+            if on_result is not None:
+                on_result(item)
+            return item
+
+        def submit(pair: tuple[dict[str, Any], str]) -> JobBatchItem:
+            spec, key = pair
+            if key in launched:
+                return record(JobBatchItem(key, spec, job_id=launched[key], resumed=True))
+            try:
+                job = self._create_with_backoff(spec, key, bucket, max_retries)
+            except (APIError, OSError, httpx.HTTPError) as e:
+                return record(JobBatchItem(key, spec, error=e))
+            return record(JobBatchItem(key, spec, job=job, job_id=job.job_id))
+
+        pairs = list(zip(specs, job_spec_keys(specs)))
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(pairs))) as pool:
+            return list(pool.map(submit, pairs))
+
     def cancel(self, job_id: str) -> dict:
         """Cancel a job"""
         return self._http.delete(f"/api/jobs/{job_id}")
@@ -402,10 +699,21 @@ class Jobs:
         data = self._http.patch(f"/api/jobs/{job_id}", json={"runtime": runtime})
         return Job.from_dict(data)
 
-    def logs(self, job_id: str) -> str:
-        """Get job logs"""
-        data = self._http.get(f"/api/jobs/{job_id}/logs")
-        return data.get("logs", "")
+    def logs(self, job_id: str, since_offset: int = None, tail: int = None) -> str:
+        """Get job logs, optionally only lines from *since_offset* and/or the last *tail*"""
+        if since_offset is None and tail is None:
+            data = self._http.get(f"/api/jobs/{job_id}/logs")
+            return data.get("logs", "")
+        return self.log_chunk(job_id, since_offset=since_offset, tail=tail).text
+
+    def log_chunk(self, job_id: str, since_offset: int = None, tail: int = None) -> LogChunk:
+        """Get the job's log lines from line *since_offset* on, capped to the last *tail*.
+
+        Pass the returned ``next_offset`` back as *since_offset* to fetch only
+        what was written since.
+        """
+        data = self._http.get(f"/api/jobs/{job_id}/logs", params=_log_params(since_offset, tail))
+        return _log_chunk(data, since_offset, tail)
 
     def metrics(self, job_id: str) -> JobMetrics:
         """Get job GPU metrics"""
@@ -428,26 +736,44 @@ class Jobs:
         Returns:
             ExecResult with stdout, stderr, and exit_code
         """
-        if (
-            not isinstance(command, list)
-            or not command
-            or any(not isinstance(argument, str) for argument in command)
-            or not command[0]
-            or any("\x00" in argument for argument in command)
-            or sum(len(argument.encode("utf-8")) for argument in command) > 65_536
-        ):
-            raise ValueError(
-                "command must be a nonempty argv list of strings with a nonempty "
-                "executable, at most 65536 UTF-8 bytes, and no NUL"
-            )
-        if isinstance(timeout, bool) or not isinstance(timeout, int) or not 1 <= timeout <= 300:
-            raise ValueError("timeout must be an integer from 1 through 300")
+        validate_exec_request(command, timeout)
         data = self._http.post(
             f"/api/jobs/{job_id}/exec",
             json={"command": list(command), "timeout": timeout},
         )
         return ExecResult.from_dict(data)
 
+    def exec_many(
+        self,
+        job_ids: Iterable[str],
+        command: list[str],
+        *,
+        timeout: int = 30,
+        concurrency: int = DEFAULT_EXEC_CONCURRENCY,
+        target_timeout: float | None = None,
+    ) -> Iterator[ExecBatchItem]:
+        """Run one command on many jobs, yielding results as each finishes.
+
+        Args:
+            job_ids: Job UUIDs to run on (duplicates are run once)
+            command: Exact executable and argument vector to run
+            timeout: Per-command timeout in seconds (default: 30)
+            concurrency: Maximum commands in flight at once
+            target_timeout: Wall-clock budget per job; defaults to
+                ``timeout`` plus connection grace
+
+        Yields:
+            ExecBatchItem per job in completion order. Summarise them with
+            ``ExecSummary.from_items``.
+        """
+        validate_exec_request(command, timeout)
+        return fan_out(
+            lambda job_id: self.exec(job_id, command, timeout=timeout),
+            job_ids,
+            concurrency=concurrency,
+            deadline=target_deadline(timeout, target_timeout),
+        )
+
     async def shell_connect(self, job_id: str, shell: str = "/bin/bash"):
         """Connect to job shell via director WebSocket proxy.
 
@@ -476,6 +802,79 @@ class Jobs:
         return await websockets.connect(url, ping_interval=20, ping_timeout=20)
 
 
+class AsyncJobs:
+    """Async Jobs API wrapper for listing and looking up jobs in async contexts."""
+
+    def __init__(self, http: "AsyncHTTPClient"):
+        self._http = http
+
+    async def list_page(
+        self,
+        state: str = None,
+        tags: dict[str, str] | list[str] | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+    ) -> JobListPage:
+        """List jobs with backend pagination metadata."""
+        data = await self._http.get(
+            "/api/jobs",
+            params=Jobs._list_params(state=state, tags=tags, page=page, page_size=page_size),
+        )
+        return _job_list_page(data, page, page_size)
+
+    async def get(self, job_id: str) -> Job:
+        """Get job details"""
+        return Job.from_dict(await self._http.get(f"/api/jobs/{job_id}"))
+
+    async def logs(self, job_id: str, since_offset: int = None, tail: int = None) -> str:
+        """Get job logs, optionally only lines from *since_offset* and/or the last *tail*"""
+        if since_offset is None and tail is None:
+            data = await self._http.get(f"/api/jobs/{job_id}/logs")
+            return data.get("logs", "")
+        return (await self.log_chunk(job_id, since_offset=since_offset, tail=tail)).text
+
+    async def log_chunk(self, job_id: str, since_offset: int = None, tail: int = None) -> LogChunk:
+        """Get the job's log lines from line *since_offset* on, capped to the last *tail*"""
+        data = await self._http.get(
+            f"/api/jobs/{job_id}/logs", params=_log_params(since_offset, tail)
+        )
+        return _log_chunk(data, since_offset, tail)
+
+    async def iter_all(
+        self,
+        state: str = None,
+        tags: dict[str, str] | list[str] | None = None,
+        *,
+        page_size: int = JOB_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Job]:
+        """Iterate every matching job across all pages. Same contract as ``Jobs.iter_all``."""
+        def fetch(number: int):
+            return self.list_page(state=state, tags=tags, page=number, page_size=page_size)
+
+        upcoming: asyncio.Task | None = None
+        try:
+            number = 1
+            page = await fetch(number)
+            fetched = 0
+            seen: set[str] = set()
+            while True:
+                fetched += len(page.jobs)
+                more = _has_more_pages(page, fetched)
+                if more and prefetch:
+                    upcoming = asyncio.ensure_future(fetch(number + 1))
+                for job in _unseen(page.jobs, seen):
+                    yield job
+                if not more:
+                    return
+                number += 1
+                page = await upcoming if upcoming else await fetch(number)
+                upcoming = None
+        finally:
+            if upcoming is not None:
+                upcoming.cancel()
+
+
 # Utility functions for finding jobs
 
 
@@ -500,11 +899,19 @@ def find_by_id(jobs: Jobs, job_id: str) -> Job | None:
         return None
 
 
-def find_by_hostname(job_list: list[Job], hostname: str) -> Job | None:
+def _is_ip_address(value: str) -> bool:
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def find_by_hostname(job_list: Iterable[Job], hostname: str) -> Job | None:
     """Find job by hostname (exact or prefix match).
 
     Args:
-        job_list: List of Job objects to search
+        job_list: Jobs to search (a list or a lazy ``iter_all`` walk)
         hostname: Hostname to match (can be partial prefix)
 
     Returns:
@@ -516,11 +923,11 @@ def find_by_hostname(job_list: list[Job], hostname: str) -> Job | None:
     return None
 
 
-def find_by_ip(job_list: list[Job], ip: str) -> Job | None:
+def find_by_ip(job_list: Iterable[Job], ip: str) -> Job | None:
     """Find job by IP address (extracted from hostname).
 
     Args:
-        job_list: List of Job objects to search
+        job_list: Jobs to search (a list or a lazy ``iter_all`` walk)
         ip: IP address to match
 
     Returns:
@@ -540,13 +947,42 @@ def find_by_ip(job_list: list[Job], ip: str) -> Job | None:
     return None
 
 
-def find_job(jobs: Jobs, identifier: str, state: str = None) -> Job | None:
+def _find_in_index(jobs: Jobs, index: "JobIndex", identifier: str, state: str | None) -> Job | None:
+    index.refresh(jobs)
+    job_ids = index.match_hostname(identifier)
+    if not job_ids and _is_ip_address(identifier):
+        job_ids = index.match_ip(identifier)
+    for job_id in job_ids:
+        job = find_by_id(jobs, job_id)
+        if job and (not state or job.state == state):
+            return job
+    return None
+
+
+def _find_by_listing(jobs: Jobs, identifier: str, state: str | None) -> Job | None:
+    # Hostnames never start with an IP, so an IP skips the hostname walk and
+    # tries the IP match (slower, one DNS lookup per job) on the first page only
+    if _is_ip_address(identifier):
+        return find_by_ip(jobs.list(state=state, page=1, page_size=JOB_PAGE_SIZE), identifier)
+
+    # Walk every page lazily; a recent match stops after the first page
+    return find_by_hostname(jobs.iter_all(state=state), identifier)
+
+
+def find_job(
+    jobs: Jobs,
+    identifier: str,
+    state: str = None,
+    index: "JobIndex | None" = None,
+) -> Job | None:
     """Find a job by UUID, hostname, or IP address.
 
     Args:
         jobs: Jobs API instance
         identifier: Job UUID, hostname (partial match), or IP address
         state: Optional state filter for listing jobs
+        index: Optional ``JobIndex``; hostname/IP lookups then use its maps
+            (with cached, concurrent DNS) first and walk the job list only on a miss
 
     Returns:
         Matching Job or None
@@ -555,13 +991,9 @@ def find_job(jobs: Jobs, identifier: str, state: str = None) -> Job | None:
     if is_uuid(identifier):
         return find_by_id(jobs, identifier)
 
-    # Get job list for hostname/IP search
-    job_list = jobs.list(state=state)
-
-    # Try hostname match
-    job = find_by_hostname(job_list, identifier)
-    if job:
-        return job
-
-    # Try IP match (slower, requires DNS lookup)
-    return find_by_ip(job_list, identifier)
+    if index is not None:
+        job = _find_in_index(jobs, index, identifier, state)
+        if job:
+            return job
+        # The index can lag the server; confirm a miss against the job list
+    return _find_by_listing(jobs, identifier, state)
@@ -0,0 +1,213 @@
+"""Rotating, compressed on-disk archive for streamed job and agent logs."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+import gzip
+import json
+from pathlib import Path
+import re
+import threading
+import time
+
+
+DEFAULT_ARCHIVE_FILE_BYTES = 64 * 1024 * 1024  # Rotate after this many compressed bytes
+DEFAULT_ARCHIVE_TOTAL_BYTES = 1024 * 1024 * 1024  # Oldest files are deleted past this
+DEFAULT_ARCHIVE_BATCH_LINES = 1000  # Lines buffered before a compressed write
+DEFAULT_ARCHIVE_FLUSH_INTERVAL = 2.0  # Seconds a buffered line may wait for its batch
+ARCHIVE_SUFFIXES = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+def _compressor(compression: str):
+    if compression == "gzip":
+        return lambda data: gzip.compress(data, compresslevel=6)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError(
+                "zstd archives require the zstandard package. "
+                "Install with: pip install 'hypercli-sdk[zstd]'"
+            ) from exc
+        return zstandard.ZstdCompressor().compress
+    raise ValueError(f"compression must be one of: {', '.join(sorted(ARCHIVE_SUFFIXES))}")
+
+
+class LogArchive:
+    """Append log lines to rotating compressed JSON-lines files.
+
+    Usage:
+        with LogArchive("./logs", name="sweep") as archive:
+            archive.write("epoch 1 done", source=job_id)
+
+    Each record is ``{"ts": ..., "source": ..., "line": ...}`` with the UTC
+    time the line was received. Lines are buffered and every batch is written
+    as its own compressed member (gzip) or frame (zstd), so a crash loses at
+    most the unflushed batch and ``zcat``/``zstdcat`` read the files whole.
+
+    Files are ``<name>-<seq>.jsonl.gz`` in *directory* and rotate once they
+    reach ``max_file_bytes``. On each rotation this archive's oldest files are
+    deleted until they total at most ``max_total_bytes``; nothing else in
+    *directory* is touched.
+    ``awrite``/``aflush`` compress and write on a worker thread, so the
+    event loop only ever appends to the in-memory batch.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        name: str = "logs",
+        *,
+        compression: str = "gzip",
+        max_file_bytes: int = DEFAULT_ARCHIVE_FILE_BYTES,
+        max_total_bytes: int | None = DEFAULT_ARCHIVE_TOTAL_BYTES,
+        batch_lines: int = DEFAULT_ARCHIVE_BATCH_LINES,
+        flush_interval: float = DEFAULT_ARCHIVE_FLUSH_INTERVAL,
+    ):
+        if max_file_bytes <= 0:
+            raise ValueError("max_file_bytes must be positive")
+        if max_total_bytes is not None and max_total_bytes < max_file_bytes:
+            raise ValueError("max_total_bytes must be at least max_file_bytes")
+        if batch_lines < 1:
+            raise ValueError("batch_lines must be at least 1")
+        self.directory = Path(directory)
+        self.name = re.sub(r"[^A-Za-z0-9._-]", "_", name) or "logs"
+        self.compression = compression
+        self.suffix = ARCHIVE_SUFFIXES.get(compression, "")
+        self._compress = _compressor(compression)
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.batch_lines = batch_lines
+        self.flush_interval = flush_interval
+        self.lines_written = 0
+
+        self._pending: list[str] = []
+        self._pending_since = 0.0
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._seq = max((self._seq_of(path) for path in self._own_files()), default=0) + 1
+        self._size = 0
+
+    @property
+    def path(self) -> Path:
+        """File the next batch is appended to."""
+        return self.directory / f"{self.name}-{self._seq:05d}{self.suffix}"
+
+    def _own_files(self) -> list[Path]:
+        candidates = self.directory.glob(f"{self.name}-[0-9]*{self.suffix}")
+        return [path for path in candidates if self._seq_of(path)]
+
+    def _seq_of(self, path: Path) -> int:
+        digits = path.name[len(self.name) + 1:-len(self.suffix)]
+        return int(digits) if digits.isdigit() else 0
+
+    def _record(self, line: str, source: str | None) -> str:
+        ts = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        return json.dumps({"ts": ts, "source": source, "line": line}, ensure_ascii=False) + "\n"
+
+    def _buffer(self, line: str, source: str | None) -> bool:
+        """Queue one record; return True when the batch is due to be written."""
+        if self._closed:
+            raise RuntimeError("LogArchive is closed")
+        record = self._record(line, source)
+        with self._buffer_lock:
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append(record)
+            return (
+                len(self._pending) >= self.batch_lines
+                or time.monotonic() - self._pending_since >= self.flush_interval
+            )
+
+    def _drain(self) -> None:
+        with self._write_lock:  # batches hit the file in the order they were taken
+            with self._buffer_lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            data = self._compress("".join(batch).encode("utf-8"))
+            with open(self.path, "ab") as handle:
+                handle.write(data)
+            self._size += len(data)
+            self.lines_written += len(batch)
+            if self._size >= self.max_file_bytes:
+                self._seq += 1
+                self._size = 0
+                self._prune()
+
+    def _prune(self) -> None:
+        """Delete this archive's oldest files until they fit the cap."""
+        if self.max_total_bytes is None:
+            return
+        files = []
+        for path in self._own_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.name, path, stat.st_size))
+        total = sum(size for *_, size in files)
+        for _, _, path, size in sorted(files):
+            if total <= self.max_total_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def write(self, line: str, source: str | None = None) -> None:
+        """Archive one line, writing the batch in this thread once it is due."""
+        if self._buffer(line, source):
+            self._drain()
+
+    async def awrite(self, line: str, source: str | None = None) -> None:
+        """Archive one line, writing the batch on a worker thread once it is due."""
+        if self._buffer(line, source):
+            await asyncio.to_thread(self._drain)
+
+    def flush(self) -> None:
+        """Write any buffered lines now."""
+        self._drain()
+
+    async def aflush(self) -> None:
+        """Write any buffered lines now, off the event loop."""
+        await asyncio.to_thread(self._drain)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._drain()
+            self._closed = True
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            await self.aflush()
+            self._closed = True
+
+    def __enter__(self) -> "LogArchive":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "LogArchive":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+
+def read_archive(path: str | Path) -> list[dict]:
+    """Records of one archive file (gzip or zstd), in write order."""
+    path = Path(path)
+    if path.name.endswith(ARCHIVE_SUFFIXES["zstd"]):
+        import zstandard
+
+        with open(path, "rb") as handle:
+            reader = zstandard.ZstdDecompressor().stream_reader(handle, read_across_frames=True)
+            data = reader.read()
+    else:
+        data = gzip.decompress(path.read_bytes())
+    return [json.loads(line) for line in data.decode("utf-8").splitlines() if line]
@@ -0,0 +1,150 @@
+"""Compiled client-side filters for streamed job and agent log lines."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import re
+from typing import Iterable, Pattern
+
+
+LOG_LEVELS = {"trace": 5, "debug": 10, "info": 20, "warning": 30, "error": 40, "critical": 50}
+_LEVEL_ALIASES = {"warn": "warning", "err": "error", "fatal": "critical", "crit": "critical"}
+# Upper-case level words ("ERROR", "[WARN]") and key/value forms ("level=info",
+# "\"level\": \"error\""); lower-case bare words are too common in prose.
+_LEVEL_WORD = re.compile(r"\b(TRACE|DEBUG|INFO|WARN(?:ING)?|ERR(?:OR)?|CRITICAL|CRIT|FATAL)\b")
+_LEVEL_KEY = re.compile(r"""\b(?:level|lvl|severity)["']?\s*[=:]\s*["']?([a-z]+)""", re.IGNORECASE)
+# RFC 3339 / ISO 8601 timestamp at the start of a line, optionally bracketed.
+_LINE_TIMESTAMP = re.compile(
+    r"^\[?(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2})(?:[.,](\d+))?\s?(Z|[+-]\d{2}:?\d{2})?"
+)
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)\s*([smhd])$")
+_DURATION_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+
+
+def normalize_level(level: str) -> str:
+    """Canonical name for *level* (``warn`` -> ``warning``); ValueError if unknown."""
+    name = _LEVEL_ALIASES.get(level.strip().lower(), level.strip().lower())
+    if name not in LOG_LEVELS:
+        raise ValueError(f"unknown log level {level!r}; expected one of: {', '.join(LOG_LEVELS)}")
+    return name
+
+
+def parse_since(value: str | datetime, *, now: datetime | None = None) -> datetime:
+    """Resolve ``10m``/``2h``/``1d``/``30s`` or an ISO timestamp to a UTC datetime."""
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    text = str(value).strip()
+    match = _DURATION.match(text.lower())
+    if match:
+        delta = timedelta(**{_DURATION_UNITS[match.group(2)]: float(match.group(1))})
+        return (now or datetime.now(timezone.utc)) - delta
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(
+            f"invalid time {value!r}; use a duration like 10m, 2h, 1d or an ISO timestamp"
+        ) from None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def line_timestamp(line: str) -> datetime | None:
+    """Timestamp a log line starts with, if any (naive times are taken as UTC)."""
+    match = _LINE_TIMESTAMP.match(line)
+    if not match:
+        return None
+    date, clock, fraction, offset = match.groups()
+    text = f"{date}T{clock}"
+    if fraction:
+        text += "." + fraction[:6].ljust(6, "0")
+    if offset and offset != "Z":
+        text += offset if ":" in offset else f"{offset[:3]}:{offset[3:]}"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return parsed.astimezone(timezone.utc) if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def line_level(line: str) -> str | None:
+    """Log level named in *line*, if one can be recognised."""
+    match = _LEVEL_KEY.search(line)
+    if match:
+        name = _LEVEL_ALIASES.get(match.group(1).lower(), match.group(1).lower())
+        if name in LOG_LEVELS:
+            return name
+    match = _LEVEL_WORD.search(line)
+    if match:
+        word = match.group(1).lower()
+        return _LEVEL_ALIASES.get(word, word)
+    return None
+
+
+class _SourceState:
+    __slots__ = ("level_ok", "since_ok")
+
+    def __init__(self):
+        self.level_ok = True
+        self.since_ok: bool | None = None  # None until a timestamped line is seen
+
+
+class LogFilter:
+    """Decide which log lines to keep, compiled once and applied per line.
+
+    Usage:
+        keep = LogFilter(grep=r"CUDA|NCCL", min_level="warning", since="10m")
+        lines = keep.apply(lines, source=job_id)
+
+    ``grep`` and ``exclude`` are regular expressions searched in each line.
+    ``min_level`` keeps lines at or above a level and ``since`` keeps lines
+    stamped at or after a time. Lines that carry no level or timestamp (a
+    traceback, a wrapped message) follow the verdict of the last line from
+    the same ``source`` that did; lines before the first timestamp are kept.
+    Once a line passes ``since`` every later line from that source does too,
+    so live streams stop paying for timestamp parsing.
+    """
+
+    def __init__(
+        self,
+        grep: str | Pattern[str] | None = None,
+        *,
+        exclude: str | Pattern[str] | None = None,
+        ignore_case: bool = False,
+        min_level: str | None = None,
+        since: str | datetime | None = None,
+    ):
+        flags = re.IGNORECASE if ignore_case else 0
+        self.grep = re.compile(grep, flags) if isinstance(grep, str) else grep
+        self.exclude = re.compile(exclude, flags) if isinstance(exclude, str) else exclude
+        self.min_level = normalize_level(min_level) if min_level else None
+        self.since = parse_since(since) if since is not None else None
+        self._threshold = LOG_LEVELS[self.min_level] if self.min_level else 0
+        self._sources: dict[str | None, _SourceState] = {}
+
+    @property
+    def active(self) -> bool:
+        return any(
+            value is not None for value in (self.grep, self.exclude, self.min_level, self.since)
+        )
+
+    def __call__(self, line: str, source: str | None = None) -> bool:
+        state = self._sources.get(source)
+        if state is None:
+            state = self._sources[source] = _SourceState()
+        if self.since is not None and state.since_ok is not True:
+            stamp = line_timestamp(line)
+            if stamp is not None:
+                state.since_ok = stamp >= self.since
+            if state.since_ok is False:
+                return False
+        if self.min_level is not None:
+            level = line_level(line)
+            if level is not None:
+                state.level_ok = LOG_LEVELS[level] >= self._threshold
+            if not state.level_ok:
+                return False
+        if self.exclude is not None and self.exclude.search(line):
+            return False
+        return self.grep is None or self.grep.search(line) is not None
+
+    def apply(self, lines: Iterable[str], source: str | None = None) -> list[str]:
+        """The lines of *lines* that pass, in order."""
+        return [line for line in lines if self(line, source)]
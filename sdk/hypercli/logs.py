@@ -2,11 +2,16 @@
 import asyncio
 import json
 from collections import deque
-from typing import TYPE_CHECKING, AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterable, Optional
 
 import websockets
 
 from .config import get_ws_url, WS_LOGS_PATH
+from .http import AsyncHTTPClient
+from .jobs import AsyncJobs, Jobs, LogChunk
+from .log_archive import LogArchive
+from .log_filter import LogFilter
 
 if TYPE_CHECKING:
     from .client import HyperCLI
@@ -16,6 +21,12 @@ if TYPE_CHECKING:
 DEFAULT_MAX_INITIAL_LINES = 1000  # Max lines to fetch on initial REST call
 DEFAULT_MAX_BUFFER = 5000  # Max lines to keep in memory buffer
 
+# LogHub pacing
+LOG_HUB_STATE_INTERVAL = 5.0  # How often to re-check jobs that are not streaming yet
+LOG_HUB_RECONNECT_INITIAL = 1.0  # First reconnect delay after a dropped websocket
+LOG_HUB_RECONNECT_MAX = 30.0  # Reconnect backoff cap
+LOG_HUB_TERMINAL_STATES = {"succeeded", "failed", "canceled", "cancelled", "terminated"}
+
 
 def fetch_logs(client: "HyperCLI", job_id: str, tail: int = None) -> list[str]:
     """Fetch logs via REST API (one-time call).
@@ -29,17 +40,79 @@ def fetch_logs(client: "HyperCLI", job_id: str, tail: int = None) -> list[str]:
         List of log lines
     """
     try:
-        logs = client.jobs.logs(job_id)
-        if not logs:
-            return []
-        lines = logs.strip().split("\n")
-        if tail and len(lines) > tail:
-            return lines[-tail:]
-        return lines
+        return client.jobs.log_chunk(job_id, tail=tail or None).lines
+    except Exception:
+        return []
+
+
+async def fetch_logs_async(jobs: AsyncJobs, job_id: str, tail: int = None) -> list[str]:
+    """Async twin of :func:`fetch_logs` over an ``AsyncJobs`` client."""
+    try:
+        return (await jobs.log_chunk(job_id, tail=tail or None)).lines
     except Exception:
         return []
 
 
+class LogCursor:
+    """Position in one job's log, so each read fetches only new lines.
+
+    Usage:
+        cursor = LogCursor(job_id)
+        lines = cursor.fetch(client.jobs, tail=100)  # bounded first read
+        ...
+        lines = cursor.fetch(client.jobs)  # only what was written since
+
+    Lines received some other way (the log websocket) are counted with
+    ``advance`` so the next fetch starts after them. ``fetch(jobs, tail=0)``
+    moves the cursor to the end of the log without returning anything.
+    """
+
+    def __init__(self, job_id: str, offset: int = 0):
+        self.job_id = job_id
+        self.offset = offset
+
+    def advance(self, count: int) -> None:
+        """Account for *count* lines consumed outside of ``fetch``."""
+        self.offset += count
+
+    def _consume(self, chunk: LogChunk) -> list[str]:
+        self.offset = max(self.offset, chunk.next_offset)
+        return chunk.lines
+
+    def fetch(self, jobs: Jobs, tail: int = None) -> list[str]:
+        """Lines past the cursor (at most the last *tail*); advances the cursor."""
+        return self._consume(jobs.log_chunk(self.job_id, since_offset=self.offset, tail=tail))
+
+    async def fetch_async(self, jobs: AsyncJobs, tail: int = None) -> list[str]:
+        """Async twin of :meth:`fetch`."""
+        return self._consume(await jobs.log_chunk(self.job_id, since_offset=self.offset, tail=tail))
+
+
+async def _fetch_delta(cursor: LogCursor, jobs: AsyncJobs, tail: int = None) -> list[str]:
+    """``cursor.fetch_async`` that treats a failed fetch as no new lines."""
+    try:
+        return await cursor.fetch_async(jobs, tail=tail)
+    except Exception:
+        return []
+
+
+def _async_jobs_for(client: "HyperCLI") -> tuple[AsyncJobs, AsyncHTTPClient]:
+    """Open an ``AsyncJobs`` on the same API and key as *client*'s sync one."""
+    http = client.jobs._http
+    async_http = AsyncHTTPClient(http.base_url, http.api_key, timeout=http.timeout)
+    return AsyncJobs(async_http), async_http
+
+
+async def _close_quietly(resource, method: str = "close") -> None:
+    """Close *resource* even while the caller is being cancelled."""
+    if resource is None:
+        return
+    try:
+        await asyncio.shield(getattr(resource, method)())
+    except Exception:
+        pass
+
+
 class LogStream:
     """Async log streamer - websocket streaming with optional initial fetch.
 
@@ -65,6 +138,9 @@ class LogStream:
         fetch_initial: bool = True,
         max_initial_lines: int = DEFAULT_MAX_INITIAL_LINES,
         max_buffer: int = DEFAULT_MAX_BUFFER,
+        async_jobs: AsyncJobs = None,
+        archive: LogArchive = None,
+        line_filter: LogFilter = None,
     ):
         """
         Args:
@@ -74,6 +150,10 @@ class LogStream:
             fetch_initial: Whether to fetch existing logs on connect
             max_initial_lines: Max lines to fetch initially (prevents huge fetch)
             max_buffer: Max lines to keep in buffer (oldest dropped)
+            async_jobs: AsyncJobs for REST calls (default: one opened from client)
+            archive: Also write every line to this LogArchive (flushed on close)
+            line_filter: Only buffer and yield lines this LogFilter keeps (the
+                archive still gets every line)
         """
         self.client = client
         self.job_id = job_id
@@ -81,9 +161,14 @@ class LogStream:
         self.fetch_initial = fetch_initial
         self.max_initial_lines = max_initial_lines
         self.max_buffer = max_buffer
+        self.archive = archive
+        self.line_filter = line_filter
 
+        self._async_jobs = async_jobs
+        self._async_http: Optional[AsyncHTTPClient] = None
         self._ws = None
         self._buffer: deque[str] = deque(maxlen=max_buffer)
+        self.cursor = LogCursor(job_id)
         self._initial_fetched = False
         self._connected = False
         self._closed = False
@@ -109,17 +194,25 @@ class LogStream:
             raise RuntimeError("LogStream is closed")
 
         initial_lines = []
+        if self._async_jobs is None:
+            self._async_jobs, self._async_http = _async_jobs_for(self.client)
 
         # Fetch initial logs ONCE (bounded)
         if self.fetch_initial and not self._initial_fetched:
-            initial_lines = fetch_logs(self.client, self.job_id, tail=self.max_initial_lines)
-            for line in initial_lines:
-                self._buffer.append(line)
+            fetched = await _fetch_delta(
+                self.cursor, self._async_jobs, tail=self.max_initial_lines or None
+            )
+            for line in fetched:
+                if self.archive is not None:
+                    await self.archive.awrite(line, source=self.job_id)
+                if self._keep(line):
+                    self._buffer.append(line)
+                    initial_lines.append(line)
             self._initial_fetched = True
 
         # Get job_key if not provided
         if not self.job_key:
-            job = self.client.jobs.get(self.job_id)
+            job = await self._async_jobs.get(self.job_id)
             self.job_key = job.job_key
 
         # Connect websocket with timeout
@@ -145,9 +238,14 @@ class LogStream:
         """Close the websocket connection"""
         self._closed = True
         self._connected = False
-        if self._ws:
-            await self._ws.close()
-            self._ws = None
+        ws, self._ws = self._ws, None
+        async_http, self._async_http = self._async_http, None
+        await _close_quietly(ws)
+        await _close_quietly(async_http, "aclose")
+        await _close_quietly(self.archive, "aflush")
+
+    def _keep(self, line: str) -> bool:
+        return self.line_filter is None or self.line_filter(line, self.job_id)
 
     def get_buffer(self) -> list[str]:
         """Get current buffer contents (bounded, oldest may be dropped)"""
@@ -170,15 +268,16 @@ class LogStream:
             async for message in self._ws:
                 if self._closed:
                     break
-                try:
-                    data = json.loads(message)
-                    if data.get("event") == "log" and data.get("log"):
-                        for line in data["log"].splitlines():
-                            if line:
-                                self._buffer.append(line)
-                                yield line
-                except json.JSONDecodeError:
-                    continue
+                lines = _log_message_lines(message)
+                self.cursor.advance(len(lines))
+                for line in lines:
+                    if not line:
+                        continue
+                    if self.archive is not None:
+                        await self.archive.awrite(line, source=self.job_id)
+                    if self._keep(line):
+                        self._buffer.append(line)
+                        yield line
         except websockets.ConnectionClosed:
             self._connected = False
 
@@ -199,6 +298,9 @@ async def stream_logs(
     fetch_initial: bool = True,
     fetch_final: bool = True,
     max_initial_lines: int = DEFAULT_MAX_INITIAL_LINES,
+    async_jobs: AsyncJobs = None,
+    archive: LogArchive = None,
+    line_filter: LogFilter = None,
 ) -> None:
     """Stream logs until job reaches a terminal state.
 
@@ -211,38 +313,59 @@ async def stream_logs(
         fetch_initial: Fetch existing logs on start
         fetch_final: Fetch logs one more time after job terminates
         max_initial_lines: Max lines to fetch initially
+        async_jobs: AsyncJobs for state and log fetches (default: one opened
+            from client and closed on return)
+        archive: Also write every line to this LogArchive (flushed on return)
+        line_filter: Only pass lines this LogFilter keeps to on_line (the
+            archive still gets every line)
 
     This function:
     - Fetches initial logs ONCE (bounded)
     - Streams via websocket (NO log polling)
     - Polls job STATE only (to detect termination)
-    - Optionally fetches final logs ONCE when job terminates
+    - Optionally fetches final logs ONCE when job terminates, starting after
+      the last line already delivered so nothing is repeated
+
+    Every REST call is async, so the event loop is never blocked, and the
+    websocket and HTTP client are closed even if the task is cancelled.
     """
     if until_state is None:
         until_state = {"succeeded", "failed", "canceled", "terminated"}
 
-    job = client.jobs.get(job_id)
-    initial_fetched = False
+    async_http = None
+    if async_jobs is None:
+        async_jobs, async_http = _async_jobs_for(client)
+    cursor = LogCursor(job_id)
+    tail = max_initial_lines or None
     ws = None
 
+    async def deliver(lines: list[str]) -> None:
+        for line in lines:
+            if archive is not None:
+                await archive.awrite(line, source=job_id)
+            if line_filter is None or line_filter(line, job_id):
+                on_line(line)
+
     try:
+        job = await async_jobs.get(job_id)
+
         # Wait for job to be assigned/running
         while job.state in ("pending", "queued"):
             await asyncio.sleep(poll_state_interval)
-            job = client.jobs.get(job_id)
+            job = await async_jobs.get(job_id)
 
         # Check for immediate terminal state
         if job.state in until_state:
             if fetch_final:
-                for line in fetch_logs(client, job_id, tail=max_initial_lines):
-                    on_line(line)
+                await deliver(await _fetch_delta(cursor, async_jobs, tail=tail))
             return
 
-        # Fetch initial logs ONCE when running (bounded)
-        if fetch_initial and job.state == "running" and not initial_fetched:
-            for line in fetch_logs(client, job_id, tail=max_initial_lines):
-                on_line(line)
-            initial_fetched = True
+        # Fetch initial logs ONCE (bounded); without them, still find the end
+        # of the log so the final fetch only returns the delta
+        if fetch_initial and job.state == "running":
+            await deliver(await _fetch_delta(cursor, async_jobs, tail=tail))
+        elif fetch_final:
+            await _fetch_delta(cursor, async_jobs, tail=0)
 
         # Connect websocket
         if job.job_key:
@@ -255,17 +378,12 @@ async def stream_logs(
                 try:
                     # Wait for message with timeout to allow state checks
                     message = await asyncio.wait_for(ws.recv(), timeout=poll_state_interval)
-                    try:
-                        data = json.loads(message)
-                        if data.get("event") == "log" and data.get("log"):
-                            for line in data["log"].splitlines():
-                                if line:
-                                    on_line(line)
-                    except json.JSONDecodeError:
-                        continue
+                    lines = _log_message_lines(message)
+                    cursor.advance(len(lines))
+                    await deliver([line for line in lines if line])
                 except asyncio.TimeoutError:
                     # Check job state (NOT polling logs!)
-                    job = client.jobs.get(job_id)
+                    job = await async_jobs.get(job_id)
                     if job.state in until_state:
                         break
                 except websockets.ConnectionClosed:
@@ -275,9 +393,212 @@ async def stream_logs(
         if fetch_final:
             # Small delay to let final logs flush
             await asyncio.sleep(0.5)
-            for line in fetch_logs(client, job_id, tail=max_initial_lines):
-                on_line(line)
+            await deliver(await _fetch_delta(cursor, async_jobs, tail=tail))
 
     finally:
-        if ws:
-            await ws.close()
+        await _close_quietly(ws)
+        await _close_quietly(async_http, "aclose")
+        await _close_quietly(archive, "aflush")
+
+
+def _log_message_lines(message) -> list[str]:
+    """Log lines carried by one websocket frame.
+
+    Blank lines are kept so callers can count them against the REST log's
+    line offsets; skip them when displaying.
+    """
+    try:
+        data = json.loads(message)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if not isinstance(data, dict) or data.get("event") != "log" or not data.get("log"):
+        return []
+    return data["log"].splitlines()
+
+
+@dataclass
+class LogEvent:
+    """One item of a ``LogHub`` stream: a log line or a job state change."""
+    job_id: str
+    line: Optional[str] = None
+    state: Optional[str] = None
+
+
+class _FollowedJob:
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.state: Optional[str] = None
+        self.job_key: Optional[str] = None
+        self.cursor = LogCursor(job_id)  # lines of the job's log already accounted for
+        self.caught_up = False
+
+
+class LogHub:
+    """Follow many jobs' logs on one event loop and merge them into one stream.
+
+    Usage:
+        hub = LogHub(client, ["job-a", "job-b"])
+        async for event in hub:
+            if event.line is not None:
+                print(f"[{event.job_id[:8]}] {event.line}")
+
+    Each running job has its own log websocket (the endpoint is per job key),
+    but all of them share the hub's loop. A dropped websocket reconnects with
+    exponential backoff; the lines missed meanwhile are read back from the
+    REST log through each job's ``LogCursor``, starting after the ones
+    already yielded. REST calls go through ``AsyncJobs``, so nothing blocks
+    the loop. Job state is re-read when a job's websocket closes, rather than
+    polled on a timer, and only queued/pending jobs wait on
+    ``state_interval``. State changes are yielded as events. Iteration ends
+    once every job is terminal. Pass ``archive`` to also write every line to
+    a ``LogArchive``, tagged with its job ID, and ``line_filter`` to yield
+    only the lines a ``LogFilter`` keeps. If one job cannot be followed, for
+    example an unknown job ID, iteration raises its error at once and stops
+    following the others.
+    """
+
+    def __init__(
+        self,
+        client: "HyperCLI",
+        job_ids: Iterable[str],
+        fetch_initial: bool = True,
+        fetch_final: bool = True,
+        max_initial_lines: int = DEFAULT_MAX_INITIAL_LINES,
+        until_state: set[str] = None,
+        state_interval: float = LOG_HUB_STATE_INTERVAL,
+        reconnect_initial: float = LOG_HUB_RECONNECT_INITIAL,
+        reconnect_max: float = LOG_HUB_RECONNECT_MAX,
+        async_jobs: AsyncJobs = None,
+        archive: LogArchive = None,
+        line_filter: LogFilter = None,
+    ):
+        self.client = client
+        self.archive = archive
+        self.line_filter = line_filter
+        self._async_jobs = async_jobs
+        self._async_http: Optional[AsyncHTTPClient] = None
+        self.fetch_initial = fetch_initial
+        self.fetch_final = fetch_final
+        self.max_initial_lines = max_initial_lines
+        self.until_state = until_state or LOG_HUB_TERMINAL_STATES
+        self.state_interval = state_interval
+        self.reconnect_initial = reconnect_initial
+        self.reconnect_max = reconnect_max
+        self.jobs = {job_id: _FollowedJob(job_id) for job_id in dict.fromkeys(job_ids)}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def _emit(self, event: Optional[LogEvent]) -> None:
+        if event is not None and event.line is not None:
+            if self.archive is not None:
+                await self.archive.awrite(event.line, source=event.job_id)
+            if self.line_filter is not None and not self.line_filter(event.line, event.job_id):
+                return
+        await self._queue.put(event)
+
+    async def _refresh(self, job: _FollowedJob) -> str:
+        current = await self._async_jobs.get(job.job_id)
+        job.job_key = current.job_key or job.job_key
+        if current.state != job.state:
+            job.state = current.state
+            await self._emit(LogEvent(job.job_id, state=current.state))
+        return current.state
+
+    async def _catch_up(self, job: _FollowedJob, *, emit: bool = True) -> None:
+        """Yield REST log lines past ``job.cursor`` (bounded on the first read)."""
+        tail = None
+        if not emit:
+            tail = 0
+        elif not job.caught_up:
+            tail = self.max_initial_lines or None
+        try:
+            fresh = await job.cursor.fetch_async(self._async_jobs, tail=tail)
+        except Exception:
+            return  # retried from the same offset on the next catch-up
+        job.caught_up = True
+        for line in fresh:
+            await self._emit(LogEvent(job.job_id, line=line))
+
+    async def _stream(self, job: _FollowedJob) -> bool:
+        """Stream one websocket session; return True if it delivered anything."""
+        full_url = f"{get_ws_url()}{WS_LOGS_PATH}/{job.job_key}"
+        delivered = False
+        try:
+            async with websockets.connect(
+                full_url,
+                ping_interval=30,
+                ping_timeout=20,
+                close_timeout=5,
+                max_size=2**20,
+                compression=None,
+                open_timeout=30,
+            ) as ws:
+                async for message in ws:
+                    lines = _log_message_lines(message)
+                    job.cursor.advance(len(lines))
+                    for line in lines:
+                        if line:
+                            delivered = True
+                            await self._emit(LogEvent(job.job_id, line=line))
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException):
+            pass
+        return delivered
+
+    async def _follow(self, job: _FollowedJob) -> None:
+        delay = self.reconnect_initial
+        try:
+            state = await self._refresh(job)
+            while state not in self.until_state:
+                if state != "running" or not job.job_key:
+                    await asyncio.sleep(self.state_interval)
+                    state = await self._refresh(job)
+                    continue
+                await self._catch_up(job, emit=job.caught_up or self.fetch_initial)
+                if await self._stream(job):
+                    delay = self.reconnect_initial
+                state = await self._refresh(job)
+                if state not in self.until_state:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.reconnect_max)
+            if self.fetch_final:
+                await self._catch_up(job, emit=job.caught_up or self.fetch_initial)
+        except Exception as exc:
+            # Hand the failure to the consumer now, not after the other jobs finish.
+            await self._queue.put(exc)
+        finally:
+            await self._emit(None)
+
+    async def __aiter__(self) -> AsyncIterator[LogEvent]:
+        self._queue = asyncio.Queue()
+        if self._async_jobs is None:
+            self._async_jobs, self._async_http = _async_jobs_for(self.client)
+        self._tasks = [asyncio.create_task(self._follow(job)) for job in self.jobs.values()]
+        remaining = len(self._tasks)
+        try:
+            while remaining:
+                event = await self._queue.get()
+                if event is None:
+                    remaining -= 1
+                    continue
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+        finally:
+            await self.close()
+
+    async def run(self, on_event: Callable[[LogEvent], None]) -> None:
+        """Follow every job, calling *on_event* for each line and state change."""
+        async for event in self:
+            on_event(event)
+
+    async def close(self) -> None:
+        """Stop following all jobs."""
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        async_http, self._async_http = self._async_http, None
+        if async_http is not None:
+            self._async_jobs = None
+        await _close_quietly(async_http, "aclose")
+        await _close_quietly(self.archive, "aflush")
@@ -0,0 +1,56 @@
+"""Client-side request pacing shared by batch operations."""
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` requests per second, bursts of ``burst``.
+
+    ``pause`` holds every caller back until a deadline, which is how a
+    ``429 Retry-After`` from one worker slows the whole batch instead of
+    just the request that hit it. With ``rate=None`` requests are not paced
+    and the bucket only acts as that shared pause gate.
+    """
+
+    def __init__(self, rate: float | None, burst: int | None = None):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate) if rate is not None else None
+        self.burst = max(1, int(burst if burst is not None else rate or 1))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token if one is available, else return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self.rate is None:
+                return 0.0
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            delay = self._reserve()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for *seconds* (extends, never shortens)."""
+        with self._lock:
+            until = time.monotonic() + max(0.0, seconds)
+            self._paused_until = max(self._paused_until, until)
+            self._updated = max(self._updated, self._paused_until)
+            self._tokens = 0.0
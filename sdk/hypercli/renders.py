@@ -1,16 +1,120 @@
 from __future__ import annotations
 
 """Renders API"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import time
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List
 
 if TYPE_CHECKING:
-    from .http import HTTPClient
+    from .http import HTTPClient, AsyncHTTPClient
 from .http import APIError
 
 
+TERMINAL_RENDER_STATES = frozenset({"completed", "failed", "cancelled"})
+
+# Adaptive polling: short renders are seen almost as soon as they finish,
+# long ones settle at one request per WAIT_MAX_INTERVAL.
+WAIT_INITIAL_INTERVAL = 0.5
+WAIT_MAX_INTERVAL = 5.0
+WAIT_BACKOFF = 1.5
+WAIT_MANY_CONCURRENCY = 8
+
+
+def poll_intervals(
+    poll_interval: float | None = None,
+    *,
+    initial: float = WAIT_INITIAL_INTERVAL,
+    maximum: float = WAIT_MAX_INTERVAL,
+    factor: float = WAIT_BACKOFF,
+) -> Iterator[float]:
+    """Yield sleep intervals: fixed when ``poll_interval`` is given, else a backoff."""
+    if poll_interval is not None:
+        while True:
+            yield poll_interval
+    delay = initial
+    while True:
+        yield delay
+        delay = min(maximum, delay * factor)
+
+
+def _subscription_allows(auth_me: dict[str, Any], family: str, resource: str | None = None) -> bool:
+    capabilities = set(auth_me.get("capabilities") or [])
+    if f"{family}:*" in capabilities:
+        return True
+    if resource and f"{family}:{resource}" in capabilities:
+        return True
+    if not auth_me.get("has_active_subscription"):
+        return False
+    if auth_me.get("auth_type") == "user":
+        return True
+    return False
+
+
+def _is_terminal(render: "Render") -> bool:
+    return (render.state or "").lower() in TERMINAL_RENDER_STATES
+
+
+class _RenderDeadline:
+    """Wait deadline with one queue grace window and one active-runtime grace window."""
+
+    def __init__(
+        self,
+        render_id: str,
+        now: float,
+        timeout: float,
+        queue_grace: float,
+        active_grace: float,
+    ):
+        self.render_id = render_id
+        self.timeout = timeout
+        self.queue_grace = queue_grace
+        self.active_grace = active_grace
+        self.deadline = now + timeout
+        self.queue_grace_used = False
+        self.active_grace_used = False
+
+    def check(self, render: "Render", now: float) -> None:
+        """Extend the deadline once per grace window; raise TimeoutError when spent."""
+        if now < self.deadline:
+            return
+        started_at = Renders._parse_render_timestamp(render.started_at)
+        if not self.queue_grace_used and started_at is None:
+            self.queue_grace_used = True
+            self.deadline = now + self.queue_grace
+        elif not self.active_grace_used and started_at is not None:
+            self.active_grace_used = True
+            self.deadline = max(self.deadline, started_at + self.active_grace)
+        else:
+            raise TimeoutError(
+                f"Render {self.render_id} did not complete within {self.timeout:.0f}s "
+                f"(+{self.queue_grace:.0f}s queue grace, +{self.active_grace:.0f}s active grace); "
+                f"last_render={render}"
+            )
+
+
+def _still_waiting(
+    pending: list[str],
+    latest: dict[str, "Render"],
+    deadlines: dict[str, _RenderDeadline],
+    now: float,
+) -> list[str]:
+    """Drop renders that finished or ran out of time from one ``wait_many`` round."""
+    remaining = []
+    for render_id in pending:
+        render = latest[render_id]
+        if _is_terminal(render):
+            continue
+        try:
+            deadlines[render_id].check(render, now)
+        except TimeoutError:
+            continue
+        remaining.append(render_id)
+    return remaining
+
+
 @dataclass
 class Render:
     render_id: str
@@ -90,16 +194,7 @@ class Renders:
             auth_me = self._auth_me()
         except APIError:
             return False
-        capabilities = set(auth_me.get("capabilities") or [])
-        if f"{family}:*" in capabilities:
-            return True
-        if resource and f"{family}:{resource}" in capabilities:
-            return True
-        if not auth_me.get("has_active_subscription"):
-            return False
-        if auth_me.get("auth_type") == "user":
-            return True
-        return False
+        return _subscription_allows(auth_me, family, resource)
 
     def _post_flow(self, flow_type: str, payload: dict[str, Any]) -> dict[str, Any]:
         primary = f"/agents/flow/{flow_type}" if self._supports_subscription_family("flows", flow_type) else f"/api/flow/{flow_type}"
@@ -202,7 +297,7 @@ class Renders:
         self,
         render_id: str,
         timeout: float = DEFAULT_WAIT_TIMEOUT,
-        poll_interval: float = 5.0,
+        poll_interval: float | None = None,
         queue_grace: float = DEFAULT_QUEUE_GRACE,
         active_grace: float = DEFAULT_ACTIVE_GRACE,
     ) -> Render:
@@ -211,36 +306,62 @@ class Renders:
         This tolerates long queue times in shared dev environments by granting
         one bounded queue grace window and one bounded active-runtime grace
         window when the render only starts near the original deadline.
-        """
-        deadline = time.time() + timeout
-        queue_grace_used = False
-        active_grace_used = False
-        last_render: Render | None = None
 
+        By default the render is polled at ``WAIT_INITIAL_INTERVAL`` backing off
+        to ``WAIT_MAX_INTERVAL``, so quick renders return within a fraction of
+        a second; pass ``poll_interval`` for a fixed cadence.
+        """
+        deadline = _RenderDeadline(render_id, time.time(), timeout, queue_grace, active_grace)
+        delays = poll_intervals(poll_interval)
         while True:
             render = self.get(render_id)
-            last_render = render
-            state = (render.state or "").lower()
-            if state in {"completed", "failed", "cancelled"}:
+            if _is_terminal(render):
                 return render
+            deadline.check(render, time.time())
+            time.sleep(next(delays))
+
+    def wait_many(
+        self,
+        render_ids: Iterable[str],
+        timeout: float = DEFAULT_WAIT_TIMEOUT,
+        poll_interval: float | None = None,
+        queue_grace: float = DEFAULT_QUEUE_GRACE,
+        active_grace: float = DEFAULT_ACTIVE_GRACE,
+        *,
+        concurrency: int = WAIT_MANY_CONCURRENCY,
+    ) -> list[Render]:
+        """Wait for several renders in one polling loop.
+
+        Each round fetches every unfinished render (``concurrency`` at a time)
+        and sleeps once, on the same schedule as ``wait``. Deadlines and grace
+        windows apply per render.
 
-            now = time.time()
-            if now >= deadline:
-                started_at = self._parse_render_timestamp(render.started_at)
-                if not queue_grace_used and started_at is None:
-                    queue_grace_used = True
-                    deadline = now + queue_grace
-                elif not active_grace_used and started_at is not None:
-                    active_grace_used = True
-                    deadline = max(deadline, started_at + active_grace)
-                else:
-                    raise TimeoutError(
-                        f"Render {render_id} did not complete within {timeout:.0f}s "
-                        f"(+{queue_grace:.0f}s queue grace, +{active_grace:.0f}s active grace); "
-                        f"last_render={last_render}"
-                    )
-
-            time.sleep(poll_interval)
+        Returns:
+            The last ``Render`` seen for each ID, in input order. A render that
+            runs past its deadline is returned in its non-terminal state rather
+            than raising, so check ``state`` on the results.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        ids = list(render_ids)
+        now = time.time()
+        deadlines = {
+            render_id: _RenderDeadline(render_id, now, timeout, queue_grace, active_grace)
+            for render_id in ids
+        }
+        latest: dict[str, Render] = {}
+        pending = list(deadlines)
+        if not pending:
+            return []
+        delays = poll_intervals(poll_interval)
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(pending))) as pool:
+            while True:
+                latest.update(zip(pending, pool.map(self.get, pending)))
+                pending = _still_waiting(pending, latest, deadlines, time.time())
+                if not pending:
+                    break
+                time.sleep(next(delays))
+        return [latest[render_id] for render_id in ids]
 
     # =========================================================================
     # Flow endpoints - simplified interfaces
@@ -557,3 +678,104 @@ class Renders:
             use_xvector_only=use_xvector_only,
             notify_url=notify_url,
         )
+
+
+class AsyncRenders:
+    """Async render status and completion waiting for async applications.
+
+    Covers lookup, cancellation and waiting; create renders with ``Renders``
+    or the flow endpoints and hand the IDs here.
+    """
+
+    DEFAULT_WAIT_TIMEOUT = Renders.DEFAULT_WAIT_TIMEOUT
+    DEFAULT_QUEUE_GRACE = Renders.DEFAULT_QUEUE_GRACE
+    DEFAULT_ACTIVE_GRACE = Renders.DEFAULT_ACTIVE_GRACE
+
+    def __init__(self, http: "AsyncHTTPClient", auth_http: "AsyncHTTPClient" | None = None):
+        self._http = http
+        self._auth_http = auth_http or http
+        self._auth_me_cache: dict[str, Any] | None = None
+
+    async def _supports_subscription_family(self, family: str) -> bool:
+        if self._auth_me_cache is None:
+            try:
+                self._auth_me_cache = await self._auth_http.get("/api/auth/me")
+            except APIError:
+                return False
+        return _subscription_allows(self._auth_me_cache, family)
+
+    async def _render_request(self, method: str, render_id: str, suffix: str = "") -> Any:
+        call = getattr(self._http, method)
+        if await self._supports_subscription_family("flows"):
+            try:
+                return await call(f"/agents/flow/renders/{render_id}{suffix}")
+            except APIError as exc:
+                if exc.status_code not in {403, 404}:
+                    raise
+        return await call(f"/api/flow/renders/{render_id}{suffix}")
+
+    async def get(self, render_id: str) -> Render:
+        """Get render details"""
+        return Render.from_dict(await self._render_request("get", render_id))
+
+    async def status(self, render_id: str) -> RenderStatus:
+        """Get render status (lightweight polling endpoint)"""
+        return RenderStatus.from_dict(await self._render_request("get", render_id, "/status"))
+
+    async def cancel(self, render_id: str) -> dict:
+        """Cancel a render"""
+        return await self._render_request("delete", render_id)
+
+    async def wait(
+        self,
+        render_id: str,
+        timeout: float = DEFAULT_WAIT_TIMEOUT,
+        poll_interval: float | None = None,
+        queue_grace: float = DEFAULT_QUEUE_GRACE,
+        active_grace: float = DEFAULT_ACTIVE_GRACE,
+    ) -> Render:
+        """Wait for a render to reach a terminal state. Same contract as ``Renders.wait``."""
+        deadline = _RenderDeadline(render_id, time.time(), timeout, queue_grace, active_grace)
+        delays = poll_intervals(poll_interval)
+        while True:
+            render = await self.get(render_id)
+            if _is_terminal(render):
+                return render
+            deadline.check(render, time.time())
+            await asyncio.sleep(next(delays))
+
+    async def wait_many(
+        self,
+        render_ids: Iterable[str],
+        timeout: float = DEFAULT_WAIT_TIMEOUT,
+        poll_interval: float | None = None,
+        queue_grace: float = DEFAULT_QUEUE_GRACE,
+        active_grace: float = DEFAULT_ACTIVE_GRACE,
+        *,
+        concurrency: int = WAIT_MANY_CONCURRENCY,
+    ) -> list[Render]:
+        """Wait for several renders in one polling loop. Same contract as ``Renders.wait_many``."""
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        ids = list(render_ids)
+        now = time.time()
+        deadlines = {
+            render_id: _RenderDeadline(render_id, now, timeout, queue_grace, active_grace)
+            for render_id in ids
+        }
+        latest: dict[str, Render] = {}
+        pending = list(deadlines)
+        gate = asyncio.Semaphore(concurrency)
+
+        async def fetch(render_id: str) -> Render:
+            async with gate:
+                return await self.get(render_id)
+
+        delays = poll_intervals(poll_interval)
+        while pending:
+            renders = await asyncio.gather(*(fetch(render_id) for render_id in pending))
+            latest.update(zip(pending, renders))
+            pending = _still_waiting(pending, latest, deadlines, time.time())
+            if pending:
+                await asyncio.sleep(next(delays))
+        return [latest[render_id] for render_id in ids]
@@ -0,0 +1,83 @@
+"""Content-addressed cache of uploaded files, kept under ~/.hypercli."""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .config import CONFIG_DIR
+
+
+UPLOAD_CACHE_FILE = CONFIG_DIR / "upload-cache.json"
+DEFAULT_UPLOAD_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+
+class UploadCache:
+    """Map upload keys (account scope, sha256, type, name) to uploaded ``File`` records.
+
+    Entries older than ``ttl`` seconds are dropped on lookup. The cache only
+    remembers what was uploaded; ``Files`` confirms a cached file still exists
+    before handing it back. The JSON file is rewritten atomically, so
+    concurrent processes can share it at worst losing each other's newest
+    entries.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = UPLOAD_CACHE_FILE,
+        ttl: float = DEFAULT_UPLOAD_CACHE_TTL_SECONDS,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, entries: dict[str, dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(entries))
+        os.replace(tmp, self.path)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached ``File`` payload for *key*, or None if absent/expired."""
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if not isinstance(entry, dict):
+                return None
+            if time.time() - float(entry.get("stored_at", 0)) > self.ttl:
+                del entries[key]
+                self._save(entries)
+                return None
+            return entry.get("file")
+
+    def put(self, key: str, file: dict[str, Any]) -> None:
+        with self._lock:
+            entries = self._load()
+            now = time.time()
+            entries = {
+                k: v
+                for k, v in entries.items()
+                if isinstance(v, dict) and now - float(v.get("stored_at", 0)) <= self.ttl
+            }
+            entries[key] = {"file": file, "stored_at": now}
+            self._save(entries)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._save(entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,123 @@
+import time
+
+import pytest
+
+from hypercli.agent_index import AgentIndex
+from hypercli.agents import Agent, DeploymentEvent, Deployments
+from hypercli.http import APIError
+
+
+ALPHA = "11111111-1111-4111-8111-111111111111"
+ALPINE = "22222222-2222-4222-8222-222222222222"
+BETA = "33333333-3333-4333-8333-333333333333"
+
+
+def _agent_data(agent_id, name, handle=None, state="RUNNING"):
+    return {
+        "id": agent_id,
+        "user_id": "user-1",
+        "name": name,
+        "handle": handle,
+        "hostname": f"{name}.agents.example.test",
+        "state": state,
+    }
+
+
+FLEET = [
+    _agent_data(ALPHA, "alpha", "al"),
+    _agent_data(ALPINE, "alpine"),
+    _agent_data(BETA, "beta", "bee"),
+]
+
+
+def make_deployments(tmp_path, fleet=FLEET):
+    calls = []
+    index = AgentIndex(tmp_path / "agents.json")
+    deployments = Deployments(
+        object(), api_key="sk-hyper-test", api_base="https://api.example.test", agent_index=index
+    )
+
+    def fake_get(path, params=None):
+        calls.append((path, params))
+        agent_id = path.rsplit("/", 1)[-1]
+        if agent_id.count("-") == 4:
+            for item in fleet:
+                if item["id"] == agent_id:
+                    return item
+            raise APIError(404, "not found")
+        params = params or {}
+        return {
+            "items": [
+                item
+                for item in fleet
+                if all(item.get(key) == value for key, value in params.items())
+            ]
+        }
+
+    deployments._get = fake_get
+    return deployments, index, calls
+
+
+def test_resolve_uses_name_filter_then_cache_without_listing(tmp_path):
+    deployments, index, calls = make_deployments(tmp_path)
+
+    assert deployments.resolve_agent_id("alpha") == ALPHA
+    assert [params for _, params in calls] == [{"name": "alpha"}]
+
+    calls.clear()
+    assert deployments.resolve_agent_id("alpha") == ALPHA
+    assert calls == []
+
+    # A fresh process reads the same answer back from disk.
+    reopened = AgentIndex(tmp_path / "agents.json")
+    assert reopened.match("alpha") == [ALPHA]
+
+
+def test_prefix_needs_full_listing_and_then_resolves_from_cache(tmp_path):
+    deployments, index, calls = make_deployments(tmp_path)
+
+    assert deployments.resolve_agent_id("be") == BETA
+    assert [params for _, params in calls] == [{"name": "be"}, {"handle": "be"}, {}]
+    assert index.fresh
+
+    calls.clear()
+    assert deployments.resolve_agent_id("bee") == BETA
+    with pytest.raises(ValueError, match="ambiguous"):
+        deployments.resolve_agent_id("alp")
+    # "alp" is ambiguous in the cache, so it was re-checked against the server.
+    assert [params for _, params in calls][:2] == [{"name": "alp"}, {"handle": "alp"}]
+
+
+def test_resolve_agent_drops_cached_entry_for_deleted_agent(tmp_path):
+    fleet = [dict(item) for item in FLEET]
+    deployments, index, calls = make_deployments(tmp_path, fleet)
+    assert deployments.resolve_agent_id("beta") == BETA
+
+    # beta is deleted elsewhere and the name is reused by a new agent.
+    fleet[2] = _agent_data("44444444-4444-4444-8444-444444444444", "beta")
+    agent = deployments.resolve_agent("beta")
+
+    assert agent.id == "44444444-4444-4444-8444-444444444444"
+    assert index.match("beta") == [agent.id]
+
+
+def test_agent_index_tracks_events_and_ttl(tmp_path):
+    index = AgentIndex(ttl=60)
+    index.replace(
+        [
+            Agent(id=ALPHA, user_id="u", name="alpha", state="RUNNING"),
+            Agent(id=BETA, user_id="u", name="beta", state="RUNNING"),
+        ]
+    )
+    assert index.match("a") == [ALPHA]
+
+    index.apply_event(DeploymentEvent(type="deployment.transition", agent_id=ALPHA, state="STOPPED"))
+    index.apply_event(DeploymentEvent(type="deployment.transition", agent_id=BETA, state="DELETED"))
+    assert index.match("alpha") == [ALPHA]
+    assert index.match("beta") == []
+
+    index.synced_at = time.time() - 120
+    assert index.match("al") == []  # prefixes need a fresh listing
+    assert index.match("alpha") == [ALPHA]  # exact names seen recently still count
+    index.invalidate()
+    assert not index.fresh
@@ -87,7 +87,7 @@ def test_attach_slack_relay_agent_resolves_name_and_posts_to_relay(monkeypatch):
             }
 
     class FakeClient:
-        def __init__(self, timeout):
+        def __init__(self, timeout, **_kwargs):
             self.timeout = timeout
 
         def __enter__(self):
@@ -96,7 +96,8 @@ def test_attach_slack_relay_agent_resolves_name_and_posts_to_relay(monkeypatch):
         def __exit__(self, *exc):
             return None
 
-        def post(self, url, headers=None, json=None):
+        def post(self, url, headers=None, json=None, timeout=None):
+            assert timeout == 30
             calls.append((url, headers, json))
             return FakeResponse()
 
@@ -140,7 +141,7 @@ def test_list_slack_directory_conversations_and_users(monkeypatch):
             return self._payload
 
     class FakeClient:
-        def __init__(self, timeout):
+        def __init__(self, timeout, **_kwargs):
             self.timeout = timeout
 
         def __enter__(self):
@@ -149,7 +150,8 @@ def test_list_slack_directory_conversations_and_users(monkeypatch):
         def __exit__(self, *exc):
             return None
 
-        def get(self, url, headers=None, params=None):
+        def get(self, url, headers=None, params=None, timeout=None):
+            assert timeout == 30
             calls.append((url, headers, params))
             if url.endswith("/slack/directory/conversations"):
                 return FakeResponse({
@@ -0,0 +1,124 @@
+import csv
+import sys
+
+import pytest
+
+from hypercli.agent_metrics import (
+    MetricRing,
+    MetricsCollector,
+    parse_cpu_quantity,
+    parse_memory_quantity,
+)
+from hypercli.agents import Agent
+
+
+def test_parse_quantities():
+    assert parse_cpu_quantity("250m") == pytest.approx(0.25)
+    assert parse_cpu_quantity("2") == 2.0
+    assert parse_cpu_quantity("1500000n") == pytest.approx(0.0015)
+    assert parse_memory_quantity("128Mi") == 128 * 2**20
+    assert parse_memory_quantity("1G") == 10**9
+    assert parse_memory_quantity("4096") == 4096
+    with pytest.raises(ValueError):
+        parse_cpu_quantity("1Gi")
+    with pytest.raises(ValueError):
+        parse_memory_quantity("lots")
+
+
+def test_metric_ring_wraps_and_computes_window_statistics():
+    ring = MetricRing(4)
+    for second in range(6):
+        ring.append(float(second), float(second * 10))
+
+    assert len(ring) == 4
+    assert list(ring.values()) == [20.0, 30.0, 40.0, 50.0]
+    assert list(ring.times(2)) == [4.0, 5.0]
+    assert ring.latest == 50.0
+    assert ring.percentile(50) == 35.0
+    assert ring.percentile(100, window=2) == 50.0
+    assert ring.rate() == 10.0
+    assert MetricRing(2).rate() is None
+
+
+class FakeDeployments:
+    def __init__(self, samples):
+        self.samples = samples
+        self.list_calls = 0
+
+    def list(self, state=None):
+        self.list_calls += 1
+        return [Agent(id=agent_id, user_id="u", state=state) for agent_id in self.samples]
+
+    def metrics(self, agent_id):
+        sample = self.samples[agent_id].pop(0)
+        if isinstance(sample, Exception):
+            raise sample
+        return {"event": "agent_metrics_result", "ok": True, **sample}
+
+
+@pytest.mark.asyncio
+async def test_collector_samples_fleet_and_ranks_agents(tmp_path):
+    deployments = FakeDeployments(
+        {
+            "a-1": [
+                {"cpu": "100m", "memory": "100Mi", "timestamp": 1000},
+                {"cpu": "300m", "memory": "110Mi", "timestamp": 1010},
+            ],
+            "b-2": [
+                {"cpu": "50m", "memory": "1Gi", "timestamp": 1000},
+                RuntimeError("socket closed"),
+            ],
+        }
+    )
+    collector = MetricsCollector(deployments, interval=0.01, discover_interval=3600)
+
+    rounds = [count async for count in collector.run(rounds=2)]
+
+    assert rounds == [1, 2]
+    assert deployments.list_calls == 1
+    assert [row.agent_id for row in collector.top(by="cpu")] == ["a-1", "b-2"]
+    assert [row.agent_id for row in collector.top(by="memory", limit=1)] == ["b-2"]
+
+    a = collector.summary("a-1")
+    assert a.cpu == pytest.approx(0.3)
+    assert a.cpu_p50 == pytest.approx(0.2)
+    assert a.memory_rate == pytest.approx(2**20)
+    b = collector.summary("b-2")
+    assert (b.samples, b.errors, b.last_error) == (1, 1, "socket closed")
+
+    path = tmp_path / "metrics.csv"
+    assert collector.to_csv(path) == 3
+    with path.open() as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows[1] == {
+        "agent_id": "a-1",
+        "timestamp": "1010.0",
+        "cpu_cores": "0.3",
+        "memory_bytes": str(110 * 2**20),
+    }
+
+
+def test_parquet_export_names_the_extra_when_pyarrow_is_missing(monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match=r"hypercli-sdk\[parquet\]"):
+        MetricsCollector(FakeDeployments({})).to_parquet(tmp_path / "metrics.parquet")
+
+
+@pytest.mark.asyncio
+async def test_collector_drops_agents_that_stop_running_from_top():
+    sample = {"cpu": "100m", "memory": "64Mi"}
+    deployments = FakeDeployments({"a-1": [sample] * 3, "b-2": [sample] * 3})
+    collector = MetricsCollector(deployments, interval=0.01, discover_interval=0)
+
+    await collector.sample_once()
+    del deployments.samples["b-2"]
+    deployments.samples["c-3"] = [sample]
+    await collector.sample_once()
+
+    assert [row.agent_id for row in collector.top()] == ["a-1", "c-3"]
+    assert [row.agent_id for row in collector.top(include_inactive=True)] == ["a-1", "b-2", "c-3"]
+    assert collector.summary("b-2").active is False
+    assert set(collector.agents) == {"a-1", "b-2", "c-3"}
+    with pytest.raises(KeyError):
+        collector.summary("never-seen")
+    assert "never-seen" not in collector
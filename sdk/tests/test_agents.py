@@ -6,10 +6,13 @@ import copy
 import asyncio
 import json
 import os
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, call, patch
 
+import httpx
 import pytest
 
 from hypercli.agents import (
@@ -25,12 +28,15 @@ from hypercli.agents import (
     AgentCapacity,
     AgentLaunchValueMutation,
     AgentRoutes,
+    AsyncDeployments,
     DEFAULT_AGENT_RUNTIME_SCOPES,
     DEFAULT_OPENCLAW_IMAGE,
     DEFAULT_OPENCLAW_PRO_IMAGE,
     DEFAULT_OPENCLAW_SYNC_EXCLUDE,
     DeploymentEvent,
+    DeploymentEventBus,
     Deployments,
+    agent_selector,
     OpenClawAgent,
     OpenClawProAgent,
     ExecResult,
@@ -431,6 +437,470 @@ async def test_wait_running_reconciles_when_transition_event_is_missed(monkeypat
     assert agent.launch_epoch == 10
 
 
+@pytest.mark.asyncio
+async def test_concurrent_waits_share_one_subscription_and_skip_non_settling_events(monkeypatch):
+    http = MagicMock(spec=HTTPClient)
+    http.api_key = "hyper_api_test"
+    deployments = Deployments(http)
+    agent_ids = [f"agent-{n}" for n in range(20)]
+    states = {agent_id: "STARTING" for agent_id in agent_ids}
+    fetches: list[str] = []
+    subscriptions = 0
+    ready = asyncio.Event()
+
+    def get(agent_id):
+        fetches.append(agent_id)
+        return Agent.from_dict({"id": agent_id, "state": states[agent_id]})
+
+    async def subscribe(handler, **kwargs):
+        nonlocal subscriptions
+        subscriptions += 1
+        await ready.wait()
+        for agent_id in agent_ids:
+            handler(DeploymentEvent("deployment.transition", agent_id, state="STARTING"))
+            states[agent_id] = "RUNNING"
+            handler(DeploymentEvent("deployment.transition", agent_id, state="RUNNING"))
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(deployments, "get", get)
+    monkeypatch.setattr(deployments, "subscribe", subscribe)
+
+    async def release_after_first_reads():
+        while len(fetches) < len(agent_ids):
+            await asyncio.sleep(0)
+        ready.set()
+
+    agents, _ = await asyncio.gather(
+        asyncio.gather(
+            *(deployments.wait_running_async(agent_id, timeout=1) for agent_id in agent_ids)
+        ),
+        release_after_first_reads(),
+    )
+
+    assert [agent.state for agent in agents] == ["RUNNING"] * len(agent_ids)
+    assert subscriptions == 1
+    assert len(fetches) == 2 * len(agent_ids)
+    assert not deployments.event_bus().running
+
+
+@pytest.mark.asyncio
+async def test_event_bus_fans_out_bounds_queues_replays_and_resyncs():
+    dispatch = {}
+    stop = asyncio.Event()
+
+    async def subscribe(handler, *, on_ready):
+        dispatch["handler"], dispatch["ready"] = handler, on_ready
+        await stop.wait()
+
+    bus = DeploymentEventBus(subscribe, queue_size=2)
+    one = bus.subscribe("agent-1")
+    everyone = bus.subscribe()
+    seen: list[str] = []
+    remove = bus.add_handler(lambda event: seen.append(event.state), agent_ids="agent-2")
+    await asyncio.sleep(0)
+    dispatch["ready"]()
+
+    for state in ("STARTING", "RUNNING", "STOPPING"):
+        dispatch["handler"](DeploymentEvent("deployment.transition", "agent-1", state=state))
+    dispatch["handler"](DeploymentEvent("deployment.transition", "agent-2", state="RUNNING"))
+
+    assert [event.state for event in one.drain()] == ["RUNNING", "STOPPING"]
+    assert one.dropped == 1
+    assert [event.agent_id for event in everyone.drain()] == ["agent-1", "agent-2"]
+    assert seen == ["RUNNING"]
+
+    late = bus.subscribe(["agent-1"])
+    assert [event.state for event in late.drain()] == ["STOPPING"]
+
+    dispatch["ready"]()  # reconnected
+    assert [event.type for event in one.drain()] == ["deployment.resync"]
+    assert seen == ["RUNNING", None]
+
+    for subscription in (one, everyone, late):
+        subscription.close()
+    assert bus.running
+    remove()
+    assert not bus.running
+
+
+@pytest.mark.asyncio
+async def test_event_bus_keeps_async_handler_tasks_and_records_failures():
+    dispatch = {}
+
+    async def subscribe(handler, *, on_ready):
+        dispatch["handler"] = handler
+        await asyncio.Event().wait()
+
+    release = asyncio.Event()
+    handled: list[str] = []
+
+    async def handler(event):
+        await release.wait()
+        handled.append(event.state)
+        if event.state == "FAILED":
+            raise RuntimeError("handler broke")
+
+    bus = DeploymentEventBus(subscribe)
+    remove = bus.add_handler(handler)
+    await asyncio.sleep(0)
+    dispatch["handler"](DeploymentEvent("deployment.transition", "agent-1", state="RUNNING"))
+    dispatch["handler"](DeploymentEvent("deployment.transition", "agent-1", state="FAILED"))
+
+    assert len(bus._handler_tasks) == 2
+    release.set()
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert handled == ["RUNNING", "FAILED"]
+    assert not bus._handler_tasks
+    assert str(bus.handler_error) == "handler broke"
+    remove()
+    await bus.aclose()
+
+
+def test_bulk_stop_runs_concurrently_and_waits_on_one_subscription(monkeypatch):
+    http = MagicMock(spec=HTTPClient)
+    http.api_key = "hyper_api_test"
+    deployments = Deployments(http)
+    agent_ids = [f"00000000-0000-4000-8000-{n:012d}" for n in range(12)]
+    states = {agent_id: "RUNNING" for agent_id in agent_ids}
+    states[agent_ids[-1]] = "FAILED_LATER"
+    in_flight = peak = 0
+    subscriptions = gets = lists = 0
+    handlers = []
+    lock = threading.Lock()
+
+    def stop(agent_id):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        if agent_id == agent_ids[0]:
+            raise APIError(409, "conflict")
+        states[agent_id] = "STOPPING"
+        return Agent.from_dict({"id": agent_id, "state": "STOPPING"})
+
+    def get(agent_id):
+        nonlocal gets
+        gets += 1
+        return Agent.from_dict({"id": agent_id, "state": states[agent_id]})
+
+    def list_agents():
+        nonlocal lists
+        lists += 1
+        return [Agent.from_dict({"id": i, "state": st}) for i, st in states.items()]
+
+    async def subscribe(handler, **kwargs):
+        nonlocal subscriptions
+        subscriptions += 1
+        handlers.append(handler)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(deployments, "stop", stop)
+    monkeypatch.setattr(deployments, "get", get)
+    monkeypatch.setattr(deployments, "list", list_agents)
+    monkeypatch.setattr(deployments, "subscribe", subscribe)
+
+    async def scenario():
+        task = asyncio.create_task(
+            deployments.bulk_async("stop", agent_ids, concurrency=4, timeout=2, poll_interval=5)
+        )
+        while lists == 0:
+            await asyncio.sleep(0.01)
+        for agent_id in agent_ids[1:]:
+            states[agent_id] = "FAILED" if agent_id == agent_ids[-1] else "STOPPED"
+            handlers[0](DeploymentEvent("deployment.transition", agent_id, state=states[agent_id]))
+        return await task
+
+    items = asyncio.run(scenario())
+
+    assert [item.agent_id for item in items] == agent_ids
+    assert peak == 4
+    assert subscriptions == 1
+    assert lists == 1
+    assert gets == len(agent_ids) - 1
+    assert isinstance(items[0].error, APIError)
+    assert [item.state for item in items[1:-1]] == ["STOPPED"] * 10
+    assert all(item.ok for item in items[1:-1])
+    assert "FAILED" in str(items[-1].error)
+
+
+def test_bulk_start_uses_each_agent_launch_config_without_waiting(monkeypatch):
+    http = MagicMock(spec=HTTPClient)
+    http.api_key = "hyper_api_test"
+    deployments = Deployments(http)
+    started = {}
+    agents = [
+        Agent(id=f"00000000-0000-4000-8000-00000000000{n}", user_id="u", state="STOPPED",
+              launch_config={"image": f"img-{n}"})
+        for n in range(2)
+    ]
+    agents.append(Agent(id="00000000-0000-4000-8000-000000000009", user_id="u", state="STOPPED"))
+
+    def start(agent_id, launch_config):
+        started[agent_id] = launch_config
+        return Agent.from_dict({"id": agent_id, "state": "STARTING"})
+
+    monkeypatch.setattr(deployments, "start", start)
+
+    items = deployments.bulk("start", agents, wait=False)
+
+    assert [item.state for item in items[:2]] == ["STARTING", "STARTING"]
+    assert started == {agent.id: agent.launch_config for agent in agents[:2]}
+    assert "no launch configuration" in str(items[2].error)
+    with pytest.raises(ValueError, match="operation"):
+        deployments.bulk("reboot", agents)
+
+
+def test_agent_selector_matches_globbed_fields():
+    web = Agent(id="a-1", user_id="u", state="RUNNING", name="web-1", tags=["prod"])
+    worker = Agent(id="b-2", user_id="u", state="STOPPED", name="worker-1")
+
+    assert agent_selector("name=web-*")(web)
+    assert not agent_selector("name=web-*")(worker)
+    assert agent_selector("w*, state=stopped")(worker)
+    assert agent_selector("tag=pro*")(web) and not agent_selector("tag=*")(worker)
+    with pytest.raises(ValueError, match="unknown selector field"):
+        agent_selector("size=large")
+
+
+def _async_deployments_with_transport(monkeypatch, handler) -> AsyncDeployments:
+    import hypercli.http as http_module
+
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        http_module.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+    async def no_threads(*_args, **_kwargs):
+        raise AssertionError("AsyncDeployments must not offload work to threads")
+
+    monkeypatch.setattr(asyncio, "to_thread", no_threads)
+    return AsyncDeployments(
+        api_key="sk-hyper-test123",
+        api_base="https://api.test.hypercli.com",
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_deployments_list_get_and_files_without_threads(monkeypatch):
+    agent_id = "11111111-1111-1111-1111-111111111111"
+    seen: list[tuple[str, str, str]] = []
+    stored: dict[str, bytes] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.host, request.url.path))
+        path = request.url.path
+        if request.url.host == "api.test.hypercli.com":
+            assert request.headers["authorization"] == "Bearer sk-hyper-test123"
+            if path == "/agents/deployments" and request.method == "GET":
+                assert request.url.params["state"] == "RUNNING"
+                return httpx.Response(
+                    200,
+                    json={
+                        "items": [{"id": agent_id, "name": "alpha", "state": "RUNNING"}],
+                        "budget": {"max_agents": 5},
+                    },
+                )
+            if path == f"/agents/deployments/{agent_id}":
+                return httpx.Response(200, json={"id": agent_id, "state": "RUNNING"})
+            if path == f"/agents/deployments/{agent_id}/files/token":
+                return httpx.Response(
+                    200,
+                    json={
+                        "url": "https://reef.test/_reef",
+                        "token": "reef-token",
+                        "expires_at": "2099-01-01T00:00:00Z",
+                    },
+                )
+        assert request.url.host == "reef.test"
+        assert request.headers["authorization"] == "Bearer reef-token"
+        if request.method == "PUT":
+            stored[path] = request.content
+            return httpx.Response(200, json={"path": path, "size": len(request.content)})
+        if path.startswith("/_reef/directories"):
+            return httpx.Response(
+                200,
+                json={
+                    "type": "directory",
+                    "directories": [],
+                    "files": [{"name": "notes.txt", "type": "file"}],
+                },
+            )
+        return httpx.Response(200, content=stored[path], headers={"content-type": "text/plain"})
+
+    deployments = _async_deployments_with_transport(monkeypatch, handler)
+    async with deployments:
+        agents = await deployments.list(state="RUNNING")
+        assert [agent.name for agent in agents] == ["alpha"]
+        agent = await deployments.get(agent_id)
+        assert agent.state == "RUNNING"
+        assert agent._deployments is None
+
+        await deployments.file_write(agent, "notes.txt", "hello")
+        assert await deployments.file_read(agent, "notes.txt") == "hello"
+        entries = await deployments.files_list(agent)
+        assert entries[0]["name"] == "notes.txt"
+
+        assert len(deployments._clients._clients) == 2
+
+    assert deployments._clients._clients == {}
+    assert ("PUT", "reef.test", "/_reef/files/notes.txt") in seen
+
+
+@pytest.mark.asyncio
+async def test_async_deployments_stream_file_bodies(monkeypatch):
+    stored: dict[str, bytes] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "api.test.hypercli.com":
+            return httpx.Response(
+                200,
+                json={
+                    "url": "https://reef.test/_reef",
+                    "token": "reef-token",
+                    "expires_at": "2099-01-01T00:00:00Z",
+                },
+            )
+        if request.method == "PUT":
+            assert request.headers["transfer-encoding"] == "chunked"
+            stored[request.url.path] = await request.aread()
+            return httpx.Response(200, json={"status": "ok"})
+
+        async def body():
+            yield stored[request.url.path][:3]
+            yield b"!"
+
+        return httpx.Response(200, content=body())
+
+    deployments = _async_deployments_with_transport(monkeypatch, handler)
+
+    async def parts():
+        yield b"abc"
+        yield b"def"
+
+    async with deployments:
+        agent_id = "11111111-1111-1111-1111-111111111111"
+        assert await deployments.file_write_stream(agent_id, "big.bin", parts()) == {
+            "status": "ok"
+        }
+        chunks = [chunk async for chunk in deployments.file_read_stream(agent_id, "big.bin")]
+
+    assert stored == {"/_reef/files/big.bin": b"abcdef"}
+    assert b"".join(chunks) == b"abc!"
+
+
+@pytest.mark.asyncio
+async def test_async_deployments_exec_uses_async_websocket(monkeypatch):
+    from websockets.exceptions import ConnectionClosed
+    from websockets.frames import Close
+
+    agent_id = "agent-123"
+    deployments = AsyncDeployments(
+        api_key="sk-hyper-test123",
+        api_base="https://api.test.hypercli.com",
+    )
+    posted: list[str] = []
+
+    async def fake_post(path, json=None):
+        posted.append(path)
+        return {
+            "agent_id": agent_id,
+            "jwt": "exec-jwt",
+            "expires_at": "2099-01-01T00:00:00Z",
+            "ws_url": f"wss://api.test.hypercli.com/ws/exec/{agent_id}",
+        }
+
+    monkeypatch.setattr(deployments, "_post", fake_post)
+    sent: list[dict] = []
+    connected: list[str] = []
+
+    class FakeSocket:
+        def __init__(self):
+            self.frames = iter(
+                (
+                    json.dumps(
+                        {
+                            "event": "agent_exec_result",
+                            "ok": True,
+                            "exit_code": 0,
+                            "stdout": "up 1 day",
+                            "stderr": "",
+                        }
+                    ),
+                )
+            )
+
+        async def send(self, payload):
+            sent.append(json.loads(payload))
+
+        async def recv(self):
+            try:
+                return next(self.frames)
+            except StopIteration:
+                raise ConnectionClosed(Close(1000, ""), None)
+
+    class FakeConnection:
+        async def __aenter__(self):
+            return FakeSocket()
+
+        async def __aexit__(self, *_args):
+            return None
+
+    import websockets
+
+    monkeypatch.setattr(
+        websockets,
+        "connect",
+        lambda url, **_kwargs: connected.append(url) or FakeConnection(),
+    )
+
+    result = await deployments.exec(agent_id, ["uptime"], timeout=5)
+
+    assert result.stdout == "up 1 day"
+    assert posted == [f"{AGENTS_API_PREFIX}/{agent_id}/exec/token"]
+    assert connected == [f"wss://api.test.hypercli.com/ws/exec/{agent_id}?jwt=exec-jwt"]
+    assert sent == [{"command": ["uptime"], "timeout": 5, "dry_run": False}]
+
+
+@pytest.mark.asyncio
+async def test_async_deployments_wait_running_awaits_rest_directly(monkeypatch):
+    http = MagicMock(spec=HTTPClient)
+    http.api_key = "hyper_api_test"
+    sync_deployments = Deployments(http)
+    deployments = sync_deployments.async_client()
+    snapshots = iter(
+        (
+            {"id": "agent-123", "state": "STARTING", "launch_epoch": 3},
+            {"id": "agent-123", "state": "RUNNING", "launch_epoch": 3},
+        )
+    )
+
+    async def get(_value):
+        return deployments._hydrate_agent(next(snapshots))
+
+    async def subscribe(_handler, **kwargs):
+        await asyncio.Event().wait()
+
+    async def no_threads(*_args, **_kwargs):
+        raise AssertionError("AsyncDeployments must not offload work to threads")
+
+    monkeypatch.setattr(deployments, "get", get)
+    monkeypatch.setattr(deployments, "subscribe", subscribe)
+    monkeypatch.setattr(asyncio, "to_thread", no_threads)
+
+    agent = await deployments.wait_running("agent-123", timeout=0.2, poll_interval=0.01)
+
+    assert agent.state == "RUNNING"
+    assert agent._deployments is sync_deployments
+    assert deployments._api_key == "hyper_api_test"
+
+
 def _routes_response(**overrides):
     response = {
         "agent_id": "agent-123",
@@ -2512,7 +2982,7 @@ def test_agents_get_returns_generic_agent_without_gateway_metadata(agents_client
         assert agent._deployments is agents_client
 
 
-def test_agents_file_ops_mint_fresh_tokens_then_call_reef_directly(agents_client):
+def test_agents_file_ops_reuse_cached_token_then_call_reef_directly(agents_client):
     assert AGENT_FILE_MAX_BYTES == 250 * 1024 * 1024
     assert AGENT_FILE_TRANSFER_CHUNK_BYTES == 64 * 1024
 
@@ -2542,11 +3012,13 @@ def test_agents_file_ops_mint_fresh_tokens_then_call_reef_directly(agents_client
 
     token_calls = []
     reef_calls = []
+    built_clients = []
 
     class FakeClient:
-        def __init__(self, timeout=None):
-            assert timeout in (AGENT_FILE_OPERATION_TIMEOUT_SECONDS, 30.0, 10)
+        def __init__(self, timeout=None, **_kwargs):
+            assert timeout == 30.0
             self.timeout = timeout
+            built_clients.append(self)
 
         def __enter__(self):
             return self
@@ -2554,10 +3026,11 @@ def test_agents_file_ops_mint_fresh_tokens_then_call_reef_directly(agents_client
         def __exit__(self, exc_type, exc, tb):
             return False
 
-        def get(self, url, headers=None, params=None, follow_redirects=None):
+        def get(self, url, headers=None, params=None, follow_redirects=None, timeout=None):
             assert params is None
             assert headers == {"Authorization": "Bearer reef-token"}
             assert follow_redirects is False
+            assert timeout == AGENT_FILE_OPERATION_TIMEOUT_SECONDS
             reef_calls.append(("GET", url))
             if url == "https://agent.example.test/_reef/directories":
                 return FakeResponse(
@@ -2614,11 +3087,13 @@ def test_agents_file_ops_mint_fresh_tokens_then_call_reef_directly(agents_client
                 )
             raise AssertionError(url)
 
-        def stream(self, method, url, headers=None, follow_redirects=None):
+        def stream(self, method, url, headers=None, follow_redirects=None, timeout=None):
             assert method == "GET"
-            return self.get(url, headers=headers, follow_redirects=follow_redirects)
+            return self.get(
+                url, headers=headers, follow_redirects=follow_redirects, timeout=timeout
+            )
 
-        def post(self, url, headers=None, params=None, content=None, json=None):
+        def post(self, url, headers=None, params=None, content=None, json=None, timeout=None):
             if url.endswith("/deployments/agent-123/files/token"):
                 assert headers["Authorization"] == "Bearer sk-hyper-test123"
                 assert json is None
@@ -2627,7 +3102,7 @@ def test_agents_file_ops_mint_fresh_tokens_then_call_reef_directly(agents_client
                     json_data={
                         "url": "https://agent.example.test/_reef",
                         "token": "reef-token",
-                        "expires_at": "2026-08-15T00:05:00Z",
+                        "expires_at": "2099-08-15T00:05:00Z",
                     }
                 )
             if url.endswith("/deployments/agent-123/profile-image"):
@@ -2643,7 +3118,8 @@ def test_agents_file_ops_mint_fresh_tokens_then_call_reef_directly(agents_client
                 )
             raise AssertionError(url)
 
-        def put(self, url, headers=None, content=None, follow_redirects=None):
+        def put(self, url, headers=None, content=None, follow_redirects=None, timeout=None):
+            assert timeout == AGENT_FILE_OPERATION_TIMEOUT_SECONDS
             assert url == "https://agent.example.test/_reef/files/workspace/a.txt"
             assert headers == {
                 "Authorization": "Bearer reef-token",
@@ -2654,7 +3130,8 @@ def test_agents_file_ops_mint_fresh_tokens_then_call_reef_directly(agents_client
             reef_calls.append(("PUT", url))
             return FakeResponse(json_data={"status": "ok"})
 
-        def delete(self, url, headers=None, params=None, follow_redirects=None):
+        def delete(self, url, headers=None, params=None, follow_redirects=None, timeout=None):
+            assert timeout == 10
             assert url == "https://agent.example.test/_reef/files/workspace/a.txt"
             assert headers == {"Authorization": "Bearer reef-token"}
             assert params is None
@@ -2704,8 +3181,225 @@ def test_agents_file_ops_mint_fresh_tokens_then_call_reef_directly(agents_client
         with pytest.raises(ValueError, match="sync root"):
             agents_client.file_delete(agent, "/etc/hosts")
 
-    assert len(token_calls) == 8
+    # One minted credential serves every file operation until it nears expiry.
+    assert len(token_calls) == 1
     assert all("/deployments/agent-123/files/" not in url for _, url in reef_calls)
+    # One pooled client for the API base and one for the Reef host.
+    assert len(built_clients) == 2
+
+
+def _reef_token_minter(tokens: list[str], expires_at: str = "2099-01-01T00:00:00Z"):
+    minted: list[str] = []
+
+    def fake_post(path, json=None):
+        assert path == f"{AGENTS_API_PREFIX}/agent-123/files/token"
+        minted.append(tokens[len(minted)])
+        return {
+            "url": "https://agent.example.test/_reef",
+            "token": minted[-1],
+            "expires_at": expires_at,
+        }
+
+    return fake_post, minted
+
+
+def _reef_listing_response(status_code=200):
+    response = Mock(status_code=status_code, text="")
+    response.json.return_value = (
+        {"type": "directory", "directories": [], "files": []}
+        if status_code == 200
+        else {"detail": "token expired"}
+    )
+    return response
+
+
+def test_agents_file_ops_refresh_cached_token_after_unauthorized(agents_client):
+    agents_client._post, minted = _reef_token_minter(["stale", "fresh"])
+    client = MagicMock()
+    seen_tokens: list[str] = []
+
+    def get(url, headers=None, **_kwargs):
+        token = headers["Authorization"].removeprefix("Bearer ")
+        seen_tokens.append(token)
+        return _reef_listing_response(401 if token == "stale" else 200)
+
+    client.get.side_effect = get
+    with patch("hypercli.agents.httpx.Client", return_value=client):
+        assert agents_client.files_list("agent-123") == []
+        assert agents_client.files_list("agent-123") == []
+
+    assert minted == ["stale", "fresh"]
+    assert seen_tokens == ["stale", "fresh", "fresh"]
+
+
+def test_agents_file_ops_surface_unauthorized_after_one_refresh(agents_client):
+    agents_client._post, minted = _reef_token_minter(["first", "second"])
+    client = MagicMock()
+    client.get.return_value = _reef_listing_response(401)
+
+    with patch("hypercli.agents.httpx.Client", return_value=client):
+        with pytest.raises(APIError) as excinfo:
+            agents_client.files_list("agent-123")
+
+    assert excinfo.value.status_code == 401
+    assert minted == ["first", "second"]
+
+
+def test_agents_file_ops_remint_token_near_expiry(agents_client, monkeypatch):
+    from datetime import datetime, timezone
+
+    expires_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    agents_client._post, minted = _reef_token_minter(
+        ["one", "two"], expires_at=expires_at.isoformat().replace("+00:00", "Z")
+    )
+    client = MagicMock()
+    client.get.return_value = _reef_listing_response()
+    clock = {"now": expires_at.timestamp() - 120}
+    monkeypatch.setattr("hypercli.agents.time.time", lambda: clock["now"])
+
+    with patch("hypercli.agents.httpx.Client", return_value=client):
+        agents_client.files_list("agent-123")
+        agents_client.files_list("agent-123")
+        clock["now"] = expires_at.timestamp() - 10
+        agents_client.files_list("agent-123")
+
+    assert minted == ["one", "two"]
+
+
+def test_agents_file_token_cache_mints_once_for_concurrent_callers(agents_client):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    mint_started = threading.Event()
+    release = threading.Event()
+    minted: list[str] = []
+
+    def fake_post(path, json=None):
+        minted.append(path)
+        mint_started.set()
+        release.wait(timeout=5)
+        return {
+            "url": "https://agent.example.test/_reef",
+            "token": "shared",
+            "expires_at": "2099-01-01T00:00:00Z",
+        }
+
+    agents_client._post = fake_post
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [
+            pool.submit(agents_client._reef_file_access, "agent-123") for _ in range(8)
+        ]
+        mint_started.wait(timeout=5)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert len(minted) == 1
+    assert set(results) == {("https://agent.example.test/_reef", "shared")}
+
+
+def _reef_mock_transport(monkeypatch, handler):
+    import hypercli.http as http_module
+
+    real_client = httpx.Client
+    monkeypatch.setattr(
+        http_module.httpx,
+        "Client",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+
+def test_file_read_stream_and_cp_from_do_not_buffer_whole_file(
+    agents_client, monkeypatch, tmp_path
+):
+    monkeypatch.setattr("hypercli.agents.AGENT_FILE_MAX_BYTES", 8)
+    agents_client._post, _minted = _reef_token_minter(["tok"])
+    body = [b"a" * 6, b"b" * 6, b"c" * 6]
+
+    def handler(request):
+        assert request.url.path == "/_reef/files/out/model.bin"
+        return httpx.Response(
+            200,
+            content=iter(body),
+            headers={"content-type": "application/octet-stream"},
+        )
+
+    _reef_mock_transport(monkeypatch, handler)
+
+    assert b"".join(agents_client.file_read_stream("agent-123", "out/model.bin")) == b"".join(
+        body
+    )
+    with pytest.raises(ValueError, match="reads are limited"):
+        agents_client.file_read_bytes("agent-123", "out/model.bin")
+
+    dest = agents_client.cp_from("agent-123", "out/model.bin", tmp_path / "model.bin")
+    assert dest.read_bytes() == b"".join(body)
+    assert [path.name for path in tmp_path.iterdir()] == ["model.bin"]
+
+
+def test_cp_from_leaves_no_partial_file_when_download_fails(
+    agents_client, monkeypatch, tmp_path
+):
+    agents_client._post, _minted = _reef_token_minter(["tok"])
+
+    def broken_body():
+        yield b"partial"
+        raise httpx.ReadError("connection reset")
+
+    _reef_mock_transport(monkeypatch, lambda request: httpx.Response(200, content=broken_body()))
+    dest = tmp_path / "model.bin"
+    dest.write_bytes(b"previous")
+
+    with pytest.raises(httpx.ReadError):
+        agents_client.cp_from("agent-123", "out/model.bin", dest)
+
+    assert dest.read_bytes() == b"previous"
+    assert [path.name for path in tmp_path.iterdir()] == ["model.bin"]
+
+
+def test_file_write_stream_sends_chunked_body_and_replays_seekable_source(
+    agents_client, monkeypatch, tmp_path
+):
+    agents_client._post, minted = _reef_token_minter(["stale", "fresh"])
+    received: list[tuple[str, str | None, bytes]] = []
+
+    def handler(request):
+        token = request.headers["authorization"].removeprefix("Bearer ")
+        received.append((token, request.headers.get("transfer-encoding"), request.read()))
+        if token == "stale":
+            return httpx.Response(401, json={"detail": "expired"})
+        return httpx.Response(200, json={"status": "ok"})
+
+    _reef_mock_transport(monkeypatch, handler)
+    source = tmp_path / "weights.bin"
+    source.write_bytes(b"x" * (AGENT_FILE_TRANSFER_CHUNK_BYTES + 10))
+
+    assert agents_client.cp_to("agent-123", source, "out/weights.bin") == {"status": "ok"}
+
+    assert minted == ["stale", "fresh"]
+    assert [(token, encoding) for token, encoding, _ in received] == [
+        ("stale", "chunked"),
+        ("fresh", "chunked"),
+    ]
+    assert received[-1][2] == source.read_bytes()
+
+
+def test_file_write_stream_enforces_write_cap_and_does_not_replay_iterators(
+    agents_client, monkeypatch
+):
+    monkeypatch.setattr("hypercli.agents.AGENT_FILE_WRITE_MAX_BYTES", 10)
+    agents_client._post, minted = _reef_token_minter(["stale", "fresh"])
+    _reef_mock_transport(
+        monkeypatch,
+        lambda request: httpx.Response(401 if request.read() else 200, json={"detail": "no"}),
+    )
+
+    with pytest.raises(APIError) as excinfo:
+        agents_client.file_write_stream("agent-123", "a.bin", iter([b"12345"]))
+    assert excinfo.value.status_code == 401
+    assert minted == ["stale"]
+
+    with pytest.raises(ValueError, match="writes are limited"):
+        agents_client.file_write_stream("agent-123", "a.bin", iter([b"123456", b"789012"]))
 
 
 @pytest.mark.parametrize(
@@ -2937,6 +3631,24 @@ def test_agents_list_with_capacity_preserves_envelope(agents_client):
     assert capacity.pooled_tpd == 100_000_000
 
 
+def test_deployments_reuse_pooled_client_until_closed(mock_http):
+    with patch("hypercli.agents.httpx.Client") as client_cls:
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"items": []}
+        client_cls.return_value.get.return_value = response
+
+        with Deployments(
+            http=mock_http, api_key="sk-hyper-test123", api_base="https://api.test.hypercli.com"
+        ) as deployments:
+            deployments.list()
+            deployments.list()
+
+    client_cls.assert_called_once()
+    assert client_cls.return_value.get.call_count == 2
+    client_cls.return_value.close.assert_called_once_with()
+
+
 def test_agents_capacity_fallback_excludes_archive_and_delete_states(agents_client):
     payload = {
         "items": [
@@ -2950,7 +3662,7 @@ def test_agents_capacity_fallback_excludes_archive_and_delete_states(agents_clie
         response = MagicMock()
         response.status_code = 200
         response.json.return_value = payload
-        client_cls.return_value.__enter__.return_value.get.return_value = response
+        client_cls.return_value.get.return_value = response
 
         capacity = agents_client.list_with_capacity()
 
@@ -3571,7 +4283,7 @@ def test_bootstrap_inference_uses_agents_api_and_caller_timeout(agents_client):
             timeout=120.0,
         )
 
-    mock_client_class.assert_called_once_with(timeout=120.0)
+    mock_client_class.assert_called_once()
     mock_client.post.assert_called_once_with(
         f"{agents_client._api_base}/bootstrap",
         headers=agents_client._headers,
@@ -3579,6 +4291,7 @@ def test_bootstrap_inference_uses_agents_api_and_caller_timeout(agents_client):
             "messages": messages,
             "response_format": {"type": "json_object"},
         },
+        timeout=120.0,
     )
     assert payload["model"] == "kimi-k2.6"
 
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from hypercli.agents import Agent, AsyncDeployments, Deployments, ExecResult
+from hypercli.exec_batch import ExecBatchItem, ExecSummary, fan_out
+from hypercli.jobs import Jobs
+
+AGENT_IDS = [f"00000000-0000-4000-8000-00000000000{n}" for n in range(3)]
+
+
+class ExecHTTP:
+    api_key = "hyper_api_test_key"
+    base_url = "https://api.hypercli.com"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def post(self, path, json=None):
+        job_id = path.split("/")[3]
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        if job_id == "job-boom":
+            raise RuntimeError("connection reset")
+        code = 2 if job_id == "job-bad" else 0
+        return {"job_id": job_id, "stdout": f"{job_id}\n", "stderr": "", "exit_code": code}
+
+
+def test_jobs_exec_many_bounds_concurrency_and_reports_each_target():
+    http = ExecHTTP()
+    job_ids = [f"job-{n}" for n in range(12)] + ["job-bad", "job-boom", "job-0"]
+
+    items = list(Jobs(http).exec_many(job_ids, ["true"], concurrency=4))
+
+    assert sorted(item.target for item in items) == sorted(set(job_ids))
+    assert http.peak <= 4
+    summary = ExecSummary.from_items(items)
+    assert (summary.total, summary.succeeded, summary.failed, summary.errors) == (14, 12, 1, 1)
+    assert summary.exit_codes == {0: 12, 2: 1}
+    assert not summary.ok
+    boom = next(item for item in items if item.target == "job-boom")
+    assert isinstance(boom.error, RuntimeError)
+    assert boom.exit_code is None
+
+
+def test_jobs_exec_many_validates_command_before_running():
+    with pytest.raises(ValueError):
+        Jobs(ExecHTTP()).exec_many(["job-1"], [], timeout=5)
+
+
+def test_fan_out_yields_in_completion_order_and_times_out_slow_targets():
+    release = threading.Event()
+
+    def run(target):
+        if target == "slow":
+            release.wait(5)
+        elif target == "medium":
+            time.sleep(0.05)
+        return SimpleNamespace(exit_code=0)
+
+    started = time.monotonic()
+    items = list(fan_out(run, ["slow", "medium", "fast"], concurrency=3, deadline=0.3))
+    release.set()
+
+    assert [item.target for item in items] == ["fast", "medium", "slow"]
+    assert isinstance(items[2].error, TimeoutError)
+    assert time.monotonic() - started < 2
+
+
+def test_deployments_exec_many_lists_once_to_resolve_names(monkeypatch):
+    agents = Deployments(SimpleNamespace(), api_key="sk-hyper-test")
+    listed = [
+        Agent(id=AGENT_IDS[1], user_id="u1", state="RUNNING", name="alpha"),
+        Agent(id=AGENT_IDS[2], user_id="u1", state="RUNNING", name="beta"),
+    ]
+    list_calls = []
+    monkeypatch.setattr(agents, "list", lambda **kwargs: list_calls.append(kwargs) or listed)
+    monkeypatch.setattr(
+        agents,
+        "exec",
+        lambda agent_id, command, timeout=30, dry_run=False: ExecResult(
+            exit_code=0 if agent_id != AGENT_IDS[2] else 7, stdout="", stderr=""
+        ),
+    )
+
+    items = list(agents.exec_many([AGENT_IDS[0], "alpha", "beta"], ["uptime"], concurrency=2))
+
+    assert len(list_calls) == 1
+    assert {item.target: item.exit_code for item in items} == {
+        AGENT_IDS[0]: 0,
+        AGENT_IDS[1]: 0,
+        AGENT_IDS[2]: 7,
+    }
+
+
+def test_async_deployments_exec_many_cancels_overrunning_targets(monkeypatch):
+    agents = AsyncDeployments(api_key="sk-hyper-test", api_base="https://api.hypercli.com")
+
+    async def fake_exec(agent_id, command, timeout=30, dry_run=False):
+        if agent_id == AGENT_IDS[0]:
+            await asyncio.sleep(5)
+        return ExecResult(exit_code=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr(agents, "exec", fake_exec)
+
+    async def collect():
+        return [
+            item
+            async for item in agents.exec_many(
+                AGENT_IDS, ["uptime"], concurrency=3, target_timeout=0.2
+            )
+        ]
+
+    items = asyncio.run(collect())
+
+    assert [item.target for item in items][-1] == AGENT_IDS[0]
+    assert isinstance(items[-1].error, TimeoutError)
+    assert all(isinstance(item, ExecBatchItem) and item.ok for item in items[:-1])
@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import threading
+
+import pytest
+from websockets.datastructures import Headers
+from websockets.exceptions import InvalidStatus
+from websockets.http11 import Response
+
+from hypercli.agents import AsyncExecSession, ExecSession
+
+AGENT_ID = "00000000-0000-4000-8000-000000000001"
+
+
+def _expires_in(seconds):
+    return (datetime.now(timezone.utc) + timedelta(seconds=seconds)).isoformat()
+
+
+class FakeDeployments:
+    def __init__(self, ttl=600, reject=()):
+        self.ttl = ttl
+        self.reject = set(reject)
+        self.mints = 0
+        self.sent = []
+        self.lock = threading.Lock()
+
+    def _mint_ws_token(self, agent_id, purpose):
+        assert (agent_id, purpose) == (AGENT_ID, "exec")
+        with self.lock:
+            self.mints += 1
+            jwt = f"jwt-{self.mints}"
+        return f"wss://api.test/ws/exec/{agent_id}", jwt, _expires_in(self.ttl)
+
+    def _ws_round_trip(self, url, *, purpose, request, timeout):
+        jwt = url.rsplit("jwt=", 1)[1]
+        if jwt in self.reject:
+            try:
+                raise InvalidStatus(Response(401, "Unauthorized", Headers()))
+            except InvalidStatus as exc:
+                raise RuntimeError("Agent exec WebSocket connection failed") from exc
+        with self.lock:
+            self.sent.append((jwt, request["command"]))
+        return {
+            "event": "agent_exec_result",
+            "ok": True,
+            "exit_code": 0,
+            "stdout": " ".join(request["command"]),
+            "stderr": "",
+        }
+
+
+class AsyncFakeDeployments(FakeDeployments):
+    async def _mint_ws_token(self, agent_id, purpose):
+        return FakeDeployments._mint_ws_token(self, agent_id, purpose)
+
+    async def _ws_round_trip(self, url, *, purpose, request, timeout):
+        await asyncio.sleep(0)
+        return FakeDeployments._ws_round_trip(self, url, purpose=purpose, request=request, timeout=timeout)
+
+
+def test_exec_session_reuses_one_token_and_correlates_results():
+    deployments = FakeDeployments()
+    commands = [["echo", str(n)] for n in range(20)]
+
+    with ExecSession(deployments, AGENT_ID, max_in_flight=4) as session:
+        first = session.submit(["git", "status"])
+        results = session.run_many(commands)
+        assert session.result(first).stdout == "git status"
+        assert session.pending == []
+
+    assert [result.stdout for result in results] == [f"echo {n}" for n in range(20)]
+    assert deployments.mints == session.tokens_minted == 1
+    with pytest.raises(RuntimeError):
+        session.submit(["ls"])
+
+
+def test_exec_session_refreshes_token_near_expiry_and_after_rejection():
+    deployments = FakeDeployments(ttl=10, reject={"jwt-2"})
+    session = ExecSession(deployments, AGENT_ID, refresh_margin=30)
+
+    session.run(["ls"])
+    result = session.run(["pwd"])
+    session.close()
+
+    assert result.stdout == "pwd"
+    assert deployments.mints == 3
+    assert deployments.sent == [("jwt-1", ["ls"]), ("jwt-3", ["pwd"])]
+
+
+def test_exec_session_rejects_unknown_request_ids():
+    with ExecSession(FakeDeployments(), AGENT_ID) as session:
+        with pytest.raises(KeyError):
+            session.result("missing")
+
+
+def test_async_exec_session_pipelines_over_one_token():
+    deployments = AsyncFakeDeployments(reject={"jwt-1"})
+
+    async def scenario():
+        async with AsyncExecSession(deployments, AGENT_ID, max_in_flight=3) as session:
+            return await session.run_many([["ls", str(n)] for n in range(6)])
+
+    results = asyncio.run(scenario())
+
+    assert [result.stdout for result in results] == [f"ls {n}" for n in range(6)]
+    assert deployments.mints == 2
+    assert {jwt for jwt, _ in deployments.sent} == {"jwt-2"}
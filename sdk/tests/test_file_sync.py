@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from hypercli.agents import Deployments
+from hypercli.file_sync import (
+    FileSyncEntry,
+    plan_sync,
+    run_transfers,
+    walk_local,
+    walk_remote,
+)
+from hypercli.http import APIError, HTTPClient
+
+
+def _write(path: Path, content: bytes, mtime: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    os.utime(path, (mtime, mtime))
+
+
+def _deployments() -> Deployments:
+    http = MagicMock(spec=HTTPClient)
+    http.api_key = "hyper_api_test"
+    return Deployments(http, api_base="https://api.test.hypercli.com")
+
+
+class FakeReef:
+    """In-memory Reef tree keyed by sync-root-relative path."""
+
+    def __init__(self, files: dict[str, dict] | None = None):
+        self.files = dict(files or {})
+        self.listed: list[str] = []
+        self.writes: list[str] = []
+        self.reads: list[str] = []
+        self.lock = threading.Lock()
+
+    def files_list(self, _agent, path=""):
+        self.listed.append(path)
+        prefix = f"{path}/" if path else ""
+        dirs: set[str] = set()
+        entries: list[dict] = []
+        for name, meta in self.files.items():
+            if not name.startswith(prefix):
+                continue
+            rest = name[len(prefix) :]
+            if "/" in rest:
+                dirs.add(rest.split("/", 1)[0])
+            else:
+                entries.append({"name": rest, "type": "file", **meta["listing"]})
+        if path and not dirs and not entries:
+            raise APIError(404, "not found")
+        return [{"name": d, "type": "directory"} for d in sorted(dirs)] + entries
+
+    def cp_to(self, _agent, local_path, remote_path):
+        with self.lock:
+            self.writes.append(remote_path)
+        return {"status": "ok"}
+
+    def cp_from(self, _agent, remote_path, local_path):
+        with self.lock:
+            self.reads.append(remote_path)
+        dest = Path(local_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(self.files[remote_path]["content"])
+        return dest
+
+
+def _install(deployments: Deployments, reef: FakeReef) -> None:
+    deployments.files_list = reef.files_list
+    deployments.cp_to = reef.cp_to
+    deployments.cp_from = reef.cp_from
+
+
+def test_walk_remote_recurses_and_keys_paths_relative_to_root():
+    reef = FakeReef(
+        {
+            "proj/a.txt": {"listing": {"size": 1}},
+            "proj/src/b.py": {"listing": {"size": 2, "mtime": "2026-01-01T00:00:00Z"}},
+            "other/c.txt": {"listing": {}},
+        }
+    )
+
+    entries = walk_remote(lambda path: reef.files_list(None, path), "proj")
+
+    assert set(entries) == {"a.txt", "src/b.py"}
+    assert entries["src/b.py"].size == 2
+    assert entries["src/b.py"].mtime == 1767225600.0
+    assert reef.listed == ["proj", "proj/src"]
+
+
+def test_plan_sync_skips_only_files_the_destination_can_vouch_for(tmp_path):
+    same = b"same"
+    _write(tmp_path / "unchanged.txt", same, 1000)
+    _write(tmp_path / "resized.txt", b"longer", 1000)
+    _write(tmp_path / "newer.txt", b"abc", 3000)
+    _write(tmp_path / "hashed.txt", same, 5000)
+    _write(tmp_path / "new.txt", b"n", 1000)
+    _write(tmp_path / "bare.txt", b"b", 1000)
+    remote = {
+        "unchanged.txt": FileSyncEntry("unchanged.txt", size=4, mtime=2000),
+        "resized.txt": FileSyncEntry("resized.txt", size=3, mtime=2000),
+        "newer.txt": FileSyncEntry("newer.txt", size=3, mtime=2000),
+        "hashed.txt": FileSyncEntry(
+            "hashed.txt", size=4, mtime=1, sha256=hashlib.sha256(same).hexdigest()
+        ),
+        "bare.txt": FileSyncEntry("bare.txt"),
+    }
+
+    actions = plan_sync(
+        "upload",
+        walk_local(tmp_path),
+        remote,
+        local_root=tmp_path,
+        remote_root="workspace",
+    )
+
+    reasons = {action.path: action.reason for action in actions}
+    assert reasons == {
+        "bare.txt": "unknown",
+        "hashed.txt": "unchanged",
+        "new.txt": "missing",
+        "newer.txt": "mtime",
+        "resized.txt": "size",
+        "unchanged.txt": "unchanged",
+    }
+    assert {action.destination for action in actions if action.path == "new.txt"} == {
+        "workspace/new.txt"
+    }
+
+    checksum_reasons = {
+        action.path: action.reason
+        for action in plan_sync(
+            "upload",
+            walk_local(tmp_path),
+            remote,
+            local_root=tmp_path,
+            remote_root="workspace",
+            checksum=True,
+        )
+    }
+    assert checksum_reasons["unchanged.txt"] == "unknown"
+    assert checksum_reasons["hashed.txt"] == "unchanged"
+
+
+def test_sync_to_uploads_changed_files_concurrently_and_dry_run_writes_nothing(tmp_path):
+    _write(tmp_path / "keep.txt", b"keep", 1000)
+    _write(tmp_path / "src" / "main.py", b"print()", 1000)
+    for index in range(20):
+        _write(tmp_path / "bulk" / f"{index}.txt", b"x", 1000)
+    reef = FakeReef({"proj/keep.txt": {"listing": {"size": 4, "mtime": 2000}}})
+    deployments = _deployments()
+    _install(deployments, reef)
+
+    plan = deployments.sync_to("agent-123", tmp_path, "proj", dry_run=True)
+
+    assert plan.dry_run is True
+    assert len(plan.transfers) == 21
+    assert [action.path for action in plan.skipped] == ["keep.txt"]
+    assert reef.writes == []
+
+    plan = deployments.sync_to("agent-123", tmp_path, "proj", concurrency=4)
+
+    assert sorted(reef.writes) == sorted(action.destination for action in plan.transfers)
+    assert "proj/keep.txt" not in reef.writes
+    assert "proj/src/main.py" in reef.writes
+
+
+def test_sync_to_treats_missing_remote_root_as_empty(tmp_path):
+    _write(tmp_path / "a.txt", b"a", 1000)
+    deployments = _deployments()
+    reef = FakeReef()
+    _install(deployments, reef)
+
+    plan = deployments.sync_to("agent-123", tmp_path, "fresh")
+
+    assert reef.writes == ["fresh/a.txt"]
+    assert plan.transfers[0].reason == "missing"
+
+
+def test_sync_from_downloads_changed_files_and_stamps_remote_mtime(tmp_path):
+    reef = FakeReef(
+        {
+            "proj/a.txt": {"listing": {"size": 5, "mtime": 4000}, "content": b"hello"},
+            "proj/deep/b.txt": {"listing": {"size": 3, "mtime": 4000}, "content": b"bye"},
+        }
+    )
+    deployments = _deployments()
+    _install(deployments, reef)
+
+    plan = deployments.sync_from("agent-123", "proj", tmp_path / "out")
+
+    assert sorted(reef.reads) == ["proj/a.txt", "proj/deep/b.txt"]
+    assert (tmp_path / "out" / "deep" / "b.txt").read_bytes() == b"bye"
+    assert (tmp_path / "out" / "a.txt").stat().st_mtime == 4000
+    assert len(plan.transfers) == 2
+
+    reef.reads.clear()
+    again = deployments.sync_from("agent-123", "proj", tmp_path / "out")
+
+    assert reef.reads == []
+    assert [action.reason for action in again.actions] == ["unchanged", "unchanged"]
+
+
+def test_run_transfers_bounds_workers_and_surfaces_first_failure():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    gate = threading.Barrier(3, timeout=5)
+
+    def transfer(action):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            if action < 3:
+                gate.wait()
+        finally:
+            with lock:
+                active -= 1
+
+    run_transfers(list(range(6)), transfer, concurrency=3)
+    assert peak == 3
+
+    def failing(action):
+        if action == 2:
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_transfers(list(range(5)), failing, concurrency=2)
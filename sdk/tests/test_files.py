@@ -0,0 +1,414 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from hypercli import files as files_module
+from hypercli import upload_cache as upload_cache_module
+from hypercli.files import MIN_UPLOAD_PART_SIZE, AsyncFiles, Files
+from hypercli.http import APIError, AsyncHTTPClient, HTTPClient
+from hypercli.upload_cache import UploadCache
+
+PART = MIN_UPLOAD_PART_SIZE
+
+
+def _files(handler, *, upload_cache=None, api_key="hyper_api_test") -> Files:
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    return Files(
+        HTTPClient("https://api.test.hypercli.com", api_key, session=session),
+        upload_cache=upload_cache,
+    )
+
+
+def _async_files(handler) -> AsyncFiles:
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncFiles(
+        AsyncHTTPClient("https://api.test.hypercli.com", "hyper_api_test", session=session)
+    )
+
+
+def _file_payload(**overrides) -> dict:
+    return {
+        "id": "file-1",
+        "user_id": "user-1",
+        "filename": "clip.mp4",
+        "content_type": "video/mp4",
+        "file_size": 0,
+        "url": "s3://bucket/clip.mp4",
+        "state": "done",
+        **overrides,
+    }
+
+
+class FakeUploads:
+    """Chunked upload backend recording every part it receives."""
+
+    def __init__(self, *, fail=None):
+        self.parts: dict[int, bytes] = {}
+        self.puts: list[int] = []
+        self.completed: list[dict] = []
+        self.fail = fail or {}
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/api/files/uploads":
+            body = json.loads(request.content)
+            return httpx.Response(200, json={"upload_id": "up-1", "part_size": body["part_size"]})
+        if request.method == "GET" and path == "/api/files/uploads/up-1":
+            return httpx.Response(
+                200,
+                json={"parts": [{"part_number": n, "etag": f"e{n}"} for n in sorted(self.parts)]},
+            )
+        if request.method == "PUT" and path.startswith("/api/files/uploads/up-1/parts/"):
+            number = int(path.rsplit("/", 1)[1])
+            with self.lock:
+                self.puts.append(number)
+                statuses = self.fail.get(number)
+                if statuses:
+                    return httpx.Response(statuses.pop(0), json={"detail": "part failed"})
+                self.parts[number] = request.read()
+            return httpx.Response(200, json={"part_number": number, "etag": f"e{number}"})
+        if request.method == "POST" and path == "/api/files/uploads/up-1/complete":
+            self.completed.append(json.loads(request.content))
+            size = sum(len(data) for data in self.parts.values())
+            return httpx.Response(200, json=_file_payload(file_size=size))
+        return httpx.Response(404, json={"detail": "not found"})
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(files_module.time, "sleep", lambda _seconds: None)
+
+
+def test_upload_streams_the_file_and_reports_progress(tmp_path):
+    source = tmp_path / "image.png"
+    source.write_bytes(b"x" * 200_000)
+    seen: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.read())
+        return httpx.Response(200, json=_file_payload(filename="image.png"))
+
+    progress: list[tuple[int, int]] = []
+    result = _files(handler).upload(str(source), progress=lambda sent, total: progress.append((sent, total)))
+
+    assert result.id == "file-1"
+    assert b'filename="image.png"' in seen[0]
+    assert b"image/png" in seen[0]
+    assert progress[-1] == (200_000, 200_000)
+    assert len(progress) > 1
+
+
+def test_upload_resumable_sends_parts_in_parallel_and_completes_in_order(tmp_path):
+    source = tmp_path / "clip.mp4"
+    payload = bytes(range(256)) * ((2 * PART + 1234) // 256 + 1)
+    payload = payload[: 2 * PART + 1234]
+    source.write_bytes(payload)
+    backend = FakeUploads()
+    progress: list[int] = []
+
+    result = _files(backend).upload_resumable(
+        str(source),
+        part_size=PART,
+        concurrency=3,
+        progress=lambda sent, total: progress.append(sent),
+        state_dir=tmp_path / "state",
+    )
+
+    assert result.file_size == len(payload)
+    assert b"".join(backend.parts[n] for n in sorted(backend.parts)) == payload
+    assert backend.completed == [
+        {"parts": [{"part_number": n, "etag": f"e{n}"} for n in (1, 2, 3)]}
+    ]
+    assert progress[0] == 0 and progress[-1] == len(payload)
+    assert list((tmp_path / "state").iterdir()) == []
+
+
+def test_upload_resumable_retries_transient_part_failures(tmp_path):
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"a" * (PART + 10))
+    backend = FakeUploads(fail={2: [503, 429]})
+
+    _files(backend).upload_resumable(str(source), part_size=PART, state_dir=tmp_path / "state")
+
+    assert backend.puts.count(2) == 3
+    assert sorted(backend.parts) == [1, 2]
+
+
+def test_upload_resumable_part_retries_are_not_multiplied_by_transport_retries(
+    tmp_path, monkeypatch
+):
+    from hypercli import http as http_module
+
+    monkeypatch.setattr(http_module.time, "sleep", lambda _seconds: None)
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"a" * 10)
+    backend = FakeUploads()
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PUT":
+            attempts.append(request.url.path)
+            raise httpx.ConnectError("connection refused", request=request)
+        return backend(request)
+
+    with pytest.raises(httpx.ConnectError):
+        _files(handler).upload_resumable(
+            str(source), part_size=PART, retries=2, state_dir=tmp_path / "state"
+        )
+
+    assert len(attempts) == 2
+
+
+def test_upload_resumable_resumes_after_interruption(tmp_path):
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"b" * (2 * PART + 1))
+    state_dir = tmp_path / "state"
+    backend = FakeUploads(fail={3: [400]})
+
+    with pytest.raises(APIError) as exc_info:
+        _files(backend).upload_resumable(
+            str(source), part_size=PART, concurrency=1, state_dir=state_dir
+        )
+    assert exc_info.value.status_code == 400
+    assert len(list(state_dir.iterdir())) == 1
+
+    backend.puts.clear()
+    progress: list[int] = []
+    _files(backend).upload_resumable(
+        str(source),
+        part_size=PART,
+        state_dir=state_dir,
+        progress=lambda sent, total: progress.append(sent),
+    )
+
+    assert backend.puts == [3]
+    assert progress[0] == 2 * PART
+    assert len(backend.completed) == 1
+
+
+def test_upload_resumable_falls_back_to_streamed_upload_without_session_api(tmp_path):
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"c" * (PART + 1))
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(f"{request.method} {request.url.path}")
+        if request.url.path == "/api/files/multi":
+            request.read()
+            return httpx.Response(200, json=_file_payload(file_size=PART + 1))
+        return httpx.Response(404, json={"detail": "Not Found"})
+
+    result = _files(handler).upload_resumable(
+        str(source), part_size=PART, state_dir=tmp_path / "state"
+    )
+
+    assert calls == ["POST /api/files/uploads", "POST /api/files/multi"]
+    assert result.file_size == PART + 1
+
+
+def test_upload_resumable_rejects_tiny_parts(tmp_path):
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"d")
+
+    with pytest.raises(ValueError, match="part_size"):
+        _files(lambda request: httpx.Response(500)).upload_resumable(str(source), part_size=1024)
+
+
+def _multi_handler(active: dict, *, fail_name: str):
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        try:
+            name = body.split(b'filename="', 1)[1].split(b'"', 1)[0].decode()
+            if name == fail_name:
+                return httpx.Response(413, json={"detail": "too large"})
+            return httpx.Response(200, json=_file_payload(id=f"id-{name}", filename=name))
+        finally:
+            with lock:
+                active["now"] -= 1
+
+    return handler
+
+
+def test_upload_many_keeps_input_order_and_reports_per_item_errors(tmp_path):
+    paths = []
+    for index in range(12):
+        path = tmp_path / f"ref{index}.png"
+        path.write_bytes(b"p" * index)
+        paths.append(path)
+    active = {"now": 0, "peak": 0}
+
+    items = _files(_multi_handler(active, fail_name="ref5.png")).upload_many(paths, concurrency=4)
+
+    assert [item.key for item in items] == [str(path) for path in paths]
+    assert [item.file.id for item in items if item.ok] == [
+        f"id-ref{index}.png" for index in range(12) if index != 5
+    ]
+    assert isinstance(items[5].error, APIError) and items[5].error.status_code == 413
+    assert active["peak"] <= 4
+
+
+def test_wait_ready_many_polls_the_batch_once_per_interval(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(files_module.time, "sleep", sleeps.append)
+    polls: dict[str, int] = {}
+    states = {
+        "a": ["processing", "done"],
+        "b": ["done"],
+        "c": ["processing", "failed"],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        file_id = request.url.path.rsplit("/", 1)[1]
+        if file_id == "gone":
+            return httpx.Response(404, json={"detail": "not found"})
+        polls[file_id] = polls.get(file_id, 0) + 1
+        seq = states.get(file_id, ["processing"])
+        state = seq[min(polls[file_id], len(seq)) - 1]
+        return httpx.Response(200, json=_file_payload(id=file_id, state=state, error="bad codec"))
+
+    items = _files(handler).wait_ready_many(["a", "b", "a", "c", "gone"], timeout=60, poll_interval=2)
+
+    assert [item.key for item in items] == ["a", "b", "a", "c", "gone"]
+    assert [item.ok for item in items] == [True, True, True, False, False]
+    assert "bad codec" in str(items[3].error)
+    assert items[4].error.status_code == 404
+    assert polls == {"a": 2, "b": 1, "c": 2}
+    assert sleeps == [2]
+
+
+def test_wait_ready_many_times_out_items_still_processing(monkeypatch):
+    clock = iter(range(0, 1000, 10))
+    monkeypatch.setattr(files_module.time, "time", lambda: next(clock))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=_file_payload(state="processing"))
+
+    items = _files(handler).wait_ready_many(["slow"], timeout=15, poll_interval=0)
+
+    assert isinstance(items[0].error, TimeoutError)
+    assert items[0].file.is_processing
+
+
+def test_async_upload_many_and_wait_ready_many(tmp_path, monkeypatch):
+    async def no_sleep(_seconds):
+        return None
+
+    monkeypatch.setattr(files_module.asyncio, "sleep", no_sleep)
+    paths = []
+    for index in range(5):
+        path = tmp_path / f"clip{index}.wav"
+        path.write_bytes(b"w" * 10)
+        paths.append(path)
+    polls: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        if request.method == "POST":
+            name = body.split(b'filename="', 1)[1].split(b'"', 1)[0].decode()
+            if name == "clip2.wav":
+                return httpx.Response(500, json={"detail": "boom"})
+            return httpx.Response(200, json=_file_payload(id=name, state="processing"))
+        file_id = request.url.path.rsplit("/", 1)[1]
+        polls[file_id] = polls.get(file_id, 0) + 1
+        state = "done" if polls[file_id] > 1 else "processing"
+        return httpx.Response(200, json=_file_payload(id=file_id, state=state))
+
+    async def run():
+        files = _async_files(handler)
+        uploaded = await files.upload_many(paths, concurrency=2, path="batch/1")
+        ready = await files.wait_ready_many([item.file.id for item in uploaded if item.ok])
+        return uploaded, ready
+
+    uploaded, ready = asyncio.run(run())
+
+    assert [item.ok for item in uploaded] == [True, True, False, True, True]
+    assert uploaded[2].error.status_code == 500
+    assert [item.key for item in ready] == ["clip0.wav", "clip1.wav", "clip3.wav", "clip4.wav"]
+    assert all(item.ok for item in ready)
+
+
+class FakeFileStore:
+    """Multipart upload + GET backend for upload cache tests."""
+
+    def __init__(self):
+        self.uploads = 0
+        self.gets: list[str] = []
+        self.live: dict[str, str] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST" and request.url.path == "/api/files/multi":
+            request.read()
+            self.uploads += 1
+            file_id = f"file-{self.uploads}"
+            self.live[file_id] = "done"
+            return httpx.Response(200, json=_file_payload(id=file_id))
+        file_id = request.url.path.rsplit("/", 1)[1]
+        self.gets.append(file_id)
+        if file_id not in self.live:
+            return httpx.Response(404, json={"detail": "File not found"})
+        return httpx.Response(200, json=_file_payload(id=file_id, state=self.live[file_id]))
+
+
+def test_upload_cache_reuses_identical_content_after_confirming_it_exists(tmp_path):
+    first = tmp_path / "a.png"
+    second = tmp_path / "copy" / "a.png"
+    renamed = tmp_path / "b.png"
+    second.parent.mkdir()
+    for path in (first, second, renamed):
+        path.write_bytes(b"same pixels")
+    store = FakeFileStore()
+    cache = UploadCache(tmp_path / "cache.json")
+    files = _files(store, upload_cache=cache)
+
+    uploaded = files.upload(str(first))
+    reused = files.upload(str(second))
+    from_bytes = files.upload_bytes(b"same pixels", "a.png", "image/png")
+
+    assert store.uploads == 1
+    assert uploaded.id == reused.id == from_bytes.id == "file-1"
+    assert store.gets == ["file-1", "file-1"]
+
+    # The same bytes under another name or content type are a separate upload.
+    assert files.upload(str(renamed)).id == "file-2"
+    assert files.upload_bytes(b"same pixels", "a.png", "image/webp").id == "file-3"
+
+    other_account = _files(store, upload_cache=cache, api_key="hyper_api_other")
+    assert other_account.upload(str(first)).id == "file-4"
+
+
+def test_upload_cache_reuploads_deleted_or_failed_files(tmp_path):
+    source = tmp_path / "a.wav"
+    source.write_bytes(b"audio")
+    store = FakeFileStore()
+    files = _files(store, upload_cache=UploadCache(tmp_path / "cache.json"))
+
+    files.upload(str(source))
+    del store.live["file-1"]
+    assert files.upload(str(source)).id == "file-2"
+
+    store.live["file-2"] = "failed"
+    assert files.upload(str(source)).id == "file-3"
+    assert files.upload(str(source)).id == "file-3"
+    assert store.uploads == 3
+
+
+def test_upload_cache_expires_entries(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(upload_cache_module.time, "time", lambda: now[0])
+    cache = UploadCache(tmp_path / "cache.json", ttl=60)
+    cache.put("scope:abc", _file_payload())
+
+    now[0] += 59
+    assert cache.get("scope:abc")["id"] == "file-1"
+    now[0] += 2
+    assert cache.get("scope:abc") is None
+    assert json.loads((tmp_path / "cache.json").read_text()) == {}
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from hypercli.agents import Agent, DeploymentEvent, DeploymentEventBus
+from hypercli.fleet import FleetMirror
+from hypercli.http import APIError
+
+
+class FakeDeployments:
+    def __init__(self, agents):
+        self.agents = {agent["id"]: agent for agent in agents}
+        self.list_calls = 0
+        self.get_calls: list[str] = []
+        self.dispatch = None
+        self.ready = None
+        self._bus = None
+
+    def list(self, include_deleted=None):
+        self.list_calls += 1
+        return [Agent.from_dict(data) for data in self.agents.values()]
+
+    def get(self, agent_id):
+        self.get_calls.append(agent_id)
+        if agent_id not in self.agents:
+            raise APIError(404, "not found")
+        return Agent.from_dict(self.agents[agent_id])
+
+    async def subscribe(self, handler, *, on_ready):
+        self.dispatch, self.ready = handler, on_ready
+        on_ready()
+        await asyncio.Event().wait()
+
+    def event_bus(self):
+        if self._bus is None:
+            self._bus = DeploymentEventBus(self.subscribe)
+        return self._bus
+
+
+def _agent(agent_id, name, state="RUNNING"):
+    return {"id": agent_id, "user_id": "user-1", "name": name, "state": state}
+
+
+async def _settle():
+    # REST calls from a sync client run in worker threads.
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_fleet_mirror_applies_events_without_relisting():
+    deployments = FakeDeployments([_agent("a-1", "alpha"), _agent("b-2", "beta")])
+    changes = []
+
+    async with FleetMirror(deployments) as fleet:
+        fleet.add_listener(lambda change: changes.append((change.kind, change.agent.id)))
+        await _settle()
+        original = fleet.get("alpha")
+
+        deployments.dispatch(DeploymentEvent("deployment.transition", "a-1", state="STOPPED"))
+        deployments.dispatch(DeploymentEvent("deployment.transition", "b-2", state="DELETED"))
+        deployments.agents["c-3"] = _agent("c-3", "gamma", "STARTING")
+        deployments.dispatch(DeploymentEvent("deployment.transition", "c-3", state="STARTING"))
+        await _settle()
+
+        assert fleet.get("a-1").state == "STOPPED"
+        assert original.state == "RUNNING"  # handed-out agents are not mutated
+        assert fleet.get("beta") is None
+        assert [agent.id for agent in fleet.list(state="starting")] == ["c-3"]
+        assert fleet.filter(lambda agent: agent.name.startswith("g"))[0].id == "c-3"
+
+    assert deployments.list_calls == 1
+    assert deployments.get_calls == ["c-3"]
+    assert changes == [("modified", "a-1"), ("deleted", "b-2"), ("added", "c-3")]
+
+
+@pytest.mark.asyncio
+async def test_fleet_mirror_resyncs_after_reconnect():
+    deployments = FakeDeployments([_agent("a-1", "alpha"), _agent("b-2", "beta")])
+    changes = []
+
+    async with FleetMirror(deployments) as fleet:
+        fleet.add_listener(lambda change: changes.append((change.kind, change.agent.id)))
+        await _settle()
+
+        del deployments.agents["b-2"]
+        deployments.agents["a-1"] = _agent("a-1", "alpha", "STOPPED")
+        deployments.ready()  # the event socket reconnected; events may be lost
+        await _settle()
+
+        assert deployments.list_calls == 2
+        assert [agent.state for agent in fleet.list()] == ["STOPPED"]
+        assert fleet.synced_at is not None
+
+    assert changes == [("modified", "a-1"), ("deleted", "b-2")]
@@ -1,10 +1,22 @@
+import asyncio
 import collections
 import logging
 
 import httpx
+import pytest
 
+from hypercli import HyperCLI
 from hypercli._compat import ensure_collections_compat
-from hypercli.http import APIError, _handle_bytes_response, _handle_response
+from hypercli.http import (
+    APIError,
+    AsyncHTTPClient,
+    AsyncClientPool,
+    ClientPool,
+    HTTPClient,
+    _handle_bytes_response,
+    _handle_response,
+    build_session,
+)
 
 
 def test_handle_response_logs_and_raises_api_error(caplog) -> None:
@@ -62,3 +74,109 @@ def test_ensure_collections_compat_restores_python312_aliases(monkeypatch) -> No
     ensure_collections_compat()
 
     assert collections.MutableSet is not None
+
+
+def test_http_client_routes_every_verb_through_one_pooled_session(monkeypatch) -> None:
+    seen: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path))
+        return httpx.Response(200, json={"ok": True})
+
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def fail_one_shot(*_args, **_kwargs):
+        raise AssertionError("per-request httpx.Client must not be built")
+
+    http = HTTPClient("https://api.example.test/", "key", session=session)
+    monkeypatch.setattr("hypercli.http.httpx.Client", fail_one_shot)
+
+    assert http.get("/a") == {"ok": True}
+    assert http.post("/b", json={}) == {"ok": True}
+    assert http.patch("/c", json={}) == {"ok": True}
+    assert http.delete("/d") == {"ok": True}
+    assert http.post_multipart("/e", files={"file": ("x.txt", b"x", "text/plain")}) == {"ok": True}
+    assert seen == [("GET", "/a"), ("POST", "/b"), ("PATCH", "/c"), ("DELETE", "/d"), ("POST", "/e")]
+
+    http.close()
+    assert not session.is_closed
+
+
+def test_http_client_closes_only_the_session_it_owns() -> None:
+    http = HTTPClient("https://api.example.test", "key")
+    http.close()
+    assert http._session.is_closed
+
+
+def test_build_session_http2_requires_h2(monkeypatch) -> None:
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_h2(name, *args, **kwargs):
+        if name == "h2":
+            raise ImportError("no h2")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_h2)
+    with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+        build_session(http2=True)
+
+
+def test_hypercli_namespaces_share_one_connection_pool() -> None:
+    limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+    with HyperCLI(api_key="hyper_api_test", api_url="https://api.example.test", limits=limits) as client:
+        session = client._http._session
+        assert client._agents_http._session is session
+        for namespace in (client.jobs, client.renders, client.files, client.instances, client.keys):
+            assert namespace._http is client._http
+        assert session._transport._pool._max_connections == 7
+    assert session.is_closed
+
+
+def test_async_http_client_reuses_pooled_session() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return httpx.Response(200, json={"ok": True})
+
+    async def run() -> None:
+        async with AsyncHTTPClient(
+            "https://api.example.test",
+            "key",
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as http:
+            session = http._session
+            await http.get("/a")
+            await http.post("/b", json={})
+            assert http._session is session
+        assert not session.is_closed
+        await session.aclose()
+
+    asyncio.run(run())
+    assert seen == ["GET", "POST"]
+
+
+def test_client_pool_reuses_one_client_per_origin() -> None:
+    pool = ClientPool(timeout=5.0)
+    api = pool.client("https://api.example.test/agents/deployments")
+    assert pool.client("https://API.example.test/other") is api
+    reef = pool.client("https://agent-1.example.test/_reef/files/a.txt")
+    assert reef is not api
+
+    pool.close()
+    assert api.is_closed and reef.is_closed
+    assert pool.client("https://api.example.test") is not api
+
+
+def test_async_client_pool_reuses_one_client_per_origin() -> None:
+    async def run() -> None:
+        pool = AsyncClientPool(timeout=5.0)
+        api = pool.client("https://api.example.test/agents")
+        assert pool.client("https://api.example.test/x") is api
+        assert pool.client("https://agent-1.example.test/_reef") is not api
+        await pool.aclose()
+        assert api.is_closed
+
+    asyncio.run(run())
@@ -0,0 +1,151 @@
+import threading
+
+from hypercli.job_index import JobIndex
+from hypercli.jobs import Jobs, find_job
+
+
+class FakeJobsHTTP:
+    """Newest-first paged /api/jobs backend with mutable job records."""
+
+    def __init__(self, count: int):
+        self.jobs = [
+            {
+                "job_id": f"{n:08x}-0000-0000-0000-000000000000",
+                "state": "running" if n > count - 3 else "succeeded",
+                "hostname": f"node-{n}.hypercli.test",
+                "created_at": 1_700_000_000 + n,
+            }
+            for n in range(count, 0, -1)
+        ]
+        self.pages: list[int] = []
+        self.gets: list[str] = []
+        self.base_url = "https://api.test.hypercli.com"
+        self.api_key = "hyper_api_test"
+
+    def get(self, path, params=None):
+        if path != "/api/jobs":
+            job_id = path.rsplit("/", 1)[1]
+            self.gets.append(job_id)
+            return next(job for job in self.jobs if job["job_id"] == job_id)
+        self.pages.append(params["page"])
+        size = params["page_size"]
+        start = (params["page"] - 1) * size
+        return {
+            "jobs": self.jobs[start : start + size],
+            "total_count": len(self.jobs),
+            "page": params["page"],
+            "page_size": size,
+        }
+
+
+def test_job_index_refresh_is_incremental_after_first_sync(tmp_path):
+    http = FakeJobsHTTP(450)
+    jobs = Jobs(http)
+    index = JobIndex(tmp_path / "index.json")
+
+    assert index.refresh(jobs) == 450
+    assert http.pages == [1, 2, 3, 4, 5]
+
+    http.pages.clear()
+    http.jobs.insert(
+        0,
+        {"job_id": "0000ffff-0000-0000-0000-000000000000", "state": "queued", "created_at": 1_800_000_000},
+    )
+    http.jobs[1]["state"] = "succeeded"
+
+    assert index.refresh(jobs) == 2
+    assert http.pages == [1, 2]
+
+    reopened = JobIndex(tmp_path / "index.json")
+    assert len(reopened) == 451
+    assert reopened.match_id("0000ffff") == ["0000ffff-0000-0000-0000-000000000000"]
+
+
+def test_job_index_matches_id_prefix_and_hostname_newest_first(tmp_path):
+    jobs = Jobs(FakeJobsHTTP(120))
+    index = JobIndex(tmp_path / "index.json")
+    index.refresh(jobs)
+
+    assert index.match_id("0000000") == [f"{n:08x}-0000-0000-0000-000000000000" for n in range(15, 0, -1)]
+    assert index.match_hostname("node-11") == [
+        f"{n:08x}-0000-0000-0000-000000000000" for n in (119, 118, 117, 116, 115, 114, 113, 112, 111, 110)
+    ] + ["0000000b-0000-0000-0000-000000000000"]
+    assert index.match_hostname("node-11.hypercli.test") == ["0000000b-0000-0000-0000-000000000000"]
+    assert index.match_hostname("missing") == []
+
+
+def test_job_index_resolves_live_hostnames_concurrently_and_caches_ips(tmp_path):
+    jobs = Jobs(FakeJobsHTTP(10))
+    index = JobIndex(tmp_path / "index.json", ip_ttl=60)
+    index.refresh(jobs)
+    lookups: list[str] = []
+    lock = threading.Lock()
+
+    def resolver(hostname):
+        with lock:
+            lookups.append(hostname)
+        if hostname == "node-9.hypercli.test":
+            raise OSError("NXDOMAIN")
+        return "10.0.0." + hostname.split("-")[1].split(".")[0]
+
+    assert index.match_ip("10.0.0.10", resolver=resolver) == ["0000000a-0000-0000-0000-000000000000"]
+    assert sorted(lookups) == ["node-10.hypercli.test", "node-8.hypercli.test", "node-9.hypercli.test"]
+
+    lookups.clear()
+    assert index.match_ip("10.0.0.9", resolver=resolver) == []
+    assert lookups == []
+
+
+def test_find_job_uses_index_for_hostname_lookup(tmp_path):
+    http = FakeJobsHTTP(300)
+    jobs = Jobs(http)
+    index = JobIndex(tmp_path / "index.json")
+    index.refresh(jobs)
+    http.pages.clear()
+
+    job = find_job(jobs, "node-42.hypercli.test", index=index)
+
+    assert job.job_id == "0000002a-0000-0000-0000-000000000000"
+    assert 3 not in http.pages
+    assert http.gets == ["0000002a-0000-0000-0000-000000000000"]
+
+
+def test_job_index_refresh_reaches_older_live_jobs(tmp_path):
+    http = FakeJobsHTTP(250)
+    for job in http.jobs[150:]:
+        job.update(state="queued", hostname=None)
+    jobs = Jobs(http)
+    index = JobIndex(tmp_path / "index.json")
+    index.refresh(jobs)
+    http.pages.clear()
+
+    # The oldest jobs of a sweep get their hostnames after newer ones settled.
+    http.jobs[-1].update(state="running", hostname="node-1.hypercli.test")
+
+    assert index.refresh(jobs) == 1
+    assert http.pages == [1, 2, 3]
+    assert index.match_hostname("node-1.hypercli.test") == ["00000001-0000-0000-0000-000000000000"]
+
+
+def test_find_job_falls_back_to_listing_on_index_miss(tmp_path):
+    http = FakeJobsHTTP(10)
+    jobs = Jobs(http)
+    index = JobIndex(tmp_path / "index.json")
+    index.refresh(jobs)
+    index.match_hostname = lambda hostname: []  # an index that lags the server
+
+    job = find_job(jobs, "node-4.hypercli.test", index=index)
+
+    assert job.job_id == "00000004-0000-0000-0000-000000000000"
+
+
+def test_find_job_skips_dns_for_non_ip_identifiers(tmp_path):
+    jobs = Jobs(FakeJobsHTTP(10))
+    index = JobIndex(tmp_path / "index.json")
+
+    def match_ip(ip, **kwargs):
+        raise AssertionError("resolved hostnames for a non-IP identifier")
+
+    index.match_ip = match_ip
+
+    assert find_job(jobs, "typo-host", index=index) is None
@@ -1,7 +1,25 @@
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
-from hypercli.jobs import Job, JobListPage, Jobs, get_job_tags, job_has_tags, normalize_job_tags
+import threading
+
+import pytest
+
+from hypercli.http import APIError
+from hypercli.jobs import (
+    AsyncJobs,
+    Job,
+    JobListPage,
+    Jobs,
+    LogChunk,
+    find_job,
+    job_spec_keys,
+    get_job_tags,
+    job_has_tags,
+    normalize_job_tags,
+)
 from hypercli.job.base import BaseJob
 
 
@@ -268,3 +286,249 @@ def test_job_has_tags_matches_required_subset():
     assert job.has_tags({"team": "ml"})
     assert job_has_tags(job, ["team=ml", "env=prod"])
     assert not job_has_tags(job, {"team": "ops"})
+
+
+class PagedHTTP:
+    """Serves ``total`` jobs newest-first in backend pages."""
+
+    def __init__(self, total: int, *, inserted_after_page: dict[int, int] | None = None):
+        self.ids = [f"job-{n:05d}" for n in range(total, 0, -1)]
+        self.calls: list[dict] = []
+        self.inserted_after_page = inserted_after_page or {}
+
+    def _page(self, params):
+        self.calls.append(dict(params))
+        page, size = params["page"], params["page_size"]
+        start = (page - 1) * size
+        items = [
+            {"job_id": job_id, "state": params.get("state", "succeeded")}
+            for job_id in self.ids[start : start + size]
+        ]
+        for _ in range(self.inserted_after_page.pop(page, 0)):
+            self.ids.insert(0, f"new-{len(self.ids)}")
+        return {"jobs": items, "total_count": len(self.ids), "page": page, "page_size": size}
+
+    def get(self, path, params=None):
+        return self._page(params)
+
+
+def test_jobs_iter_all_walks_every_page_and_prefetches_the_next():
+    http = PagedHTTP(250)
+    jobs = Jobs(http)
+
+    walk = jobs.iter_all(state="succeeded", tags={"team": "ml"})
+    first = next(walk)
+
+    assert first.job_id == "job-00250"
+    # Page 2 is requested while the caller is still on page 1.
+    for _ in range(500):
+        if len(http.calls) == 2:
+            break
+        time.sleep(0.01)
+    assert [call["page"] for call in http.calls] == [1, 2]
+
+    rest = list(walk)
+    assert len(rest) == 249
+    assert rest[-1].job_id == "job-00001"
+    assert [call["page"] for call in http.calls] == [1, 2, 3]
+    assert http.calls[0] == {"state": "succeeded", "tag": ["team=ml"], "page": 1, "page_size": 100}
+
+
+def test_jobs_iter_all_skips_jobs_shifted_by_new_arrivals():
+    http = PagedHTTP(150, inserted_after_page={1: 3})
+
+    ids = [job.job_id for job in Jobs(http).iter_all(page_size=100, prefetch=False)]
+
+    assert len(ids) == len(set(ids)) == 150
+    assert [call["page"] for call in http.calls] == [1, 2]
+
+
+def test_find_job_searches_past_the_first_page():
+    http = PagedHTTP(120)
+    original = http._page
+
+    def with_hostnames(params):
+        data = original(params)
+        for item in data["jobs"]:
+            item["hostname"] = f"{item['job_id']}.hypercli.test"
+        return data
+
+    http._page = with_hostnames
+
+    job = find_job(Jobs(http), "job-00003")
+
+    assert job.job_id == "job-00003"
+    assert [call["page"] for call in http.calls] == [1, 2]
+
+
+def test_find_job_only_resolves_ips_on_the_first_page(monkeypatch):
+    import socket
+
+    http = PagedHTTP(250)
+    original = http._page
+
+    def with_hostnames(params):
+        data = original(params)
+        for item in data["jobs"]:
+            item["hostname"] = f"{item['job_id']}.hypercli.test"
+        return data
+
+    http._page = with_hostnames
+    lookups = []
+    monkeypatch.setattr(socket, "gethostbyname", lambda host: lookups.append(host) or "10.9.9.9")
+
+    assert find_job(Jobs(http), "no-such-host") is None
+    assert lookups == []
+
+    http.calls.clear()
+    assert find_job(Jobs(http), "10.0.0.1") is None
+    assert len(lookups) == 100
+    assert [call["page"] for call in http.calls] == [1]
+
+
+def test_async_jobs_iter_all_prefetches_pages():
+    http = PagedHTTP(205)
+
+    class AsyncHTTP:
+        async def get(self, path, params=None):
+            return http.get(path, params)
+
+    async def collect():
+        return [job.job_id async for job in AsyncJobs(AsyncHTTP()).iter_all(page_size=100)]
+
+    ids = asyncio.run(collect())
+
+    assert len(ids) == 205
+    assert [call["page"] for call in http.calls] == [1, 2, 3]
+
+
+class CreateHTTP:
+    """Fake POST /api/jobs that throttles the first few requests with 429."""
+
+    def __init__(self, throttle=0, fail_images=()):
+        self.lock = threading.Lock()
+        self.throttle = throttle
+        self.fail_images = set(fail_images)
+        self.created = []
+
+    def post(self, path, json=None, headers=None):
+        assert path == "/api/jobs"
+        key = headers["Idempotency-Key"]
+        with self.lock:
+            if self.throttle:
+                self.throttle -= 1
+                raise APIError(429, "slow down", retry_after=0.01)
+            if json["docker_image"] in self.fail_images:
+                raise APIError(400, "bad image")
+            self.created.append(key)
+            return {"job_id": f"job-{len(self.created)}", "state": "queued", "docker_image": json["docker_image"]}
+
+
+def test_job_spec_keys_are_stable_and_distinguish_repeats():
+    specs = [{"image": "a"}, {"image": "b"}, {"image": "a"}, {"image": "c", "idempotency_key": "mine"}]
+
+    keys = job_spec_keys(specs)
+
+    assert keys == job_spec_keys([dict(spec) for spec in specs])
+    assert len(set(keys)) == 4
+    assert keys[0].endswith("-0") and keys[2].endswith("-1")
+    assert keys[3] == "mine"
+
+
+def test_create_many_retries_429_and_resumes_from_ledger(tmp_path):
+    ledger = tmp_path / "sweep.launched.jsonl"
+    specs = [{"image": "pytorch", "env": {"LR": str(lr)}} for lr in range(6)] + [{"image": "broken"}]
+    http = CreateHTTP(throttle=3, fail_images={"broken"})
+    seen = []
+
+    items = Jobs(http).create_many(specs, concurrency=3, ledger=ledger, on_result=seen.append)
+
+    assert [item.ok for item in items] == [True] * 6 + [False]
+    assert items[-1].error.status_code == 400
+    assert len(http.created) == 6
+    assert len(seen) == 7
+    assert len(ledger.read_text().splitlines()) == 6
+
+    http.fail_images.clear()
+    with ledger.open("a") as f:
+        f.write('{"idempotency_key": "torn')
+    resumed = Jobs(http).create_many(specs, ledger=ledger)
+
+    assert [item.resumed for item in resumed] == [True] * 6 + [False]
+    assert [item.job_id for item in resumed[:6]] == [item.job_id for item in items[:6]]
+    assert len(http.created) == 7
+    assert all(item.resumed for item in Jobs(http).create_many(specs, ledger=ledger))
+
+
+def test_create_many_429_pauses_every_worker_without_rate_limit():
+    class ThrottleOnceHTTP(CreateHTTP):
+        def __init__(self):
+            super().__init__()
+            self.sent_at = []
+
+        def post(self, path, json=None, headers=None):
+            with self.lock:
+                self.sent_at.append(time.monotonic())
+                if len(self.sent_at) == 1:
+                    raise APIError(429, "slow down", retry_after=0.2)
+            time.sleep(0.01)
+            return super().post(path, json=json, headers=headers)
+
+    http = ThrottleOnceHTTP()
+    specs = [{"image": "pytorch", "env": {"N": str(n)}} for n in range(8)]
+
+    items = Jobs(http).create_many(specs, concurrency=2)
+
+    assert all(item.ok for item in items)
+    throttled_at = http.sent_at[0]
+    # The other worker may have a request in flight already; nothing else is sent early.
+    assert sum(1 for sent in http.sent_at[1:] if sent - throttled_at < 0.19) <= 1
+
+
+def test_create_many_rejects_unknown_spec_fields_before_submitting():
+    http = CreateHTTP()
+
+    with pytest.raises(ValueError, match="unknown fields: gpu"):
+        Jobs(http).create_many([{"image": "a"}, {"image": "b", "gpu": "h100"}])
+
+    assert http.created == []
+
+
+def test_token_bucket_paces_and_pauses_all_callers():
+    from hypercli.rate_limit import TokenBucket
+
+    bucket = TokenBucket(rate=50, burst=1)
+    started = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - started >= 0.07
+
+    bucket.pause(0.1)
+    started = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - started >= 0.09
+
+
+def test_log_chunk_sends_window_and_slices_when_server_ignores_it():
+    calls = []
+    full = {"logs": "l0\nl1\nl2\nl3\nl4\n"}
+
+    def get(path, params=None):
+        calls.append((path, params))
+        return full
+
+    jobs = Jobs(SimpleNamespace(get=get))
+
+    assert jobs.log_chunk("job-1", since_offset=2) == LogChunk(["l2", "l3", "l4"], 2, 5)
+    assert jobs.log_chunk("job-1", since_offset=1, tail=2) == LogChunk(["l3", "l4"], 3, 5)
+    assert jobs.log_chunk("job-1", since_offset=9) == LogChunk([], 5, 5)
+    assert jobs.logs("job-1", tail=0) == ""
+    assert calls[:2] == [
+        ("/api/jobs/job-1/logs", {"since_offset": 2}),
+        ("/api/jobs/job-1/logs", {"since_offset": 1, "tail": 2}),
+    ]
+
+    full = {"logs": "l7\nl8", "next_offset": 9}
+    assert jobs.log_chunk("job-1", since_offset=7) == LogChunk(["l7", "l8"], 7, 9)
+    with pytest.raises(ValueError):
+        jobs.log_chunk("job-1", since_offset=-1)
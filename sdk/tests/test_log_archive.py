@@ -0,0 +1,95 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from hypercli import log_archive as archive_module
+from hypercli.log_archive import LogArchive, read_archive
+
+
+def test_log_archive_batches_rotates_and_resumes(tmp_path):
+    archive = LogArchive(tmp_path, name="jobs", max_file_bytes=1, batch_lines=2, flush_interval=60)
+
+    archive.write("one", source="job-a")
+    assert list(tmp_path.iterdir()) == []  # still buffered
+    archive.write("two", source="job-b")
+    archive.write("three", source="job-a")
+    archive.close()
+
+    files = sorted(path.name for path in tmp_path.iterdir())
+    assert files == ["jobs-00001.jsonl.gz", "jobs-00002.jsonl.gz"]
+    records = read_archive(tmp_path / files[0]) + read_archive(tmp_path / files[1])
+    assert [(r["source"], r["line"]) for r in records] == [
+        ("job-a", "one"),
+        ("job-b", "two"),
+        ("job-a", "three"),
+    ]
+    assert all(r["ts"].endswith("+00:00") for r in records)
+    assert archive.lines_written == 3
+
+    with pytest.raises(RuntimeError):
+        archive.write("late")
+    assert LogArchive(tmp_path, name="jobs").path.name == "jobs-00003.jsonl.gz"
+
+
+def test_log_archive_appends_batches_as_separate_members(tmp_path):
+    with LogArchive(tmp_path, batch_lines=1) as archive:
+        archive.write("a")
+        archive.write("b")
+
+    assert [r["line"] for r in read_archive(archive.path)] == ["a", "b"]
+
+
+def test_log_archive_prunes_only_its_own_oldest_files(tmp_path):
+    names = ["sweep-00001.jsonl.gz", "sweep-00002.jsonl.gz", "data-00001.jsonl.gz"]
+    for n, name in enumerate(names):
+        path = tmp_path / name
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (n, n))
+    (tmp_path / "sweep-final.jsonl.gz").write_bytes(b"x" * 100)
+    (tmp_path / "notes.txt").write_text("keep")
+
+    archive = LogArchive(
+        tmp_path, name="sweep", max_file_bytes=1, max_total_bytes=250, batch_lines=1
+    )
+    archive.write("line")
+
+    remaining = sorted(path.name for path in tmp_path.iterdir())
+    assert remaining == [
+        "data-00001.jsonl.gz",
+        "notes.txt",
+        "sweep-00002.jsonl.gz",
+        "sweep-00003.jsonl.gz",
+        "sweep-final.jsonl.gz",
+    ]
+
+
+def test_log_archive_writes_off_the_event_loop(tmp_path, monkeypatch):
+    threads = []
+    real_compress = archive_module.gzip.compress
+
+    def compress(data, **kwargs):
+        threads.append(threading.current_thread())
+        return real_compress(data, **kwargs)
+
+    monkeypatch.setattr(archive_module.gzip, "compress", compress)
+
+    async def scenario():
+        archive = LogArchive(tmp_path, batch_lines=2)
+        await archive.awrite("a", source="agent-1")
+        await archive.awrite("b", source="agent-1")
+        await archive.awrite("c", source="agent-1")
+        await archive.aclose()
+        return archive
+
+    archive = asyncio.run(scenario())
+
+    assert [r["line"] for r in read_archive(archive.path)] == ["a", "b", "c"]
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_log_archive_rejects_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        LogArchive(tmp_path, compression="bz2")
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from hypercli.log_filter import LogFilter, line_level, line_timestamp, parse_since
+
+
+def test_parse_since_accepts_durations_and_timestamps():
+    now = datetime(2026, 1, 2, 12, 0, tzinfo=timezone.utc)
+
+    assert parse_since("10m", now=now) == now - timedelta(minutes=10)
+    assert parse_since("1.5h", now=now) == now - timedelta(hours=1.5)
+    assert parse_since("2026-01-02T11:00:00Z") == datetime(2026, 1, 2, 11, tzinfo=timezone.utc)
+    assert parse_since("2026-01-02 11:00") == datetime(2026, 1, 2, 11, tzinfo=timezone.utc)
+    with pytest.raises(ValueError):
+        parse_since("yesterday")
+
+
+def test_line_timestamp_and_level_recognise_common_formats():
+    utc = timezone.utc
+    assert line_timestamp("2026-01-02T11:00:00.123456789Z step 5") == datetime(
+        2026, 1, 2, 11, 0, 0, 123456, tzinfo=utc
+    )
+    assert line_timestamp("[2026-01-02 13:00:00,5 +0200] ready") == datetime(
+        2026, 1, 2, 11, 0, 0, 500000, tzinfo=utc
+    )
+    assert line_timestamp("epoch 2026-01-02T11:00:00Z") is None
+
+    assert line_level("2026-01-02 ERROR CUDA out of memory") == "error"
+    assert line_level('{"level": "warn", "msg": "slow"}') == "warning"
+    assert line_level("time=1 lvl=debug msg=x") == "debug"
+    assert line_level("for more info see the docs") is None
+
+
+def test_log_filter_combines_grep_exclude_and_level_with_continuations():
+    keep = LogFilter("nccl|cuda", exclude="heartbeat", ignore_case=True, min_level="warning")
+    lines = [
+        "INFO loading CUDA kernels",
+        "ERROR CUDA error: out of memory",
+        "  cuda traceback frame",  # continuation of the ERROR line
+        "WARNING NCCL heartbeat slow",
+        "INFO nccl ready",
+    ]
+
+    assert keep.apply(lines) == ["ERROR CUDA error: out of memory", "  cuda traceback frame"]
+    assert keep.active
+    assert not LogFilter().active
+    with pytest.raises(ValueError):
+        LogFilter(min_level="loud")
+
+
+def test_log_filter_since_tracks_each_source_separately():
+    keep = LogFilter(since="2026-01-02T11:00:00Z")
+
+    assert not keep("2026-01-02T10:59:59Z old", source="a")
+    assert not keep("  continuation of old", source="a")
+    assert keep("untimed line before any timestamp", source="b")
+    assert keep("2026-01-02T11:00:01Z new", source="a")
+    assert keep("no timestamp after the cutoff", source="a")
+    assert not keep("2026-01-02T10:00:00Z stale", source="b")
@@ -0,0 +1,286 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from websockets.exceptions import ConnectionClosedError
+
+from hypercli import logs as logs_module
+from hypercli.http import APIError
+from hypercli.jobs import _log_chunk
+from hypercli.logs import LogCursor, LogHub
+
+
+def _frame(*lines):
+    return json.dumps({"event": "log", "log": "\n".join(lines)})
+
+
+class FakeJobs:
+    def __init__(self, states, log_lines):
+        self.states = {job_id: list(seq) for job_id, seq in states.items()}
+        self.log_lines = log_lines
+        self.gets = []
+        self.chunks = []
+
+    async def get(self, job_id):
+        self.gets.append(job_id)
+        seq = self.states[job_id]
+        state = seq.pop(0) if len(seq) > 1 else seq[0]
+        return SimpleNamespace(job_id=job_id, state=state, job_key=f"key-{job_id}")
+
+    async def log_chunk(self, job_id, since_offset=None, tail=None):
+        self.chunks.append((job_id, since_offset, tail))
+        return _log_chunk({"logs": "\n".join(self.log_lines[job_id])}, since_offset, tail)
+
+
+class FakeSocket:
+    def __init__(self, frames, drop):
+        self.frames = frames
+        self.drop = drop
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for frame in self.frames:
+            await asyncio.sleep(0)
+            yield frame
+        if self.drop:
+            raise ConnectionClosedError(None, None)
+
+
+def test_log_hub_merges_jobs_and_resumes_without_duplicates(monkeypatch):
+    log_lines = {"a": ["a1", "a2"], "b": []}
+    sessions = {
+        "key-a": [
+            # First session drops after a3; a4 lands while disconnected.
+            (["a3"], True, ["a4"]),
+            (["a5"], False, []),
+        ],
+        "key-b": [(["b1", "b2"], False, [])],
+    }
+
+    def fake_connect(url, **kwargs):
+        key = url.rsplit("/", 1)[1]
+        job_id = key.removeprefix("key-")
+        frames, drop, missed = sessions[key].pop(0)
+        log_lines[job_id].extend(line for frame in frames for line in frame.split())
+        log_lines[job_id].extend(missed)
+        return FakeSocket([_frame(*frame.split()) for frame in frames], drop)
+
+    monkeypatch.setattr(logs_module.websockets, "connect", fake_connect)
+    jobs = FakeJobs(
+        {
+            "a": ["running", "running", "succeeded"],
+            "b": ["queued", "running", "succeeded"],
+        },
+        log_lines,
+    )
+    hub = LogHub(None, ["a", "b", "a"], state_interval=0, reconnect_initial=0, async_jobs=jobs)
+
+    async def collect():
+        return [event async for event in hub]
+
+    events = asyncio.run(collect())
+
+    lines = {job_id: [e.line for e in events if e.job_id == job_id and e.line] for job_id in "ab"}
+    states = {job_id: [e.state for e in events if e.job_id == job_id and e.state] for job_id in "ab"}
+    assert lines["a"] == ["a1", "a2", "a3", "a4", "a5"]
+    assert lines["b"] == ["b1", "b2"]
+    assert states == {"a": ["running", "succeeded"], "b": ["queued", "running", "succeeded"]}
+
+
+def test_log_hub_emits_bounded_tail_for_finished_jobs(monkeypatch):
+    monkeypatch.setattr(logs_module.websockets, "connect", lambda *a, **k: None)
+    jobs = FakeJobs({"done": ["failed"]}, {"done": [f"line {n}" for n in range(10)]})
+    hub = LogHub(None, ["done"], max_initial_lines=3, async_jobs=jobs)
+    seen = []
+
+    asyncio.run(hub.run(seen.append))
+
+    assert [event.line for event in seen if event.line] == ["line 7", "line 8", "line 9"]
+    assert [event.state for event in seen if event.state] == ["failed"]
+
+
+def test_log_hub_raises_a_job_failure_without_waiting_for_the_rest(monkeypatch):
+    monkeypatch.setattr(logs_module.websockets, "connect", lambda *a, **k: None)
+
+    class MissingJobs(FakeJobs):
+        async def get(self, job_id):
+            if job_id == "missing":
+                raise APIError(404, "job not found")
+            return await super().get(job_id)
+
+    # "slow" stays queued for an hour of state polls; the 404 must not wait for it.
+    jobs = MissingJobs({"slow": ["queued"]}, {"slow": []})
+    hub = LogHub(None, ["slow", "missing"], state_interval=3600, async_jobs=jobs)
+
+    async def collect():
+        return [event async for event in hub]
+
+    with pytest.raises(APIError, match="job not found"):
+        asyncio.run(asyncio.wait_for(collect(), timeout=5))
+
+
+def test_stream_logs_checks_state_without_blocking_the_loop(monkeypatch):
+    class SilentSocket:
+        closed = False
+
+        async def recv(self):
+            await asyncio.sleep(3600)
+
+        async def close(self):
+            self.closed = True
+
+    socket = SilentSocket()
+
+    async def fake_connect(url):
+        return socket
+
+    monkeypatch.setattr(logs_module.websockets, "connect", fake_connect)
+    jobs = FakeJobs({"j": ["running", "running", "running", "succeeded"]}, {"j": ["one", "two"]})
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(asyncio.get_running_loop().time())
+            await asyncio.sleep(0.005)
+
+    async def scenario():
+        lines = []
+        task = asyncio.create_task(ticker())
+        await logs_module.stream_logs(
+            None, "j", lines.append, poll_state_interval=0.02, fetch_final=False, async_jobs=jobs
+        )
+        task.cancel()
+        return lines
+
+    lines = asyncio.run(scenario())
+
+    assert lines == ["one", "two"]
+    assert socket.closed
+    assert len(ticks) >= 5
+
+
+def test_stream_logs_cleans_up_when_cancelled(monkeypatch):
+    closed = []
+
+    class HangingSocket:
+        async def recv(self):
+            await asyncio.sleep(3600)
+
+        async def close(self):
+            closed.append(True)
+
+    async def fake_connect(url):
+        return HangingSocket()
+
+    monkeypatch.setattr(logs_module.websockets, "connect", fake_connect)
+    jobs = FakeJobs({"j": ["running"]}, {"j": []})
+
+    async def scenario():
+        task = asyncio.create_task(
+            logs_module.stream_logs(None, "j", print, poll_state_interval=10, async_jobs=jobs)
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    assert asyncio.run(scenario())
+    assert closed == [True]
+
+
+def test_log_cursor_fetches_only_new_lines():
+    log_lines = {"j": ["one", "two", "three"]}
+    jobs = FakeJobs({"j": ["running"]}, log_lines)
+    cursor = LogCursor("j")
+
+    async def scenario():
+        first = await cursor.fetch_async(jobs, tail=2)
+        log_lines["j"].extend(["four", "five"])
+        cursor.advance(1)  # "four" arrived over the websocket
+        return first, await cursor.fetch_async(jobs), await cursor.fetch_async(jobs)
+
+    assert asyncio.run(scenario()) == (["two", "three"], ["five"], [])
+    assert cursor.offset == 5
+    assert jobs.chunks == [("j", 0, 2), ("j", 4, None), ("j", 5, None)]
+
+
+def test_stream_logs_final_fetch_returns_only_the_delta(monkeypatch):
+    log_lines = {"j": ["one", "two"]}
+
+    class OneFrameSocket:
+        def __init__(self):
+            self.frames = [_frame("three", "four")]
+
+        async def recv(self):
+            if not self.frames:
+                await asyncio.sleep(3600)
+            log_lines["j"].extend(["three", "four", "five"])  # "five" lands after the frame
+            return self.frames.pop()
+
+        async def close(self):
+            pass
+
+    async def fake_connect(url):
+        return OneFrameSocket()
+
+    monkeypatch.setattr(logs_module.websockets, "connect", fake_connect)
+    monkeypatch.setattr(logs_module.asyncio, "sleep", _no_final_delay(asyncio.sleep))
+    jobs = FakeJobs({"j": ["running", "running", "succeeded"]}, log_lines)
+    lines = []
+
+    asyncio.run(logs_module.stream_logs(None, "j", lines.append, poll_state_interval=0.01, async_jobs=jobs))
+
+    assert lines == ["one", "two", "three", "four", "five"]
+    assert jobs.chunks[-1] == ("j", 4, 1000)
+
+
+def _no_final_delay(sleep):
+    async def patched(delay):
+        await sleep(0 if delay == 0.5 else delay)
+    return patched
+
+
+def test_log_hub_archives_every_line_with_its_job(monkeypatch, tmp_path):
+    from hypercli.log_archive import LogArchive, read_archive
+
+    monkeypatch.setattr(logs_module.websockets, "connect", lambda *a, **k: None)
+    jobs = FakeJobs({"a": ["succeeded"], "b": ["failed"]}, {"a": ["a1", "a2"], "b": ["b1"]})
+    archive = LogArchive(tmp_path, batch_lines=100)
+    hub = LogHub(None, ["a", "b"], async_jobs=jobs, archive=archive)
+
+    asyncio.run(hub.run(lambda event: None))
+
+    records = read_archive(archive.path)
+    assert sorted((r["source"], r["line"]) for r in records) == [("a", "a1"), ("a", "a2"), ("b", "b1")]
+
+
+def test_stream_logs_filters_lines_but_archives_all(monkeypatch, tmp_path):
+    from hypercli.log_archive import LogArchive, read_archive
+    from hypercli.log_filter import LogFilter
+
+    monkeypatch.setattr(logs_module.websockets, "connect", lambda *a, **k: None)
+    jobs = FakeJobs({"j": ["failed"]}, {"j": ["INFO start", "ERROR boom", "  at frame 1", "INFO exit"]})
+    archive = LogArchive(tmp_path)
+    lines = []
+
+    asyncio.run(
+        logs_module.stream_logs(
+            None, "j", lines.append, async_jobs=jobs, archive=archive,
+            line_filter=LogFilter(min_level="error"),
+        )
+    )
+
+    assert lines == ["ERROR boom", "  at frame 1"]
+    assert len(read_archive(archive.path)) == 4
@@ -1,5 +1,7 @@
+import asyncio
+
 from hypercli.http import APIError
-from hypercli.renders import Renders
+from hypercli.renders import AsyncRenders, Renders, poll_intervals
 from hypercli.http import APIError
 
 
@@ -202,3 +204,100 @@ def test_wait_allows_recent_active_grace(monkeypatch):
 
     assert render.state == "completed"
     assert clock.time() == 10
+
+
+def _sequenced_http(states: dict[str, list[str]]):
+    """Paid-route HTTP fake returning each render's states in order, then the last."""
+    polls: dict[str, int] = {}
+
+    class SequencedHTTP:
+        def get(self, path, params=None):
+            if path == "/api/auth/me":
+                raise APIError(403, "Access denied")
+            render_id = path.rsplit("/", 1)[-1]
+            polls[render_id] = polls.get(render_id, 0) + 1
+            seq = states[render_id]
+            state = seq[min(polls[render_id], len(seq)) - 1]
+            return {"id": render_id, "state": state, "started_at": None}
+
+    return SequencedHTTP(), polls
+
+
+def test_poll_intervals_back_off_unless_fixed():
+    adaptive = poll_intervals()
+    assert [next(adaptive) for _ in range(8)] == [0.5, 0.75, 1.125, 1.6875, 2.53125, 3.796875, 5.0, 5.0]
+    fixed = poll_intervals(2.0)
+    assert [next(fixed) for _ in range(3)] == [2.0, 2.0, 2.0]
+
+
+def test_wait_defaults_to_adaptive_polling(monkeypatch):
+    clock = Clock()
+    http, _ = _sequenced_http({"r1": ["queued", "running", "completed"]})
+    monkeypatch.setattr("hypercli.renders.time.time", clock.time)
+    monkeypatch.setattr("hypercli.renders.time.sleep", clock.sleep)
+
+    render = Renders(http).wait("r1")
+
+    assert render.state == "completed"
+    assert clock.time() == 1.25
+
+
+def test_wait_many_polls_all_renders_in_one_loop(monkeypatch):
+    clock = Clock()
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock.sleep(seconds)
+
+    http, polls = _sequenced_http(
+        {
+            "fast": ["completed"],
+            "mid": ["running", "running", "failed"],
+            "stuck": ["queued"],
+        }
+    )
+    monkeypatch.setattr("hypercli.renders.time.time", clock.time)
+    monkeypatch.setattr("hypercli.renders.time.sleep", sleep)
+
+    renders = Renders(http).wait_many(
+        ["stuck", "fast", "mid"], timeout=3, poll_interval=1, queue_grace=2, concurrency=2
+    )
+
+    assert [(r.render_id, r.state) for r in renders] == [
+        ("stuck", "queued"),
+        ("fast", "completed"),
+        ("mid", "failed"),
+    ]
+    assert polls == {"fast": 1, "mid": 3, "stuck": 6}
+    assert sleeps == [1, 1, 1, 1, 1]
+
+
+def test_async_wait_and_wait_many(monkeypatch):
+    clock = Clock()
+
+    async def sleep(seconds):
+        clock.sleep(seconds)
+
+    states = {"a": ["running", "completed"], "b": ["completed"], "c": ["running", "running", "cancelled"]}
+    sync_http, polls = _sequenced_http(states)
+
+    class AsyncHTTP:
+        async def get(self, path, params=None):
+            return sync_http.get(path, params)
+
+    monkeypatch.setattr("hypercli.renders.time.time", clock.time)
+    monkeypatch.setattr("hypercli.renders.asyncio.sleep", sleep)
+    renders = AsyncRenders(AsyncHTTP())
+
+    async def run():
+        one = await renders.wait("a")
+        many = await renders.wait_many(["c", "b"])
+        return one, many
+
+    one, many = asyncio.run(run())
+
+    assert one.state == "completed"
+    assert [r.state for r in many] == ["cancelled", "completed"]
+    assert polls == {"a": 2, "b": 1, "c": 3}
+    assert clock.time() == 0.5 + 0.5 + 0.75